@@ -1,19 +1,51 @@
 # -*- coding: utf-8 -*-
-from qgis.PyQt.QtCore import QSettings, QTranslator, QCoreApplication
+from qgis.PyQt.QtCore import QSettings, QTranslator, QCoreApplication, QTimer
 from qgis.PyQt.QtGui import QIcon
-from qgis.PyQt.QtWidgets import QAction, QApplication
-from qgis.core import QgsVectorLayer, QgsProject
+from qgis.PyQt.QtWidgets import QAction
+from qgis.core import QgsApplication, QgsVectorLayer, QgsVectorTileLayer, QgsProject
 
 import os.path
+import sqlite3
+import itertools
 import time
+import queue
+from collections import deque
+from functools import partial
 from datetime import datetime
 import logging
+from logging.handlers import QueueHandler, QueueListener
 
 from ...resources import *
 from .Space_trace_dialog import SpaceTracePluginDialog
+from .track_task import TrackGenerationTask
 from .orbital.facade import OrbitalTrackFacade
+from .orbital.pipeline import Stage, StagedPipeline
+from .orbital.temporal import configure_temporal_properties
 from ..config.orbital import OrbitalConfig
 
+OUTPUT_FORMATS = {"shp", "gpkg", "geojson", "geojsonl", "geojsons", "mbtiles"}
+# Formats that keep the Z and M values of compact LineStringZM tracks.
+COMPACT_FORMATS = {"shp", "gpkg"}
+# Interval at which buffered log lines are appended to the dialog.
+LOG_FLUSH_INTERVAL_MS = 200
+# Log lines kept for the dialog between two flushes; older lines are dropped.
+LOG_BUFFER_LINES = 1000
+# QGIS setting that turns on DEBUG records; without it they are dropped at the level check.
+DEBUG_LOG_SETTING = "SpaceTrace/debugLogging"
+LOG_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+}
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """QueueHandler passing records on unformatted, so the listener thread formats them."""
+
+    def prepare(self, record):
+        return record
+
 
 class SpaceTracePlugin:
     """QGIS Plugin for generating orbital tracks from local files or SpaceTrack data.
@@ -35,16 +67,31 @@ class SpaceTracePlugin:
         self.dlg = None
         self.logger = None
         self.translator = None
+        self._log_listener = None
+        self._log_buffer = deque(maxlen=LOG_BUFFER_LINES)
+        self._log_dropped = 0
+        self.task = None
+        # Set when the log is closed while a task still logs; _finish_run closes it.
+        self._close_log_pending = False
+        self._log_timer = QTimer()
+        self._log_timer.setInterval(LOG_FLUSH_INTERVAL_MS)
+        self._log_timer.timeout.connect(self._flush_log_buffer)
 
         self._init_logger()
         self._init_localization()
         self.logger.info("SpaceTracePlugin initialized.")
 
     def _init_logger(self):
-        """Set up file logging for the plugin."""
+        """Set up file logging for the plugin.
+
+        Records are put on a queue and formatted and written by a QueueListener
+        thread, so logging never waits for the disk. DEBUG records are logged only
+        if the DEBUG_LOG_SETTING setting is true.
+        """
         self.logger = logging.getLogger("SpaceTracePlugin")
+        debug = QSettings().value(DEBUG_LOG_SETTING, False, type=bool)
+        self.logger.setLevel(logging.DEBUG if debug else logging.INFO)
         if not self.logger.handlers:
-            self.logger.setLevel(logging.DEBUG)
             log_file = os.path.join(self.plugin_dir, "SpaceTracePlugin.log")
             handler = logging.FileHandler(log_file, encoding="utf-8")
             handler.setLevel(logging.DEBUG)
@@ -52,8 +99,11 @@ class SpaceTracePlugin:
                 "[%(asctime)s] %(levelname)s: %(message)s",
                 datefmt="%Y-%m-%d %H:%M:%S"
             ))
-            self.logger.addHandler(handler)
+            log_queue = queue.SimpleQueue()
+            self.logger.addHandler(_DeferredQueueHandler(log_queue))
             self.logger.propagate = False
+            self._log_listener = QueueListener(log_queue, handler, respect_handler_level=True)
+            self._log_listener.start()
 
     def _init_localization(self):
         """Configure localization based on QGIS settings."""
@@ -64,7 +114,7 @@ class SpaceTracePlugin:
             self.translator = QTranslator()
             if self.translator.load(locale_path):
                 QCoreApplication.installTranslator(self.translator)
-                self.logger.debug(f"Loaded translation: {locale_path}")
+                self.logger.debug("Loaded translation: %s", locale_path)
             else:
                 self.logger.warning(f"Failed to load translation: {locale_path}")
         else:
@@ -103,6 +153,10 @@ class SpaceTracePlugin:
 
     def initGui(self):
         """Set up the plugin's GUI elements."""
+        from .orbital.array_provider import register_array_provider
+
+        if not register_array_provider():
+            self.logger.warning("Columnar track provider could not be registered; using memory layers.")
         icon_path = ':/plugins/Space_trace/icon.png'
         self._add_action(
             icon_path=icon_path,
@@ -113,37 +167,76 @@ class SpaceTracePlugin:
 
     def unload(self):
         """Clean up GUI elements on plugin unload."""
+        from .orbital.array_provider import unregister_array_provider
+
+        unregister_array_provider()
         for action in self.actions:
             self.iface.removePluginVectorMenu(self.menu, action)
             self.iface.removeToolBarIcon(action)
+        if self.task is not None:
+            self.task.cancel()
         self._close_logger()
 
     def _close_logger(self):
-        """Close all logger handlers."""
+        """Flush the dialog log, write the queued records and close all logger handlers.
+
+        While a task runs its threads keep logging, so closing is deferred until the
+        run has finished.
+        """
+        if self.task is not None:
+            self._close_log_pending = True
+            return
+        self._close_log_pending = False
+        self._log_timer.stop()
+        self._flush_log_buffer()
         if self.logger:
             for handler in self.logger.handlers[:]:
                 handler.close()
                 self.logger.removeHandler(handler)
+        if self._log_listener is not None:
+            # stop() writes the records still in the queue before the file is closed.
+            self._log_listener.stop()
+            for handler in self._log_listener.handlers:
+                handler.close()
+            self._log_listener = None
+
+    def log_message(self, message: str, level: str = "INFO", *args):
+        """Log a message to file and dialog (any thread).
 
-    def log_message(self, message: str, level: str = "INFO"):
-        """Log a message to file and dialog.
+        Nothing is formatted here: the file log formats records on its listener thread
+        and dialog lines are formatted when the flush timer appends them. Unless the
+        DEBUG_LOG_SETTING setting is on, a DEBUG message costs only the level check.
 
         Args:
-            message (str): Message content.
+            message (str): Message content, a %-format string if args are given.
             level (str): Log level ("INFO", "DEBUG", "WARNING", "ERROR").
+            *args: Values substituted into the message when it is formatted.
         """
-        log_func = {
-            "DEBUG": self.logger.debug,
-            "WARNING": self.logger.warning,
-            "ERROR": self.logger.error,
-            "INFO": self.logger.info
-        }.get(level.upper(), self.logger.info)
-        log_func(message)
+        level_no = LOG_LEVELS.get(level.upper(), logging.INFO)
+        self.logger.log(level_no, message, *args)
+
+        if level_no >= logging.INFO:
+            if len(self._log_buffer) == self._log_buffer.maxlen:
+                self._log_dropped += 1
+            self._log_buffer.append((time.time(), message, args))
 
-        if self.dlg and level in ["INFO", "WARNING", "ERROR"]:
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            self.dlg.appendLog(f"[{timestamp}] {message}")
-        QApplication.processEvents()
+    def _flush_log_buffer(self):
+        """Append the buffered log lines to the dialog in one update (GUI thread only)."""
+        if not self.dlg or not self._log_buffer:
+            return
+        lines = []
+        if self._log_dropped:
+            lines.append(f"... {self._log_dropped} earlier lines are only in the log file")
+            self._log_dropped = 0
+        while self._log_buffer:
+            created, message, args = self._log_buffer.popleft()
+            timestamp = datetime.fromtimestamp(created).strftime("%Y-%m-%d %H:%M:%S")
+            try:
+                text = message % args if args else message
+            except (TypeError, ValueError):
+                text = f"{message} {args}"
+            lines.append(f"[{timestamp}] {text}")
+        self.dlg.appendLog("\n".join(lines))
 
     def _parse_norad_ids(self, text: str) -> list[int]:
         """Parse NORAD IDs from a string.
@@ -188,8 +281,8 @@ class SpaceTracePlugin:
             directory, fmt = output_path.split('|', 1)
             directory = directory.strip()
             fmt = fmt.strip().lower()
-            if fmt not in {"shp", "gpkg", "geojson"}:
-                raise Exception(self.tr("Unsupported format. Use shp, gpkg, or geojson."))
+            if fmt not in OUTPUT_FORMATS:
+                raise Exception(self.tr("Unsupported format. Use shp, gpkg, geojson, geojsonl, geojsons or mbtiles."))
             if not os.path.isdir(directory):
                 raise Exception(self.tr("Output directory does not exist or is not writable."))
             return directory, fmt
@@ -200,16 +293,16 @@ class SpaceTracePlugin:
                 output_dir = os.getcwd()
             _, ext = os.path.splitext(output_path)
             fmt = ext[1:].lower() if ext else "shp"
-            if fmt not in {"shp", "gpkg", "geojson"}:
-                raise Exception(self.tr("Unsupported format. Use shp, gpkg, or geojson."))
+            if fmt not in OUTPUT_FORMATS:
+                raise Exception(self.tr("Unsupported format. Use shp, gpkg, geojson, geojsonl, geojsons or mbtiles."))
             if not os.path.isdir(output_dir):
                 raise Exception(self.tr("Output directory does not exist or is not writable."))
             return output_dir, fmt
 
         _, ext = os.path.splitext(output_path)
         fmt = ext[1:].lower()
-        if fmt not in {"shp", "gpkg", "geojson"}:
-            raise Exception(self.tr("Unsupported format. Use shp, gpkg, or geojson."))
+        if fmt not in OUTPUT_FORMATS:
+            raise Exception(self.tr("Unsupported format. Use shp, gpkg, geojson, geojsonl, geojsons or mbtiles."))
         output_dir = os.path.dirname(output_path)
         if output_dir and not os.path.isdir(output_dir):
             raise Exception(self.tr("Output directory does not exist or is not writable."))
@@ -255,6 +348,17 @@ class SpaceTracePlugin:
             for i, file_path in enumerate(inputs["data_file_paths"]):
                 if not os.path.isfile(file_path):
                     raise Exception(self.tr(f"File {i+1} is not readable: {file_path}"))
+            if inputs.get("catalog_id_text"):
+                if len(inputs["data_file_paths"]) != 1:
+                    raise Exception(self.tr("Select a single catalog file to take NORAD IDs from."))
+                sat_ids = self._parse_norad_ids(inputs["catalog_id_text"])
+                inputs["catalog_path"] = inputs["data_file_paths"][0]
+            elif len(inputs["data_file_paths"]) == 1 and inputs["data_format"] == "OMM":
+                catalog_ids = self._omm_catalog_ids(inputs["data_file_paths"][0])
+                if len(catalog_ids) > 1:
+                    # One OMM file with several objects drives a batch of satellites.
+                    sat_ids = catalog_ids
+                    inputs["catalog_path"] = inputs["data_file_paths"][0]
         else:
             if not inputs["sat_id_text"]:
                 raise Exception(self.tr("Enter at least one NORAD ID."))
@@ -263,11 +367,51 @@ class SpaceTracePlugin:
                 raise Exception(self.tr("Provide SpaceTrack login and password."))
 
         # Validate paths
-        output_path, file_format = self._validate_output_path(inputs["output_path"], len(sat_ids))
+        raw_output_path = inputs["output_path"]
+        output_path, file_format = self._validate_output_path(raw_output_path, len(sat_ids))
         self._validate_save_data_path(inputs["save_data_path"], inputs["save_data"], len(sat_ids))
 
+        if inputs.get("compact_track"):
+            if inputs.get("single_dataset"):
+                raise Exception(self.tr("Compact tracks cannot be written to a single output dataset."))
+            if output_path and file_format not in COMPACT_FORMATS:
+                raise Exception(self.tr("Compact tracks require the shp or gpkg format."))
+
+        if file_format == "mbtiles" or (inputs.get("single_dataset") and output_path):
+            if file_format not in ("gpkg", "mbtiles"):
+                raise Exception(self.tr("A single output dataset requires the gpkg or mbtiles format."))
+            inputs["dataset_path"] = (
+                os.path.join(output_path, f"tracks.{file_format}")
+                if '|' in raw_output_path or os.path.isdir(raw_output_path)
+                else raw_output_path
+            )
+
         return sat_ids, file_format, output_path
 
+    def _omm_catalog_ids(self, file_path: str) -> list[int]:
+        """Return the NORAD IDs of all objects in a local OMM file.
+
+        Args:
+            file_path (str): Path of a JSON, CSV or XML OMM file.
+
+        Returns:
+            list[int]: Sorted NORAD IDs.
+
+        Raises:
+            Exception: If the file cannot be parsed.
+        """
+        from ..data_retriver.omm_catalog import OmmCatalog
+
+        try:
+            # Runs on the GUI thread, so skip the sidecar index; the task's retriever writes it.
+            catalog = OmmCatalog(file_path, use_sidecar=False, log_callback=self.log_message)
+        except (ValueError, SyntaxError) as e:
+            raise Exception(self.tr(f"Cannot read OMM file {file_path}: {str(e)}"))
+        try:
+            return catalog.norad_ids()
+        finally:
+            catalog.close()
+
     def _create_config_for_local_file(self, inputs: dict, file_index: int, file_format: str) -> OrbitalConfig:
         """Create config for a local file.
 
@@ -303,9 +447,52 @@ class SpaceTracePlugin:
             create_line_layer=inputs["create_line_layer"],
             save_data=inputs["save_data"],
             data_file_path=file_path,
-            save_data_path=save_data_path
+            save_data_path=save_data_path,
+            compact_track=inputs.get("compact_track", False)
         )
 
+    def _create_config_for_catalog(self, inputs: dict, sat_id: int, file_format: str) -> OrbitalConfig:
+        """Create config for one object of a local catalog file.
+
+        Args:
+            inputs (dict): User inputs.
+            sat_id (int): NORAD ID of the satellite in the catalog.
+            file_format (str): Output file format.
+
+        Returns:
+            OrbitalConfig: Configuration object.
+        """
+        config = self._create_config_for_spacetrack(inputs, sat_id, file_format)
+        config.login = config.password = None
+        config.data_file_path = inputs["catalog_path"]
+        config.catalog = True
+        return config
+
+    def _create_config(self, inputs: dict, item_id: int, file_format: str) -> OrbitalConfig:
+        """Create the config of one item for the selected data source.
+
+        Args:
+            inputs (dict): User inputs.
+            item_id (int): NORAD ID or file index.
+            file_format (str): Output file format.
+
+        Returns:
+            OrbitalConfig: Configuration object.
+        """
+        if inputs.get("catalog_path"):
+            return self._create_config_for_catalog(inputs, item_id, file_format)
+        if inputs["data_file_paths"]:
+            return self._create_config_for_local_file(inputs, item_id, file_format)
+        return self._create_config_for_spacetrack(inputs, item_id, file_format)
+
+    def _is_file_items(self, inputs: dict) -> bool:
+        """Return True if items are indices of local files rather than NORAD IDs."""
+        return bool(inputs["data_file_paths"]) and not inputs.get("catalog_path")
+
+    def _item_name(self, inputs: dict, item_id: int) -> str:
+        """Return the file name or NORAD ID shown for an item in messages."""
+        return os.path.basename(inputs["data_file_paths"][item_id]) if self._is_file_items(inputs) else str(item_id)
+
     def _create_config_for_spacetrack(self, inputs: dict, sat_id: int, file_format: str) -> OrbitalConfig:
         """Create config for SpaceTrack data.
 
@@ -339,117 +526,400 @@ class SpaceTracePlugin:
             create_line_layer=inputs["create_line_layer"],
             save_data=inputs["save_data"],
             data_file_path=inputs["data_file_path"],
-            save_data_path=save_data_path
+            save_data_path=save_data_path,
+            compact_track=inputs.get("compact_track", False)
         )
 
-    def _load_layer(self, file_path: str, layer_type: str) -> None:
+    def _load_layer(self, file_path: str, layer_type: str, layer_name: str = None) -> None:
         """Load and add a vector layer to QGIS.
 
         Args:
-            file_path (str): Path to the layer file.
+            file_path (str): Path to the layer file or OGR data source URI.
             layer_type (str): "point" or "line".
+            layer_name (str): Optional layer name; defaults to the file name.
         """
         if not file_path:
             return
-        layer_name = os.path.splitext(os.path.basename(file_path))[0]
+        layer_name = layer_name or os.path.splitext(os.path.basename(file_path))[0]
         layer = QgsVectorLayer(file_path, layer_name, "ogr")
         if layer.isValid():
+            if layer_type == "point":
+                configure_temporal_properties(layer)
             QgsProject.instance().addMapLayer(layer)
-            self.log_message(f"{layer_type.capitalize()} layer loaded with {layer.featureCount()} features.", "INFO")
+            self.log_message("%s layer loaded with %d features.", "INFO", layer_type.capitalize(), layer.featureCount())
         else:
             self.log_message(f"Failed to load {layer_type} layer: {file_path}", "ERROR")
             self.iface.messageBar().pushMessage("Error", f"Failed to load {layer_type} layer", level=3)
 
-    def _process_track(self, config: OrbitalConfig, facade: OrbitalTrackFacade) -> None:
-        """Generate an orbital track based on configuration.
+    def _load_vector_tile_layer(self, uri: str, layer_name: str) -> None:
+        """Load a vector tile layer (e.g. an MBTiles track pyramid) into QGIS.
+
+        Args:
+            uri (str): Vector tile data source URI ("type=mbtiles&url=...").
+            layer_name (str): Name of the layer.
+        """
+        layer = QgsVectorTileLayer(uri, layer_name)
+        if layer.isValid():
+            QgsProject.instance().addMapLayer(layer)
+            self.log_message("Vector tile layer loaded: %s", "INFO", layer_name)
+        else:
+            self.log_message(f"Failed to load vector tile layer: {uri}", "ERROR")
+            self.iface.messageBar().pushMessage("Error", "Failed to load vector tile layer", level=3)
+
+    def _retrieve_item(self, run, item_id: int) -> tuple:
+        """Retrieval stage: create the config of an item and retrieve its data (task thread).
+
+        Args:
+            run (TrackGenerationTask): Running task holding the facade.
+            item_id (int): NORAD ID or file index.
+
+        Returns:
+            tuple: (config, data).
+        """
+        config = self._create_config(run.inputs, item_id, run.file_format)
+        self.log_message("Processing %s: %s", "INFO", "file" if self._is_file_items(run.inputs) else "NORAD ID",
+                         self._item_name(run.inputs, item_id))
+        return config, run.facade.retrieve_data(config)
+
+    def _propagate_item(self, run, retrieved: tuple) -> tuple:
+        """Propagation stage (task thread).
+
+        Streamed formats get a lazy chunk iterable here; their chunks are propagated by the
+        output stage as it writes them, so memory stays bounded by one chunk.
+
+        Args:
+            run (TrackGenerationTask): Running task holding the facade and writer.
+            retrieved (tuple): (config, data) from the retrieval stage.
+
+        Returns:
+            tuple: (config, data, track).
+        """
+        config, data = retrieved
+        return config, data, run.facade.propagate_track(config, data, run.writer)
+
+    def _write_item(self, run, propagated: tuple):
+        """Output stage: write the track to its files, the shared dataset or in-memory layers (task thread).
+
+        Args:
+            run (TrackGenerationTask): Running task holding the facade and writer.
+            propagated (tuple): (config, data, track) from the propagation stage.
+
+        Returns:
+            tuple: (config, point, line) to finish on the GUI thread, or None for single-dataset output.
+        """
+        config, data, track = propagated
+        result = run.facade.write_track(config, data, track, run.writer)
+        if result is None:
+            return None
+        if not config.output_path:
+            # Layers created on a task thread must belong to the GUI thread before they are added.
+            for layer in result:
+                if layer is not None:
+                    layer.moveToThread(QCoreApplication.instance().thread())
+        return (config,) + tuple(result)
+
+    def _finish_track(self, config: OrbitalConfig, point, line) -> None:
+        """Add the track of one item to the project (GUI thread).
 
         Args:
             config (OrbitalConfig): Track configuration.
-            facade (OrbitalTrackFacade): Processing facade.
+            point: Point file path or in-memory point layer.
+            line: Line file path or in-memory line layer, or None.
         """
         if config.output_path:
-            point_file, line_file = facade.process_persistent_track(config)
-            self.log_message(f"Files created: Point={point_file}, Line={line_file}", "INFO")
-            self._load_layer(point_file, "point")
-            self._load_layer(line_file, "line")
-            self.iface.messageBar().pushMessage(
-                self.tr("Success"),
-                self.tr(f"{config.file_format.capitalize()} created"),
-                level=0
-            )
+            self._finish_persistent_track(config, point, line)
+            return
+        if config.add_layer:
+            for layer in (point, line):
+                if layer is not None:
+                    QgsProject.instance().addMapLayer(layer)
+            if point is not None:
+                self.log_message("Temporary layers added: %d points.", "INFO", point.featureCount())
+            else:
+                self.log_message("Temporary track layer added: %d segments.", "INFO", line.featureCount())
+        self.iface.messageBar().pushMessage(
+            self.tr("Success"),
+            self.tr("Temporary layers created"),
+            level=0
+        )
+
+    def _finish_persistent_track(self, config: OrbitalConfig, point_file: str, line_file: str) -> None:
+        """Report written track files and load them into the project.
+
+        Args:
+            config (OrbitalConfig): Track configuration.
+            point_file (str): Path of the written point file.
+            line_file (str): Path of the written line file, or None.
+        """
+        self.log_message("Files created: Point=%s, Line=%s", "INFO", point_file, line_file)
+        self._load_layer(point_file, "point")
+        self._load_layer(line_file, "line")
+        self.iface.messageBar().pushMessage(
+            self.tr("Success"),
+            self.tr(f"{config.file_format.capitalize()} created"),
+            level=0
+        )
+
+    def _report_item_failure(self, item_name: str, is_local: bool, error: Exception) -> None:
+        """Show a per-item failure in the message bar (GUI thread).
+
+        Args:
+            item_name (str): File name or NORAD ID of the item.
+            is_local (bool): Whether the item is a local file.
+            error (Exception): Raised exception.
+        """
+        self.iface.messageBar().pushMessage(
+            self.tr("Warning"),
+            f"Failed to process {'file' if is_local else 'satellite'} {item_name}: {str(error)}",
+            level=2
+        )
+
+    def _log_item_outcome(self, run, item_name: str, is_local: bool, error: Exception = None) -> None:
+        """Log the outcome of one item with the progress and estimated time left of the run.
+
+        Args:
+            run (TrackGenerationTask): Running task.
+            item_name (str): File name or NORAD ID of the item.
+            is_local (bool): Whether the item is a local file.
+            error (Exception): Raised exception if the item failed.
+        """
+        done, total = run.processed_count(), len(run.sat_ids)
+        remaining = (time.time() - run.started_at) / done * (total - done)
+        item_type = "file" if is_local else "NORAD ID"
+        if error is not None:
+            self.log_message("Error processing %s %s: %s (%d/%d, about %.0f s left)", "ERROR",
+                             item_type, item_name, error, done, total, remaining)
         else:
-            point_layer, line_layer = facade.process_in_memory_track(config)
-            if config.add_layer:
-                QgsProject.instance().addMapLayer(point_layer)
-                QgsProject.instance().addMapLayer(line_layer)
-                self.log_message(f"Temporary layers added: {point_layer.featureCount()} points.", "INFO")
-            self.iface.messageBar().pushMessage(
-                self.tr("Success"),
-                self.tr("Temporary layers created"),
-                level=0
-            )
+            self.log_message("Processed %s: %s (%d/%d, about %.0f s left)", "INFO",
+                             item_type, item_name, done, total, remaining)
+
+    def _prepare_run(self, run) -> None:
+        """Open the retriever, facade, dataset writer and stage pipeline of a run (task thread).
 
-    def _process_item(self, item_id: int, inputs: dict, file_format: str, facade: OrbitalTrackFacade) -> bool:
-        """Process a single satellite or file.
+        Retrieval runs on several workers only when the retriever is thread-safe, and
+        output only when every track goes to its own files. Propagation processes, if
+        requested, replace the propagation threads.
 
         Args:
-            item_id (int): NORAD ID or file index.
-            inputs (dict): User inputs.
-            file_format (str): Output file format.
-            facade (OrbitalTrackFacade): Processing facade.
+            run (TrackGenerationTask): Running task.
+        """
+        from ..data_retriver.data_retriver import LocalFileRetriever
+
+        inputs = run.inputs
+        retriever = (
+            LocalFileRetriever(log_callback=self.log_message) if inputs["data_file_paths"]
+            else self._create_spacetrack_retriever(inputs)
+        )
+        process_workers = int(inputs.get("process_workers", 0))
+        propagator = None
+        if process_workers > 0:
+            from ..orbital_data_processor.process_pool import ProcessPoolPropagator
+
+            propagator = ProcessPoolPropagator(process_workers, log_callback=self.log_message)
+        run.facade = OrbitalTrackFacade(retriever, log_callback=self.log_message, propagator=propagator,
+                                        project_crs=inputs.get("project_crs"),
+                                        transform_context=inputs.get("transform_context"))
+        if not inputs["data_file_paths"] and (len(run.sat_ids) > 1 or inputs.get("incremental_sync")):
+            run.facade.prefetch_data(run.sat_ids, inputs["start_datetime"], inputs["data_format"])
+        run.writer = self._open_dataset_writer(inputs)
+
+        retrieve_workers = int(inputs.get("concurrent_requests", 1)) if retriever.thread_safe else 1
+        # With worker processes, each propagation thread only waits for one process.
+        propagate_workers = process_workers or int(inputs.get("propagate_workers", 1))
+        write_workers = int(inputs.get("write_workers", 1)) if run.writer is None and inputs["output_path"] else 1
+        run.pipeline = StagedPipeline([
+            Stage("retrieve", partial(self._retrieve_item, run), max(1, retrieve_workers)),
+            Stage("propagate", partial(self._propagate_item, run), max(1, propagate_workers)),
+            Stage("write", partial(self._write_item, run), max(1, write_workers)),
+        ], log_callback=self.log_message)
+        self.log_message("Pipeline workers: %s.", "INFO", ", ".join(
+            f"{stage.name} {stage.workers}" for stage in run.pipeline.stages))
+
+    def _process_chunk(self, run, items: list[int], task) -> bool:
+        """Pass one chunk of the items of a run through the stage pipeline (task thread).
+
+        Args:
+            run (TrackGenerationTask): Running task holding the pipeline.
+            items (list[int]): NORAD IDs or file indices of the chunk.
+            task (QgsTask): Subtask reporting progress and cancellation.
 
         Returns:
-            bool: True if successful, False otherwise.
+            bool: False if the task was canceled.
         """
-        is_local = bool(inputs["data_file_paths"])
-        item_name = os.path.basename(inputs["data_file_paths"][item_id]) if is_local else str(item_id)
+        is_local = self._is_file_items(run.inputs)
+        finished = itertools.count(1)
+
+        def on_result(item_id, result):
+            run.record(item_id, result)
+            self._log_item_outcome(run, self._item_name(run.inputs, item_id), is_local)
+            task.setProgress(100.0 * next(finished) / len(items))
+
+        def on_error(item_id, stage, error):
+            run.record(item_id, error=error)
+            self._log_item_outcome(run, self._item_name(run.inputs, item_id), is_local, error)
+            task.setProgress(100.0 * next(finished) / len(items))
+
+        return run.pipeline.run(items, on_result, on_error, task.isCanceled)
 
+    def _complete_run(self, run) -> None:
+        """Commit the consolidated dataset and release the retriever (task thread).
+
+        Args:
+            run (TrackGenerationTask): Task whose subtasks all completed.
+        """
         try:
-            config = (self._create_config_for_local_file if is_local else self._create_config_for_spacetrack)(
-                inputs, item_id, file_format
-            )
-            self.log_message(f"Processing {'file' if is_local else 'NORAD ID'}: {item_name}", "INFO")
-            self._process_track(config, facade)
-            self.log_message(f"Processed {'file' if is_local else 'NORAD ID'}: {item_name}", "INFO")
-            return True
+            if run.writer is not None:
+                run.dataset_uris = run.writer.close()
+        finally:
+            if run.facade is not None:
+                run.facade.close()
+                run.facade = None
+
+    def _abort_run(self, run) -> None:
+        """Roll back the consolidated dataset and release the retriever of a canceled or failed run.
+
+        Args:
+            run (TrackGenerationTask): Terminated task.
+        """
+        if run.writer is not None and run.dataset_uris is None:
+            run.writer.abort()
+        if run.facade is not None:
+            run.facade.close()
+            run.facade = None
+
+    def _finish_run(self, run, result: bool) -> None:
+        """Add the results of a run to the project and report it (GUI thread).
+
+        Args:
+            run (TrackGenerationTask): Finished task.
+            result (bool): True if the run completed, False if it was canceled or failed.
+        """
+        self._flush_log_buffer()
+        self.task = None
+        if self.dlg:
+            self.dlg.pushButtonExecute.setEnabled(True)
+
+        try:
+            if not result:
+                self._abort_run(run)
+            for item_id, config, point, line in run.results:
+                try:
+                    self._finish_track(config, point, line)
+                except Exception as e:
+                    self.log_message(f"Failed to add layers of {self._item_name(run.inputs, item_id)}: {str(e)}",
+                                     "ERROR")
+            is_local = self._is_file_items(run.inputs)
+            for item_id, error in run.failed:
+                self._report_item_failure(self._item_name(run.inputs, item_id), is_local, error)
+            if run.dataset_uris is not None:
+                self._load_dataset_layers(run.writer, run.dataset_uris)
         except Exception as e:
-            self.log_message(f"Error processing {'file' if is_local else 'NORAD ID'} {item_name}: {str(e)}", "ERROR")
-            self.iface.messageBar().pushMessage(
-                self.tr("Warning"),
-                f"Failed to process {'file' if is_local else 'satellite'} {item_name}: {str(e)}",
-                level=2
-            )
-            return False
+            self.log_message(f"Error: {str(e)}", "ERROR")
+            self.iface.messageBar().pushMessage("Error", str(e), level=3)
 
-    def _process_satellites(self, sat_ids: list[int], inputs: dict, file_format: str) -> tuple[list[int], list[int]]:
-        """Process all satellites or files.
+        if result:
+            done = set(run.successful)
+            successful = [item_id for item_id in run.sat_ids if item_id in done]
+            failed = [item_id for item_id, _ in run.failed]
+            self._log_summary(successful, failed, run.inputs, time.time() - run.started_at, run.pipeline)
+        elif run.exception is not None:
+            self.log_message(f"Error: {str(run.exception)}", "ERROR")
+            self.iface.messageBar().pushMessage("Error", str(run.exception), level=3)
+        else:
+            self.log_message(f"Process canceled after {run.processed_count()}/{len(run.sat_ids)} items.", "WARNING")
+            self.iface.messageBar().pushMessage(self.tr("Canceled"), self.tr("Track generation canceled"), level=1)
+        if self._close_log_pending:
+            self._close_logger()
+
+    def _create_spacetrack_retriever(self, inputs: dict):
+        """Create the Space-Track retriever; more than one concurrent request selects the async backend.
 
         Args:
-            sat_ids (list[int]): List of NORAD IDs or file indices.
             inputs (dict): User inputs.
-            file_format (str): Output file format.
 
         Returns:
-            tuple[list[int], list[int]]: (successful IDs, failed IDs).
+            SpaceTrackRetriever or AsyncSpaceTrackRetriever.
         """
-        from ..data_retriver.data_retriver import LocalFileRetriever
         from ..data_retriver.spacetrack_retriver import SpaceTrackRetriever
 
-        retriever = (
-            LocalFileRetriever(log_callback=self.log_message) if inputs["data_file_paths"]
-            else SpaceTrackRetriever(inputs["login"], inputs["password"], log_callback=self.log_message)
+        cache = self._open_element_cache(inputs)
+        if inputs.get("incremental_sync") and cache is not None:
+            # A sync is a few small batched queries, so the synchronous backend is used.
+            return SpaceTrackRetriever(inputs["login"], inputs["password"], log_callback=self.log_message,
+                                       cache=cache, incremental_sync=True)
+        concurrency = int(inputs.get("concurrent_requests", 1))
+        if concurrency > 1:
+            from ..data_retriver.async_spacetrack_retriver import AsyncSpaceTrackRetriever
+
+            self.log_message("Downloading element sets with up to %d concurrent requests.", "INFO", concurrency)
+            return AsyncSpaceTrackRetriever(inputs["login"], inputs["password"], log_callback=self.log_message,
+                                            cache=cache, max_concurrency=concurrency)
+        return SpaceTrackRetriever(inputs["login"], inputs["password"], log_callback=self.log_message, cache=cache)
+
+    def _open_element_cache(self, inputs: dict):
+        """Open the local element-set cache unless its TTL is set to zero.
+
+        Args:
+            inputs (dict): User inputs.
+
+        Returns:
+            ElementSetCache or None.
+        """
+        from ..spacetrack_client.element_cache import DEFAULT_TTL_HOURS, ElementSetCache
+
+        ttl_hours = inputs.get("cache_ttl_hours", DEFAULT_TTL_HOURS)
+        if ttl_hours <= 0:
+            return None
+        try:
+            return ElementSetCache(ttl_hours=ttl_hours, log_callback=self.log_message)
+        except (OSError, sqlite3.Error) as e:
+            self.log_message(f"Element-set cache unavailable, downloading all data: {str(e)}", "WARNING")
+            return None
+
+    def _open_dataset_writer(self, inputs: dict):
+        """Open the consolidated dataset when single-dataset output is requested.
+
+        Args:
+            inputs (dict): User inputs.
+
+        Returns:
+            ConsolidatedTrackWriter or None.
+        """
+        if not inputs.get("dataset_path"):
+            return None
+        self.log_message("Writing all tracks to %s", "INFO", inputs['dataset_path'])
+        if inputs["dataset_path"].lower().endswith(".mbtiles"):
+            from .orbital.mbtiles import MBTilesTrackWriter
+
+            return MBTilesTrackWriter(
+                inputs["dataset_path"], inputs["create_line_layer"], log_callback=self.log_message
+            )
+        from .orbital.consolidated import ConsolidatedTrackWriter
+
+        return ConsolidatedTrackWriter(
+            inputs["dataset_path"], inputs["create_line_layer"], log_callback=self.log_message
         )
-        facade = OrbitalTrackFacade(retriever, log_callback=self.log_message)
 
-        successful, failed = [], []
-        for item_id in sat_ids:
-            if self._process_item(item_id, inputs, file_format, facade):
-                successful.append(item_id)
-            else:
-                failed.append(item_id)
-        return successful, failed
+    def _load_dataset_layers(self, writer, uris: tuple) -> None:
+        """Load the layers of the committed consolidated dataset.
+
+        Args:
+            writer (ConsolidatedTrackWriter): Closed dataset writer.
+            uris (tuple): (points_uri, lines_uri) returned by the writer.
+        """
+        if not writer.track_count:
+            return
+        points_uri, lines_uri = uris
+        base_name = os.path.splitext(os.path.basename(writer.output_path))[0]
+        if writer.layer_provider == "vectortile":
+            self._load_vector_tile_layer(points_uri, base_name)
+            return
+        self._load_layer(points_uri, "point", f"{base_name}_points")
+        self._load_layer(lines_uri, "line", f"{base_name}_lines")
+        self.log_message("Filter a single satellite with the expression \"NORAD_ID\" = <id>.", "INFO")
 
-    def _log_summary(self, successful: list[int], failed: list[int], inputs: dict, duration: float) -> None:
+    def _log_summary(self, successful: list[int], failed: list[int], inputs: dict, duration: float,
+                     pipeline: StagedPipeline = None) -> None:
         """Log processing summary.
 
         Args:
@@ -457,19 +927,23 @@ class SpaceTracePlugin:
             failed (list[int]): IDs of failed items.
             inputs (dict): User inputs.
             duration (float): Processing time in seconds.
+            pipeline (StagedPipeline): Pipeline of the run whose stage throughput is reported, or None.
         """
-        is_local = bool(inputs["data_file_paths"])
+        is_local = self._is_file_items(inputs)
         item_type = "files" if is_local else "satellites"
         total = len(successful) + len(failed)
 
-        self.log_message(f"Completed in {duration:.2f} seconds.", "INFO")
-        self.log_message(f"Summary: {len(successful)}/{total} {item_type} processed.", "INFO")
+        self.log_message("Completed in %.2f seconds.", "INFO", duration)
+        self.log_message("Summary: %d/%d %s processed.", "INFO", len(successful), total, item_type)
+        if pipeline is not None:
+            for metrics in pipeline.metrics:
+                self.log_message("Stage %s", "INFO", metrics.summary())
 
         if successful:
-            names = [os.path.basename(inputs["data_file_paths"][i]) if is_local else str(i) for i in successful]
-            self.log_message(f"Successful {item_type}: {', '.join(names)}", "INFO")
+            names = [self._item_name(inputs, i) for i in successful]
+            self.log_message("Successful %s: %s", "INFO", item_type, ', '.join(names))
         if failed:
-            names = [os.path.basename(inputs["data_file_paths"][i]) if is_local else str(i) for i in failed]
+            names = [self._item_name(inputs, i) for i in failed]
             self.log_message(f"Failed {item_type}: {', '.join(names)}", "WARNING")
             self.iface.messageBar().pushMessage(
                 self.tr("Processing Complete"),
@@ -484,21 +958,32 @@ class SpaceTracePlugin:
             )
 
     def execute_logic(self):
-        """Run the main logic to generate orbital tracks."""
+        """Validate the inputs and start generating orbital tracks in a background task."""
         self.dlg.switch_to_log_tab()
+        if self.task is not None:
+            self.log_message("Track generation is already running.", "WARNING")
+            return
         self.log_message("Process started.", "INFO")
 
         try:
-            start_time = time.time()
             inputs = self.dlg.get_inputs()
             sat_ids, file_format, validated_output_path = self._validate_inputs(inputs)
             inputs["output_path"] = validated_output_path
             inputs["file_format"] = file_format
-            successful, failed = self._process_satellites(sat_ids, inputs, file_format)
-            self._log_summary(successful, failed, inputs, time.time() - start_time)
+            # QgsProject may only be read here on the GUI thread; the task's savers get copies.
+            project = QgsProject.instance()
+            inputs["project_crs"] = project.crs()
+            inputs["transform_context"] = project.transformContext()
+            task = TrackGenerationTask(self, sat_ids, inputs, file_format)
         except Exception as e:
             self.log_message(f"Error: {str(e)}", "ERROR")
             self.iface.messageBar().pushMessage("Error", str(e), level=3)
+            return
+
+        # The task manager does not keep a Python reference, so the task is held until it finishes.
+        self.task = task
+        self.dlg.pushButtonExecute.setEnabled(False)
+        QgsApplication.taskManager().addTask(task)
 
     def run(self):
         """Display the plugin dialog."""
@@ -510,6 +995,8 @@ class SpaceTracePlugin:
             self.dlg.rejected.connect(self._close_logger)
         else:
             self._init_logger()
+        self._close_log_pending = False
+        self._log_timer.start()
         self.dlg.show()
 
     def _on_close_dialog(self):
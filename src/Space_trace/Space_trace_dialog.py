@@ -80,7 +80,7 @@ class SpaceTracePluginDialog(SpaceTracePluginDialogBase):
         fmt = (self.comboBoxDataFormatLocal.currentText()
                if self.radioLocalFile.isChecked()
                else self.comboBoxDataFormatSpaceTrack.currentText())
-        filter_ = "Text Files (*.txt)" if fmt == "TLE" else "JSON Files (*.json)"
+        filter_ = "TLE Files (*.txt *.tle *.3le)" if fmt == "TLE" else "OMM Files (*.json *.csv)"
         
         # Allow multiple file selection for local files
         paths, _ = QFileDialog.getOpenFileNames(
@@ -97,7 +97,10 @@ class SpaceTracePluginDialog(SpaceTracePluginDialogBase):
         """Select output path for layer(s), handling multiple IDs or files."""
 
         data_source_local = self.radioLocalFile.isChecked()
-        if data_source_local:
+        if data_source_local and self.lineEditCatalogIDs.text().strip():
+            sat_ids = self._parse_satellite_ids(self.lineEditCatalogIDs.text())
+            num_items = len(sat_ids) if sat_ids else 1
+        elif data_source_local:
             data_file_path = self.lineEditDataPath.text().strip()
             num_items = len([path.strip() for path in data_file_path.split(';') if path.strip()]) if data_file_path else 1
         else:
@@ -120,7 +123,8 @@ class SpaceTracePluginDialog(SpaceTracePluginDialogBase):
                 self,
                 self.tr("Select Output File"),
                 "",
-                "Shapefiles (*.shp);;GeoPackage (*.gpkg);;GeoJSON (*.geojson);;All Files (*)"
+                "Shapefiles (*.shp);;GeoPackage (*.gpkg);;GeoJSON (*.geojson);;"
+                "GeoJSON Sequence (*.geojsonl *.geojsons);;MBTiles vector tiles (*.mbtiles);;All Files (*)"
             )
             if path:
                 self.lineEditOutputPath.setText(path)
@@ -132,7 +136,7 @@ class SpaceTracePluginDialog(SpaceTracePluginDialogBase):
         layout = QtWidgets.QVBoxLayout(dlg)
         layout.addWidget(QtWidgets.QLabel(self.tr("Select format for saving layers:")))
         combo = QtWidgets.QComboBox(dlg)
-        combo.addItems(["shp", "gpkg", "geojson"])
+        combo.addItems(["shp", "gpkg", "geojson", "geojsonl", "geojsons", "mbtiles"])
         layout.addWidget(combo)
         buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel, dlg)
         buttons.accepted.connect(dlg.accept)
@@ -182,7 +186,9 @@ class SpaceTracePluginDialog(SpaceTracePluginDialogBase):
             return
 
         dlg = SpaceTrackDialog(self, login=login, password=password,
-                               log_callback=self.appendLog, translator=self.translator)
+                               log_callback=self.appendLog, translator=self.translator,
+                               start_datetime=self.dateTimeEdit.dateTime().toPyDateTime(),
+                               cache_ttl_hours=self.spinBoxCacheTtl.value())
         if dlg.exec_() == QDialog.Accepted:
             ids = sorted(int(i) for i in dlg.get_selected_norad_ids())
             self.lineEditSatID.setText(self._format_id_ranges(ids))
@@ -247,6 +253,7 @@ class SpaceTracePluginDialog(SpaceTracePluginDialogBase):
             "data_file_paths": data_file_paths,  # List of file paths for local files
             "data_file_path": data_file_path,    # Original single path (for backward compatibility)
             "sat_id_text": self.lineEditSatID.text().strip(),
+            "catalog_id_text": self.lineEditCatalogIDs.text().strip() if data_source_local else "",
             "start_datetime": self.dateTimeEdit.dateTime().toPyDateTime(),
             "duration_hours": self.spinBoxDuration.value(),
             "step_minutes": self.spinBoxStepMinutes.value(),
@@ -260,6 +267,14 @@ class SpaceTracePluginDialog(SpaceTracePluginDialogBase):
                 else self.comboBoxDataFormatSpaceTrack.currentText()
             ),
             "create_line_layer": self.checkBoxCreateLineLayer.isChecked(),
+            "single_dataset": self.checkBoxSingleDataset.isChecked(),
+            "compact_track": self.checkBoxCompactTrack.isChecked(),
+            "write_workers": self.spinBoxWriteWorkers.value(),
+            "propagate_workers": self.spinBoxPropagateWorkers.value(),
+            "process_workers": self.spinBoxProcessWorkers.value(),
+            "cache_ttl_hours": self.spinBoxCacheTtl.value(),
+            "concurrent_requests": self.spinBoxConcurrentRequests.value(),
+            "incremental_sync": self.checkBoxIncrementalSync.isChecked(),
             "save_data": save_data,
             "save_data_path": self.lineEditSaveDataPath.text().strip() if save_data else ""
         }
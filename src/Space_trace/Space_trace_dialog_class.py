@@ -72,6 +72,9 @@ class SpaceTracePluginDialogBase(QDialog):
         self.comboBoxDataFormatLocal = QtWidgets.QComboBox(self.groupBoxLocalFile)
         self.comboBoxDataFormatLocal.addItems(["TLE", "OMM"])
         lf_layout.addWidget(self.comboBoxDataFormatLocal)
+        self.lineEditCatalogIDs = QtWidgets.QLineEdit(self.groupBoxLocalFile)
+        self.lineEditCatalogIDs.setPlaceholderText("NORAD IDs to take from a catalog file (optional)")
+        lf_layout.addWidget(self.lineEditCatalogIDs)
         main_layout.addWidget(self.groupBoxLocalFile)
         self.groupBoxLocalFile.setEnabled(False)
         self.groupBoxLocalFile.hide()
@@ -99,6 +102,26 @@ class SpaceTracePluginDialogBase(QDialog):
         self.lineEditPassword.setPlaceholderText("Enter your SpaceTrack account password")
         self.lineEditPassword.setEchoMode(QtWidgets.QLineEdit.Password)
         st_layout.addWidget(self.lineEditPassword)
+
+        hl_cache = QtWidgets.QHBoxLayout()
+        hl_cache.setSpacing(5)
+        self.labelCacheTtl = QtWidgets.QLabel("Element cache TTL (hours, 0 = off):", self.groupBoxSpaceTrack)
+        self.spinBoxCacheTtl = QtWidgets.QDoubleSpinBox(self.groupBoxSpaceTrack)
+        self.spinBoxCacheTtl.setRange(0, 168)
+        self.spinBoxCacheTtl.setDecimals(1)
+        self.spinBoxCacheTtl.setValue(6)
+        hl_cache.addWidget(self.labelCacheTtl)
+        hl_cache.addWidget(self.spinBoxCacheTtl)
+        self.labelConcurrentRequests = QtWidgets.QLabel("Concurrent requests:", self.groupBoxSpaceTrack)
+        self.spinBoxConcurrentRequests = QtWidgets.QSpinBox(self.groupBoxSpaceTrack)
+        self.spinBoxConcurrentRequests.setRange(1, 16)
+        self.spinBoxConcurrentRequests.setValue(1)
+        hl_cache.addWidget(self.labelConcurrentRequests)
+        hl_cache.addWidget(self.spinBoxConcurrentRequests)
+        self.checkBoxIncrementalSync = QtWidgets.QCheckBox("Incremental sync", self.groupBoxSpaceTrack)
+        hl_cache.addWidget(self.checkBoxIncrementalSync)
+        hl_cache.addStretch()
+        st_layout.addLayout(hl_cache)
         
         self.comboBoxDataFormatSpaceTrack = QtWidgets.QComboBox(self.groupBoxSpaceTrack)
         self.comboBoxDataFormatSpaceTrack.addItems(["TLE", "OMM"])
@@ -153,6 +176,35 @@ class SpaceTracePluginDialogBase(QDialog):
         self.checkBoxCreateLineLayer = QtWidgets.QCheckBox("Create line layer", self.groupBoxOutput)
         self.checkBoxCreateLineLayer.setChecked(True)
         out_layout.addWidget(self.checkBoxCreateLineLayer)
+
+        self.checkBoxSingleDataset = QtWidgets.QCheckBox("Write all satellites to one GeoPackage", self.groupBoxOutput)
+        out_layout.addWidget(self.checkBoxSingleDataset)
+
+        self.checkBoxCompactTrack = QtWidgets.QCheckBox("Compact track (one LineStringZM per segment, time as M)", self.groupBoxOutput)
+        out_layout.addWidget(self.checkBoxCompactTrack)
+
+        hl_workers = QtWidgets.QHBoxLayout()
+        hl_workers.setSpacing(5)
+        self.labelWriteWorkers = QtWidgets.QLabel("Parallel file writers:", self.groupBoxOutput)
+        self.spinBoxWriteWorkers = QtWidgets.QSpinBox(self.groupBoxOutput)
+        self.spinBoxWriteWorkers.setRange(1, max(1, os.cpu_count() or 1))
+        self.spinBoxWriteWorkers.setValue(min(4, self.spinBoxWriteWorkers.maximum()))
+        hl_workers.addWidget(self.labelWriteWorkers)
+        hl_workers.addWidget(self.spinBoxWriteWorkers)
+        self.labelPropagateWorkers = QtWidgets.QLabel("Propagation workers:", self.groupBoxOutput)
+        self.spinBoxPropagateWorkers = QtWidgets.QSpinBox(self.groupBoxOutput)
+        self.spinBoxPropagateWorkers.setRange(1, max(1, os.cpu_count() or 1))
+        self.spinBoxPropagateWorkers.setValue(min(2, self.spinBoxPropagateWorkers.maximum()))
+        hl_workers.addWidget(self.labelPropagateWorkers)
+        hl_workers.addWidget(self.spinBoxPropagateWorkers)
+        self.labelProcessWorkers = QtWidgets.QLabel("Propagation processes:", self.groupBoxOutput)
+        self.spinBoxProcessWorkers = QtWidgets.QSpinBox(self.groupBoxOutput)
+        self.spinBoxProcessWorkers.setRange(0, max(1, os.cpu_count() or 1))
+        self.spinBoxProcessWorkers.setValue(0)
+        hl_workers.addWidget(self.labelProcessWorkers)
+        hl_workers.addWidget(self.spinBoxProcessWorkers)
+        hl_workers.addStretch()
+        out_layout.addLayout(hl_workers)
         
         main_layout.addWidget(self.groupBoxOutput)
 
@@ -226,6 +278,13 @@ class SpaceTracePluginDialogBase(QDialog):
         self.pushButtonBrowseOutput.setText(_translate("SpaceTracePluginDialog", "Browse"))
         self.checkBoxAddLayer.setText(_translate("SpaceTracePluginDialog", "Add created layer to project"))
         self.checkBoxCreateLineLayer.setText(_translate("SpaceTracePluginDialog", "Create line layer"))
+        self.checkBoxSingleDataset.setText(_translate("SpaceTracePluginDialog", "Write all satellites to one GeoPackage"))
+        self.checkBoxCompactTrack.setText(_translate("SpaceTracePluginDialog", "Compact track (one LineStringZM per segment, time as M)"))
+        self.labelWriteWorkers.setText(_translate("SpaceTracePluginDialog", "Parallel file writers:"))
+        self.labelPropagateWorkers.setText(_translate("SpaceTracePluginDialog", "Propagation workers:"))
+        self.labelProcessWorkers.setText(_translate("SpaceTracePluginDialog", "Propagation processes:"))
+        self.labelCacheTtl.setText(_translate("SpaceTracePluginDialog", "Element cache TTL (hours, 0 = off):"))
+        self.labelConcurrentRequests.setText(_translate("SpaceTracePluginDialog", "Concurrent requests:"))
         self.groupBoxSaveData.setTitle(_translate("SpaceTracePluginDialog", "Save Received Data"))
         self.checkBoxSaveData.setText(_translate("SpaceTracePluginDialog", "Save TLE/OMM data"))
         self.pushButtonBrowseSaveData.setText(_translate("SpaceTracePluginDialog", "Browse"))
@@ -238,6 +297,7 @@ class SpaceTracePluginDialogBase(QDialog):
         self.quickButton_1_day.setText(_translate("SpaceTracePluginDialog", "1 day"))
         self.quickButton_1_week.setText(_translate("SpaceTracePluginDialog", "1 week"))
         self.lineEditDataPath.setPlaceholderText(_translate("SpaceTracePluginDialog", "Specify the path to the TLE/OMM data file(s)"))
+        self.lineEditCatalogIDs.setPlaceholderText(_translate("SpaceTracePluginDialog", "NORAD IDs to take from a catalog file (optional)"))
         self.lineEditOutputPath.setPlaceholderText(_translate("SpaceTracePluginDialog", "Specify the path to save file (leave empty for temporary layer)"))
         self.lineEditSaveDataPath.setPlaceholderText(_translate("SpaceTracePluginDialog", "Specify the path to save received data"))
         self.labelDuration.setText(_translate("SpaceTracePluginDialog", "Duration (hours):"))
\ No newline at end of file
@@ -0,0 +1,349 @@
+"""
+This module contains a read-only QGIS vector data provider that serves point
+features lazily from columnar propagation arrays.
+
+The arrays produced by the orbital processors are kept as they are; a QgsFeature
+is only built when QGIS iterates the layer for rendering, identify or export.
+"""
+
+import sys
+import uuid
+from datetime import datetime
+
+import numpy as np
+from qgis.core import (
+    QgsAbstractFeatureIterator,
+    QgsAbstractFeatureSource,
+    QgsCoordinateReferenceSystem,
+    QgsCoordinateTransform,
+    QgsCsException,
+    QgsDataProvider,
+    QgsExpressionContext,
+    QgsExpressionContextUtils,
+    QgsFeature,
+    QgsFeatureIterator,
+    QgsFeatureRequest,
+    QgsField,
+    QgsFields,
+    QgsGeometry,
+    QgsPointXY,
+    QgsProviderMetadata,
+    QgsProviderRegistry,
+    QgsRectangle,
+    QgsVectorDataProvider,
+    QgsVectorLayer,
+    QgsWkbTypes,
+)
+from PyQt5.QtCore import QVariant, QDateTime
+
+from .saver import FileSaver
+from .temporal import SortedTimeIndex, configure_temporal_properties
+
+PROVIDER_KEY = "spacetrace_array"
+
+# Columnar datasets by key; providers created for a layer URI look their arrays up here.
+_datasets = {}
+
+
+def _attribute_columns(columns):
+    """Return the attribute arrays in the order of FileSaver.point_fields (without Point_ID/Date_Time)."""
+    return [
+        columns["lat"], columns["lon"], columns["alt"], columns["velocity"], columns["azimuth"],
+        columns["trajectory_arc"], columns["true_anomaly"], columns["inclination"],
+    ]
+
+
+def _point_fields():
+    """Build the point layer fields; Date_Time is a DateTime field as in memory layers."""
+    fields = QgsFields()
+    for name, vtype in FileSaver.point_fields:
+        fields.append(QgsField(name, QVariant.DateTime if name == "Date_Time" else vtype))
+    return fields
+
+
+class ArrayFeatureIterator(QgsAbstractFeatureIterator):
+    """Iterates the features of an ArrayFeatureSource, building each QgsFeature on demand."""
+
+    def __init__(self, source, request):
+        super().__init__(request)
+        self._request = request if request is not None else QgsFeatureRequest()
+        self._source = source
+        self._position = 0
+        self._transform = QgsCoordinateTransform()
+        self._expression_context = None
+        if self._request.destinationCrs().isValid() and self._request.destinationCrs() != source.crs:
+            self._transform = QgsCoordinateTransform(
+                source.crs, self._request.destinationCrs(), self._request.transformContext()
+            )
+        try:
+            filter_rect = self.filterRectToSourceCrs(self._transform)
+        except QgsCsException:
+            self._ids = np.empty(0, dtype=np.int64)
+            return
+        self._ids = self._candidate_ids(filter_rect)
+        if self._request.filterType() == QgsFeatureRequest.FilterExpression:
+            self._expression_context = QgsExpressionContext(
+                QgsExpressionContextUtils.globalProjectLayerScopes(None)
+            )
+            self._expression_context.setFields(source.fields)
+
+    def _temporal_window(self):
+        """
+        Return the (start, end) map time range of a temporal render request, or None.
+
+        The layer is in redraw-only temporal mode, so the renderer applies no filter
+        of its own; the range comes from the map settings expression variables.
+        """
+        context = self._request.expressionContext()
+        if context is None or not context.hasVariable("map_start_time"):
+            return None
+        start, end = context.variable("map_start_time"), context.variable("map_end_time")
+        if not isinstance(start, QDateTime) or not isinstance(end, QDateTime):
+            return None
+        return start.toPyDateTime(), end.toPyDateTime()
+
+    def _candidate_ids(self, filter_rect):
+        """Resolve fid, time window and rectangle filters with vectorized lookups over the columns."""
+        source = self._source
+        filter_type = self._request.filterType()
+        if filter_type == QgsFeatureRequest.FilterFid:
+            fid = self._request.filterFid()
+            return np.array([fid] if 0 <= fid < source.count else [], dtype=np.int64)
+        window = self._temporal_window()
+        if window is not None and source.time_index is not None:
+            ids = source.time_index.ids_between(window[0], window[1], include_end=False)
+        else:
+            ids = np.arange(source.count, dtype=np.int64)
+        if filter_type == QgsFeatureRequest.FilterFids:
+            fids = np.fromiter(self._request.filterFids(), dtype=np.int64)
+            ids = np.intersect1d(ids, fids, assume_unique=True)
+        if filter_rect is not None and not filter_rect.isNull():
+            lon, lat = source.columns["lon"][ids], source.columns["lat"][ids]
+            mask = ((lon >= filter_rect.xMinimum()) & (lon <= filter_rect.xMaximum()) &
+                    (lat >= filter_rect.yMinimum()) & (lat <= filter_rect.yMaximum()))
+            ids = ids[mask]
+        return ids
+
+    def fetchFeature(self, f):
+        """Materialize the next matching feature into f."""
+        while self._position < len(self._ids):
+            fid = int(self._ids[self._position])
+            self._position += 1
+            self._source.fill_feature(f, fid, self._request.flags() & QgsFeatureRequest.NoGeometry)
+            if self._expression_context is not None:
+                self._expression_context.setFeature(f)
+                if not self._request.filterExpression().evaluate(self._expression_context):
+                    continue
+            self.geometryToDestinationCrs(f, self._transform)
+            return True
+        return False
+
+    def __iter__(self):
+        self._position = 0
+        return self
+
+    def __next__(self):
+        feature = QgsFeature()
+        if not self.nextFeature(feature):
+            raise StopIteration
+        return feature
+
+    def rewind(self):
+        self._position = 0
+        return True
+
+    def close(self):
+        self._position = len(self._ids)
+        return True
+
+
+class ArrayFeatureSource(QgsAbstractFeatureSource):
+    """Snapshot of a provider's arrays that feature iterators read from."""
+
+    def __init__(self, provider):
+        super().__init__()
+        self.columns = provider.columns
+        self.count = provider.count
+        self.fields = provider.fields()
+        self.crs = provider.crs()
+        self.time_index = provider.time_index
+        self._attributes = _attribute_columns(self.columns) if self.count else []
+        self._times = self.columns["time"] if self.count else None
+
+    def fill_feature(self, f, fid, no_geometry=False):
+        """Populate f with the attributes and geometry of sample fid."""
+        f.setFields(self.fields, True)
+        f.setId(fid)
+        dt = self._times[fid].astype("datetime64[ms]").astype(datetime)
+        f.setAttributes([fid, QDateTime(dt)] + [float(col[fid]) for col in self._attributes])
+        if no_geometry:
+            f.clearGeometry()
+        else:
+            f.setGeometry(QgsGeometry.fromPointXY(
+                QgsPointXY(float(self.columns["lon"][fid]), float(self.columns["lat"][fid]))
+            ))
+        f.setValid(True)
+
+    def getFeatures(self, request):
+        return QgsFeatureIterator(ArrayFeatureIterator(self, request))
+
+
+class ArrayProvider(QgsVectorDataProvider):
+    """
+    Read-only vector data provider over columnar propagation arrays.
+
+    The layer URI is ``key=<dataset key>`` as returned by register_dataset().
+    Extent, feature count and the sorted time index are computed once from the arrays.
+    """
+
+    @classmethod
+    def providerKey(cls):
+        return PROVIDER_KEY
+
+    @classmethod
+    def description(cls):
+        return "SpaceTrace columnar track provider"
+
+    @classmethod
+    def createProvider(cls, uri, providerOptions, flags=QgsDataProvider.ReadFlags()):
+        return ArrayProvider(uri, providerOptions, flags)
+
+    def __init__(self, uri="", providerOptions=QgsDataProvider.ProviderOptions(),
+                 flags=QgsDataProvider.ReadFlags()):
+        super().__init__(uri, providerOptions, flags)
+        params = dict(part.split("=", 1) for part in uri.split("&") if "=" in part)
+        self._key = params.get("key")
+        self.columns = _datasets.get(self._key)
+        self._is_valid = self.columns is not None
+        self._fields = _point_fields()
+        self._crs = QgsCoordinateReferenceSystem("EPSG:4326")
+        self.count = len(self.columns["time"]) if self._is_valid else 0
+        self._extent = QgsRectangle()
+        self.time_index = None
+        if self.count:
+            lon, lat = self.columns["lon"], self.columns["lat"]
+            self._extent = QgsRectangle(float(lon.min()), float(lat.min()), float(lon.max()), float(lat.max()))
+            self.time_index = SortedTimeIndex(self.columns["time"])
+
+    def featureSource(self):
+        return ArrayFeatureSource(self)
+
+    def getFeatures(self, request=QgsFeatureRequest()):
+        return QgsFeatureIterator(ArrayFeatureIterator(ArrayFeatureSource(self), request))
+
+    def dataSourceUri(self, expandAuthConfig=False):
+        return f"key={self._key}"
+
+    def storageType(self):
+        return "SpaceTrace columnar arrays"
+
+    def wkbType(self):
+        return QgsWkbTypes.Point
+
+    def featureCount(self):
+        return self.count
+
+    def fields(self):
+        return self._fields
+
+    def capabilities(self):
+        return QgsVectorDataProvider.SelectAtId | QgsVectorDataProvider.ReadLayerMetadata
+
+    def extent(self):
+        return self._extent
+
+    def updateExtents(self):
+        pass
+
+    def isValid(self):
+        return self._is_valid
+
+    def crs(self):
+        return self._crs
+
+    def name(self):
+        return self.providerKey()
+
+    def dataset_key(self):
+        return self._key
+
+
+def _create_provider(uri, providerOptions, flags=QgsDataProvider.ReadFlags()):
+    """
+    Provider factory of the registered metadata.
+
+    The provider class is looked up in the module as it is loaded now, so metadata
+    that outlives a plugin reload does not serve layers from the arrays of the old module.
+    """
+    return sys.modules[__name__].ArrayProvider.createProvider(uri, providerOptions, flags)
+
+
+def register_array_provider():
+    """
+    Register ArrayProvider with the QGIS provider registry once per session.
+
+    :return: True if the provider is available.
+    """
+    registry = QgsProviderRegistry.instance()
+    if PROVIDER_KEY in registry.providerList():
+        return True
+    metadata = QgsProviderMetadata(PROVIDER_KEY, ArrayProvider.description(), _create_provider)
+    return registry.registerProvider(metadata)
+
+
+def unregister_array_provider():
+    """
+    Remove ArrayProvider from the provider registry when the plugin is unloaded.
+
+    QGIS versions without QgsProviderRegistry.unregisterProvider() keep the metadata;
+    its factory then resolves to the provider of the reloaded module.
+
+    :return: True if the provider is no longer registered.
+    """
+    registry = QgsProviderRegistry.instance()
+    if PROVIDER_KEY not in registry.providerList():
+        return True
+    unregister = getattr(registry, "unregisterProvider", None)
+    return bool(unregister and unregister(PROVIDER_KEY))
+
+
+def is_array_provider_registered():
+    """Return True if ArrayProvider can be used for new layers."""
+    return PROVIDER_KEY in QgsProviderRegistry.instance().providerList()
+
+
+def register_dataset(columns):
+    """
+    Keep columnar arrays available to providers and return their key.
+
+    :param columns: Dict of arrays keyed by ORBITAL_COLUMNS.
+    :return: Dataset key used in the layer URI.
+    """
+    key = uuid.uuid4().hex
+    _datasets[key] = columns
+    return key
+
+
+def release_dataset(key):
+    """Drop the arrays of a dataset once no layer uses them."""
+    _datasets.pop(key, None)
+
+
+def create_array_layer(columns, layer_name):
+    """
+    Create a point layer served by ArrayProvider from columnar arrays.
+
+    The layer is set up for the temporal controller in redraw-only mode: the
+    provider narrows each frame to its time window through the sorted time index
+    instead of evaluating a filter expression per feature. The arrays are released
+    when the layer is deleted.
+
+    :param columns: Dict of arrays keyed by ORBITAL_COLUMNS.
+    :param layer_name: Name of the layer.
+    :return: QgsVectorLayer.
+    """
+    key = register_dataset(columns)
+    layer = QgsVectorLayer(f"key={key}", layer_name, PROVIDER_KEY)
+    layer.willBeDeleted.connect(lambda: release_dataset(key))
+    configure_temporal_properties(layer, redraw_only=True)
+    return layer
@@ -0,0 +1,196 @@
+"""
+This module contains the ConsolidatedTrackWriter class which writes the tracks of
+many satellites into a single GeoPackage with one points table and one lines table.
+"""
+
+import os
+from typing import Callable, Optional
+
+from osgeo import ogr, osr
+
+from ...orbital_data_processor.orbital_data_processor import ORBITAL_COLUMNS, points_to_columns
+
+# OGR time zone flag of UTC values.
+OGR_TZ_UTC = 100
+
+
+class ConsolidatedTrackWriter:
+    """
+    Writes the tracks of all satellites of a run into one GeoPackage.
+
+    Every feature carries an indexed NORAD_ID column, so a whole constellation is
+    loaded as a single points layer and a single lines layer that can be filtered
+    per satellite. All tables are written inside one dataset transaction that is
+    committed by close(); coordinates are stored in EPSG:4326.
+    """
+    # Tracks are added from columnar propagation results.
+    columnar = True
+    # Kind of QGIS layer the output is opened as.
+    layer_provider = "ogr"
+    points_table = "points"
+    lines_table = "lines"
+    point_fields = [
+        ("NORAD_ID", ogr.OFTInteger),
+        ("Point_ID", ogr.OFTInteger),
+        ("Date_Time", ogr.OFTDateTime),
+        ("Latitude", ogr.OFTReal),
+        ("Longitude", ogr.OFTReal),
+        ("Altitude", ogr.OFTReal),
+        ("Velocity", ogr.OFTReal),
+        ("Azimuth", ogr.OFTReal),
+        ("TrajectoryArc", ogr.OFTReal),
+        ("TrueAnomaly", ogr.OFTReal),
+        ("Inclination", ogr.OFTReal),
+    ]
+    line_fields = [
+        ("NORAD_ID", ogr.OFTInteger),
+        ("ID", ogr.OFTInteger),
+    ]
+
+    def __init__(self, output_path: str, create_line: bool = True,
+                 log_callback: Optional[Callable[[str, str], None]] = None):
+        """
+        Create the GeoPackage and its tables and open the write transaction.
+
+        :param output_path: Path of the .gpkg file; an existing file is replaced.
+        :param create_line: Whether the lines table should be created.
+        :param log_callback: Optional function to handle logging.
+        :raises RuntimeError: If the dataset cannot be created.
+        """
+        self.output_path = output_path
+        self.create_line = create_line
+        self.log_callback = log_callback
+        self.track_count = 0
+
+        driver = ogr.GetDriverByName("GPKG")
+        if os.path.exists(output_path):
+            driver.DeleteDataSource(output_path)
+        self.dataset = driver.CreateDataSource(output_path)
+        if self.dataset is None:
+            self._log(f"Failed to create GeoPackage: {output_path}", "ERROR")
+            raise RuntimeError(f"Failed to create GeoPackage: {output_path}")
+
+        srs = osr.SpatialReference()
+        srs.ImportFromEPSG(4326)
+        srs.SetAxisMappingStrategy(osr.OAMS_TRADITIONAL_GIS_ORDER)
+        self.points_layer = self._create_table(self.points_table, ogr.wkbPoint, srs, self.point_fields)
+        self.lines_layer = (self._create_table(self.lines_table, ogr.wkbLineString, srs, self.line_fields)
+                            if create_line else None)
+
+        self.dataset.StartTransaction()
+        self._log("Opened consolidated GeoPackage %s", "DEBUG", output_path)
+
+    def _log(self, message: str, level: str = "INFO", *args):
+        """
+        Log a message using the provided callback if available.
+
+        :param message: Message to log, a %-format string if args are given.
+        :param level: Log level ("INFO", "DEBUG", "WARNING", "ERROR").
+        :param args: Values the sink substitutes into message, only if the level is logged.
+        """
+        if self.log_callback:
+            if args:
+                self.log_callback(message, level, *args)
+            else:
+                self.log_callback(message, level)
+
+    def _create_table(self, name, geom_type, srs, fields):
+        """Create a table with the given geometry type and fields."""
+        layer = self.dataset.CreateLayer(name, srs, geom_type, options=["SPATIAL_INDEX=YES"])
+        for field_name, field_type in fields:
+            layer.CreateField(ogr.FieldDefn(field_name, field_type))
+        return layer
+
+    def add_track(self, norad_id: int, points, segments=None) -> None:
+        """
+        Append the track of one satellite given as point tuples.
+
+        :param norad_id: NORAD ID stored in the NORAD_ID column.
+        :param points: List of point‐tuples: (datetime, lon, lat, alt, vel, az, arc, ta, inc).
+        :param segments: List of line segments, each a list of (lon, lat, ...) tuples.
+        """
+        self.add_track_columns(norad_id, points_to_columns(points), segments)
+
+    def add_track_columns(self, norad_id: int, columns, segments=None) -> None:
+        """
+        Append the track of one satellite given as columnar arrays.
+
+        Date_Time is set from its date and time components, so the stored value does
+        not depend on how the GDAL version parses date strings.
+
+        :param norad_id: NORAD ID stored in the NORAD_ID column.
+        :param columns: Dict of arrays keyed by ORBITAL_COLUMNS.
+        :param segments: List of line segments, each a list of (lon, lat, ...) tuples.
+        """
+        norad_id = int(norad_id)
+        defn = self.points_layer.GetLayerDefn()
+        norad_index = defn.GetFieldIndex("NORAD_ID")
+        point_id_index = defn.GetFieldIndex("Point_ID")
+        date_index = defn.GetFieldIndex("Date_Time")
+        value_indexes = [defn.GetFieldIndex(name) for name, _ in self.point_fields[3:]]
+        # point_fields lists Latitude before Longitude, ORBITAL_COLUMNS lists lon first.
+        value_columns = [columns[name].tolist() for name in ("lat", "lon") + ORBITAL_COLUMNS[3:]]
+        times = columns["time"].astype("datetime64[us]").tolist()
+        lons, lats = value_columns[1], value_columns[0]
+
+        for i, dt in enumerate(times):
+            feat = ogr.Feature(defn)
+            feat.SetField(norad_index, norad_id)
+            feat.SetField(point_id_index, i)
+            feat.SetField(date_index, dt.year, dt.month, dt.day, dt.hour, dt.minute,
+                          dt.second + dt.microsecond / 1e6, OGR_TZ_UTC)
+            for index, values in zip(value_indexes, value_columns):
+                feat.SetField(index, values[i])
+            geom = ogr.Geometry(ogr.wkbPoint)
+            geom.AddPoint_2D(lons[i], lats[i])
+            feat.SetGeometry(geom)
+            self.points_layer.CreateFeature(feat)
+
+        if self.lines_layer is not None and segments:
+            defn = self.lines_layer.GetLayerDefn()
+            for i, seg in enumerate(segments, start=1):
+                feat = ogr.Feature(defn)
+                feat.SetField("NORAD_ID", norad_id)
+                feat.SetField("ID", i)
+                geom = ogr.Geometry(ogr.wkbLineString)
+                for vertex in seg:
+                    geom.AddPoint_2D(vertex[0], vertex[1])
+                feat.SetGeometry(geom)
+                self.lines_layer.CreateFeature(feat)
+
+        self.track_count += 1
+        self._log("Added %d points of NORAD ID %s to %s", "DEBUG", len(times), norad_id, self.output_path)
+
+    def close(self):
+        """
+        Create the NORAD_ID and Date_Time indexes and commit the transaction.
+
+        :return: Tuple (points_uri, lines_uri) suitable for the "ogr" provider.
+        """
+        self.dataset.ExecuteSQL(
+            f"CREATE INDEX IF NOT EXISTS idx_{self.points_table}_norad_id "
+            f"ON {self.points_table} (NORAD_ID, Point_ID)"
+        )
+        self.dataset.ExecuteSQL(
+            f"CREATE INDEX IF NOT EXISTS idx_{self.points_table}_date_time "
+            f"ON {self.points_table} (Date_Time)"
+        )
+        if self.lines_layer is not None:
+            self.dataset.ExecuteSQL(
+                f"CREATE INDEX IF NOT EXISTS idx_{self.lines_table}_norad_id "
+                f"ON {self.lines_table} (NORAD_ID)"
+            )
+        self.dataset.CommitTransaction()
+        self.dataset = None
+        self._log("Committed %d tracks to %s", "INFO", self.track_count, self.output_path)
+        return (
+            f"{self.output_path}|layername={self.points_table}",
+            f"{self.output_path}|layername={self.lines_table}" if self.create_line else None,
+        )
+
+    def abort(self):
+        """Roll back everything written since the dataset was opened."""
+        if self.dataset is not None:
+            self.dataset.RollbackTransaction()
+            self.dataset = None
+            self._log(f"Rolled back consolidated GeoPackage {self.output_path}", "WARNING")
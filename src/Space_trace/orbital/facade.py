@@ -2,37 +2,51 @@
 This module contains the OrbitalTrackFacade class that orchestrates the process
 of retrieving TLE/OMM data and generating orbital track layers.
 """
-import os
-import json
+import threading
 
+from ...data_retriver.element_archive import ElementArchive
 from .handler import OrbitalLogicHandler
+from ...orbital_data_processor.orbital_data_processor import iso_date_unit
 
 class OrbitalTrackFacade:
     """
     Orchestrates the process of retrieving TLE/OMM data and generating orbital tracks.
     """
 
-    def __init__(self, retriever, log_callback=None):
+    def __init__(self, retriever, log_callback=None, archive=None, propagator=None, project_crs=None,
+                 transform_context=None):
         """
         Initialize with a data retriever and computation engine.
 
         :param retriever: Instance of DataRetriever.
         :param engine: Instance of ComputationEngine.
         :param log_callback: Function to handle logging.
+        :param archive: ElementArchive receiving saved data; the default archive is opened on first save.
+        :param propagator: Optional ProcessPoolPropagator running the propagation on worker processes.
+        :param project_crs: Project CRS captured on the GUI thread for the savers; None reads the current project.
+        :param transform_context: Project transform context captured with project_crs.
         """
         self.retriever = retriever
-        self.logic_handler = OrbitalLogicHandler(log_callback=log_callback)
+        self.archive = archive
+        self._archive_lock = threading.Lock()
+        self.propagator = propagator
+        self.logic_handler = OrbitalLogicHandler(log_callback=log_callback, propagator=propagator,
+                                                 project_crs=project_crs, transform_context=transform_context)
         self.log_callback = log_callback
 
-    def _log(self, message, level="INFO"):
+    def _log(self, message, level="INFO", *args):
         """
         Log a message to both the file and the UI log window via the callback, if available.
 
-        :param message: The log message.
+        :param message: The log message, a %-format string if args are given.
         :param level: Log level ("INFO", "DEBUG", "WARNING", "ERROR").
+        :param args: Values the sink substitutes into message, only if the level is logged.
         """
         if self.log_callback:
-            self.log_callback(message, level)
+            if args:
+                self.log_callback(message, level, *args)
+            else:
+                self.log_callback(message, level)
 
     def _retrieve_data(self, config):
         """
@@ -44,21 +58,17 @@ class OrbitalTrackFacade:
         """
         data_format = config.data_format
         source = config.data_file_path if config.data_file_path else "SpaceTrack API"
-        self._log(f"Retrieving data from {source} for SatID: {config.sat_id or 'local'}, "
-                f"Start: {config.start_datetime}, Format: {data_format}", "INFO")
+        self._log("Retrieving data from %s for SatID: %s, Start: %s, Format: %s", "INFO",
+                  source, config.sat_id or 'local', config.start_datetime, data_format)
         
         try:
             data = self.retriever.retrieve_data(config)
             if not self._verify_data(data, data_format):
                 raise Exception(f"No data received for format: {data_format}")
             
-            # Save data if specified in config
-            if config.save_data and config.save_data_path:
-                if data_format == "TLE":
-                    self._save_tle_data(data, config.save_data_path)
-                elif data_format == "OMM":
-                    self._save_omm_data(data, config.save_data_path)
-            
+            if config.save_data:
+                self._archive_data(data, config)
+
             return data
         except Exception as e:
             self._log(f"Error retrieving or processing data: {str(e)}", "ERROR")
@@ -75,76 +85,103 @@ class OrbitalTrackFacade:
         if not data:
             self._log(f"No data received for format: {data_format}", "ERROR")
             return False
-        self._log(f"Successfully received data for format: {data_format}", "INFO")
+        self._log("Successfully received data for format: %s", "INFO", data_format)
         return True
 
-    def _save_tle_data(self, tle_data, output_path):
+    def _archive_data(self, data, config):
         """
-        Save TLE data to a file.
-        """
-        output_path = os.path.splitext(output_path)[0]
-        tle_filename = f"{output_path}_tle.txt"
-        with open(tle_filename, 'w') as f:
-            f.write(f"{tle_data[0]}\n{tle_data[1]}\n")
-        self._log(f"TLE data saved to {tle_filename}", "INFO")
+        Store retrieved data in the element archive and export it to save_data_path if one is set.
 
-    def _save_omm_data(self, omm_data, output_path):
-        """
-        Save OMM data to a JSON file.
+        :param data: Retrieved TLE or OMM data.
+        :param config: OrbitalConfig instance with settings.
         """
-        output_path = os.path.splitext(output_path)[0]
-        json_filename = f"{output_path}_omm.json"
-        with open(json_filename, "w") as f:
-            json.dump(omm_data, f, indent=4)
-        self._log(f"OMM data saved to {json_filename}", "INFO")
+        with self._archive_lock:
+            # Several retrieval workers may save at once; they share one archive.
+            if self.archive is None:
+                self.archive = ElementArchive(log_callback=self.log_callback)
+        digests = self.archive.add(data, config.data_format)
+        if config.save_data_path:
+            self.archive.export(digests, config.data_format, config.save_data_path)
 
-    def process_persistent_track(self, config):
+    def retrieve_data(self, config):
         """
-        Generate persistent orbital track shapefiles using configuration settings.
+        Retrieve TLE/OMM data for a configuration without generating a track.
 
         :param config: An OrbitalConfig instance containing all settings.
-        :return: Tuple (points_file, line_file).
+        :return: Retrieved TLE or OMM data.
+        :raises Exception: If data retrieval fails.
         """
-        self._log(f"Processing persistent track for SatID: {config.sat_id}, Start: {config.start_datetime}, "
-                f"Duration: {config.duration_hours} hours, Format: {config.data_format}", "INFO")
-        
-        data = self._retrieve_data(config)
-        if not data:
-            return None
-        
-        return self.logic_handler.create_persistent_orbital_track(
-        data, config.data_format, config.start_datetime, config.duration_hours, config.step_minutes,
-        config.output_path, config.file_format, config.create_line_layer, config.sat_id
-    )
+        return self._retrieve_data(config)
 
-    def process_in_memory_track(self, config):
+    def prefetch_data(self, sat_ids, start_datetime, data_format):
         """
-        Generate temporary in-memory QGIS layers.
+        Batch-retrieve data for many satellites before they are processed one by one.
 
-        :param config: An OrbitalConfig instance containing all settings.
-        :return: Tuple (point_layer, line_layer).
-        :raises Exception: If data folder creation or data retrieval fails.
+        Failures are logged and leave per-satellite retrieval in place.
+
+        :param sat_ids: List of NORAD IDs.
+        :param start_datetime: Start date and time of the tracks.
+        :param data_format: Data format ("TLE" or "OMM").
+        :return: Number of satellites whose data was prefetched.
         """
-        self._log(f"Processing in-memory track for SatID: {config.sat_id}, Start: {config.start_datetime}, "
-                f"Duration: {config.duration_hours} hours, Format: {config.data_format}", "INFO")
-        plugin_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-        data_folder = os.path.join(plugin_dir, "data")
-        
         try:
-            if not os.path.exists(data_folder):
-                os.makedirs(data_folder)
-                self._log(f"Created data folder at: {data_folder}", "INFO")
-            elif not os.access(data_folder, os.W_OK):
-                raise Exception(f"Data folder {data_folder} is not writable")
+            return self.retriever.prefetch(sat_ids, start_datetime, data_format)
         except Exception as e:
-            self._log(f"Failed to create or access data folder: {str(e)}", "ERROR")
-            raise
-        
-        default_output_path = os.path.join(data_folder, f"{config.sat_id or 'local'}_{config.start_datetime.strftime('%Y%m%d%H%M')}")
-        config.save_data_path = config.save_data_path or default_output_path
-        
-        data = self._retrieve_data(config)
-        return self.logic_handler.create_in_memory_layers(
-            data, config.data_format, config.start_datetime, config.duration_hours, 
-            config.step_minutes, config.create_line_layer, config.sat_id
+            self._log(f"Batch retrieval failed, falling back to per-satellite requests: {str(e)}", "WARNING")
+            return 0
+
+    def close(self):
+        """Release the retriever and the propagation processes once all tracks of a run are processed."""
+        try:
+            self.retriever.close()
+        finally:
+            if self.propagator is not None:
+                self.propagator.close()
+
+    def propagate_track(self, config, data, writer=None):
+        """
+        Propagate already retrieved data without writing it.
+
+        Together with write_track() this turns retrieved data into a track in a CPU step
+        and an output step that can run on different threads.
+
+        :param config: An OrbitalConfig instance containing all settings.
+        :param data: TLE or OMM data returned by retrieve_data.
+        :param writer: Open ConsolidatedTrackWriter if the track goes to a shared dataset.
+        :return: Propagated track in the form its output is written from; chunks stay a lazy
+                 iterable that write_track() propagates while it writes them, so a streamed
+                 track is never held in memory as a whole.
+        """
+        if writer is not None:
+            shape = self.logic_handler.track_shape("dataset", columnar=writer.columnar)
+        else:
+            shape = self.logic_handler.track_shape(config.file_format if config.output_path else "memory",
+                                                   config.compact_track)
+        return self.logic_handler.propagate_track(
+            data, config.data_format, config.start_datetime, config.duration_hours, config.step_minutes,
+            shape, config.chunk_size
+        )
+
+    def write_track(self, config, data, track, writer=None):
+        """
+        Write a track returned by propagate_track() to its output.
+
+        :param config: An OrbitalConfig instance containing all settings.
+        :param data: TLE or OMM data the track was propagated from.
+        :param track: Result of propagate_track().
+        :param writer: Open ConsolidatedTrackWriter if the track goes to a shared dataset.
+        :return: Tuple (points_file, line_file) for files, (point_layer, line_layer) for
+                 in-memory output, or None for a shared dataset.
+        """
+        if writer is not None:
+            norad_id = self.logic_handler._norad_from_data(data, config.data_format) or config.sat_id
+            self.logic_handler.write_dataset_track(track, writer, norad_id)
+            return None
+        if config.output_path:
+            return self.logic_handler.write_persistent_track(
+                track, config.output_path, config.file_format, config.create_line_layer, config.sat_id,
+                config.compact_track, iso_date_unit(config.start_datetime, config.step_minutes)
+            )
+        return self.logic_handler.write_memory_layers(
+            track, config.data_format, config.create_line_layer, config.sat_id, config.compact_track
         )
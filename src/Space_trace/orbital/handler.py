@@ -7,7 +7,9 @@ for orbital track computation and layer creation from TLE or OMM data.
 
 import os
 from qgis.core import (QgsGeometry, QgsPointXY, QgsCoordinateReferenceSystem)
-from .saver import FactoryProvider
+from .saver import FactoryProvider, STREAMING_FORMATS
+from .measured import measured_geometry, measured_vertices, times_to_m
+from ...orbital_data_processor.orbital_data_processor import DEFAULT_CHUNK_SIZE, columns_to_points
 
 class OrbitalLogicHandler:
     """
@@ -17,37 +19,56 @@ class OrbitalLogicHandler:
     from TLE or OMM data.
     """
 
-    def __init__(self, log_callback=None):
+    def __init__(self, log_callback=None, propagator=None, project_crs=None, transform_context=None):
+        """
+        :param log_callback: Optional function to handle logging.
+        :param propagator: Optional ProcessPoolPropagator running the propagation on worker processes.
+        :param project_crs: Project CRS captured on the GUI thread; None reads the current project.
+        :param transform_context: Project transform context captured with project_crs.
+        """
         self.log_callback=log_callback
+        self.propagator = propagator
+        self.project_crs = project_crs
+        self.transform_context = transform_context
 
-    def _log(self, message: str, level: str = "INFO"):
+    def _log(self, message: str, level: str = "INFO", *args):
         """
         Log a message using the provided callback if available.
 
-        :param message: Message to log.
+        :param message: Message to log, a %-format string if args are given.
         :param level: Log level ("INFO", "DEBUG", "WARNING", "ERROR").
+        :param args: Values the sink substitutes into message, only if the level is logged.
         """
         if self.log_callback:
-            self.log_callback(message, level)
+            if args:
+                self.log_callback(message, level, *args)
+            else:
+                self.log_callback(message, level)
 
     def get_line_segments(self, points):
         """
         Generate line segments from a list of points based on the split type.
 
-        :param points: List of (lon, lat) tuples.
-        :return: List of segments, where each segment is a list of (lon, lat) tuples.
+        Points may carry extra values after lon and lat (e.g. altitude and time as
+        (lon, lat, alt, m)); they are interpolated linearly at inserted split vertices.
+
+        :param points: List of (lon, lat) or (lon, lat, *extra) tuples.
+        :return: List of segments, where each segment is a list of tuples like the input.
         """
         if not points:
             raise ValueError("Points list is empty.")
 
+        def extra_at(p1, p2, t):
+            return tuple(a + t * (b - a) for a, b in zip(p1[2:], p2[2:]))
+
         segments = []
         current_segment = [points[0]]
 
         for i in range(len(points) - 1):
             p1 = points[i]
             p2 = points[i + 1]
-            lon1, lat1 = p1
-            lon2, lat2 = p2
+            lon1, lat1 = p1[0], p1[1]
+            lon2, lat2 = p2[0], p2[1]
 
             delta_lon = lon2 - lon1
             delta_lat = lat2 - lat1
@@ -59,21 +80,23 @@ class OrbitalLogicHandler:
                 if delta_lon < -180:
                     t = (180 - lon1) / (lon2 + 360 - lon1)
                     lat_interp = lat1 + t * delta_lat
-                    current_segment.append((180, lat_interp))
+                    extra = extra_at(p1, p2, t)
+                    current_segment.append((180, lat_interp) + extra)
                     segments.append(current_segment)
-                    current_segment = [(-180, lat_interp), p2]
+                    current_segment = [(-180, lat_interp) + extra, p2]
                 elif delta_lon > 180:
                     t = (-180 - lon1) / (lon2 - 360 - lon1)
                     lat_interp = lat1 + t * delta_lat
-                    current_segment.append((-180, lat_interp))
+                    extra = extra_at(p1, p2, t)
+                    current_segment.append((-180, lat_interp) + extra)
                     segments.append(current_segment)
-                    current_segment = [(180, lat_interp), p2]
+                    current_segment = [(180, lat_interp) + extra, p2]
             elif cross_pole:
                 # Interpolate crossing at the pole (lat = ±90), longitude undefined, but we use ±180
                 t = (90 - abs(lat1)) / (abs(lat2 - lat1))
                 pole_lat = 90.0 if lat2 > lat1 else -90.0
                 pole_lon = 180.0  # Or any constant, as longitude at pole is degenerate
-                interpolated_point = (pole_lon, pole_lat)
+                interpolated_point = (pole_lon, pole_lat) + extra_at(p1, p2, t)
                 current_segment.append(interpolated_point)
                 segments.append(current_segment)
                 current_segment = [interpolated_point, p2]
@@ -106,14 +129,13 @@ class OrbitalLogicHandler:
             return f"{base}{suffix}.gpkg"
         elif file_format == 'geojson':
             return f"{base}{suffix}.geojson"
+        elif file_format in STREAMING_FORMATS:
+            return f"{base}{suffix}.{file_format}"
 
-    def create_track_from_points(self, points, output_path, file_format, create_line, norad_id=None):
+    def _ensure_output_dir(self, output_path):
         """
-        Save point and optional line shapefiles from propagated points.
+        Create the parent directory of output_path if it does not exist.
         """
-        if not points:
-            raise ValueError("No points provided to create track.")
-        
         if output_path:
             output_dir = os.path.dirname(output_path)
             if output_dir and not os.path.exists(output_dir):
@@ -123,11 +145,25 @@ class OrbitalLogicHandler:
                     self._log(f"Failed to create output directory: {str(e)}", "ERROR")
                     raise RuntimeError(f"Failed to create output directory: {str(e)}")
 
-
+    def _get_saver(self, file_format):
+        """
+        Create a saver for the given output format with EPSG:4326 input coordinates.
+        """
         input_crs = QgsCoordinateReferenceSystem("EPSG:4326")
         factory = FactoryProvider.get_factory(file_format)
-        saver = factory.get_saver(log_callback=self.log_callback, input_crs=input_crs)
-        
+        return factory.get_saver(log_callback=self.log_callback, input_crs=input_crs,
+                                 project_crs=self.project_crs, transform_context=self.transform_context)
+
+    def create_track_from_points(self, points, output_path, file_format, create_line, norad_id=None):
+        """
+        Save point and optional line shapefiles from propagated points.
+        """
+        if not points:
+            raise ValueError("No points provided to create track.")
+
+        self._ensure_output_dir(output_path)
+        saver = self._get_saver(file_format)
+
         try:
             saver.save_points(points, output_path, norad_id=norad_id)
             line_file = None
@@ -141,17 +177,126 @@ class OrbitalLogicHandler:
             self._log(f"Error creating track: {str(e)}", "ERROR")
             raise RuntimeError(f"Failed to create track: {str(e)}")
 
+    def create_compact_track(self, columns, output_path, file_format, norad_id=None):
+        """
+        Save a track as LineStringZM features, one per continuous segment.
+
+        Z holds the altitude and M the sample time in epoch seconds, so the per-sample
+        positions are kept in the geometry instead of one point feature per sample.
+
+        :param columns: Dict of arrays keyed by ORBITAL_COLUMNS.
+        :param output_path: Path of the track file, or None for an in-memory layer.
+        :param file_format: Output file format ('shp', 'gpkg' or 'memory').
+        :return: Track file path, or the in-memory layer.
+        """
+        if not len(columns["time"]):
+            raise ValueError("No points provided to create track.")
+
+        segments = [seg for seg in self.get_line_segments(measured_vertices(columns)) if len(seg) > 1]
+        geometries = [measured_geometry(seg) for seg in segments]
+        saver = self._get_saver(file_format)
+        if saver.is_memory():
+            layer_name = f"Track_{norad_id}" if norad_id else "Track"
+            return saver.save_lines(geometries, layer_name, norad_id, geometry_type="LineStringZM")
+
+        self._ensure_output_dir(output_path)
+        try:
+            saver.save_lines(geometries, output_path, norad_id, geometry_type="LineStringZM")
+        except Exception as e:
+            self._log(f"Error creating track: {str(e)}", "ERROR")
+            raise RuntimeError(f"Failed to create track: {str(e)}")
+        self._log("Saved %d samples as %d measured lines to %s", "INFO", len(columns["time"]), len(geometries),
+                  output_path)
+        return output_path
+
+    def create_streamed_track(self, chunks, output_path, file_format, create_line, norad_id=None, date_unit=None):
+        """
+        Append point and optional line features chunk by chunk as they are propagated.
+
+        Only savers with supports_streaming are accepted. The last vertex of each chunk
+        is carried over so the line stays continuous across chunk boundaries.
+
+        :param chunks: Iterable of columnar propagation results (dicts keyed by ORBITAL_COLUMNS).
+        :param output_path: Path of the point file.
+        :param file_format: Streaming output format ('geojsonl', 'geojsons').
+        :param create_line: Boolean to indicate if line file should be created.
+        :param date_unit: Date precision of the run from iso_date_unit(); None decides per chunk.
+        :return: Tuple (points_file, line_file).
+        """
+        self._ensure_output_dir(output_path)
+        saver = self._get_saver(file_format)
+        if not saver.supports_streaming:
+            raise ValueError(f"Format {file_format} does not support streamed output")
+
+        line_file = self._adjust_output_path(output_path, file_format, norad_id) if create_line else None
+        try:
+            saver.begin(output_path)
+            if line_file:
+                saver.begin(line_file)
+
+            point_count, line_count, tail = 0, 0, None
+            for columns in chunks:
+                point_count += saver.append_point_columns(columns, output_path, start_id=point_count,
+                                                          date_unit=date_unit)
+                if not line_file or not len(columns["time"]):
+                    continue
+                coords = list(zip(columns["lon"].tolist(), columns["lat"].tolist()))
+                if tail is not None:
+                    coords.insert(0, tail)
+                tail = coords[-1]
+                segments = [seg for seg in self.get_line_segments(coords) if len(seg) > 1]
+                line_count += saver.append_line_segments(segments, line_file, start_id=line_count + 1)
+
+            if not point_count:
+                raise ValueError("No points provided to create track.")
+            self._log("Streamed %d points and %d lines to %s", "INFO", point_count, line_count, output_path)
+            return output_path, line_file
+        except Exception as e:
+            self._log(f"Error creating track: {str(e)}", "ERROR")
+            raise RuntimeError(f"Failed to create track: {str(e)}")
+
+    def add_track_to_dataset(self, points, writer, norad_id):
+        """
+        Append propagated points and their line segments to a consolidated dataset.
+
+        :param points: List of point tuples from the processor.
+        :param writer: Open ConsolidatedTrackWriter.
+        :param norad_id: NORAD ID stored with every feature.
+        """
+        if not points:
+            raise ValueError("No points provided to create track.")
+        segments = self.get_line_segments([(pt[1], pt[2]) for pt in points]) if writer.create_line else None
+        writer.add_track(norad_id, points, segments)
+
+    def add_columns_to_dataset(self, columns, writer, norad_id):
+        """
+        Append columnar propagation results and their timed line segments to a columnar dataset.
+
+        :param columns: Dict of arrays keyed by ORBITAL_COLUMNS.
+        :param writer: Open writer with columnar = True (ConsolidatedTrackWriter or MBTilesTrackWriter).
+        :param norad_id: NORAD ID stored with every feature.
+        """
+        if not len(columns["time"]):
+            raise ValueError("No points provided to create track.")
+        segments = None
+        if writer.create_line:
+            segments = self.get_line_segments(list(zip(
+                columns["lon"].tolist(), columns["lat"].tolist(), times_to_m(columns["time"]).tolist()
+            )))
+        writer.add_track_columns(norad_id, columns, segments)
+
     def create_memory_layers_from_points(self, points, data_format, create_line,  norad_id=None):
         """
         Create in-memory QGIS layers from propagated points.
+
+        The layers get a spatial index after bulk insertion and the point layer a sorted
+        time index, so temporal.features_between() resolves time ranges without
+        evaluating expressions.
         """
         if not points:
             raise ValueError("No points provided to create track.")
 
-        input_crs = QgsCoordinateReferenceSystem("EPSG:4326")
-
-        factory = FactoryProvider.get_factory("memory")
-        saver = factory.get_saver(log_callback=self.log_callback, input_crs=input_crs)
+        saver = self._get_saver("memory")
         point_layer = saver.save_points(points, norad_id=norad_id)
         line_layer = None
         if create_line:
@@ -159,72 +304,154 @@ class OrbitalLogicHandler:
             line_layer = saver.save_lines(geometries, norad_id=norad_id)
         return point_layer, line_layer
 
-    def create_persistent_orbital_track(self, data, data_format, start_datetime, duration_hours, step_minutes, output_path, file_format, create_line, norad_id):
+    def create_array_layers_from_columns(self, columns, create_line, norad_id=None):
+        """
+        Create in-memory QGIS layers whose points are served lazily from columnar arrays.
+
+        :param columns: Dict of arrays keyed by ORBITAL_COLUMNS.
+        :param create_line: Boolean to indicate if line layer should be created.
+        :return: Tuple (point_layer, line_layer).
+        """
+        from .array_provider import create_array_layer
+
+        if not len(columns["time"]):
+            raise ValueError("No points provided to create track.")
+
+        point_layer = create_array_layer(columns, f"Points_{norad_id}" if norad_id else "Points")
+        line_layer = None
+        if create_line:
+            geometries = self.generate_line_geometries(
+                list(zip(columns["lon"].tolist(), columns["lat"].tolist()))
+            )
+            line_layer = self._get_saver("memory").save_lines(geometries, norad_id=norad_id)
+        return point_layer, line_layer
+
+    def track_shape(self, file_format, compact=False, columnar=False):
         """
-        Create persistent orbital track files from data.
+        Return the form of propagation result a track output is written from.
+
+        :param file_format: Output file format, 'memory' for in-memory layers or 'dataset' for a consolidated dataset.
+        :param compact: Whether the track is written as LineStringZM features.
+        :param columnar: Whether the consolidated dataset takes columns (writer.columnar).
+        :return: 'columns', 'chunks' or 'points'.
+        """
+        if compact or columnar:
+            return "columns"
+        if file_format == "memory":
+            from .array_provider import is_array_provider_registered
+
+            return "columns" if is_array_provider_registered() else "points"
+        if file_format in STREAMING_FORMATS:
+            return "chunks"
+        return "points"
+
+    def propagate_track(self, data, data_format, start_datetime, duration_hours, step_minutes, shape="points",
+                        chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Propagate data without writing it.
+
+        Chunks are a lazy iterable, propagated while the writer consumes them, unless a
+        process pool propagates the whole track at once and the chunks are slices of it.
 
         :param data: TLE or OMM data.
         :param data_format: Data format ('TLE' or 'OMM').
         :param start_datetime: Start datetime for propagation.
         :param duration_hours: Duration in hours.
         :param step_minutes: Time step in minutes.
-        :param output_path: Path for saving output files.
-        :param file_format: Output file format ('shp', 'gpkg', 'geojson').
-        :param create_line: Boolean to indicate if line layer should be created.
-        :return: Tuple (points_file, line_file).
+        :param shape: Form of the result returned by track_shape().
+        :param chunk_size: Number of samples per chunk for the 'chunks' shape.
+        :return: Dict of arrays, iterable of such dicts, or list of point tuples.
         """
+        if self.propagator is not None:
+            columns = self.propagator.propagate_columns(data, data_format, start_datetime, duration_hours, step_minutes)
+            if shape == "columns":
+                return columns
+            if shape == "chunks":
+                return ({name: column[offset:offset + chunk_size] for name, column in columns.items()}
+                        for offset in range(0, len(columns["time"]), chunk_size))
+            return columns_to_points(columns)
         processor = self._get_processor(data, data_format)
-        points = processor.propagate(start_datetime, duration_hours, step_minutes)
-        return self.create_track_from_points(points, output_path, file_format, create_line, norad_id)
+        if shape == "columns":
+            return processor.propagate_columns(start_datetime, duration_hours, step_minutes)
+        if shape == "chunks":
+            return processor.propagate_chunks(start_datetime, duration_hours, step_minutes, chunk_size)
+        return processor.propagate(start_datetime, duration_hours, step_minutes)
+
+    def write_persistent_track(self, track, output_path, file_format, create_line, norad_id, compact=False,
+                               date_unit=None):
+        """
+        Write a propagated track to files.
 
-    def create_in_memory_layers(self, data, data_format, start_datetime, duration_hours, step_minutes, create_line, norad_id):
+        :param track: Result of propagate_track() in the shape of track_shape(file_format, compact).
+        :param output_path: Path for saving output files.
+        :param file_format: Output file format.
+        :param create_line: Boolean to indicate if line file should be created.
+        :param compact: Write one LineStringZM track file instead of point and line files.
+        :param date_unit: Date precision of the run from iso_date_unit(), used for streamed chunks.
+        :return: Tuple (points_file, line_file); points_file is None for compact output.
         """
-        Create in-memory QGIS layers from data.
+        if compact:
+            return None, self.create_compact_track(track, output_path, file_format, norad_id)
+        if file_format in STREAMING_FORMATS:
+            return self.create_streamed_track(track, output_path, file_format, create_line, norad_id, date_unit)
+        return self.create_track_from_points(track, output_path, file_format, create_line, norad_id)
 
-        :param data: TLE or OMM data.
+    def write_memory_layers(self, track, data_format, create_line, norad_id, compact=False):
+        """
+        Create in-memory QGIS layers from a propagated track.
+
+        :param track: Result of propagate_track() in the shape of track_shape('memory', compact).
         :param data_format: Data format ('TLE' or 'OMM').
-        :param start_datetime: Start datetime for propagation.
-        :param duration_hours: Duration in hours.
-        :param step_minutes: Time step in minutes.
         :param create_line: Boolean to indicate if line layer should be created.
-        :return: Tuple (point_layer, line_layer).
+        :param compact: Create one LineStringZM track layer instead of point and line layers.
+        :return: Tuple (point_layer, line_layer); point_layer is None for compact output.
         """
-        
-        processor = self._get_processor(data, data_format)
-        points = processor.propagate(start_datetime, duration_hours, step_minutes)
-        return self.create_memory_layers_from_points(points, data_format, create_line, norad_id)
-    
+        if compact:
+            return None, self.create_compact_track(track, None, "memory", norad_id)
+        if isinstance(track, dict):
+            return self.create_array_layers_from_columns(track, create_line, norad_id)
+        return self.create_memory_layers_from_points(track, data_format, create_line, norad_id)
+
+    def write_dataset_track(self, track, writer, norad_id):
+        """
+        Append a propagated track to a consolidated dataset.
+
+        :param track: Result of propagate_track() in the shape of track_shape('dataset', columnar=writer.columnar).
+        :param writer: Open ConsolidatedTrackWriter or MBTilesTrackWriter.
+        :param norad_id: NORAD ID stored with every feature.
+        """
+        if writer.columnar:
+            self.add_columns_to_dataset(track, writer, norad_id)
+        else:
+            self.add_track_to_dataset(track, writer, norad_id)
+
+    def _norad_from_data(self, data, data_format):
+        """
+        Read the NORAD catalog number from TLE or OMM data.
+
+        :return: NORAD ID as int, or None if it cannot be determined.
+        """
+        try:
+            if data_format == "TLE":
+                return int(data[0][2:7])
+            if data_format == "OMM":
+                return int(data[0]["NORAD_CAT_ID"])
+        except (TypeError, ValueError, KeyError, IndexError):
+            pass
+        return None
+
     def _get_processor(self, data, data_format):
         """
         Create an OrbitalDataProcessor based on data format.
 
+        OMM records are initialized from their mean elements; TLE lines inside the
+        record are only used when the mean elements are missing.
+
         :param data: TLE or OMM data.
         :param data_format: Data format ('TLE' or 'OMM').
         :return: OrbitalDataProcessorInterface instance.
         :raises ValueError: If data format is unsupported.
         """
-        from ...orbital_data_processor.skyfield import SkyfieldOrbitalDataProcessor
-
-        if data_format == "TLE":
-            if not isinstance(data, (list, tuple)) or len(data) < 3:
-                error_msg = f"Incorrect TLE data: expected at least 3 elements (got {type(data)} of length {len(data)})"
-                self._log(f"[_get_processor] {error_msg}", "ERROR")
-                raise ValueError(error_msg)
-            
-            tle1, tle2, inc = data[0], data[1], data[2]
-
-            self._log(f"[_get_processor] TLE_LINE1 is {'not empty' if tle1 else 'EMPTY'}", 
-                      "WARNING" if not tle1 else "DEBUG")
-            self._log(f"[_get_processor] TLE_LINE2 is {'not empty' if tle2 else 'EMPTY'}", 
-                      "WARNING" if not tle2 else "DEBUG")
-
-            return SkyfieldOrbitalDataProcessor("N", tle1, tle2, self.log_callback)
-        
-        elif data_format == "OMM":
-            record = data[0]
-            tle_1 = record.get("TLE_LINE1")
-            tle_2 = record.get("TLE_LINE2")
-            inc = record.get("INCLINATION")
-            return SkyfieldOrbitalDataProcessor("N", tle_1, tle_2, self.log_callback)
-        else:
-            raise ValueError(f"Unsupported data format: {data_format}")
\ No newline at end of file
+        from ...orbital_data_processor.skyfield import create_processor
+
+        return create_processor(data, data_format, self.log_callback)
\ No newline at end of file
@@ -0,0 +1,467 @@
+"""
+This module contains the MBTilesTrackWriter class which tiles the tracks of many
+satellites into a Mapbox Vector Tile pyramid stored in a single MBTiles file.
+
+QGIS opens the result as a vector tile layer and only decodes the tiles in view,
+so whole constellations stay responsive. Tiles are built from columnar propagation
+results: every track is projected once and cut into tiles for all zoom levels when
+it is added. Tile features are moved to a staging SQLite file next to the output
+whenever enough of them are buffered, so memory stays bounded for long runs; close()
+merges the staged features of each tile, encodes it and writes the MBTiles file.
+"""
+
+import gzip
+import itertools
+import json
+import os
+import pickle
+import sqlite3
+import struct
+from typing import Callable, Optional
+
+import numpy as np
+
+from ...orbital_data_processor.orbital_data_processor import column_date_unit, format_iso_dates, points_to_columns
+from .measured import m_to_times
+
+DEFAULT_MIN_ZOOM = 0
+DEFAULT_MAX_ZOOM = 6
+TILE_EXTENT = 4096
+MAX_MERCATOR_LAT = 85.0511287798
+
+_POINT, _LINESTRING = 1, 2
+
+
+def _varint(value: int) -> bytes:
+    """Encode an unsigned integer as a protobuf varint."""
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _zigzag(value: int) -> int:
+    """Zigzag-encode a signed integer."""
+    return (value << 1) ^ (value >> 63)
+
+
+def _field(number: int, payload: bytes) -> bytes:
+    """Encode a length-delimited protobuf field."""
+    return _varint((number << 3) | 2) + _varint(len(payload)) + payload
+
+
+def _uint_field(number: int, value: int) -> bytes:
+    """Encode a varint protobuf field."""
+    return _varint(number << 3) + _varint(value)
+
+
+def _encode_value(value) -> bytes:
+    """Encode an attribute value as an MVT Value message."""
+    if isinstance(value, str):
+        return _field(1, value.encode("utf-8"))
+    if isinstance(value, (int, np.integer)):
+        return _varint(6 << 3) + _varint(_zigzag(int(value)))
+    return _varint((3 << 3) | 1) + struct.pack("<d", float(value))
+
+
+def _clip_edge(x0, y0, x1, y1, low, high):
+    """
+    Clip an edge to the square [low, high] x [low, high] (Liang-Barsky).
+
+    :return: ((x, y), (x, y)) rounded to integers, or None if nothing of the edge is inside.
+    """
+    t0, t1 = 0.0, 1.0
+    dx, dy = x1 - x0, y1 - y0
+    for p, q in ((-dx, x0 - low), (dx, high - x0), (-dy, y0 - low), (dy, high - y0)):
+        if p == 0:
+            if q < 0:
+                return None
+            continue
+        t = q / p
+        if p < 0:
+            if t > t1:
+                return None
+            t0 = max(t0, t)
+        else:
+            if t < t0:
+                return None
+            t1 = min(t1, t)
+    start = (round(x0 + t0 * dx), round(y0 + t0 * dy))
+    end = (round(x0 + t1 * dx), round(y0 + t1 * dy))
+    return (start, end) if start != end else None
+
+
+def _line_geometry(runs) -> list:
+    """Build MVT command integers for a (multi)linestring given as runs of (x, y) tile coordinates."""
+    commands, cx, cy = [], 0, 0
+    for run in runs:
+        x, y = run[0]
+        commands += [(1 & 0x7) | (1 << 3), _zigzag(x - cx), _zigzag(y - cy)]
+        cx, cy = x, y
+        commands.append((2 & 0x7) | ((len(run) - 1) << 3))
+        for x, y in run[1:]:
+            commands += [_zigzag(x - cx), _zigzag(y - cy)]
+            cx, cy = x, y
+    return commands
+
+
+def encode_tile(layers: dict, extent: int = TILE_EXTENT) -> bytes:
+    """
+    Encode features as a Mapbox Vector Tile.
+
+    :param layers: Dict layer name -> list of (feature_id, attributes dict, geometry type, commands).
+    :param extent: Tile extent in tile coordinate units.
+    :return: Uncompressed MVT protobuf bytes.
+    """
+    tile = bytearray()
+    for name, features in layers.items():
+        if not features:
+            continue
+        keys, values, key_index, value_index = [], [], {}, {}
+        encoded_features = bytearray()
+        for fid, attributes, geom_type, commands in features:
+            tags = []
+            for key, value in attributes.items():
+                if key not in key_index:
+                    key_index[key] = len(keys)
+                    keys.append(key)
+                value_key = (type(value).__name__, value)
+                if value_key not in value_index:
+                    value_index[value_key] = len(values)
+                    values.append(value)
+                tags += [key_index[key], value_index[value_key]]
+            feature = (
+                _uint_field(1, fid)
+                + _field(2, b"".join(_varint(tag) for tag in tags))
+                + _uint_field(3, geom_type)
+                + _field(4, b"".join(_varint(command) for command in commands))
+            )
+            encoded_features += _field(2, feature)
+        layer = (
+            _uint_field(15, 2)
+            + _field(1, name.encode("utf-8"))
+            + bytes(encoded_features)
+            + b"".join(_field(3, key.encode("utf-8")) for key in keys)
+            + b"".join(_field(4, _encode_value(value)) for value in values)
+            + _uint_field(5, extent)
+        )
+        tile += _field(3, layer)
+    return bytes(tile)
+
+
+def mercator_unit(lon, lat):
+    """
+    Project lon/lat arrays to Web Mercator normalized to [0, 1] with y pointing south.
+
+    :return: Tuple (u, v) of float arrays.
+    """
+    lat = np.clip(np.asarray(lat, dtype=float), -MAX_MERCATOR_LAT, MAX_MERCATOR_LAT)
+    u = (np.asarray(lon, dtype=float) + 180.0) / 360.0
+    v = 0.5 - np.log(np.tan(np.pi / 4 + np.radians(lat) / 2)) / (2 * np.pi)
+    return u, v
+
+
+class MBTilesTrackWriter:
+    """
+    Writes the tracks of all satellites of a run into one MBTiles vector tile pyramid.
+
+    The "points" layer holds the samples thinned per zoom level, with NORAD_ID,
+    Point_ID, Date_Time and Altitude attributes; the "lines" layer holds the track
+    segments clipped to each tile plus tile_buffer, with NORAD_ID, Start_Time and
+    End_Time attributes. Simplification snaps vertices to the tile grid of each zoom
+    level and drops vertices that fall on the same cell as their predecessor.
+    """
+    # Tracks are added from columnar propagation results.
+    columnar = True
+    # Kind of QGIS layer the output is opened as.
+    layer_provider = "vectortile"
+    point_spacing = 64
+    line_tolerance = 8
+    # Tile coordinate units lines extend beyond the tile edge, so strokes join seamlessly.
+    tile_buffer = 64
+    # Buffered tile features that trigger a move to the staging file.
+    flush_features = 50000
+
+    def __init__(self, output_path: str, create_line: bool = True,
+                 min_zoom: int = DEFAULT_MIN_ZOOM, max_zoom: int = DEFAULT_MAX_ZOOM,
+                 log_callback: Optional[Callable[[str, str], None]] = None):
+        """
+        :param output_path: Path of the .mbtiles file; an existing file is replaced on close().
+        :param create_line: Whether the lines layer should be written.
+        :param min_zoom: Lowest zoom level of the pyramid.
+        :param max_zoom: Highest zoom level of the pyramid; QGIS overzooms beyond it.
+        :param log_callback: Optional function to handle logging.
+        :raises ValueError: If the zoom range is invalid.
+        """
+        if not 0 <= min_zoom <= max_zoom <= 16:
+            raise ValueError(f"Invalid zoom range: {min_zoom}-{max_zoom}")
+        self.output_path = output_path
+        self.create_line = create_line
+        self.min_zoom = min_zoom
+        self.max_zoom = max_zoom
+        self.log_callback = log_callback
+        self.track_count = 0
+        self._tiles = {}
+        self._buffered = 0
+        self._staging = None
+        self._staging_path = f"{output_path}.staging"
+        self._next_id = 1
+        self._bounds = [180.0, 90.0, -180.0, -90.0]
+
+    def _log(self, message: str, level: str = "INFO", *args):
+        """
+        Log a message using the provided callback if available.
+
+        :param message: Message to log, a %-format string if args are given.
+        :param level: Log level ("INFO", "DEBUG", "WARNING", "ERROR").
+        :param args: Values the sink substitutes into message, only if the level is logged.
+        """
+        if self.log_callback:
+            if args:
+                self.log_callback(message, level, *args)
+            else:
+                self.log_callback(message, level)
+
+    def _add_feature(self, key, name, feature):
+        """Buffer a feature of a layer in a tile."""
+        self._tiles.setdefault(key, {"points": [], "lines": []})[name].append(feature)
+        self._buffered += 1
+
+    def _flush(self):
+        """Move the buffered tile features to the staging file."""
+        if not self._tiles:
+            return
+        if self._staging is None:
+            if os.path.exists(self._staging_path):
+                os.remove(self._staging_path)
+            # The writer is opened and closed on different task threads.
+            self._staging = sqlite3.connect(self._staging_path, check_same_thread=False)
+            self._staging.execute(
+                "CREATE TABLE features (zoom_level INTEGER, tile_x INTEGER, tile_y INTEGER, layer TEXT, data BLOB)"
+            )
+        with self._staging:
+            self._staging.executemany(
+                "INSERT INTO features VALUES (?, ?, ?, ?, ?)",
+                (
+                    (zoom, x, y, name, pickle.dumps(features, pickle.HIGHEST_PROTOCOL))
+                    for (zoom, x, y), layers in self._tiles.items()
+                    for name, features in layers.items() if features
+                ),
+            )
+        self._log("Staged %d tile features for %s", "DEBUG", self._buffered, self.output_path)
+        self._tiles = {}
+        self._buffered = 0
+
+    def _staged_tiles(self):
+        """Yield (zoom, x, y, layers) with the staged features of every tile merged in insertion order."""
+        if self._staging is None:
+            return
+        rows = self._staging.execute(
+            "SELECT zoom_level, tile_x, tile_y, layer, data FROM features ORDER BY zoom_level, tile_x, tile_y, rowid"
+        )
+        for (zoom, x, y), group in itertools.groupby(rows, key=lambda row: row[:3]):
+            layers = {"points": [], "lines": []}
+            for row in group:
+                layers[row[3]].extend(pickle.loads(row[4]))
+            yield zoom, x, y, layers
+
+    def _discard_staging(self):
+        """Close and delete the staging file."""
+        if self._staging is not None:
+            self._staging.close()
+            self._staging = None
+        if os.path.exists(self._staging_path):
+            os.remove(self._staging_path)
+
+    def add_track(self, norad_id: int, points, segments=None) -> None:
+        """
+        Append the track of one satellite given as point tuples.
+
+        :param norad_id: NORAD ID stored in the NORAD_ID attribute.
+        :param points: List of point‐tuples: (datetime, lon, lat, alt, vel, az, arc, ta, inc).
+        :param segments: List of line segments, each a list of (lon, lat, m) tuples.
+        """
+        self.add_track_columns(norad_id, points_to_columns(points), segments)
+
+    def add_track_columns(self, norad_id: int, columns, segments=None) -> None:
+        """
+        Cut the track of one satellite into tiles for every zoom level.
+
+        :param norad_id: NORAD ID stored in the NORAD_ID attribute.
+        :param columns: Dict of arrays keyed by ORBITAL_COLUMNS.
+        :param segments: Antimeridian-split line segments, each a list of (lon, lat, m) tuples.
+        """
+        count = len(columns["time"])
+        if not count:
+            return
+        norad_id = int(norad_id)
+        lon, lat = columns["lon"], columns["lat"]
+        self._bounds = [
+            min(self._bounds[0], float(lon.min())), min(self._bounds[1], float(lat.min())),
+            max(self._bounds[2], float(lon.max())), max(self._bounds[3], float(lat.max())),
+        ]
+        u, v = mercator_unit(lon, lat)
+        # Line pieces format their start and end times with the precision of the whole track.
+        date_unit = column_date_unit(columns["time"])
+        dates = format_iso_dates(columns["time"], date_unit)
+        altitudes = columns["alt"]
+        first_id = self._next_id
+        self._next_id += count
+
+        for zoom in range(self.min_zoom, self.max_zoom + 1):
+            self._add_points(zoom, u, v, norad_id, first_id, dates, altitudes)
+
+        if self.create_line and segments:
+            for segment in segments:
+                if len(segment) < 2:
+                    continue
+                seg = np.asarray(segment, dtype=float)
+                su, sv = mercator_unit(seg[:, 0], seg[:, 1])
+                for zoom in range(self.min_zoom, self.max_zoom + 1):
+                    self._add_line(zoom, su, sv, seg[:, 2], norad_id, date_unit)
+
+        self.track_count += 1
+        self._log("Tiled %d samples of NORAD ID %d for %s", "DEBUG", count, norad_id, self.output_path)
+        if self._buffered >= self.flush_features:
+            self._flush()
+
+    def _add_points(self, zoom, u, v, norad_id, first_id, dates, altitudes):
+        """Thin the samples to one per point_spacing cell run and add them to their tiles."""
+        scale = (1 << zoom) * TILE_EXTENT
+        px = np.minimum((u * scale).astype(np.int64), scale - 1)
+        py = np.minimum((v * scale).astype(np.int64), scale - 1)
+        spacing = 1 if zoom == self.max_zoom else self.point_spacing
+        cx, cy = px // spacing, py // spacing
+        keep = np.ones(len(px), dtype=bool)
+        keep[1:] = (cx[1:] != cx[:-1]) | (cy[1:] != cy[:-1])
+        for i in np.nonzero(keep)[0].tolist():
+            x, y = int(px[i]), int(py[i])
+            tx, ty = x // TILE_EXTENT, y // TILE_EXTENT
+            self._add_feature((zoom, tx, ty), "points", (
+                first_id + i,
+                {"NORAD_ID": norad_id, "Point_ID": i, "Date_Time": str(dates[i]),
+                 "Altitude": float(altitudes[i])},
+                _POINT,
+                [(1 & 0x7) | (1 << 3), _zigzag(x - tx * TILE_EXTENT), _zigzag(y - ty * TILE_EXTENT)],
+            ))
+
+    def _add_line(self, zoom, u, v, ms, norad_id, date_unit=None):
+        """Simplify one segment on the zoom grid and clip its edges into per-tile runs."""
+        scale = (1 << zoom) * TILE_EXTENT
+        px = np.round(u * scale).astype(np.int64)
+        py = np.round(v * scale).astype(np.int64)
+        cell = self.line_tolerance if zoom < self.max_zoom else 1
+        keep = np.ones(len(px), dtype=bool)
+        keep[1:-1] = ((px[1:-1] // cell != px[:-2] // cell) | (py[1:-1] // cell != py[:-2] // cell))
+        px, py, ms = px[keep], py[keep], ms[keep]
+        if len(px) < 2:
+            return
+
+        max_tile = (1 << zoom) - 1
+        buffer = self.tile_buffer
+        low, high = -buffer, TILE_EXTENT + buffer
+        px, py = px.tolist(), py.tolist()
+        # Per tile: runs of tile coordinates, index of the last vertex and first/last vertex index.
+        pieces = {}
+        for i in range(len(px) - 1):
+            x0, y0, x1, y1 = px[i], py[i], px[i + 1], py[i + 1]
+            tiles_x = range(max(0, (min(x0, x1) - buffer) // TILE_EXTENT),
+                            min(max_tile, (max(x0, x1) + buffer) // TILE_EXTENT) + 1)
+            tiles_y = range(max(0, (min(y0, y1) - buffer) // TILE_EXTENT),
+                            min(max_tile, (max(y0, y1) + buffer) // TILE_EXTENT) + 1)
+            for x in tiles_x:
+                ox = x * TILE_EXTENT
+                for y in tiles_y:
+                    oy = y * TILE_EXTENT
+                    clipped = _clip_edge(x0 - ox, y0 - oy, x1 - ox, y1 - oy, low, high)
+                    if clipped is None:
+                        continue
+                    start, end = clipped
+                    piece = pieces.get((x, y))
+                    if piece is None:
+                        piece = pieces[(x, y)] = {"runs": [], "last": -1, "first": i}
+                    # A run continues only if the previous edge reached this one unclipped.
+                    if piece["last"] != i or piece["runs"][-1][-1] != start:
+                        piece["runs"].append([start])
+                    piece["runs"][-1].append(end)
+                    piece["last"] = i + 1
+
+        for (x, y), piece in pieces.items():
+            times = format_iso_dates(m_to_times([ms[piece["first"]], ms[piece["last"]]]), date_unit)
+            self._add_feature((zoom, x, y), "lines", (
+                self._next_id,
+                {"NORAD_ID": norad_id, "Start_Time": str(times[0]), "End_Time": str(times[1])},
+                _LINESTRING,
+                _line_geometry(piece["runs"]),
+            ))
+            self._next_id += 1
+
+    def _metadata(self):
+        """Return the MBTiles metadata rows."""
+        west, south, east, north = self._bounds if self.track_count else (-180.0, -85.0, 180.0, 85.0)
+        point_fields = {"NORAD_ID": "Number", "Point_ID": "Number", "Date_Time": "String", "Altitude": "Number"}
+        vector_layers = [{"id": "points", "fields": point_fields,
+                          "minzoom": self.min_zoom, "maxzoom": self.max_zoom}]
+        if self.create_line:
+            vector_layers.append({"id": "lines",
+                                  "fields": {"NORAD_ID": "Number", "Start_Time": "String", "End_Time": "String"},
+                                  "minzoom": self.min_zoom, "maxzoom": self.max_zoom})
+        return [
+            ("name", os.path.splitext(os.path.basename(self.output_path))[0]),
+            ("format", "pbf"),
+            ("type", "overlay"),
+            ("minzoom", str(self.min_zoom)),
+            ("maxzoom", str(self.max_zoom)),
+            ("bounds", f"{west},{max(south, -MAX_MERCATOR_LAT)},{east},{min(north, MAX_MERCATOR_LAT)}"),
+            ("center", f"{(west + east) / 2},{(south + north) / 2},{self.min_zoom}"),
+            ("json", json.dumps({"vector_layers": vector_layers})),
+        ]
+
+    def close(self):
+        """
+        Encode all tiles and write the MBTiles file.
+
+        :return: Tuple (points_uri, lines_uri) suitable for QgsVectorTileLayer; both
+                 point to the same file, lines_uri is None without lines.
+        :raises RuntimeError: If the file cannot be written.
+        """
+        try:
+            self._flush()
+            if os.path.exists(self.output_path):
+                os.remove(self.output_path)
+            connection = sqlite3.connect(self.output_path)
+            with connection:
+                connection.execute("CREATE TABLE metadata (name TEXT, value TEXT)")
+                connection.execute(
+                    "CREATE TABLE tiles (zoom_level INTEGER, tile_column INTEGER, tile_row INTEGER, tile_data BLOB)"
+                )
+                connection.execute("CREATE UNIQUE INDEX tile_index ON tiles (zoom_level, tile_column, tile_row)")
+                connection.executemany("INSERT INTO metadata VALUES (?, ?)", self._metadata())
+                connection.executemany(
+                    "INSERT INTO tiles VALUES (?, ?, ?, ?)",
+                    (
+                        # MBTiles rows follow the TMS scheme with y pointing north.
+                        (zoom, x, (1 << zoom) - 1 - y, gzip.compress(encode_tile(layers)))
+                        for zoom, x, y, layers in self._staged_tiles()
+                    ),
+                )
+            (tile_count,) = connection.execute("SELECT COUNT(*) FROM tiles").fetchone()
+            connection.close()
+        except (OSError, sqlite3.Error) as e:
+            self._log(f"Failed to write MBTiles {self.output_path}: {str(e)}", "ERROR")
+            raise RuntimeError(f"Failed to write MBTiles {self.output_path}: {str(e)}")
+        finally:
+            self._discard_staging()
+
+        self._log("Wrote %d tiles of %d tracks to %s", "INFO", tile_count, self.track_count, self.output_path)
+        uri = f"type=mbtiles&url={self.output_path}"
+        return uri, uri if self.create_line else None
+
+    def abort(self):
+        """Discard all tiled tracks without writing the file."""
+        self._tiles = {}
+        self._buffered = 0
+        self._discard_staging()
+        self._log(f"Discarded MBTiles output {self.output_path}", "WARNING")
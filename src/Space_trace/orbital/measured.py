@@ -0,0 +1,114 @@
+"""
+This module contains helpers for the compact track representation: every continuous
+segment of a track is one LineStringZM feature with the altitude as Z and the sample
+time in epoch seconds as M.
+
+Longitude, latitude, altitude and time of every sample live in the geometry, so point
+values can be recovered on demand by interpolating along M.
+"""
+
+import numpy as np
+from qgis.core import QgsGeometry, QgsLineString
+
+# Epoch of the M values.
+M_EPOCH = np.datetime64("1970-01-01T00:00:00", "us")
+
+
+def times_to_m(times) -> np.ndarray:
+    """
+    Convert a datetime64 column to M values in epoch seconds.
+
+    :param times: datetime64 array.
+    :return: float64 array of seconds since 1970-01-01T00:00:00 UTC.
+    """
+    return (np.asarray(times, dtype="datetime64[us]") - M_EPOCH) / np.timedelta64(1, "s")
+
+
+def m_to_times(ms) -> np.ndarray:
+    """
+    Convert M values in epoch seconds back to datetime64[us].
+
+    :param ms: Array of epoch seconds.
+    :return: datetime64[us] array.
+    """
+    return M_EPOCH + np.round(np.asarray(ms, dtype=float) * 1e6).astype("timedelta64[us]")
+
+
+def measured_vertices(columns) -> list:
+    """
+    Build (lon, lat, alt, m) vertices from columnar propagation results.
+
+    :param columns: Dict of arrays keyed by ORBITAL_COLUMNS.
+    :return: List of (lon, lat, alt, m) tuples suitable for get_line_segments.
+    """
+    return list(zip(
+        columns["lon"].tolist(), columns["lat"].tolist(), columns["alt"].tolist(),
+        times_to_m(columns["time"]).tolist(),
+    ))
+
+
+def measured_geometry(segment) -> QgsGeometry:
+    """
+    Build a LineStringZM geometry from a segment of (lon, lat, alt, m) vertices.
+
+    :param segment: List of (lon, lat, alt, m) tuples.
+    :return: QgsGeometry of type LineStringZM.
+    """
+    xs, ys, zs, ms = (list(values) for values in zip(*segment))
+    return QgsGeometry(QgsLineString(xs, ys, zs, ms))
+
+
+def interpolate_along_m(vertices, times) -> dict:
+    """
+    Interpolate lon, lat and alt of one segment at the given times.
+
+    Times outside the M range of the segment yield NaN.
+
+    :param vertices: Array-like of (lon, lat, alt, m) rows ordered by M.
+    :param times: datetime64 array of requested sample times.
+    :return: Dict with "time", "lon", "lat" and "alt" arrays.
+    """
+    vertices = np.asarray(vertices, dtype=float).reshape(-1, 4)
+    times = np.asarray(times, dtype="datetime64[us]")
+    ms = times_to_m(times)
+    result = {"time": times}
+    if not len(vertices):
+        nan = np.full(len(ms), np.nan)
+        result.update(lon=nan, lat=nan.copy(), alt=nan.copy())
+        return result
+    for name, column in (("lon", 0), ("lat", 1), ("alt", 2)):
+        result[name] = np.interp(ms, vertices[:, 3], vertices[:, column], left=np.nan, right=np.nan)
+    return result
+
+
+def geometry_vertices(geometry) -> np.ndarray:
+    """
+    Return the (lon, lat, alt, m) rows of a LineStringZM geometry.
+
+    :param geometry: QgsGeometry of a compact track feature.
+    :return: Array of shape (n, 4).
+    """
+    return np.array([(v.x(), v.y(), v.z(), v.m()) for v in geometry.vertices()], dtype=float).reshape(-1, 4)
+
+
+def sample_measured_layer(layer, times) -> dict:
+    """
+    Recover point values of a compact track layer at the given times.
+
+    Each time is resolved against the segment whose M range contains it; times not
+    covered by any segment yield NaN.
+
+    :param layer: Layer of LineStringZM features written by the compact output.
+    :param times: datetime64 array (or list of datetimes) of requested sample times.
+    :return: Dict with "time", "lon", "lat" and "alt" arrays.
+    """
+    times = np.asarray(times, dtype="datetime64[us]")
+    result = {"time": times}
+    for name in ("lon", "lat", "alt"):
+        result[name] = np.full(len(times), np.nan)
+    for feature in layer.getFeatures():
+        sampled = interpolate_along_m(geometry_vertices(feature.geometry()), times)
+        hit = np.isnan(result["lon"]) & ~np.isnan(sampled["lon"])
+        for name in ("lon", "lat", "alt"):
+            result[name][hit] = sampled[name][hit]
+    return result
@@ -0,0 +1,200 @@
+"""
+This module contains the StagedPipeline class which moves the items of a run through
+several stages at the same time, e.g. retrieval, propagation and output.
+
+Every stage has its own worker threads and reads from a bounded queue, so network,
+CPU and disk work overlap while at most queue_size items wait in front of a stage; a
+full queue blocks the stage feeding it. StageMetrics count the items, failures and busy
+time of every stage for the summary of the run.
+"""
+
+import queue
+import threading
+import time
+
+DEFAULT_QUEUE_SIZE = 4
+
+# Queue entry telling one worker that no more items follow.
+_STOP = object()
+
+
+class Stage:
+    """
+    One step of a StagedPipeline.
+    """
+
+    def __init__(self, name: str, func, workers: int = 1):
+        """
+        :param name: Name of the stage shown in the metrics.
+        :param func: Function turning the output of the previous stage (or the item) into the input of the next.
+        :param workers: Number of threads running func.
+        :raises ValueError: If workers is less than 1.
+        """
+        if workers < 1:
+            raise ValueError(f"Stage {name} needs at least one worker")
+        self.name = name
+        self.func = func
+        self.workers = workers
+
+
+class StageMetrics:
+    """
+    Throughput counters of one stage, accumulated over every run of the pipeline.
+    """
+
+    def __init__(self, name: str, workers: int):
+        self.name = name
+        self.workers = workers
+        self.items = 0
+        self.failures = 0
+        self.busy_seconds = 0.0
+        self.first_start = None
+        self.last_end = None
+        self._lock = threading.Lock()
+
+    def add(self, started: float, ended: float, failed: bool = False) -> None:
+        """
+        Record one call of the stage function.
+
+        :param started: time.perf_counter() value before the call.
+        :param ended: time.perf_counter() value after the call.
+        :param failed: Whether the call raised.
+        """
+        with self._lock:
+            self.items += 1
+            self.failures += int(failed)
+            self.busy_seconds += ended - started
+            self.first_start = started if self.first_start is None else min(self.first_start, started)
+            self.last_end = ended if self.last_end is None else max(self.last_end, ended)
+
+    @property
+    def wall_seconds(self) -> float:
+        """Seconds from the first call of the stage to the end of the last."""
+        if self.first_start is None:
+            return 0.0
+        return self.last_end - self.first_start
+
+    @property
+    def throughput(self) -> float:
+        """Items per second of wall time."""
+        return self.items / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+    @property
+    def utilization(self) -> float:
+        """Share of the wall time the workers of the stage spent in the stage function."""
+        return self.busy_seconds / (self.wall_seconds * self.workers) if self.wall_seconds > 0 else 0.0
+
+    def summary(self) -> str:
+        """One-line description of the stage metrics."""
+        return (f"{self.name}: {self.items} items in {self.wall_seconds:.2f} s ({self.throughput:.2f}/s), "
+                f"{self.workers} workers {self.utilization:.0%} busy, {self.failures} failed")
+
+
+class StagedPipeline:
+    """
+    Producer/consumer pipeline of stages connected by bounded queues.
+    """
+
+    def __init__(self, stages: list, queue_size: int = DEFAULT_QUEUE_SIZE, log_callback=None):
+        """
+        :param stages: List of Stage objects in processing order.
+        :param queue_size: Maximum number of items waiting in front of each stage.
+        :param log_callback: Optional function to handle logging.
+        """
+        self.stages = stages
+        self.queue_size = queue_size
+        self.log_callback = log_callback
+        self.metrics = [StageMetrics(stage.name, stage.workers) for stage in stages]
+
+    def _log(self, message: str, level: str = "INFO", *args):
+        """
+        Log a message using the provided callback if available.
+
+        :param message: Message to log, a %-format string if args are given.
+        :param level: Log level ("INFO", "DEBUG", "WARNING", "ERROR").
+        :param args: Values the sink substitutes into message, only if the level is logged.
+        """
+        if self.log_callback:
+            if args:
+                self.log_callback(message, level, *args)
+            else:
+                self.log_callback(message, level)
+
+    def run(self, items, on_result=None, on_error=None, is_canceled=None) -> bool:
+        """
+        Pass items through all stages and wait until every item has left the pipeline.
+
+        Items are fed from the calling thread. An item whose stage function raises
+        leaves the pipeline through on_error; the other items are not affected. The
+        callbacks run on worker threads.
+
+        :param items: Iterable of inputs of the first stage.
+        :param on_result: Function called with (item, output of the last stage).
+        :param on_error: Function called with (item, stage name, exception).
+        :param is_canceled: Function returning True once the remaining items should be dropped.
+        :return: False if the run was canceled.
+        """
+        is_canceled = is_canceled or (lambda: False)
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in self.stages]
+        alive = [stage.workers for stage in self.stages]
+        alive_lock = threading.Lock()
+
+        def finish_item(index, item, value=None, error=None):
+            try:
+                if error is not None:
+                    if on_error:
+                        on_error(item, self.stages[index].name, error)
+                elif on_result:
+                    on_result(item, value)
+            except Exception as e:
+                self._log(f"Pipeline callback failed: {str(e)}", "ERROR")
+
+        def work(index):
+            stage, metrics = self.stages[index], self.metrics[index]
+            last = index == len(self.stages) - 1
+            try:
+                while True:
+                    entry = queues[index].get()
+                    if entry is _STOP:
+                        return
+                    item, value = entry
+                    if is_canceled():
+                        continue
+                    started = time.perf_counter()
+                    try:
+                        value = stage.func(value)
+                    except Exception as e:
+                        metrics.add(started, time.perf_counter(), failed=True)
+                        finish_item(index, item, error=e)
+                        continue
+                    metrics.add(started, time.perf_counter())
+                    if last:
+                        finish_item(index, item, value)
+                    else:
+                        queues[index + 1].put((item, value))
+            finally:
+                # The last worker of a stage stops the workers of the next one.
+                with alive_lock:
+                    alive[index] -= 1
+                    stop_next = alive[index] == 0 and not last
+                if stop_next:
+                    for _ in range(self.stages[index + 1].workers):
+                        queues[index + 1].put(_STOP)
+
+        threads = [
+            threading.Thread(target=work, args=(index,), name=f"SpaceTrace-{stage.name}-{n}", daemon=True)
+            for index, stage in enumerate(self.stages) for n in range(stage.workers)
+        ]
+        for thread in threads:
+            thread.start()
+        try:
+            for item in items:
+                if is_canceled():
+                    break
+                queues[0].put((item, item))
+        finally:
+            for _ in range(self.stages[0].workers):
+                queues[0].put(_STOP)
+            for thread in threads:
+                thread.join()
+        return not is_canceled()
@@ -8,11 +8,46 @@ from qgis.core import (
     QgsFields,
     QgsProject,
     QgsCoordinateTransform,
+    QgsCoordinateTransformContext,
     QgsCoordinateReferenceSystem,
 )
 from PyQt5.QtCore import QVariant, QDateTime, Qt
 from typing import Optional, Callable
 from abc import ABC, abstractmethod
+import math
+import numpy as np
+
+from ...orbital_data_processor.orbital_data_processor import format_iso_dates, points_to_columns
+from .temporal import (
+    TIME_FIELD,
+    configure_temporal_properties,
+    create_attribute_index,
+    create_time_index,
+    register_time_index,
+)
+
+# Output formats whose savers append columnar chunks instead of building a layer first.
+STREAMING_FORMATS = ('geojsonl', 'geojsons')
+
+
+def to_qdatetimes(times) -> list:
+    """
+    Convert a datetime64 column to QDateTime values with millisecond precision.
+
+    Values are built from epoch milliseconds without parsing strings. They keep the
+    UTC wall-clock time with the local time spec, like QDateTime(datetime) elsewhere
+    in the plugin.
+
+    :param times: datetime64 array.
+    :return: List of QDateTime.
+    """
+    values = []
+    for ms in np.asarray(times, dtype="datetime64[ms]").astype(np.int64).tolist():
+        value = QDateTime.fromMSecsSinceEpoch(ms, Qt.UTC)
+        value.setTimeSpec(Qt.LocalTime)
+        values.append(value)
+    return values
+
 
 class FileSaver(ABC):
     """
@@ -32,20 +67,34 @@ class FileSaver(ABC):
         ("TrueAnomaly", QVariant.Double),
         ("Inclination", QVariant.Double),
     ]
+    # Savers that can append columnar chunks as they are propagated set this to True.
+    supports_streaming = False
 
     def __init__(
         self,
         log_callback: Optional[Callable[[str, str], None]] = None,
-        input_crs: Optional[QgsCoordinateReferenceSystem] = None
+        input_crs: Optional[QgsCoordinateReferenceSystem] = None,
+        project_crs: Optional[QgsCoordinateReferenceSystem] = None,
+        transform_context: Optional[QgsCoordinateTransformContext] = None
     ):
         """
         Initialize with a logging callback and set both input CRS and project CRS.
 
+        Savers created in a task get the project CRS and transform context captured on
+        the GUI thread; QgsProject is only read when they are not given.
+
         :param log_callback: Optional function to handle logging.
         :param input_crs: CRS of the input coordinates. If None, defaults to project CRS.
+        :param project_crs: CRS of the output. If None, the current project CRS.
+        :param transform_context: Transform context of the project. If None, the current project's.
         """
         self.log_callback = log_callback
-        self.project_crs = QgsProject.instance().crs()
+        if project_crs is None or transform_context is None:
+            project = QgsProject.instance()
+            project_crs = project_crs if project_crs is not None else project.crs()
+            transform_context = transform_context if transform_context is not None else project.transformContext()
+        self.project_crs = project_crs
+        self.transform_context = transform_context
 
         # If the user did not specify an input CRS, assume the input is already in project CRS.
         if input_crs and input_crs.isValid():
@@ -55,20 +104,23 @@ class FileSaver(ABC):
 
         if self.log_callback:
             self._log(
-                f"Initialized FileSaver with project CRS: {self.project_crs.authid()} "
-                f"({self.project_crs.description()}); input CRS: {self.input_crs.authid()}",
-                "DEBUG"
+                "Initialized FileSaver with project CRS: %s (%s); input CRS: %s", "DEBUG",
+                self.project_crs.authid(), self.project_crs.description(), self.input_crs.authid()
             )
 
-    def _log(self, message: str, level: str = "INFO"):
+    def _log(self, message: str, level: str = "INFO", *args):
         """
         Log a message using the provided callback.
 
-        :param message: Message to log.
+        :param message: Message to log, a %-format string if args are given.
         :param level: Log level ("INFO", "DEBUG", "WARNING", "ERROR").
+        :param args: Values the sink substitutes into message, only if the level is logged.
         """
         if self.log_callback:
-            self.log_callback(message, level)
+            if args:
+                self.log_callback(message, level, *args)
+            else:
+                self.log_callback(message, level)
 
     @property
     @abstractmethod
@@ -83,8 +135,8 @@ class FileSaver(ABC):
         pass
 
     @abstractmethod
-    def prepare_date(self, dt):
-        """Prepare a Python datetime for storage in the layer."""
+    def prepare_dates(self, times):
+        """Prepare a datetime64 column for storage in the layer's Date_Time field."""
         pass
 
     @abstractmethod
@@ -101,12 +153,10 @@ class FileSaver(ABC):
         """
         if self.input_crs != self.project_crs:
             self._log(
-                f"Transforming geometry from {self.input_crs.authid()} "
-                f"to {self.project_crs.authid()}",
-                "DEBUG"
+                "Transforming geometry from %s to %s", "DEBUG", self.input_crs.authid(), self.project_crs.authid()
             )
             transform = QgsCoordinateTransform(
-                self.input_crs, self.project_crs, QgsProject.instance()
+                self.input_crs, self.project_crs, self.transform_context
             )
             geometry.transform(transform)
         return geometry
@@ -125,7 +175,7 @@ class FileSaver(ABC):
         :param output_path_or_layername: File path (for disk formats) or layer name (for memory).
         :return: QgsVectorLayer (for memory) or None (for disk).
         """
-        self._log(f"Starting save_points for format: {self.format_name}", "DEBUG")
+        self._log("Starting save_points for format: %s", "DEBUG", self.format_name)
 
         if not self.is_memory() and not output_path_or_layername:
             self._log(
@@ -139,10 +189,7 @@ class FileSaver(ABC):
         else:
             layer_name = output_path_or_layername
 
-        self._log(
-            f"Creating point layer '{layer_name}' in CRS {self.project_crs.authid()}",
-            "DEBUG"
-        )
+        self._log("Creating point layer '%s' in CRS %s", "DEBUG", layer_name, self.project_crs.authid())
 
         # Create a vector layer for points with the project's CRS
         layer = QgsVectorLayer(
@@ -160,6 +207,9 @@ class FileSaver(ABC):
         prov.addAttributes(fields)
         layer.updateFields()
 
+        # Date values for the whole track are prepared in one step
+        dates = self.prepare_dates(np.array([pt[0] for pt in points], dtype="datetime64[us]"))
+
         # Create and accumulate features
         feats = []
         for i, pt in enumerate(points):
@@ -167,7 +217,7 @@ class FileSaver(ABC):
             feat = QgsFeature()
             feat.setFields(fields)
             feat.setAttribute("Point_ID", i)
-            feat.setAttribute("Date_Time", self.prepare_date(dt))
+            feat.setAttribute("Date_Time", dates[i])
             # Store original input coordinates as attributes, even if input CRS != EPSG:4326
             feat.setAttribute("Latitude", lat)
             feat.setAttribute("Longitude", lon)
@@ -184,18 +234,15 @@ class FileSaver(ABC):
             feat.setGeometry(geometry)
             feats.append(feat)
 
-        self._log(f"Created {len(feats)} point features", "DEBUG")
+        self._log("Created %d point features", "DEBUG", len(feats))
 
         if feats:
-            prov.addFeatures(feats)
-            self._log(f"Added {len(feats)} features to point layer", "DEBUG")
+            _, feats = prov.addFeatures(feats)
+            self._log("Added %d features to point layer", "DEBUG", len(feats))
 
             if not self.is_memory():
-                self._log(
-                    f"Saving points to file: {output_path_or_layername} "
-                    f"in CRS {self.project_crs.authid()}",
-                    "DEBUG"
-                )
+                self._log("Saving points to file: %s in CRS %s", "DEBUG",
+                          output_path_or_layername, self.project_crs.authid())
                 write_result, error_message = QgsVectorFileWriter.writeAsVectorFormat(
                     layer,
                     output_path_or_layername,
@@ -211,29 +258,58 @@ class FileSaver(ABC):
                     raise RuntimeError(
                         f"Failed to save {self.format_name}: {error_message}"
                     )
-                self._log(f"Successfully saved points to {output_path_or_layername}", "INFO")
+                self._log("Successfully saved points to %s", "INFO", output_path_or_layername)
+                self._index_time_field(output_path_or_layername)
             else:
                 layer.updateExtents()
                 self._log("Updated extents for in-memory point layer", "DEBUG")
+                self._index_memory_layer(layer)
+                register_time_index(layer, [pt[0] for pt in points], [feat.id() for feat in feats])
+                configure_temporal_properties(layer)
         else:
             self._log("No point features were created", "WARNING")
 
         return layer if self.is_memory() else None
 
+    def _index_memory_layer(self, layer: QgsVectorLayer, field_names=(TIME_FIELD, "Point_ID")) -> None:
+        """
+        Build the spatial index and the supported attribute indexes after bulk insertion.
+
+        :param layer: In-memory layer whose features have been added.
+        :param field_names: Fields to index if the provider supports attribute indexes.
+        """
+        if layer.dataProvider().createSpatialIndex():
+            self._log("Created spatial index on '%s'", "DEBUG", layer.name())
+        for field_name in field_names:
+            if create_attribute_index(layer, field_name):
+                self._log("Created %s index on '%s'", "DEBUG", field_name, layer.name())
+
+    def _index_time_field(self, output_path: str) -> None:
+        """
+        Create an attribute index on Date_Time in a written file if its driver supports it.
+
+        :param output_path: Path of the written point file.
+        """
+        layer = QgsVectorLayer(output_path, "", "ogr")
+        if create_time_index(layer):
+            self._log("Created Date_Time index in %s", "DEBUG", output_path)
+
     def save_lines(
         self,
         geometries,
         output_path_or_layername: Optional[str] = None,
-        norad_id: Optional[int] = None
+        norad_id: Optional[int] = None,
+        geometry_type: str = "LineString"
     ) -> Optional[QgsVectorLayer]:
         """
         Save line geometries to a layer or file.
 
         :param geometries: List of QgsGeometry objects (constructed in input CRS).
         :param output_path_or_layername: File path (for disk) or layer name (for memory).
+        :param geometry_type: Layer geometry type, e.g. "LineStringZM" for compact tracks.
         :return: QgsVectorLayer (for memory) or None (for disk).
         """
-        self._log(f"Starting save_lines for format: {self.format_name}", "DEBUG")
+        self._log("Starting save_lines for format: %s", "DEBUG", self.format_name)
 
         if not self.is_memory() and not output_path_or_layername:
             self._log(
@@ -247,14 +323,11 @@ class FileSaver(ABC):
         else:
             layer_name = output_path_or_layername
 
-        self._log(
-            f"Creating line layer '{layer_name}' in CRS {self.project_crs.authid()}",
-            "DEBUG"
-        )
+        self._log("Creating line layer '%s' in CRS %s", "DEBUG", layer_name, self.project_crs.authid())
 
         # Create a vector layer for lines with the project's CRS
         layer = QgsVectorLayer(
-            f"LineString?crs={self.project_crs.authid()}",
+            f"{geometry_type}?crs={self.project_crs.authid()}",
             layer_name,
             "memory"
         )
@@ -265,13 +338,13 @@ class FileSaver(ABC):
         fields.append(QgsField("ID", QVariant.Int))
         prov.addAttributes(fields)
         layer.updateFields()
-        self._log(f"Fields added to line layer: {[f.name() for f in fields]}", "DEBUG")
+        self._log("Fields added to line layer: %s", "DEBUG", fields.names())
 
         id_index = layer.fields().indexFromName("ID")
         if id_index == -1:
             self._log("Field 'ID' was not added to the line layer", "ERROR")
         else:
-            self._log(f"Field 'ID' found at index {id_index}", "DEBUG")
+            self._log("Field 'ID' found at index %d", "DEBUG", id_index)
 
         # Create and accumulate features
         feats = []
@@ -281,28 +354,22 @@ class FileSaver(ABC):
             if id_index != -1:
                 feat.setAttribute("ID", i)
             else:
-                self._log(
-                    f"Skipping attribute 'ID' for feature {i} as field is missing",
-                    "WARNING"
-                )
+                self._log("Skipping attribute 'ID' for feature %d as field is missing", "WARNING", i)
 
             # Transform geometry from input CRS to project CRS if needed
             transformed_geom = self._transform_geometry(geom)
             feat.setGeometry(transformed_geom)
             feats.append(feat)
 
-        self._log(f"Created {len(feats)} line features", "DEBUG")
+        self._log("Created %d line features", "DEBUG", len(feats))
 
         if feats:
             prov.addFeatures(feats)
-            self._log(f"Added {len(feats)} features to line layer", "DEBUG")
+            self._log("Added %d features to line layer", "DEBUG", len(feats))
 
             if not self.is_memory():
-                self._log(
-                    f"Saving lines to file: {output_path_or_layername} "
-                    f"in CRS {self.project_crs.authid()}",
-                    "DEBUG"
-                )
+                self._log("Saving lines to file: %s in CRS %s", "DEBUG",
+                          output_path_or_layername, self.project_crs.authid())
                 write_result, error_message = QgsVectorFileWriter.writeAsVectorFormat(
                     layer,
                     output_path_or_layername,
@@ -318,10 +385,11 @@ class FileSaver(ABC):
                     raise RuntimeError(
                         f"Failed to save {self.format_name}: {error_message}"
                     )
-                self._log(f"Successfully saved lines to {output_path_or_layername}", "INFO")
+                self._log("Successfully saved lines to %s", "INFO", output_path_or_layername)
             else:
                 layer.updateExtents()
                 self._log("Updated extents for in-memory line layer", "DEBUG")
+                self._index_memory_layer(layer, field_names=())
         else:
             self._log("No line features were created", "WARNING")
 
@@ -333,12 +401,9 @@ class ShpSaver(FileSaver):
     format_name = "ESRI Shapefile"
     date_field_type = QVariant.String
 
-    def prepare_date(self, dt):
-        """Convert datetime to ISO string for shapefiles."""
-        return QDateTime(
-            dt.year, dt.month, dt.day,
-            dt.hour, dt.minute, dt.second
-        ).toString(Qt.ISODate)
+    def prepare_dates(self, times):
+        """Convert datetimes to ISO strings for shapefiles."""
+        return format_iso_dates(times).tolist()
 
     def is_memory(self) -> bool:
         return False
@@ -349,12 +414,9 @@ class GpkgSaver(FileSaver):
     format_name = "GPKG"
     date_field_type = QVariant.DateTime
 
-    def prepare_date(self, dt):
-        """Convert datetime to QDateTime for GeoPackage."""
-        return QDateTime(
-            dt.year, dt.month, dt.day,
-            dt.hour, dt.minute, dt.second
-        )
+    def prepare_dates(self, times):
+        """Convert datetimes to QDateTime for GeoPackage."""
+        return to_qdatetimes(times)
 
     def is_memory(self) -> bool:
         return False
@@ -365,28 +427,208 @@ class GeoJsonSaver(FileSaver):
     format_name = "GeoJSON"
     date_field_type = QVariant.DateTime
 
-    def prepare_date(self, dt):
-        """Convert datetime to QDateTime for GeoJSON."""
-        return QDateTime(
-            dt.year, dt.month, dt.day,
-            dt.hour, dt.minute, dt.second
+    def prepare_dates(self, times):
+        """Convert datetimes to QDateTime for GeoJSON."""
+        return to_qdatetimes(times)
+
+    def is_memory(self) -> bool:
+        return False
+
+
+class GeoJsonSeqSaver(FileSaver):
+    """
+    Streaming saver for GeoJSON text sequences (disk).
+
+    Features are serialized straight from columnar propagation arrays and appended
+    to the file one per line, so the output can be tailed while it is written and
+    several files can be concatenated. Files ending in ``.geojsons`` get the RFC 8142
+    record separator before every feature; ``.geojsonl`` files are plain
+    newline-delimited. Coordinates are always written in EPSG:4326 as GeoJSON requires.
+    """
+    format_name = "GeoJSONSeq"
+    date_field_type = QVariant.String
+    supports_streaming = True
+    coordinate_precision = 6
+    value_precision = 4
+    # Columns checked for NaN and infinity, which JSON cannot represent.
+    value_columns = ("lon", "lat", "alt", "velocity", "azimuth", "trajectory_arc", "true_anomaly", "inclination")
+
+    def __init__(
+        self,
+        log_callback: Optional[Callable[[str, str], None]] = None,
+        input_crs: Optional[QgsCoordinateReferenceSystem] = None,
+        project_crs: Optional[QgsCoordinateReferenceSystem] = None,
+        transform_context: Optional[QgsCoordinateTransformContext] = None
+    ):
+        super().__init__(log_callback=log_callback, input_crs=input_crs, project_crs=project_crs,
+                         transform_context=transform_context)
+        coord = self._coord_format = f"%.{self.coordinate_precision}f"
+        value = self._value_format = f"%.{self.value_precision}f"
+        # Per-feature templates are built once; only %-substitution runs per row.
+        self._point_template = (
+            '{"type":"Feature","geometry":{"type":"Point","coordinates":[' + coord + ',' + coord + ']},'
+            '"properties":{"Point_ID":%d,"Date_Time":"%s","Latitude":' + value +
+            ',"Longitude":' + value + ',"Altitude":' + value + ',"Velocity":' + value +
+            ',"Azimuth":' + value + ',"TrajectoryArc":' + value + ',"TrueAnomaly":' + value +
+            ',"Inclination":' + value + '}}\n'
         )
+        self._line_template = (
+            '{"type":"Feature","geometry":{"type":"LineString","coordinates":[%s]},'
+            '"properties":{"ID":%d}}\n'
+        )
+        self._vertex_template = "[" + coord + "," + coord + "]"
+
+    def prepare_dates(self, times):
+        """Convert datetimes to ISO strings for GeoJSON sequences."""
+        return format_iso_dates(times).tolist()
 
     def is_memory(self) -> bool:
         return False
 
+    @staticmethod
+    def _record_separator(output_path: str) -> str:
+        """Return the RFC 8142 record separator for .geojsons files, nothing otherwise."""
+        return "\x1e" if output_path.lower().endswith(".geojsons") else ""
+
+    def begin(self, output_path: str) -> None:
+        """
+        Create or truncate the output file before chunks are appended.
+
+        :param output_path: Path of the sequence file.
+        """
+        if not output_path:
+            self._log(f"Output path is required for {self.format_name} format but was None", "ERROR")
+            raise ValueError(f"Output path is required for {self.format_name} format")
+        with open(output_path, "w", encoding="utf-8"):
+            pass
+        self._log("Started GeoJSON sequence %s", "DEBUG", output_path)
+
+    def append_point_columns(self, columns, output_path: str, start_id: int = 0, date_unit: str = None) -> int:
+        """
+        Serialize one chunk of columnar propagation results as point features.
+
+        :param columns: Dict of arrays keyed by ORBITAL_COLUMNS.
+        :param output_path: Path of the sequence file.
+        :param start_id: Point_ID of the first sample in the chunk.
+        :param date_unit: Date precision of the whole track ("s" or "ms"); None decides from the chunk.
+        :return: Number of features written.
+        """
+        count = len(columns["time"])
+        if not count:
+            return 0
+        rs = self._record_separator(output_path)
+        dates = format_iso_dates(columns["time"], date_unit).tolist()
+        lons = columns["lon"].tolist()
+        lats = columns["lat"].tolist()
+        rows = zip(
+            lons, lats, range(start_id, start_id + count), dates, lats, lons,
+            columns["alt"].tolist(), columns["velocity"].tolist(), columns["azimuth"].tolist(),
+            columns["trajectory_arc"].tolist(), columns["true_anomaly"].tolist(),
+            columns["inclination"].tolist(),
+        )
+        template = rs + self._point_template
+        finite = np.logical_and.reduce([np.isfinite(columns[name]) for name in self.value_columns])
+        if finite.all():
+            text = "".join(template % row for row in rows)
+        else:
+            text = "".join(template % row if ok else rs + self._format_non_finite_point(row)
+                           for row, ok in zip(rows, finite.tolist()))
+        with open(output_path, "a", encoding="utf-8") as f:
+            f.write(text)
+        self._log("Appended %d point features to %s", "DEBUG", count, output_path)
+        return count
+
+    def _format_non_finite_point(self, row) -> str:
+        """
+        Serialize a point row holding NaN or infinite values, which are written as null.
+
+        :param row: (lon, lat, Point_ID, Date_Time, Latitude, Longitude, ...) as passed to the point template.
+        :return: Feature line; the geometry is null if a coordinate is not finite.
+        """
+        lon, lat, point_id, date = row[:4]
+        if math.isfinite(lon) and math.isfinite(lat):
+            geometry = '{"type":"Point","coordinates":[%s,%s]}' % (self._coord_format % lon, self._coord_format % lat)
+        else:
+            geometry = "null"
+        values = ",".join(
+            '"%s":%s' % (name, self._value_format % value if math.isfinite(value) else "null")
+            for (name, _), value in zip(self.point_fields[2:], row[4:])
+        )
+        return '{"type":"Feature","geometry":%s,"properties":{"Point_ID":%d,"Date_Time":"%s",%s}}\n' % (
+            geometry, point_id, date, values
+        )
+
+    def append_line_segments(self, segments, output_path: str, start_id: int = 1) -> int:
+        """
+        Serialize line segments as LineString features.
+
+        :param segments: List of segments, each a list of (lon, lat) tuples.
+        :param output_path: Path of the sequence file.
+        :param start_id: ID of the first segment.
+        :return: Number of features written.
+        """
+        # Vertices JSON cannot represent are dropped.
+        segments = [seg for seg in (
+            [pt for pt in seg if math.isfinite(pt[0]) and math.isfinite(pt[1])] for seg in segments
+        ) if len(seg) > 1]
+        if not segments:
+            return 0
+        template = self._record_separator(output_path) + self._line_template
+        vertex = self._vertex_template
+        with open(output_path, "a", encoding="utf-8") as f:
+            f.write("".join(
+                template % (",".join(vertex % pt for pt in seg), i)
+                for i, seg in enumerate(segments, start=start_id)
+            ))
+        self._log("Appended %d line features to %s", "DEBUG", len(segments), output_path)
+        return len(segments)
+
+    def save_points(
+        self,
+        points,
+        output_path_or_layername: Optional[str] = None,
+        norad_id: Optional[int] = None
+    ) -> Optional[QgsVectorLayer]:
+        """
+        Save point data to a GeoJSON sequence in a single chunk.
+
+        :param points: List of point‐tuples: (datetime, lon, lat, alt, vel, az, arc, ta, inc).
+        :param output_path_or_layername: File path of the sequence.
+        :return: None.
+        """
+        self.begin(output_path_or_layername)
+        count = self.append_point_columns(points_to_columns(points), output_path_or_layername)
+        self._log("Successfully saved %d points to %s", "INFO", count, output_path_or_layername)
+        return None
+
+    def save_lines(
+        self,
+        geometries,
+        output_path_or_layername: Optional[str] = None,
+        norad_id: Optional[int] = None
+    ) -> Optional[QgsVectorLayer]:
+        """
+        Save line geometries to a GeoJSON sequence.
+
+        :param geometries: List of QgsGeometry objects (constructed in EPSG:4326).
+        :param output_path_or_layername: File path of the sequence.
+        :return: None.
+        """
+        self.begin(output_path_or_layername)
+        segments = [[(pt.x(), pt.y()) for pt in geom.asPolyline()] for geom in geometries]
+        count = self.append_line_segments(segments, output_path_or_layername)
+        self._log("Successfully saved %d lines to %s", "INFO", count, output_path_or_layername)
+        return None
+
 
 class MemorySaver(FileSaver):
     """Saver for in-memory QGIS layers."""
     format_name = "memory"
     date_field_type = QVariant.DateTime
 
-    def prepare_date(self, dt):
-        """Convert datetime to QDateTime for in-memory layers."""
-        return QDateTime(
-            dt.year, dt.month, dt.day,
-            dt.hour, dt.minute, dt.second
-        )
+    def prepare_dates(self, times):
+        """Convert datetimes to QDateTime for in-memory layers."""
+        return to_qdatetimes(times)
 
     def is_memory(self) -> bool:
         return True
@@ -398,7 +640,9 @@ class SaverFactory(ABC):
     def get_saver(
         self,
         log_callback: Optional[Callable[[str, str], None]] = None,
-        input_crs: Optional[QgsCoordinateReferenceSystem] = None
+        input_crs: Optional[QgsCoordinateReferenceSystem] = None,
+        project_crs: Optional[QgsCoordinateReferenceSystem] = None,
+        transform_context: Optional[QgsCoordinateTransformContext] = None
     ) -> FileSaver:
         pass
 
@@ -407,36 +651,60 @@ class ShpFactory(SaverFactory):
     def get_saver(
         self,
         log_callback: Optional[Callable[[str, str], None]] = None,
-        input_crs: Optional[QgsCoordinateReferenceSystem] = None
+        input_crs: Optional[QgsCoordinateReferenceSystem] = None,
+        project_crs: Optional[QgsCoordinateReferenceSystem] = None,
+        transform_context: Optional[QgsCoordinateTransformContext] = None
     ) -> FileSaver:
-        return ShpSaver(log_callback=log_callback, input_crs=input_crs)
+        return ShpSaver(log_callback=log_callback, input_crs=input_crs, project_crs=project_crs,
+                        transform_context=transform_context)
 
 
 class GpkgFactory(SaverFactory):
     def get_saver(
         self,
         log_callback: Optional[Callable[[str, str], None]] = None,
-        input_crs: Optional[QgsCoordinateReferenceSystem] = None
+        input_crs: Optional[QgsCoordinateReferenceSystem] = None,
+        project_crs: Optional[QgsCoordinateReferenceSystem] = None,
+        transform_context: Optional[QgsCoordinateTransformContext] = None
     ) -> FileSaver:
-        return GpkgSaver(log_callback=log_callback, input_crs=input_crs)
+        return GpkgSaver(log_callback=log_callback, input_crs=input_crs, project_crs=project_crs,
+                         transform_context=transform_context)
 
 
 class GeoJsonFactory(SaverFactory):
     def get_saver(
         self,
         log_callback: Optional[Callable[[str, str], None]] = None,
-        input_crs: Optional[QgsCoordinateReferenceSystem] = None
+        input_crs: Optional[QgsCoordinateReferenceSystem] = None,
+        project_crs: Optional[QgsCoordinateReferenceSystem] = None,
+        transform_context: Optional[QgsCoordinateTransformContext] = None
+    ) -> FileSaver:
+        return GeoJsonSaver(log_callback=log_callback, input_crs=input_crs, project_crs=project_crs,
+                            transform_context=transform_context)
+
+
+class GeoJsonSeqFactory(SaverFactory):
+    def get_saver(
+        self,
+        log_callback: Optional[Callable[[str, str], None]] = None,
+        input_crs: Optional[QgsCoordinateReferenceSystem] = None,
+        project_crs: Optional[QgsCoordinateReferenceSystem] = None,
+        transform_context: Optional[QgsCoordinateTransformContext] = None
     ) -> FileSaver:
-        return GeoJsonSaver(log_callback=log_callback, input_crs=input_crs)
+        return GeoJsonSeqSaver(log_callback=log_callback, input_crs=input_crs, project_crs=project_crs,
+                               transform_context=transform_context)
 
 
 class MemoryFactory(SaverFactory):
     def get_saver(
         self,
         log_callback: Optional[Callable[[str, str], None]] = None,
-        input_crs: Optional[QgsCoordinateReferenceSystem] = None
+        input_crs: Optional[QgsCoordinateReferenceSystem] = None,
+        project_crs: Optional[QgsCoordinateReferenceSystem] = None,
+        transform_context: Optional[QgsCoordinateTransformContext] = None
     ) -> FileSaver:
-        return MemorySaver(log_callback=log_callback, input_crs=input_crs)
+        return MemorySaver(log_callback=log_callback, input_crs=input_crs, project_crs=project_crs,
+                           transform_context=transform_context)
 
 
 class FactoryProvider:
@@ -454,6 +722,8 @@ class FactoryProvider:
             return GpkgFactory()
         elif fmt == 'geojson':
             return GeoJsonFactory()
+        elif fmt in STREAMING_FORMATS:
+            return GeoJsonSeqFactory()
         elif fmt == 'memory':
             return MemoryFactory()
         else:
@@ -0,0 +1,188 @@
+"""
+This module contains helpers that prepare track layers for the QGIS temporal
+controller, attribute indexes on track fields and a sorted time index used to
+answer time-range queries without expression evaluation.
+"""
+
+import numpy as np
+from qgis.core import QgsFeatureRequest, QgsVectorDataProvider, QgsVectorLayerTemporalProperties
+from PyQt5.QtCore import QVariant, QDateTime
+
+TIME_FIELD = "Date_Time"
+
+# Sorted time indexes of in-memory point layers by layer id: (SortedTimeIndex, feature ids).
+_layer_time_indexes = {}
+
+
+def configure_temporal_properties(layer, redraw_only: bool = False) -> bool:
+    """
+    Activate the layer for the temporal controller using its Date_Time field.
+
+    DateTime fields are used directly; string fields (Shapefile) are converted with
+    to_datetime() in the start expression.
+
+    :param layer: QgsVectorLayer with a Date_Time field.
+    :param redraw_only: Only redraw on time changes and let the provider filter
+                        features itself (used by ArrayProvider layers).
+    :return: True if temporal properties were configured.
+    """
+    if layer is None or not layer.isValid():
+        return False
+    index = layer.fields().indexFromName(TIME_FIELD)
+    if index == -1:
+        return False
+
+    props = layer.temporalProperties()
+    if redraw_only:
+        props.setMode(QgsVectorLayerTemporalProperties.ModeRedrawLayerOnly)
+    elif layer.fields().at(index).type() == QVariant.String:
+        props.setMode(QgsVectorLayerTemporalProperties.ModeFeatureDateTimeStartAndEndFromExpressions)
+        props.setStartExpression(f'to_datetime("{TIME_FIELD}")')
+        props.setEndExpression(f'to_datetime("{TIME_FIELD}")')
+    else:
+        props.setMode(QgsVectorLayerTemporalProperties.ModeFeatureDateTimeInstantFromField)
+        props.setStartField(TIME_FIELD)
+    props.setIsActive(True)
+    return True
+
+
+def create_attribute_index(layer, field_name: str) -> bool:
+    """
+    Create an attribute index on a field if the layer's provider supports it.
+
+    :param layer: QgsVectorLayer containing the field.
+    :param field_name: Name of the field to index.
+    :return: True if the index was created.
+    """
+    if layer is None or not layer.isValid():
+        return False
+    index = layer.fields().indexFromName(field_name)
+    provider = layer.dataProvider()
+    if index == -1 or not provider.capabilities() & QgsVectorDataProvider.CreateAttributeIndex:
+        return False
+    return provider.createAttributeIndex(index)
+
+
+def create_time_index(layer) -> bool:
+    """
+    Create an attribute index on Date_Time if the layer's provider supports it.
+
+    :param layer: QgsVectorLayer with a Date_Time field.
+    :return: True if the index was created.
+    """
+    return create_attribute_index(layer, TIME_FIELD)
+
+
+def register_time_index(layer, times, feature_ids) -> None:
+    """
+    Keep a sorted time index for a point layer so time ranges resolve to feature ids directly.
+
+    The index is dropped when the layer is deleted.
+
+    :param layer: QgsVectorLayer the features were added to.
+    :param times: Sequence of datetimes in the order the features were added.
+    :param feature_ids: Feature ids assigned by the provider, in the same order.
+    """
+    layer_id = layer.id()
+    _layer_time_indexes[layer_id] = (
+        SortedTimeIndex(np.asarray(times, dtype="datetime64[us]")),
+        np.asarray(feature_ids, dtype=np.int64),
+    )
+    layer.willBeDeleted.connect(lambda: _layer_time_indexes.pop(layer_id, None))
+
+
+def _to_datetime(value):
+    """Convert a QDateTime to datetime, leaving other values untouched."""
+    return value.toPyDateTime() if isinstance(value, QDateTime) else value
+
+
+def _iso(value) -> str:
+    """Format a datetime or datetime64 as an ISO string with millisecond precision."""
+    return np.datetime_as_string(np.datetime64(value, "ms"))
+
+
+def feature_ids_between(layer, start, end, include_end: bool = True):
+    """
+    Return the ids of the features of a track layer whose Date_Time lies between start and end.
+
+    Layers with a sorted time index (array-provider layers and in-memory layers created by
+    the plugin) are resolved with a binary search; other layers fall back to an
+    attribute filter expression.
+
+    :param layer: Point layer with a Date_Time field.
+    :param start: Range start (datetime, QDateTime or datetime64); None for open start.
+    :param end: Range end (datetime, QDateTime or datetime64); None for open end.
+    :param include_end: Whether samples at end are included.
+    :return: List of ascending feature ids.
+    """
+    start, end = _to_datetime(start), _to_datetime(end)
+    entry = _layer_time_indexes.get(layer.id())
+    if entry is not None:
+        time_index, feature_ids = entry
+        return feature_ids[time_index.ids_between(start, end, include_end=include_end)].tolist()
+    time_index = getattr(layer.dataProvider(), "time_index", None)
+    if time_index is not None:
+        return time_index.ids_between(start, end, include_end=include_end).tolist()
+
+    clauses = []
+    if start is not None:
+        clauses.append(f"to_datetime(\"{TIME_FIELD}\") >= to_datetime('{_iso(start)}')")
+    if end is not None:
+        operator = "<=" if include_end else "<"
+        clauses.append(f"to_datetime(\"{TIME_FIELD}\") {operator} to_datetime('{_iso(end)}')")
+    request = QgsFeatureRequest()
+    if clauses:
+        request.setFilterExpression(" AND ".join(clauses))
+    request.setFlags(QgsFeatureRequest.NoGeometry)
+    request.setNoAttributes()
+    return [feature.id() for feature in layer.getFeatures(request)]
+
+
+def features_between(layer, start, end, include_end: bool = True):
+    """
+    Iterate the features of a track layer whose Date_Time lies between start and end.
+
+    :param layer: Point layer with a Date_Time field.
+    :param start: Range start; None for open start.
+    :param end: Range end; None for open end.
+    :param include_end: Whether samples at end are included.
+    :return: QgsFeatureIterator over the matching features.
+    """
+    return layer.getFeatures(QgsFeatureRequest().setFilterFids(
+        feature_ids_between(layer, start, end, include_end)
+    ))
+
+
+class SortedTimeIndex:
+    """
+    Sorted view of a datetime64 column for range lookups in O(log n).
+
+    Propagated samples are already chronological, but the order is stored
+    explicitly so the index stays correct for any input.
+    """
+
+    def __init__(self, times: np.ndarray):
+        """
+        :param times: datetime64 array indexed by feature id.
+        """
+        self.order = np.argsort(times, kind="stable")
+        self.sorted_times = times[self.order]
+
+    def ids_between(self, start, end, include_start: bool = True, include_end: bool = True) -> np.ndarray:
+        """
+        Return the ascending feature ids whose time lies between start and end.
+
+        :param start: Range start (datetime or datetime64); None for open start.
+        :param end: Range end (datetime or datetime64); None for open end.
+        :param include_start: Whether samples at start are included.
+        :param include_end: Whether samples at end are included.
+        :return: Sorted int64 array of feature ids.
+        """
+        unit = self.sorted_times.dtype
+        lo = 0 if start is None else np.searchsorted(
+            self.sorted_times, np.datetime64(start).astype(unit), side="left" if include_start else "right"
+        )
+        hi = len(self.sorted_times) if end is None else np.searchsorted(
+            self.sorted_times, np.datetime64(end).astype(unit), side="right" if include_end else "left"
+        )
+        return np.sort(self.order[lo:hi]).astype(np.int64)
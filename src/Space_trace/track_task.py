@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""
+This module contains the QgsTask classes that run track generation in the background.
+
+A TrackGenerationTask splits a run into TrackChunkTask subtasks of a few satellites or
+files each. The subtasks run one after another on the threads of the QGIS task manager
+and pass their items through the retrieve, propagate and write stages of the run's
+StagedPipeline; the parent task finishes the run once all of them completed. Layers are
+added to the project in finished(), which QGIS calls on the GUI thread.
+"""
+import threading
+import time
+
+from qgis.core import QgsTask
+
+# Satellites or files per subtask; progress and cancellation are checked per item. The
+# stage pipeline drains at the end of every subtask, so chunks are kept fairly large.
+ITEMS_PER_SUBTASK = 50
+
+
+class TrackGenerationTask(QgsTask):
+    """Background run of the plugin over a list of satellites or files.
+
+    Holds the state shared by the subtasks of the run: the facade, the dataset writer,
+    the stage pipeline and the results waiting to be loaded on the GUI thread.
+    """
+
+    def __init__(self, plugin, sat_ids: list[int], inputs: dict, file_format: str,
+                 items_per_subtask: int = ITEMS_PER_SUBTASK):
+        """Create the task and its subtasks.
+
+        Args:
+            plugin (SpaceTracePlugin): Plugin processing the items.
+            sat_ids (list[int]): List of NORAD IDs or file indices.
+            inputs (dict): Validated user inputs.
+            file_format (str): Output file format.
+            items_per_subtask (int): Number of items processed by one subtask.
+        """
+        super().__init__(f"Space Trace: {len(sat_ids)} tracks", QgsTask.CanCancel)
+        self.plugin = plugin
+        self.sat_ids = sat_ids
+        self.inputs = inputs
+        self.file_format = file_format
+        self.facade = None
+        self.writer = None
+        self.pipeline = None
+        self.dataset_uris = None
+        self.results = []
+        self.successful = []
+        self.failed = []
+        self.exception = None
+        self.started_at = time.time()
+        self._lock = threading.Lock()
+
+        self.subtasks = []
+        for start in range(0, len(sat_ids), items_per_subtask):
+            subtask = TrackChunkTask(self, sat_ids[start:start + items_per_subtask], prepare=start == 0)
+            # Each chunk waits for the previous one; the parent runs after the last.
+            dependencies = self.subtasks[-1:]
+            self.addSubTask(subtask, dependencies, QgsTask.ParentDependsOnSubTask)
+            self.subtasks.append(subtask)
+
+    def record(self, item_id: int, result=None, error: Exception = None) -> None:
+        """Record the outcome of one item (any thread).
+
+        Args:
+            item_id (int): NORAD ID or file index.
+            result (tuple): (config, point, line) to finish on the GUI thread, or None.
+            error (Exception): Raised exception if the item failed.
+        """
+        with self._lock:
+            if error is not None:
+                self.failed.append((item_id, error))
+                return
+            self.successful.append(item_id)
+            if result is not None:
+                self.results.append((item_id,) + tuple(result))
+
+    def processed_count(self) -> int:
+        """Return the number of items finished so far."""
+        with self._lock:
+            return len(self.successful) + len(self.failed)
+
+    def run(self) -> bool:
+        """Close the dataset writer and the facade once all subtasks completed."""
+        try:
+            self.plugin._complete_run(self)
+            return True
+        except Exception as e:
+            self.exception = e
+            return False
+
+    def finished(self, result: bool) -> None:
+        """Load the results on the GUI thread and log the summary.
+
+        Args:
+            result (bool): True if the run completed, False if it was canceled or failed.
+        """
+        self.plugin._finish_run(self, result)
+
+
+class TrackChunkTask(QgsTask):
+    """Subtask processing one chunk of the items of a TrackGenerationTask."""
+
+    def __init__(self, run: TrackGenerationTask, items: list[int], prepare: bool = False):
+        """
+        Args:
+            run (TrackGenerationTask): Parent task holding the shared state.
+            items (list[int]): NORAD IDs or file indices of the chunk.
+            prepare (bool): Whether this subtask opens the facade, writer and pipeline of the run.
+        """
+        super().__init__(f"Space Trace: {len(items)} tracks", QgsTask.CanCancel)
+        self.run_task = run
+        self.items = items
+        self.prepare = prepare
+
+    def run(self) -> bool:
+        """Process the items of the chunk; returns False if canceled or the run failed."""
+        try:
+            if self.prepare:
+                self.run_task.plugin._prepare_run(self.run_task)
+            return self.run_task.plugin._process_chunk(self.run_task, self.items, self)
+        except Exception as e:
+            self.run_task.exception = e
+            return False
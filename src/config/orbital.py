@@ -17,4 +17,7 @@ class OrbitalConfig:
     create_line_layer: bool = True  # Whether to create a line layer
     save_data: bool = False         # Whether to save received data
     data_file_path: str = ""        # Path to local data file
-    save_data_path: str = ""        # Path to save received data
\ No newline at end of file
+    catalog: bool = False           # data_file_path is a multi-object catalog; sat_id selects the object
+    save_data_path: str = ""        # Path to save received data
+    chunk_size: int = 10000         # Samples per propagation chunk for streaming formats
+    compact_track: bool = False     # Write one LineStringZM feature per segment (Z=altitude, M=time)
@@ -0,0 +1,106 @@
+import asyncio
+import threading
+
+from .spacetrack_retriver import SpaceTrackRetriever
+from ..spacetrack_client.async_spacetrack_client import AsyncSpacetrackClientWrapper, DEFAULT_MAX_CONCURRENCY
+from ..spacetrack_client.spacetrack_client import MAX_ID_QUERY_CHARS, chunk_norad_ids
+
+
+class AsyncSpaceTrackRetriever(SpaceTrackRetriever):
+    """
+    Retrieves orbital data from the SpaceTrack API with concurrent asynchronous requests.
+
+    An event loop on a background thread runs the downloads. prefetch() starts the
+    batched queries of all chunks of NORAD IDs and returns at once, so the tracks of
+    satellites whose batch has arrived are generated while the other batches are still
+    in flight.
+    """
+    # Downloads run on the event loop; callers only wait for their futures.
+    thread_safe = True
+    # Maximum length of the NORAD ID list of one batched query.
+    max_id_chars = MAX_ID_QUERY_CHARS
+
+    def __init__(self, username, password, log_callback=None, cache=None,
+                 max_concurrency=DEFAULT_MAX_CONCURRENCY, base_url=None):
+        """
+        Initialize with SpaceTrack credentials and start the event loop thread.
+
+        :param username: SpaceTrack login username.
+        :param password: SpaceTrack password.
+        :param log_callback: Function to handle logging.
+        :param cache: Optional ElementSetCache serving recently fetched element sets.
+        :param max_concurrency: Maximum number of requests in flight.
+        :param base_url: Optional API root replacing https://www.space-track.org/.
+        """
+        client = AsyncSpacetrackClientWrapper(username, password, cache=cache, max_concurrency=max_concurrency,
+                                              base_url=base_url)
+        super().__init__(username, password, log_callback=log_callback, cache=cache, base_url=base_url,
+                         client=client)
+        # Futures by (sat_id, data_format, start_datetime): the batch of a prefetched satellite
+        # (dict NORAD ID -> data) or the download of a single one.
+        self._prefetched = {}
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="SpaceTraceRetriever", daemon=True)
+        self._thread.start()
+
+    def _submit(self, sat_id, start_datetime, data_format):
+        """Schedule the download of one satellite on the event loop and return its future."""
+        return asyncio.run_coroutine_threadsafe(
+            self.client.get_elements(sat_id, start_datetime, data_format), self._loop
+        )
+
+    def prefetch(self, sat_ids, start_datetime, data_format):
+        """
+        Start batched downloads for many satellites without waiting for them.
+
+        :param sat_ids: List of NORAD IDs.
+        :param start_datetime: Start date and time of the tracks.
+        :param data_format: Data format ("TLE" or "OMM").
+        :return: Number of satellites whose download was started.
+        """
+        ids = [sat_id for sat_id in dict.fromkeys(int(i) for i in sat_ids)
+               if (sat_id, data_format, start_datetime) not in self._prefetched]
+        chunks = chunk_norad_ids(ids, self.max_id_chars)
+        for chunk in chunks:
+            future = asyncio.run_coroutine_threadsafe(
+                self.client.get_elements_batch(chunk, start_datetime, data_format, self.max_id_chars), self._loop
+            )
+            for sat_id in chunk:
+                self._prefetched[(sat_id, data_format, start_datetime)] = future
+        self._log("Started %d batched %s downloads for %d satellites, %d requests in flight at most", "INFO",
+                  len(chunks), data_format, len(ids), self.client.max_concurrency)
+        return len(ids)
+
+    def _fetch(self, sat_id, start_datetime, data_format):
+        """
+        Wait for the prefetched batch of a satellite, or download it now.
+
+        :raises Exception: If the download failed or found no data.
+        """
+        future = self._prefetched.pop((int(sat_id), data_format, start_datetime), None)
+        if future is None:
+            return self._submit(int(sat_id), start_datetime, data_format).result()
+        try:
+            batch = future.result()
+        except Exception as e:
+            self._log(f"Batched download failed, requesting NORAD ID {sat_id} on its own: {str(e)}", "WARNING")
+            return self._submit(int(sat_id), start_datetime, data_format).result()
+        data = batch.get(int(sat_id))
+        if data is None:
+            raise Exception(f'No {data_format} data found for satellite {sat_id} before {start_datetime}')
+        return data
+
+    def close(self):
+        """Cancel pending downloads, close the session and stop the event loop."""
+        for future in self._prefetched.values():
+            future.cancel()
+        self._prefetched.clear()
+        if self._loop.is_running():
+            try:
+                asyncio.run_coroutine_threadsafe(self.client.close(), self._loop).result(timeout=10)
+            except Exception as e:
+                self._log(f"Failed to close SpaceTrack session: {str(e)}", "WARNING")
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=10)
+        if not self._loop.is_running():
+            self._loop.close()
@@ -0,0 +1,172 @@
+"""
+This module contains the MappedCatalog base class for element catalogs that are read
+through a memory map and indexed by NORAD ID.
+
+The index maps every NORAD ID to the byte offsets of its records and is kept in a
+sidecar file next to the catalog. When the catalog is opened again and its size and
+modification time match the sidecar, the index is loaded instead of scanning the file.
+"""
+
+import json
+import mmap
+import os
+
+SIDECAR_SUFFIX = ".stidx"
+SIDECAR_VERSION = 1
+
+
+def sidecar_path(file_path: str) -> str:
+    """Return the path of the index sidecar of a catalog file."""
+    return file_path + SIDECAR_SUFFIX
+
+
+class MappedCatalog:
+    """
+    Base class of memory-mapped catalogs with a persistent NORAD ID index.
+
+    Subclasses set kind and implement _scan(), _decode() and _epoch().
+    """
+    # Name of the catalog format stored in the sidecar.
+    kind = None
+
+    def __init__(self, file_path: str, use_sidecar: bool = True, log_callback=None):
+        """
+        Map the catalog and load or build its index.
+
+        :param file_path: Path of the catalog file.
+        :param use_sidecar: Whether to read and write the index sidecar.
+        :param log_callback: Optional function to handle logging.
+        :raises ValueError: If the file contains no records.
+        """
+        self.file_path = file_path
+        self.log_callback = log_callback
+        stat = os.stat(file_path)
+        self._signature = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+        self._file = open(file_path, "rb")
+        self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if stat.st_size else b""
+        # NORAD ID -> list of record entries (tuples of byte offsets, format specific).
+        self.offsets = {}
+        self.invalid_ids = set()
+
+        if not (use_sidecar and self._load_sidecar()):
+            for sat_id, entry in self._scan():
+                if entry is None:
+                    self.invalid_ids.add(sat_id)
+                else:
+                    self.offsets.setdefault(sat_id, []).append(tuple(entry))
+            self.invalid_ids -= set(self.offsets)
+            if use_sidecar:
+                self._save_sidecar()
+        if not self.offsets and not self.invalid_ids:
+            self.close()
+            self._log(f"No element sets found in {file_path}", "ERROR")
+            raise ValueError(f"No element sets found in {file_path}")
+        if self.invalid_ids:
+            self._log("Indexed %d objects in %s, %d with invalid records", "INFO",
+                      len(self.offsets), file_path, len(self.invalid_ids))
+        else:
+            self._log("Indexed %d objects in %s", "INFO", len(self.offsets), file_path)
+
+    def _log(self, message: str, level: str = "INFO", *args):
+        """
+        Log a message using the provided callback if available.
+
+        :param message: Message to log, a %-format string if args are given.
+        :param level: Log level ("INFO", "DEBUG", "WARNING", "ERROR").
+        :param args: Values the sink substitutes into message, only if the level is logged.
+        """
+        if self.log_callback:
+            if args:
+                self.log_callback(message, level, *args)
+            else:
+                self.log_callback(message, level)
+
+    def _load_sidecar(self) -> bool:
+        """Load the index from the sidecar if it matches the catalog; return True on success."""
+        try:
+            with open(sidecar_path(self.file_path), "r") as f:
+                sidecar = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if (sidecar.get("version") != SIDECAR_VERSION or sidecar.get("kind") != self.kind
+                or sidecar.get("signature") != self._signature):
+            return False
+        self.offsets = {int(sat_id): [tuple(entry) for entry in entries]
+                        for sat_id, entries in sidecar["offsets"].items()}
+        self.invalid_ids = set(sidecar["invalid_ids"])
+        self._log("Loaded catalog index from %s", "DEBUG", sidecar_path(self.file_path))
+        return True
+
+    def _save_sidecar(self) -> None:
+        """Write the index sidecar; an unwritable location only costs a rescan next time."""
+        sidecar = {
+            "version": SIDECAR_VERSION,
+            "kind": self.kind,
+            "signature": self._signature,
+            "offsets": {str(sat_id): entries for sat_id, entries in self.offsets.items()},
+            "invalid_ids": sorted(self.invalid_ids),
+        }
+        try:
+            with open(sidecar_path(self.file_path), "w") as f:
+                json.dump(sidecar, f, separators=(",", ":"))
+        except OSError as e:
+            self._log("Could not write catalog index %s: %s", "DEBUG", sidecar_path(self.file_path), e)
+
+    def _scan(self):
+        """Yield (sat_id, entry) for every record, entry None for invalid records."""
+        raise NotImplementedError
+
+    def _decode(self, entry):
+        """Decode the record stored at entry."""
+        raise NotImplementedError
+
+    def _epoch(self, record):
+        """Return the epoch of a decoded record as a naive UTC datetime."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release the memory map."""
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._data = b""
+        self._file.close()
+
+    def norad_ids(self) -> list:
+        """Return the sorted NORAD IDs of all objects with valid records."""
+        return sorted(self.offsets)
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __contains__(self, sat_id):
+        return int(sat_id) in self.offsets
+
+    def iter_records(self):
+        """
+        Yield (sat_id, record) for all valid records in file order, decoding each lazily.
+        """
+        entries = sorted((entry, sat_id) for sat_id, items in self.offsets.items() for entry in items)
+        for entry, sat_id in entries:
+            yield sat_id, self._decode(entry)
+
+    def get_record(self, sat_id: int, before=None):
+        """
+        Return the record of an object, the latest one not after before if given.
+
+        :param sat_id: NORAD ID.
+        :param before: Optional upper bound of the epoch.
+        :return: Decoded record.
+        :raises ValueError: If the object is missing or only has invalid records.
+        """
+        sat_id = int(sat_id)
+        if sat_id in self.invalid_ids:
+            raise ValueError(f"Records of NORAD ID {sat_id} in {self.file_path} are invalid")
+        entries = self.offsets.get(sat_id)
+        if not entries:
+            raise ValueError(f"NORAD ID {sat_id} not found in {self.file_path}")
+        records = [self._decode(entry) for entry in entries]
+        if len(records) > 1 or before is not None:
+            records.sort(key=self._epoch)
+            if before is not None:
+                records = [r for r in records if self._epoch(r) <= before] or records[:1]
+        return records[-1]
@@ -1,15 +1,36 @@
 from abc import ABC, abstractmethod
-import os
-import json
+
+from .omm_catalog import OmmCatalog
+from .tle_catalog import TleCatalog
 
 class DataRetriever(ABC):
+    # Whether retrieve_data may be called from several threads at once.
+    thread_safe = False
+
     @abstractmethod
     def retrieve_data(self, config):
         pass
 
+    def prefetch(self, sat_ids, start_datetime, data_format):
+        """
+        Retrieve data for many satellites ahead of the per-satellite retrieve_data calls.
+
+        The default implementation does nothing; retrievers with a batch API override it.
+
+        :param sat_ids: List of NORAD IDs.
+        :param start_datetime: Start date and time of the tracks.
+        :param data_format: Data format ("TLE" or "OMM").
+        :return: Number of satellites whose data was prefetched.
+        """
+        return 0
+
+    def close(self):
+        """Release connections or threads held by the retriever; the default has none."""
+        pass
+
 class LocalFileRetriever(DataRetriever):
     """
-    Retrieves orbital data from local files and saves it if specified.
+    Retrieves orbital data from local files.
     """
     def __init__(self, log_callback=None):
         """
@@ -18,46 +39,43 @@ class LocalFileRetriever(DataRetriever):
         :param log_callback: Function to handle logging.
         """
         self.log_callback = log_callback
+        # Catalog indexes by file path, built once per run.
+        self._catalogs = {}
 
-    def _log(self, message, level="INFO"):
+    def _log(self, message, level="INFO", *args):
         """
         Log a message using the provided callback, if available.
 
-        :param message: The message to log.
+        :param message: The message to log, a %-format string if args are given.
         :param level: Log level ("INFO", "DEBUG", "WARNING", "ERROR").
+        :param args: Values the sink substitutes into message, only if the level is logged.
         """
         if self.log_callback:
-            self.log_callback(message, level)
-
-    def _save_tle_data(self, tle_data, output_path):
-        """
-        Save TLE data to a file.
+            if args:
+                self.log_callback(message, level, *args)
+            else:
+                self.log_callback(message, level)
 
-        :param tle_data: Tuple containing TLE lines (tle_line1, tle_line2, orb_incl).
-        :param output_path: Path to save the TLE file.
-        """
-        output_path = os.path.splitext(output_path)[0]
-        tle_filename = f"{output_path}_tle.txt"
-        with open(tle_filename, 'w') as f:
-            f.write(f"{tle_data[0]}\n{tle_data[1]}\n")
-        self._log(f"TLE data saved to {tle_filename}", "INFO")
+    def _open_catalog(self, file_path, data_format):
+        """Return the TleCatalog or OmmCatalog of a file, indexing it on first use."""
+        key = (file_path, data_format)
+        if key not in self._catalogs:
+            catalog_class = TleCatalog if data_format == 'TLE' else OmmCatalog
+            self._catalogs[key] = catalog_class(file_path, log_callback=self.log_callback)
+        return self._catalogs[key]
 
-    def _save_omm_data(self, omm_data, output_path):
-        """
-        Save OMM data to a JSON file.
-
-        :param omm_data: OMM data to save.
-        :param output_path: Path to save the OMM JSON file.
-        """
-        output_path = os.path.splitext(output_path)[0]
-        json_filename = f"{output_path}_omm.json"
-        with open(json_filename, "w") as f:
-            json.dump(omm_data, f, indent=4)
-        self._log(f"OMM data saved to {json_filename}", "INFO")
+    def close(self):
+        """Release the memory maps of all opened catalogs."""
+        for catalog in self._catalogs.values():
+            catalog.close()
+        self._catalogs.clear()
 
     def retrieve_data(self, config):
         """
-        Retrieve data from a local file and save it if specified.
+        Retrieve data from a local file.
+
+        If config.catalog is set, the file is a multi-object catalog (2LE/3LE for TLE,
+        JSON array or CSV for OMM) and the element set of config.sat_id is taken from it.
 
         :param config: OrbitalConfig instance with settings.
         :return: Retrieved TLE or OMM data.
@@ -65,11 +83,13 @@ class LocalFileRetriever(DataRetriever):
         """
         file_path = config.data_file_path
         data_format = config.data_format
-        save_data = config.save_data
-        save_data_path = config.save_data_path
-
         try:
-            if data_format == 'TLE':
+            if config.catalog and data_format in ('TLE', 'OMM'):
+                catalog = self._open_catalog(file_path, data_format)
+                if data_format == 'TLE':
+                    return catalog.get_tle(config.sat_id, config.start_datetime)
+                return catalog.get_omm(config.sat_id, config.start_datetime)
+            elif data_format == 'TLE':
                 with open(file_path, 'r') as f:
                     lines = f.readlines()
                     if len(lines) < 2:
@@ -77,16 +97,19 @@ class LocalFileRetriever(DataRetriever):
                     tle_line1 = lines[0].strip()
                     tle_line2 = lines[1].strip()
                     orb_incl = float(tle_line2[8:16])
-                    data = (tle_line1, tle_line2, orb_incl)
-                    if save_data and save_data_path:
-                        self._save_tle_data(data, save_data_path)
-                    return data
+                    return (tle_line1, tle_line2, orb_incl)
             elif data_format == 'OMM':
-                with open(file_path, 'r') as f:
-                    data = json.load(f)
-                    if save_data and save_data_path:
-                        self._save_omm_data(data, save_data_path)
-                    return data
+                # JSON, CSV and XML payloads; the file may hold several epochs of the object,
+                # so the latest record not after the start time is returned as for catalogs.
+                catalog = OmmCatalog(file_path, use_sidecar=False, log_callback=self.log_callback)
+                try:
+                    sat_ids = catalog.norad_ids()
+                    if not sat_ids:
+                        raise ValueError("The OMM file contains no records.")
+                    sat_id = config.sat_id if config.sat_id in catalog else sat_ids[0]
+                    return catalog.get_omm(sat_id, config.start_datetime)
+                finally:
+                    catalog.close()
             else:
                 raise ValueError("Unsupported data format.")
         except Exception as e:
@@ -0,0 +1,237 @@
+"""
+This module contains the ElementArchive class, the store of TLE/OMM data saved by
+track runs.
+
+Every element set is stored once in an append-only pack file, zlib-compressed and
+addressed by the SHA-256 digest of its canonical text. A SQLite index maps digests to
+their place in the pack and (NORAD ID, epoch, format) to digests, so saving the same
+element set again only touches the index. The per-file TLE/OMM export of earlier
+versions is written from the archive on request.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+from .omm_catalog import omm_epoch
+from .tle_catalog import parse_norad_field, tle_epoch
+
+DEFAULT_ARCHIVE_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "element_archive")
+PACK_FILE = "elements.pack"
+INDEX_FILE = "index.sqlite"
+
+
+def canonical_element_sets(data, data_format: str):
+    """
+    Split retrieved data into element sets with their canonical text.
+
+    TLE sets are their two lines; OMM records are JSON with sorted keys, so equal
+    records always have equal text.
+
+    :param data: Tuple (tle_line1, tle_line2, orb_incl) for TLE, list of records for OMM.
+    :param data_format: Data format ("TLE" or "OMM").
+    :return: List of tuples (sat_id, epoch ISO string, text).
+    :raises ValueError: If the data format is unsupported.
+    """
+    if data_format == "TLE":
+        line1, line2 = data[0].strip(), data[1].strip()
+        return [(parse_norad_field(line1[2:7]), tle_epoch(line1).isoformat(timespec="microseconds"),
+                 f"{line1}\n{line2}\n")]
+    if data_format == "OMM":
+        return [(int(record["NORAD_CAT_ID"]), omm_epoch(record).isoformat(timespec="microseconds"),
+                 json.dumps(record, sort_keys=True, separators=(",", ":")))
+                for record in data]
+    raise ValueError("Unsupported data format. Use 'TLE' or 'OMM'.")
+
+
+class ElementArchive:
+    """
+    Content-addressed, compressed and append-only archive of element sets.
+    """
+
+    def __init__(self, directory: str = DEFAULT_ARCHIVE_DIR, log_callback=None):
+        """
+        Open (and create if needed) the archive.
+
+        :param directory: Directory holding the pack file and its index.
+        :param log_callback: Optional function to handle logging.
+        """
+        self.directory = directory
+        self.pack_path = os.path.join(directory, PACK_FILE)
+        self.index_path = os.path.join(directory, INDEX_FILE)
+        self.log_callback = log_callback
+        self._lock = threading.Lock()
+
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+        connection = self._connect()
+        with connection:
+            connection.executescript("""
+                CREATE TABLE IF NOT EXISTS blobs (
+                    digest TEXT PRIMARY KEY,
+                    pack_offset INTEGER NOT NULL,
+                    pack_length INTEGER NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS entries (
+                    norad_cat_id INTEGER NOT NULL,
+                    epoch TEXT NOT NULL,
+                    data_format TEXT NOT NULL,
+                    digest TEXT NOT NULL REFERENCES blobs (digest),
+                    added_at REAL NOT NULL,
+                    PRIMARY KEY (norad_cat_id, data_format, epoch)
+                );
+            """)
+        connection.close()
+
+    def _log(self, message: str, level: str = "INFO", *args):
+        """
+        Log a message using the provided callback if available.
+
+        :param message: Message to log, a %-format string if args are given.
+        :param level: Log level ("INFO", "DEBUG", "WARNING", "ERROR").
+        :param args: Values the sink substitutes into message, only if the level is logged.
+        """
+        if self.log_callback:
+            if args:
+                self.log_callback(message, level, *args)
+            else:
+                self.log_callback(message, level)
+
+    def _connect(self):
+        """Open a connection; one per operation so the archive can be used from any thread."""
+        connection = sqlite3.connect(self.index_path, timeout=30)
+        connection.execute("PRAGMA journal_mode=WAL")
+        return connection
+
+    def add(self, data, data_format: str) -> list:
+        """
+        Archive retrieved data; element sets already in the archive are not written again.
+
+        :param data: Tuple (tle_line1, tle_line2, orb_incl) for TLE, list of records for OMM.
+        :param data_format: Data format ("TLE" or "OMM").
+        :return: Digests of the element sets, in the order of data.
+        :raises ValueError: If the data format is unsupported.
+        """
+        element_sets = canonical_element_sets(data, data_format)
+        now = time.time()
+        digests, written = [], 0
+        with self._lock:
+            connection = self._connect()
+            try:
+                with connection:
+                    for sat_id, epoch, text in element_sets:
+                        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+                        if connection.execute("SELECT 1 FROM blobs WHERE digest = ?", (digest,)).fetchone() is None:
+                            # The blob is appended before it is indexed, so a crash leaves at most unreferenced bytes.
+                            blob = zlib.compress(text.encode("utf-8"))
+                            with open(self.pack_path, "ab") as pack:
+                                offset = pack.seek(0, os.SEEK_END)
+                                pack.write(blob)
+                            connection.execute("INSERT INTO blobs VALUES (?, ?, ?)", (digest, offset, len(blob)))
+                            written += 1
+                        connection.execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                                           (sat_id, epoch, data_format, digest, now))
+                        digests.append(digest)
+            finally:
+                connection.close()
+        self._log("Archived %d %s element sets, %d new", "INFO", len(digests), data_format, written)
+        return digests
+
+    def read(self, digest: str) -> str:
+        """
+        Return the canonical text of an archived element set.
+
+        :param digest: SHA-256 digest returned by add().
+        :raises KeyError: If the digest is not in the archive.
+        """
+        connection = self._connect()
+        try:
+            row = connection.execute(
+                "SELECT pack_offset, pack_length FROM blobs WHERE digest = ?", (digest,)
+            ).fetchone()
+        finally:
+            connection.close()
+        if row is None:
+            raise KeyError(digest)
+        with open(self.pack_path, "rb") as pack:
+            pack.seek(row[0])
+            return zlib.decompress(pack.read(row[1])).decode("utf-8")
+
+    def entries(self, sat_id: int = None) -> list:
+        """
+        List the archived element sets, optionally of one object.
+
+        :param sat_id: Optional NORAD ID.
+        :return: List of tuples (sat_id, epoch ISO string, data format, digest) ordered by ID and epoch.
+        """
+        query = "SELECT norad_cat_id, epoch, data_format, digest FROM entries"
+        params = ()
+        if sat_id is not None:
+            query += " WHERE norad_cat_id = ?"
+            params = (int(sat_id),)
+        connection = self._connect()
+        try:
+            return connection.execute(query + " ORDER BY norad_cat_id, epoch", params).fetchall()
+        finally:
+            connection.close()
+
+    def get(self, sat_id: int, data_format: str, before=None):
+        """
+        Return the latest archived element set of an object, shaped like retriever results.
+
+        :param sat_id: NORAD ID.
+        :param data_format: Data format ("TLE" or "OMM").
+        :param before: Optional datetime upper bound of the epoch.
+        :return: Tuple (tle_line1, tle_line2, orb_incl) for TLE, list with one record for OMM.
+        :raises ValueError: If no element set of the object is archived.
+        """
+        query = "SELECT digest FROM entries WHERE norad_cat_id = ? AND data_format = ?"
+        params = [int(sat_id), data_format]
+        if before is not None:
+            query += " AND epoch <= ?"
+            params.append(before.replace(tzinfo=None).isoformat(timespec="microseconds"))
+        connection = self._connect()
+        try:
+            row = connection.execute(query + " ORDER BY epoch DESC LIMIT 1", params).fetchone()
+        finally:
+            connection.close()
+        if row is None:
+            raise ValueError(f"No archived {data_format} data for NORAD ID {sat_id}")
+        return self._decode(self.read(row[0]), data_format)
+
+    @staticmethod
+    def _decode(text: str, data_format: str):
+        """Turn canonical text back into retriever-shaped data."""
+        if data_format == "TLE":
+            line1, line2 = text.splitlines()[:2]
+            return line1, line2, float(line2[8:16])
+        return [json.loads(text)]
+
+    def export(self, digests, data_format: str, output_path: str) -> str:
+        """
+        Write archived element sets to a TLE text or OMM JSON file.
+
+        The file is named like the files earlier versions saved next to the output:
+        <output_path without extension>_tle.txt or _omm.json.
+
+        :param digests: Digests returned by add().
+        :param data_format: Data format ("TLE" or "OMM").
+        :param output_path: Base path of the exported file.
+        :return: Path of the written file.
+        """
+        base = os.path.splitext(output_path)[0]
+        texts = [self.read(digest) for digest in digests]
+        if data_format == "TLE":
+            file_name = f"{base}_tle.txt"
+            with open(file_name, "w") as f:
+                f.write("".join(texts))
+        else:
+            file_name = f"{base}_omm.json"
+            with open(file_name, "w") as f:
+                json.dump([json.loads(text) for text in texts], f, indent=4)
+        self._log("%s data exported to %s", "INFO", data_format, file_name)
+        return file_name
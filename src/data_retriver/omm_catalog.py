@@ -0,0 +1,169 @@
+"""
+This module contains the OmmCatalog class which reads OMM catalogs in Space-Track's
+JSON array, CSV and XML (NDM) layouts.
+
+Records are located by a streaming pass over the memory-mapped file; only one record
+is decoded at a time, so the whole catalog is never held as Python objects.
+"""
+
+import csv
+import io
+import json
+import re
+import xml.etree.ElementTree as ET
+from datetime import datetime
+
+from .catalog_index import MappedCatalog
+
+# Initial window decoded around a JSON record; doubled until the record fits.
+JSON_WINDOW_BYTES = 4096
+
+_WHITESPACE = re.compile(rb"[\s,]*")
+_XML_OMM_START = re.compile(rb"<(?:\w+:)?omm[\s>]")
+_XML_OMM_END = re.compile(rb"</(?:\w+:)?omm\s*>")
+
+
+def xml_omm_record(segment: bytes) -> dict:
+    """
+    Flatten one <omm> element into a record keyed like the JSON and CSV layouts.
+
+    :param segment: Bytes of a complete <omm>...</omm> element.
+    :return: Dict of leaf element names to their text.
+    """
+    record = {}
+    for element in ET.fromstring(segment).iter():
+        if len(element) == 0 and element.text is not None:
+            record[element.tag.rsplit("}", 1)[-1]] = element.text.strip()
+    return record
+
+
+def omm_epoch(record) -> datetime:
+    """Return the EPOCH of an OMM record as a naive UTC datetime."""
+    return datetime.fromisoformat(record["EPOCH"].rstrip("Z"))
+
+
+class OmmCatalog(MappedCatalog):
+    """
+    Index over an OMM catalog (JSON array, XML or CSV with a header line).
+
+    Entries are (record offset, record length) in bytes.
+    """
+    kind = "omm"
+
+    def __init__(self, file_path: str, use_sidecar: bool = True, log_callback=None):
+        self._decoder = json.JSONDecoder()
+        self._header = None
+        self._layout = None
+        super().__init__(file_path, use_sidecar, log_callback)
+
+    @property
+    def layout(self) -> str:
+        """Return "json", "xml" or "csv" depending on the first character of the catalog."""
+        if self._layout is None:
+            start = _WHITESPACE.match(self._data, 0).end()
+            first = self._data[start:start + 1]
+            self._layout = "json" if first == b"[" else "xml" if first == b"<" else "csv"
+        return self._layout
+
+    @property
+    def is_csv(self) -> bool:
+        """Return True if the catalog is CSV."""
+        return self.layout == "csv"
+
+    def _scan(self):
+        """Yield the NORAD ID and byte range of every record."""
+        scanners = {"json": self._scan_json, "xml": self._scan_xml, "csv": self._scan_csv}
+        for offset, length, record in scanners[self.layout]():
+            try:
+                yield int(record["NORAD_CAT_ID"]), (offset, length)
+            except (KeyError, TypeError, ValueError):
+                self._log(f"Skipped OMM record without NORAD_CAT_ID at byte {offset}", "WARNING")
+
+    def _scan_json(self):
+        """Walk the top-level array, decoding one object at a time from a growing window."""
+        data = self._data
+        position = _WHITESPACE.match(data, 0).end() + 1
+        while True:
+            position = _WHITESPACE.match(data, position).end()
+            if position >= len(data) or data[position:position + 1] == b"]":
+                return
+            record, length = self._decode_json_at(position)
+            yield position, length, record
+            position += length
+
+    def _decode_json_at(self, offset: int, length: int = None):
+        """
+        Decode the JSON object starting at offset.
+
+        :return: Tuple (record, length in bytes).
+        :raises ValueError: If no complete object starts at offset.
+        """
+        window = length or JSON_WINDOW_BYTES
+        while True:
+            chunk = self._data[offset:offset + window]
+            try:
+                record, end = self._decoder.raw_decode(chunk.decode("utf-8", errors="ignore"))
+                consumed = len(chunk.decode("utf-8", errors="ignore")[:end].encode("utf-8"))
+                return record, consumed
+            except ValueError:
+                if offset + window >= len(self._data):
+                    raise ValueError(f"Malformed OMM record at byte {offset} of {self.file_path}")
+                window *= 2
+
+    def _scan_xml(self):
+        """Yield every <omm> element of an NDM/OMM XML document."""
+        position = 0
+        while True:
+            start = _XML_OMM_START.search(self._data, position)
+            if start is None:
+                return
+            end = _XML_OMM_END.search(self._data, start.end())
+            if end is None:
+                raise ValueError(f"Unterminated <omm> element at byte {start.start()} of {self.file_path}")
+            segment = self._data[start.start():end.end()]
+            yield start.start(), len(segment), xml_omm_record(segment)
+            position = end.end()
+
+    def _csv_header(self):
+        """Return the column names of a CSV catalog."""
+        if self._header is None:
+            end = self._data.find(b"\n")
+            line = self._data[:end if end >= 0 else len(self._data)].decode("utf-8-sig")
+            self._header = next(csv.reader([line]))
+        return self._header
+
+    def _scan_csv(self):
+        """Yield every data line of a CSV catalog with its parsed record."""
+        header = self._csv_header()
+        position = self._data.find(b"\n") + 1
+        while 0 < position < len(self._data):
+            end = self._data.find(b"\n", position)
+            end = len(self._data) if end < 0 else end + 1
+            line = self._data[position:end].decode("utf-8").strip()
+            if line:
+                yield position, end - position, dict(zip(header, next(csv.reader(io.StringIO(line)))))
+            position = end
+
+    def _decode(self, entry):
+        """Decode the OMM record stored at entry."""
+        offset, length = entry
+        if self.layout == "csv":
+            line = self._data[offset:offset + length].decode("utf-8").strip()
+            return dict(zip(self._csv_header(), next(csv.reader(io.StringIO(line)))))
+        if self.layout == "xml":
+            return xml_omm_record(self._data[offset:offset + length])
+        return self._decode_json_at(offset, length)[0]
+
+    def _epoch(self, record):
+        return omm_epoch(record)
+
+    def get_omm(self, sat_id: int, before: datetime = None):
+        """
+        Return the OMM record of an object, the latest one not after before if given.
+
+        :param sat_id: NORAD ID.
+        :param before: Optional upper bound of the epoch.
+        :return: List with one OMM record, shaped like Space-Track OMM responses.
+        :raises ValueError: If the object is missing.
+        """
+        return [self.get_record(sat_id, before)]
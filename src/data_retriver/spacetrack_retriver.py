@@ -1,86 +1,97 @@
-import os
-import json
 from .data_retriver import DataRetriever
 from ..spacetrack_client.spacetrack_client import SpacetrackClientWrapper
 
 class SpaceTrackRetriever(DataRetriever):
     """
-    Retrieves orbital data from the SpaceTrack API and saves it if specified.
+    Retrieves orbital data from the SpaceTrack API.
     """
-    def __init__(self, username, password, log_callback=None):
+    def __init__(self, username, password, log_callback=None, cache=None, incremental_sync=False, base_url=None,
+                 client=None):
         """
         Initialize with SpaceTrack credentials and optional logging callback.
 
         :param username: SpaceTrack login username.
         :param password: SpaceTrack password.
         :param log_callback: Function to handle logging.
+        :param cache: Optional ElementSetCache serving recently fetched element sets.
+        :param incremental_sync: Whether prefetch() first requests only element sets newer than those in the cache.
+        :param base_url: Optional API root replacing https://www.space-track.org/.
+        :param client: Client wrapper to use instead of a new SpacetrackClientWrapper.
         """
-        self.client = SpacetrackClientWrapper(username, password)
+        self.client = client or SpacetrackClientWrapper(username, password, cache=cache, base_url=base_url)
         self.log_callback = log_callback
+        self.incremental_sync = incremental_sync
+        # Batch results by (sat_id, data_format, start_datetime); None marks IDs without data.
+        self._prefetched = {}
 
-    def _log(self, message, level="INFO"):
+    def _log(self, message, level="INFO", *args):
         """
         Log a message using the provided callback, if available.
 
-        :param message: The message to log.
+        :param message: The message to log, a %-format string if args are given.
         :param level: Log level ("INFO", "DEBUG", "WARNING", "ERROR").
+        :param args: Values the sink substitutes into message, only if the level is logged.
         """
         if self.log_callback:
-            self.log_callback(message, level)
+            if args:
+                self.log_callback(message, level, *args)
+            else:
+                self.log_callback(message, level)
 
-    def _save_tle_data(self, tle_data, output_path):
+    def prefetch(self, sat_ids, start_datetime, data_format):
         """
-        Save TLE data to a file.
+        Retrieve data for many satellites with batched Space-Track queries.
 
-        :param tle_data: Tuple containing TLE lines (tle_line1, tle_line2, orb_incl).
-        :param output_path: Path to save the TLE file.
+        Later retrieve_data calls for the same satellite, start time and format are
+        answered from the batch without another request.
+
+        :param sat_ids: List of NORAD IDs.
+        :param start_datetime: Start date and time of the tracks.
+        :param data_format: Data format ("TLE" or "OMM").
+        :return: Number of satellites whose data was found.
         """
-        output_path = os.path.splitext(output_path)[0]
-        tle_filename = f"{output_path}_tle.txt"
-        with open(tle_filename, 'w') as f:
-            f.write(f"{tle_data[0]}\n{tle_data[1]}\n")
-        self._log(f"TLE data saved to {tle_filename}", "INFO")
+        if self.incremental_sync:
+            synced = self.client.sync_elements(sat_ids, start_datetime)
+            self._log("Incremental sync updated %d of %d satellites from the local history", "INFO",
+                      len(synced), len(sat_ids))
+        self._log("Requesting %s data for %d satellites in batches", "INFO", data_format, len(sat_ids))
+        results = self.client.get_elements_batch(sat_ids, start_datetime, data_format)
+        for sat_id in sat_ids:
+            self._prefetched[(int(sat_id), data_format, start_datetime)] = results.get(int(sat_id))
+        missing = len(set(map(int, sat_ids))) - len(results)
+        self._log("Batch retrieval returned data for %d satellites, %d without data", "INFO", len(results), missing)
+        return len(results)
 
-    def _save_omm_data(self, omm_data, output_path):
+    def _fetch(self, sat_id, start_datetime, data_format):
         """
-        Save OMM data to a JSON file.
+        Return prefetched data for a satellite, or query it individually.
 
-        :param omm_data: OMM data to save.
-        :param output_path: Path to save the OMM JSON file.
+        :raises Exception: If the batch found no data for the satellite.
         """
-        output_path = os.path.splitext(output_path)[0]
-        json_filename = f"{output_path}_omm.json"
-        with open(json_filename, "w") as f:
-            json.dump(omm_data, f, indent=4)
-        self._log(f"OMM data saved to {json_filename}", "INFO")
+        key = (int(sat_id), data_format, start_datetime)
+        if key not in self._prefetched:
+            if data_format == 'TLE':
+                return self.client.get_tle(sat_id, start_datetime)
+            return self.client.get_omm(sat_id, start_datetime)
+        data = self._prefetched.pop(key)
+        if data is None:
+            raise Exception(f'No {data_format} data found for satellite {sat_id} before {start_datetime}')
+        return data
 
     def retrieve_data(self, config):
         """
-        Retrieve data from SpaceTrack API and save it if specified.
+        Retrieve data from SpaceTrack API.
 
         :param config: OrbitalConfig instance with settings.
         :return: Retrieved TLE or OMM data, or None if retrieval fails.
         :raises ValueError: If the data format is unsupported.
         """
         data_format = config.data_format
-        sat_id = config.sat_id
-        start_datetime = config.start_datetime
-        save_data = config.save_data
-        save_data_path = config.save_data_path
-
-        if data_format == 'TLE':
-            data = self.client.get_tle(sat_id, start_datetime)
-            if save_data and data and save_data_path:
-                self._save_tle_data(data, save_data_path)
-        elif data_format == 'OMM':
-            data = self.client.get_omm(sat_id, start_datetime)
-            if save_data and data and save_data_path:
-                self._save_omm_data(data, save_data_path)
-        else:
+        if data_format not in ('TLE', 'OMM'):
             raise ValueError("Unsupported data format. Use 'TLE' or 'OMM'.")
 
+        data = self._fetch(config.sat_id, config.start_datetime, data_format)
         if not data:
             self._log(f"No data received for format: {data_format}", "ERROR")
             return None
         return data
-        
\ No newline at end of file
@@ -0,0 +1,148 @@
+"""
+This module contains the TleCatalog class which reads multi-object 2LE and 3LE
+catalog files.
+
+The memory-mapped file is scanned once to build an index from NORAD ID to the byte
+offsets of the element sets of that object; line checksums of all records are
+validated in one vectorized pass. Element sets are decoded only when requested.
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from .catalog_index import MappedCatalog
+
+TLE_LINE_LENGTH = 69
+
+# Alpha-5 NORAD IDs replace the leading digit by a letter; I and O are not used.
+_ALPHA5 = {letter: 10 + i for i, letter in enumerate("ABCDEFGHJKLMNPQRSTUVWXYZ")}
+
+
+def parse_norad_field(field: str) -> int:
+    """
+    Decode the 5-character catalog number of a TLE line, including Alpha-5 numbers.
+
+    :param field: Columns 3-7 of TLE line 1.
+    :return: NORAD ID.
+    :raises ValueError: If the field is not a valid catalog number.
+    """
+    field = field.strip()
+    if field and field[0].isalpha():
+        return _ALPHA5[field[0].upper()] * 10000 + int(field[1:])
+    return int(field)
+
+
+def tle_epoch(line1: str) -> datetime:
+    """
+    Decode the epoch of TLE line 1 (two-digit year and fractional day of year).
+
+    :param line1: TLE line 1.
+    :return: Naive UTC datetime.
+    """
+    year = int(line1[18:20])
+    year += 2000 if year < 57 else 1900
+    return datetime(year, 1, 1) + timedelta(days=float(line1[20:32]) - 1)
+
+
+def line_starts(buffer: np.ndarray):
+    """
+    Return the start and end offsets of all lines of a byte buffer.
+
+    Line ends exclude the line break and a preceding carriage return.
+
+    :param buffer: uint8 array of the file contents.
+    :return: Tuple (starts, ends) of int64 arrays.
+    """
+    breaks = np.flatnonzero(buffer == ord("\n"))
+    starts = np.concatenate(([0], breaks + 1))
+    ends = np.concatenate((breaks, [len(buffer)]))
+    if len(starts) and starts[-1] >= len(buffer):
+        starts, ends = starts[:-1], ends[:-1]
+    has_cr = (ends > starts) & (buffer[np.maximum(ends - 1, 0)] == ord("\r"))
+    return starts.astype(np.int64), (ends - has_cr).astype(np.int64)
+
+
+def valid_checksums(buffer: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """
+    Validate the modulo-10 checksums of many TLE lines at once.
+
+    Digits count with their value and minus signs count as 1; the sum of the first
+    68 characters modulo 10 must equal the digit in column 69.
+
+    :param buffer: uint8 array of the file contents.
+    :param starts: Start offsets of lines that are at least 69 characters long.
+    :return: Boolean array, True where the checksum matches.
+    """
+    if not len(starts):
+        return np.zeros(0, dtype=bool)
+    chars = buffer[starts[:, None] + np.arange(TLE_LINE_LENGTH - 1)].astype(np.int64)
+    digits = (chars >= ord("0")) & (chars <= ord("9"))
+    values = np.where(digits, chars - ord("0"), 0) + (chars == ord("-"))
+    expected = buffer[starts + TLE_LINE_LENGTH - 1].astype(np.int64) - ord("0")
+    return values.sum(axis=1) % 10 == expected
+
+
+class TleCatalog(MappedCatalog):
+    """
+    Index over a 2LE or 3LE catalog file with any number of objects.
+
+    Entries are (line 1 offset, line 2 offset, name line offset or -1).
+    """
+    kind = "tle"
+
+    def _scan(self):
+        """Find line 1/line 2 pairs and validate their checksums."""
+        buffer = np.frombuffer(self._data, dtype=np.uint8) if len(self._data) else np.zeros(0, dtype=np.uint8)
+        starts, ends = line_starts(buffer)
+        if len(starts) < 2:
+            return
+        long_enough = (ends - starts) >= TLE_LINE_LENGTH
+        first = np.where(ends > starts, buffer[np.minimum(starts, len(buffer) - 1)], 0)
+        second = np.where(ends - starts > 1, buffer[np.minimum(starts + 1, len(buffer) - 1)], 0)
+        is_line1 = long_enough & (first == ord("1")) & (second == ord(" "))
+        is_line2 = long_enough & (first == ord("2")) & (second == ord(" "))
+        pairs = np.flatnonzero(is_line1[:-1] & is_line2[1:])
+
+        valid = valid_checksums(buffer, starts[pairs]) & valid_checksums(buffer, starts[pairs + 1])
+        for i, ok in zip(pairs.tolist(), valid.tolist()):
+            start = int(starts[i])
+            sat_id = parse_norad_field(self._data[start + 2:start + 7].decode("ascii"))
+            if not ok:
+                self._log(f"Skipped element set of NORAD ID {sat_id} with checksum errors", "WARNING")
+                yield sat_id, None
+                continue
+            has_name = i > 0 and not is_line2[i - 1] and not is_line1[i - 1] and ends[i - 1] > starts[i - 1]
+            yield sat_id, (start, int(starts[i + 1]), int(starts[i - 1]) if has_name else -1)
+
+    def _line(self, offset: int) -> str:
+        """Decode the line starting at offset."""
+        end = self._data.find(b"\n", offset)
+        return self._data[offset:end if end >= 0 else len(self._data)].decode("ascii").rstrip("\r")
+
+    def _decode(self, entry):
+        """Return (line1, line2) of an entry."""
+        return self._line(entry[0]), self._line(entry[1])
+
+    def _epoch(self, record):
+        return tle_epoch(record[0])
+
+    def name(self, sat_id: int):
+        """Return the object name of a 3LE record, or None for 2LE files."""
+        entries = self.offsets.get(int(sat_id))
+        if not entries or entries[-1][2] < 0:
+            return None
+        name = self._line(entries[-1][2]).strip()
+        return name[2:] if name.startswith("0 ") else name
+
+    def get_tle(self, sat_id: int, before: datetime = None):
+        """
+        Return the element set of an object, the latest one not after before if given.
+
+        :param sat_id: NORAD ID.
+        :param before: Optional upper bound of the epoch.
+        :return: Tuple (tle_line1, tle_line2, orb_incl).
+        :raises ValueError: If the object is missing or only has invalid element sets.
+        """
+        line1, line2 = self.get_record(sat_id, before)
+        return line1, line2, float(line2[8:16])
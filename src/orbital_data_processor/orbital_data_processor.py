@@ -1,6 +1,17 @@
 from abc import ABC, abstractmethod
-from datetime import datetime
-from typing import List, Tuple
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Tuple
+
+import numpy as np
+
+# Column names of the columnar propagation result, in the order of the point tuples.
+ORBITAL_COLUMNS = (
+    "time", "lon", "lat", "alt", "velocity",
+    "azimuth", "trajectory_arc", "true_anomaly", "inclination",
+)
+
+DEFAULT_CHUNK_SIZE = 10000
+
 
 class OrbitalDataProcessorInterface(ABC):
     """
@@ -16,6 +27,14 @@ class OrbitalDataProcessorInterface(ABC):
         pass
 
     @abstractmethod
+    def compute_orbital_columns(self, times: List[datetime]) -> Dict[str, np.ndarray]:
+        """
+        Compute orbital parameters for each datetime in times list as columnar arrays.
+        Returns a dict keyed by ORBITAL_COLUMNS; "time" is a datetime64[us] array,
+        every other column is a float64 array rounded to 4 decimals.
+        """
+        pass
+
     def compute_orbital_parameters(
         self,
         times: List[datetime]
@@ -24,9 +43,26 @@ class OrbitalDataProcessorInterface(ABC):
         Compute detailed orbital parameters for each datetime in times list.
         Returns list of tuples: (time, lon, lat, alt, velocity, azimuth, arc, true_anomaly, inclination).
         """
-        pass
+        return columns_to_points(self.compute_orbital_columns(times), times)
+
+    @staticmethod
+    def time_step_count(start: datetime, duration_hours: float, step_minutes: float) -> int:
+        """
+        Return the number of propagation times from start over duration with given step.
+        """
+        return int(timedelta(hours=duration_hours) / timedelta(minutes=step_minutes)) + 1
+
+    @staticmethod
+    def time_steps(start: datetime, duration_hours: float, step_minutes: float) -> List[datetime]:
+        """
+        Generate the list of all propagation times from start over duration with given step.
+        The list holds one datetime per sample of the whole track; propagate_chunks()
+        builds the times of each chunk instead.
+        """
+        step = timedelta(minutes=step_minutes)
+        count = OrbitalDataProcessorInterface.time_step_count(start, duration_hours, step_minutes)
+        return [start + i * step for i in range(count)]
 
-    @abstractmethod
     def propagate(
         self,
         start: datetime,
@@ -36,4 +72,109 @@ class OrbitalDataProcessorInterface(ABC):
         """
         Generate propagated orbital parameters from start over duration with given step.
         """
-        pass
+        return self.compute_orbital_parameters(self.time_steps(start, duration_hours, step_minutes))
+
+    def propagate_columns(
+        self,
+        start: datetime,
+        duration_hours: float,
+        step_minutes: float
+    ) -> Dict[str, np.ndarray]:
+        """
+        Generate propagated orbital parameters as columnar arrays keyed by ORBITAL_COLUMNS.
+        """
+        return self.compute_orbital_columns(self.time_steps(start, duration_hours, step_minutes))
+
+    def propagate_chunks(
+        self,
+        start: datetime,
+        duration_hours: float,
+        step_minutes: float,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[Dict[str, np.ndarray]]:
+        """
+        Propagate the orbit lazily, yielding columnar results of at most chunk_size samples.
+        The times of each chunk are computed as start + k * step when it is propagated,
+        so peak memory stays bounded by the chunk size regardless of the track length.
+        """
+        step = timedelta(minutes=step_minutes)
+        count = self.time_step_count(start, duration_hours, step_minutes)
+        for offset in range(0, count, chunk_size):
+            times = [start + k * step for k in range(offset, min(offset + chunk_size, count))]
+            yield self.compute_orbital_columns(times)
+
+
+def columns_to_points(
+    columns: Dict[str, np.ndarray],
+    times: List[datetime] = None
+) -> List[Tuple[datetime, float, float, float, float, float, float, float, float]]:
+    """
+    Convert columnar propagation results to the legacy list of point tuples.
+
+    :param columns: Dict of arrays keyed by ORBITAL_COLUMNS.
+    :param times: Optional original datetimes, reused instead of converting the time column.
+    :return: List of tuples (time, lon, lat, alt, velocity, azimuth, arc, true_anomaly, inclination).
+    """
+    if times is None:
+        times = columns["time"].astype("datetime64[us]").tolist()
+    values = [columns[name].tolist() for name in ORBITAL_COLUMNS[1:]]
+    return list(zip(times, *values))
+
+
+def iso_date_unit(start_datetime: datetime, step_minutes: float) -> str:
+    """
+    Return the precision of the dates of a run: "s" if every sample falls on a whole second, "ms" otherwise.
+
+    Deciding it once from the start and step keeps the dates of a track consistent
+    when its chunks are formatted separately.
+
+    :param start_datetime: Start datetime for propagation.
+    :param step_minutes: Time step in minutes.
+    :return: "s" or "ms".
+    """
+    step_ms = round(step_minutes * 60000)
+    whole_seconds = step_ms % 1000 == 0 and start_datetime.microsecond // 1000 == 0
+    return "s" if whole_seconds else "ms"
+
+
+def column_date_unit(times: np.ndarray) -> str:
+    """
+    Return "s" if every value of a datetime64 column falls on a whole second, "ms" otherwise.
+
+    :param times: datetime64 array.
+    :return: "s" or "ms".
+    """
+    milliseconds = np.asarray(times, dtype="datetime64[ms]").astype(np.int64)
+    return "ms" if np.any(milliseconds % 1000) else "s"
+
+
+def format_iso_dates(times: np.ndarray, unit: str = None) -> np.ndarray:
+    """
+    Format a datetime64 column as ISO 8601 strings in one vectorized step.
+
+    Without a unit, whole-second columns are formatted to the second and columns
+    with sub-second samples keep millisecond precision.
+
+    :param times: datetime64 array.
+    :param unit: "s" or "ms" as returned by iso_date_unit(), or None to decide from the column.
+    :return: Array of strings such as "2025-03-28T00:00:00" or "2025-03-28T00:00:00.500".
+    """
+    times = np.asarray(times, dtype="datetime64[ms]")
+    return np.datetime_as_string(times, unit=unit or column_date_unit(times))
+
+
+def points_to_columns(points) -> Dict[str, np.ndarray]:
+    """
+    Convert a list of point tuples to columnar arrays keyed by ORBITAL_COLUMNS.
+
+    :param points: List of tuples (time, lon, lat, alt, velocity, azimuth, arc, true_anomaly, inclination).
+    :return: Dict of numpy arrays.
+    """
+    if not points:
+        return {name: np.array([], dtype="datetime64[us]" if name == "time" else float)
+                for name in ORBITAL_COLUMNS}
+    transposed = list(zip(*points))
+    columns = {"time": np.array(transposed[0], dtype="datetime64[us]")}
+    for name, values in zip(ORBITAL_COLUMNS[1:], transposed[1:]):
+        columns[name] = np.asarray(values, dtype=float)
+    return columns
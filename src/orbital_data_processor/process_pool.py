@@ -0,0 +1,207 @@
+"""
+This module contains the ProcessPoolPropagator class which propagates satellites on
+worker processes.
+
+Only the element sets are sent to the workers. The parent allocates a shared-memory
+block sized for the columnar result (the number of samples follows from the start,
+duration and step), the worker propagates straight into it, and the parent copies the
+columns out and frees the block, so no point data is pickled.
+
+Workers are started with the spawn method: forking QGIS and its threads is unsafe.
+When QGIS embeds Python, sys.executable is the QGIS binary, so the interpreter of the
+embedded installation is used instead. Workers import only this package and the plugin
+package above it, neither of which needs QGIS.
+"""
+
+import multiprocessing
+import os
+import shutil
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker, shared_memory
+from typing import Dict
+
+import numpy as np
+
+from .orbital_data_processor import ORBITAL_COLUMNS, OrbitalDataProcessorInterface
+
+# Every column is 8 bytes per sample: datetime64[us] for time, float64 for the rest.
+_ITEM_SIZE = 8
+
+
+def python_executable() -> str:
+    """
+    Return the Python interpreter worker processes are started with.
+
+    :return: Path of the interpreter.
+    :raises RuntimeError: If no interpreter is found next to the embedded one.
+    """
+    if os.path.basename(sys.executable).lower().startswith("python"):
+        return sys.executable
+    version = f"{sys.version_info.major}.{sys.version_info.minor}"
+    candidates = [
+        os.path.join(sys.exec_prefix, "pythonw.exe"),  # Windows (OSGeo4W, standalone installer)
+        os.path.join(sys.exec_prefix, "python.exe"),
+        os.path.join(sys.exec_prefix, "bin", f"python{version}"),  # Linux, macOS framework build
+        os.path.join(sys.exec_prefix, "bin", "python3"),
+    ]
+    for candidate in candidates:
+        if os.path.isfile(candidate):
+            return candidate
+    found = shutil.which(f"python{version}")
+    if found:
+        return found
+    raise RuntimeError(f"No Python {version} interpreter found for propagation workers")
+
+
+def column_dtype(name: str) -> np.dtype:
+    """Return the dtype of a column of the columnar propagation result."""
+    return np.dtype("datetime64[us]") if name == "time" else np.dtype(np.float64)
+
+
+def shared_columns(buffer, count: int) -> Dict[str, np.ndarray]:
+    """
+    Map the columns of a propagation result onto a buffer, one column after another.
+
+    :param buffer: Buffer of at least count * len(ORBITAL_COLUMNS) * 8 bytes.
+    :param count: Number of samples.
+    :return: Dict of arrays keyed by ORBITAL_COLUMNS, backed by the buffer.
+    """
+    return {
+        name: np.ndarray((count,), dtype=column_dtype(name), buffer=buffer, offset=index * count * _ITEM_SIZE)
+        for index, name in enumerate(ORBITAL_COLUMNS)
+    }
+
+
+def attach_block(block_name: str) -> shared_memory.SharedMemory:
+    """
+    Attach to a shared-memory block owned by another process without tracking it.
+
+    Before Python 3.13 attaching registers the block with the resource tracker as if the
+    attaching process owned it. Spawned workers share the parent's tracker, which keeps
+    one entry per name, so unregistering afterwards would drop the parent's entry too;
+    registration is skipped instead. Workers attach from a single thread.
+
+    :param block_name: Name of the block.
+    :return: Attached SharedMemory instance.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=block_name, track=False)
+    register = resource_tracker.register
+    resource_tracker.register = lambda name, rtype: None
+    try:
+        return shared_memory.SharedMemory(name=block_name)
+    finally:
+        resource_tracker.register = register
+
+
+def propagate_into(block_name: str, count: int, data, data_format: str, start_datetime,
+                   duration_hours: float, step_minutes: float) -> None:
+    """
+    Propagate one satellite into a shared-memory block (runs in a worker process).
+
+    :param block_name: Name of the block allocated by the parent.
+    :param count: Number of samples the block was sized for.
+    :param data: TLE or OMM data.
+    :param data_format: Data format ('TLE' or 'OMM').
+    :param start_datetime: Start datetime for propagation.
+    :param duration_hours: Duration in hours.
+    :param step_minutes: Time step in minutes.
+    :raises ValueError: If the propagation returns a different number of samples.
+    """
+    from .skyfield import create_processor
+
+    # The default logger of the processor prints; workers have no log window.
+    processor = create_processor(data, data_format, log_callback=lambda message, level="INFO", *args: None)
+    columns = processor.propagate_columns(start_datetime, duration_hours, step_minutes)
+    if len(columns["time"]) != count:
+        raise ValueError(f"Propagation returned {len(columns['time'])} samples, expected {count}")
+    block = attach_block(block_name)
+    try:
+        target = shared_columns(block.buf, count)
+        for name in ORBITAL_COLUMNS:
+            target[name][:] = columns[name]
+        del target
+    finally:
+        block.close()
+
+
+class ProcessPoolPropagator:
+    """
+    Pool of worker processes returning columnar propagation results through shared memory.
+
+    propagate_columns() may be called from several threads at once; each call keeps
+    one worker busy.
+    """
+
+    def __init__(self, workers: int = None, log_callback=None):
+        """
+        :param workers: Number of worker processes (defaults to the number of CPUs).
+        :param log_callback: Optional function to handle logging.
+        """
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.log_callback = log_callback
+        self._executor = None
+        # Propagation threads reach _pool() at the same time on the first tracks of a run.
+        self._executor_lock = threading.Lock()
+
+    def _log(self, message: str, level: str = "INFO", *args):
+        """
+        Log a message using the provided callback if available.
+
+        :param message: Message to log, a %-format string if args are given.
+        :param level: Log level ("INFO", "DEBUG", "WARNING", "ERROR").
+        :param args: Values the sink substitutes into message, only if the level is logged.
+        """
+        if self.log_callback:
+            if args:
+                self.log_callback(message, level, *args)
+            else:
+                self.log_callback(message, level)
+
+    def _pool(self) -> ProcessPoolExecutor:
+        """Start the worker processes on first use."""
+        executor = self._executor
+        if executor is not None:
+            return executor
+        with self._executor_lock:
+            if self._executor is None:
+                context = multiprocessing.get_context("spawn")
+                executable = python_executable()
+                if executable != sys.executable:
+                    context.set_executable(executable)
+                self._log("Starting %d propagation processes with %s", "INFO", self.workers, executable)
+                self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=context)
+            return self._executor
+
+    def propagate_columns(self, data, data_format: str, start_datetime, duration_hours: float,
+                          step_minutes: float) -> Dict[str, np.ndarray]:
+        """
+        Propagate one satellite on a worker process.
+
+        :param data: TLE or OMM data.
+        :param data_format: Data format ('TLE' or 'OMM').
+        :param start_datetime: Start datetime for propagation.
+        :param duration_hours: Duration in hours.
+        :param step_minutes: Time step in minutes.
+        :return: Dict of arrays keyed by ORBITAL_COLUMNS.
+        :raises Exception: If the worker fails to propagate the data.
+        """
+        count = OrbitalDataProcessorInterface.time_step_count(start_datetime, duration_hours, step_minutes)
+        block = shared_memory.SharedMemory(create=True, size=max(1, count * len(ORBITAL_COLUMNS) * _ITEM_SIZE))
+        try:
+            self._pool().submit(
+                propagate_into, block.name, count, data, data_format, start_datetime, duration_hours, step_minutes
+            ).result()
+            return {name: column.copy() for name, column in shared_columns(block.buf, count).items()}
+        finally:
+            block.close()
+            block.unlink()
+
+    def close(self) -> None:
+        """Stop the worker processes."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
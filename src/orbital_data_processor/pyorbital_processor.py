@@ -1,5 +1,5 @@
-from datetime import datetime, timedelta
-from typing import List, Tuple
+from datetime import datetime
+from typing import Dict, List, Tuple
 import numpy as np
 from pyorbital.orbital import Orbital
 from poliastro.twobody.angles import M_to_nu
@@ -12,52 +12,54 @@ class PyOrbitalDataProcessor(OrbitalDataProcessorInterface):
     """
     def __init__(self, tle_name: str, tle1: str, tle2: str, inclination: float, log_callback=None):
 
-        self.log_callback = log_callback or (lambda msg, lvl="INFO": print(f"[{lvl}] {msg}"))
-        self._log(f"Initializing PyOrbitalDataProcessor with name={tle_name}, line1={tle1[:20]}..., line2={tle2[:20]}...", "DEBUG")
+        self.log_callback = log_callback or (lambda msg, lvl="INFO", *args: print(f"[{lvl}] {msg % args if args else msg}"))
+        self._log("Initializing PyOrbitalDataProcessor with name=%s, line1=%.20s..., line2=%.20s...", "DEBUG",
+                  tle_name, tle1, tle2)
         
         try:
             self.orb = Orbital(tle_name, line1=tle1, line2=tle2)
             self.inclination = float(self.orb.tle.inclination)  # Derive from TLE
-            self._log(f"Inclination derived: {self.inclination}", "DEBUG")
+            self._log("Inclination derived: %s", "DEBUG", self.inclination)
         except Exception as e:
             self._log(f"Failed to initialize Orbital with TLE data: {str(e)}", "ERROR")
             raise ValueError(f"Failed to initialize Orbital with TLE data: {str(e)}")
         
-    def _log(self, message, level="INFO"):
+    def _log(self, message, level="INFO", *args):
         """
         Log a message using the provided callback.
 
-        :param message: The log message.
+        :param message: The log message, a %-format string if args are given.
         :param level: Log level ("INFO", "DEBUG", "WARNING", "ERROR").
+        :param args: Values the sink substitutes into message, only if the level is logged.
         """
         if self.log_callback:
-            self.log_callback(message, level)
+            if args:
+                self.log_callback(message, level, *args)
+            else:
+                self.log_callback(message, level)
 
     def get_coord(self, time_utc: datetime) -> Tuple[float, float, float]:
         """
         Obtain geodetic position (lon, lat, alt) at specified UTC time.
         """
-        self._log(f"Getting coordinates for time: {time_utc}", "DEBUG")
+        self._log("Getting coordinates for time: %s", "DEBUG", time_utc)
 
         lon, lat, alt = self.orb.get_lonlatalt(time_utc)
         return lon, lat, alt
 
-    def compute_orbital_parameters(
-        self,
-        times: List[datetime]
-    ) -> List[Tuple[datetime, float, float, float, float, float, float, float, float]]:
+    def compute_orbital_columns(self, times: List[datetime]) -> Dict[str, np.ndarray]:
         """
-        Compute orbital parameters for given list of datetimes.
+        Compute orbital parameters for given list of datetimes as columnar arrays.
 
         :param times: List of datetime objects.
-        :return: List of tuples containing orbital parameters.
+        :return: Dict of arrays keyed by ORBITAL_COLUMNS.
         :raises RuntimeError: If computation fails.
         """
 
-        self._log(f"Computing orbital parameters for {len(times)} times", "DEBUG")
+        self._log("Computing orbital parameters for %d times", "DEBUG", len(times))
 
         try:
-            times_np = np.array([np.datetime64(t) for t in times])
+            times_np = np.array(times, dtype="datetime64[us]")
             _, velocities = self.orb.get_position(times_np, normalize=False)
             lons, lats, alts = self.get_coord(times_np)
 
@@ -91,22 +93,20 @@ class PyOrbitalDataProcessor(OrbitalDataProcessorInterface):
             M = M0_rad + n_rad_per_sec * times_sec
             true_anomaly = (np.degrees(M_to_nu(M, e)) + 360) % 360
 
-            results = []
-            for i, t in enumerate(times):
-                results.append((
-                    t,
-                    round(float(lons[i]), 4),
-                    round(float(lats[i]), 4),
-                    round(float(alts[i]), 4),
-                    round(float(np.linalg.norm(velocities[:, i])), 4),
-                    round(float(azimuth[i]), 4),
-                    round(float(trajectory_arc[i]), 4),
-                    round(float(true_anomaly[i]), 4),
-                    round(float(self.inclination), 4)
-                ))
-
-            self._log(f"Computed {len(results)} orbital parameter sets", "INFO")
-            return results
+            columns = {
+                "time": times_np,
+                "lon": np.round(np.asarray(lons, dtype=float), 4),
+                "lat": np.round(np.asarray(lats, dtype=float), 4),
+                "alt": np.round(np.asarray(alts, dtype=float), 4),
+                "velocity": np.round(np.linalg.norm(velocities, axis=0), 4),
+                "azimuth": np.round(azimuth, 4),
+                "trajectory_arc": np.round(trajectory_arc, 4),
+                "true_anomaly": np.round(true_anomaly, 4),
+                "inclination": np.full(len(times), round(self.inclination, 4)),
+            }
+
+            self._log("Computed %d orbital parameter sets", "INFO", len(times))
+            return columns
         except Exception as e:
             self._log(f"Failed to compute orbital parameters: {str(e)}", "ERROR")
             raise RuntimeError(f"Failed to compute orbital parameters: {str(e)}")
@@ -121,16 +121,10 @@ class PyOrbitalDataProcessor(OrbitalDataProcessorInterface):
         Generate orbital parameters from start time over given duration and step size.
         """
 
-        self._log(f"Propagating orbit: start={start}, duration={duration_hours}h, step={step_minutes}m", "INFO")
-
-        end = start + timedelta(hours=duration_hours)
-        step = timedelta(minutes=step_minutes)
-        times = []
-        current = start
-        while current <= end:
-            times.append(current)
-            current += step
-            
-        self._log(f"Generated {len(times)} time steps", "DEBUG")
+        self._log("Propagating orbit: start=%s, duration=%sh, step=%sm", "INFO", start, duration_hours, step_minutes)
+
+        times = self.time_steps(start, duration_hours, step_minutes)
+
+        self._log("Generated %d time steps", "DEBUG", len(times))
         return self.compute_orbital_parameters(times)
     
\ No newline at end of file
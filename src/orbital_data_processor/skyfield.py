@@ -1,12 +1,90 @@
 from skyfield.api import load, EarthSatellite
-from datetime import datetime, timedelta
-from typing import List, Tuple
+from sgp4 import omm
+from sgp4.api import Satrec
+from datetime import datetime
+from typing import Dict, List, Tuple
 import numpy as np
 from poliastro.twobody.angles import M_to_nu
-from pandas import date_range
 
 from .orbital_data_processor import OrbitalDataProcessorInterface
 
+# OMM fields sgp4.omm.initialize() reads; a record missing one of them cannot be used.
+OMM_MEAN_ELEMENT_FIELDS = (
+    "EPOCH", "MEAN_MOTION", "ECCENTRICITY", "INCLINATION", "RA_OF_ASC_NODE",
+    "ARG_OF_PERICENTER", "MEAN_ANOMALY", "BSTAR", "MEAN_MOTION_DOT", "MEAN_MOTION_DDOT",
+)
+
+
+def has_mean_elements(record) -> bool:
+    """Return True if an OMM record carries all mean elements needed for SGP4."""
+    return all(record.get(field) not in (None, "") for field in OMM_MEAN_ELEMENT_FIELDS)
+
+
+def omm_satrec(record) -> Satrec:
+    """
+    Build an SGP4 satellite record directly from the mean elements of an OMM record.
+
+    Optional identification fields that sgp4 expects are filled with neutral defaults.
+
+    :param record: OMM record (values may be strings).
+    :return: Initialized Satrec.
+    """
+    fields = {
+        "OBJECT_ID": "", "CLASSIFICATION_TYPE": "U", "EPHEMERIS_TYPE": 0,
+        "ELEMENT_SET_NO": 999, "REV_AT_EPOCH": 0, "NORAD_CAT_ID": 0,
+    }
+    fields.update({key: value for key, value in record.items() if value not in (None, "")})
+    # sgp4 parses EPOCH with a mandatory fraction and no zone designator.
+    epoch = str(fields["EPOCH"]).rstrip("Z")
+    fields["EPOCH"] = epoch if "." in epoch else f"{epoch}.0"
+    satrec = Satrec()
+    omm.initialize(satrec, fields)
+    return satrec
+
+
+def create_processor(data, data_format: str, log_callback=None):
+    """
+    Create a SkyfieldOrbitalDataProcessor from retrieved TLE or OMM data.
+
+    OMM records are initialized from their mean elements; TLE lines inside the
+    record are only used when the mean elements are missing.
+
+    :param data: Tuple (tle_line1, tle_line2, orb_incl) for TLE, list with the selected record (or the record) for OMM.
+    :param data_format: Data format ('TLE' or 'OMM').
+    :param log_callback: Optional logging function.
+    :return: SkyfieldOrbitalDataProcessor instance.
+    :raises ValueError: If the data is incomplete or the data format is unsupported.
+    """
+    def log(message, level, *args):
+        if log_callback:
+            log_callback(message, level, *args)
+
+    if data_format == "TLE":
+        if not isinstance(data, (list, tuple)) or len(data) < 3:
+            error_msg = f"Incorrect TLE data: expected at least 3 elements (got {type(data)} of length {len(data)})"
+            log(f"[create_processor] {error_msg}", "ERROR")
+            raise ValueError(error_msg)
+
+        tle1, tle2 = data[0], data[1]
+        log("[create_processor] TLE_LINE1 is %s", "WARNING" if not tle1 else "DEBUG", "not empty" if tle1 else "EMPTY")
+        log("[create_processor] TLE_LINE2 is %s", "WARNING" if not tle2 else "DEBUG", "not empty" if tle2 else "EMPTY")
+        return SkyfieldOrbitalDataProcessor("N", tle1, tle2, log_callback)
+
+    if data_format == "OMM":
+        record = data[0] if isinstance(data, (list, tuple)) else data
+        if has_mean_elements(record):
+            return SkyfieldOrbitalDataProcessor.from_omm(record, log_callback)
+        tle_1 = record.get("TLE_LINE1")
+        tle_2 = record.get("TLE_LINE2")
+        if not tle_1 or not tle_2:
+            error_msg = "Incorrect OMM data: the record has neither mean elements nor TLE lines"
+            log(f"[create_processor] {error_msg}", "ERROR")
+            raise ValueError(error_msg)
+        return SkyfieldOrbitalDataProcessor("N", tle_1, tle_2, log_callback)
+
+    raise ValueError(f"Unsupported data format: {data_format}")
+
+
 class SkyfieldOrbitalDataProcessor(OrbitalDataProcessorInterface):
     """
     Implementation of OrbitalDataProcessorInterface using Skyfield.
@@ -14,7 +92,7 @@ class SkyfieldOrbitalDataProcessor(OrbitalDataProcessorInterface):
     Optimized for performance using vectorized computations.
     """
 
-    def __init__(self, tle_name: str, tle1: str, tle2: str, log_callback=None):
+    def __init__(self, tle_name: str, tle1: str, tle2: str, log_callback=None, satrec=None):
         """
         Initialize with TLE data and a logger.
 
@@ -22,29 +100,60 @@ class SkyfieldOrbitalDataProcessor(OrbitalDataProcessorInterface):
         :param tle1: First TLE line.
         :param tle2: Second TLE line.
         :param log_callback: Optional logging function (defaults to print).
+        :param satrec: Already initialized sgp4 Satrec; the TLE lines are ignored if given.
         :raises ValueError: If TLE data is invalid or satellite initialization fails.
         """
-        self.log_callback = log_callback or (lambda msg, lvl="INFO": print(f"[{lvl}] {msg}"))
-        self._log(f"Initializing SkyfieldOrbitalDataProcessor with name={tle_name}, line1={tle1[:20]}..., line2={tle2[:20]}...", "DEBUG")
+        self.log_callback = log_callback or (lambda msg, lvl="INFO", *args: print(f"[{lvl}] {msg % args if args else msg}"))
+        if satrec is None:
+            self._log("Initializing SkyfieldOrbitalDataProcessor with name=%s, line1=%.20s..., line2=%.20s...", "DEBUG",
+                      tle_name, tle1, tle2)
+        else:
+            self._log("Initializing SkyfieldOrbitalDataProcessor with name=%s from mean elements", "DEBUG", tle_name)
 
         try:
             self.ts = load.timescale()  # Create timescale for time conversions
-            self.satellite = EarthSatellite(tle1, tle2, tle_name, self.ts)  # Initialize satellite
+            if satrec is not None:
+                self.satellite = EarthSatellite.from_satrec(satrec, self.ts)
+                self.satellite.name = tle_name
+            else:
+                self.satellite = EarthSatellite(tle1, tle2, tle_name, self.ts)  # Initialize satellite
             self.inclination = float(self.satellite.model.inclo) * (180.0 / np.pi)  # Derive inclination in degrees
-            self._log(f"Inclination derived: {self.inclination}", "DEBUG")
+            self._log("Inclination derived: %s", "DEBUG", self.inclination)
         except Exception as e:
             self._log(f"Failed to initialize satellite: {str(e)}", "ERROR")
             raise ValueError(f"Failed to initialize satellite with TLE data: {str(e)}")
 
-    def _log(self, message: str, level: str = "INFO"):
+    @classmethod
+    def from_omm(cls, record: dict, log_callback=None):
+        """
+        Initialize from the mean elements of an OMM record without TLE lines.
+
+        :param record: OMM record with keys as in Space-Track JSON/CSV/XML (values may be strings).
+        :param log_callback: Optional logging function.
+        :return: SkyfieldOrbitalDataProcessor instance.
+        :raises ValueError: If the record lacks mean elements.
+        """
+        try:
+            satrec = omm_satrec(record)
+        except (KeyError, TypeError, ValueError) as e:
+            if log_callback:
+                log_callback(f"Invalid OMM mean elements: {str(e)}", "ERROR")
+            raise ValueError(f"Invalid OMM mean elements: {str(e)}")
+        return cls(record.get("OBJECT_NAME") or "N", None, None, log_callback, satrec=satrec)
+
+    def _log(self, message: str, level: str = "INFO", *args):
         """
         Log a message using the provided callback.
 
-        :param message: The message to log.
+        :param message: The message to log, a %-format string if args are given.
         :param level: Log level ("INFO", "DEBUG", "WARNING", "ERROR").
+        :param args: Values the sink substitutes into message, only if the level is logged.
         """
         if self.log_callback:
-            self.log_callback(message, level)
+            if args:
+                self.log_callback(message, level, *args)
+            else:
+                self.log_callback(message, level)
 
     def get_coord(self, time_utc: datetime) -> Tuple[float, float, float]:
         """
@@ -53,9 +162,9 @@ class SkyfieldOrbitalDataProcessor(OrbitalDataProcessorInterface):
         :param time_utc: Time in UTC format.
         :return: Tuple of (longitude, latitude, altitude) in degrees and kilometers.
         """
-        self._log(f"Getting coordinates for time: {time_utc}", "DEBUG")
+        self._log("Getting coordinates for time: %s", "DEBUG", time_utc)
         t = self.ts.utc(time_utc.year, time_utc.month, time_utc.day,
-                        time_utc.hour, time_utc.minute, time_utc.second)
+                        time_utc.hour, time_utc.minute, time_utc.second + time_utc.microsecond / 1e6)
         geocentric = self.satellite.at(t)  # Position in geocentric system
         subpoint = geocentric.subpoint()  # Convert to geodetic coordinates
         lon = subpoint.longitude.degrees
@@ -63,24 +172,21 @@ class SkyfieldOrbitalDataProcessor(OrbitalDataProcessorInterface):
         alt = subpoint.elevation.km
         return lon, lat, alt
 
-    def compute_orbital_parameters(
-        self,
-        times: List[datetime]
-    ) -> List[Tuple[datetime, float, float, float, float, float, float, float, float]]:
+    def compute_orbital_columns(self, times: List[datetime]) -> Dict[str, np.ndarray]:
         """
-        Compute orbital parameters for a list of datetimes.
+        Compute orbital parameters for a list of datetimes as columnar arrays.
 
         :param times: List of datetime objects.
-        :return: List of tuples containing (time, lon, lat, alt, speed, azimuth, trajectory_arc, true_anomaly, inclination).
+        :return: Dict of arrays keyed by ORBITAL_COLUMNS.
         :raises RuntimeError: If computation fails.
         """
-        self._log(f"Computing orbital parameters for {len(times)} times", "DEBUG")
+        self._log("Computing orbital parameters for %d times", "DEBUG", len(times))
 
         try:
             # Vectorized time conversion
             t = self.ts.utc([t.year for t in times], [t.month for t in times],
                             [t.day for t in times], [t.hour for t in times],
-                            [t.minute for t in times], [t.second for t in times])
+                            [t.minute for t in times], [t.second + t.microsecond / 1e6 for t in times])
             
             # Vectorized position and velocity computation
             geocentrics = self.satellite.at(t)
@@ -117,7 +223,7 @@ class SkyfieldOrbitalDataProcessor(OrbitalDataProcessorInterface):
             M0_deg = self.satellite.model.mo  # Mean anomaly at epoch
             n = self.satellite.model.no_kozai  # Mean motion in radians per minute
             t0 = np.datetime64(self.satellite.epoch.utc_datetime())
-            times_np = np.array([np.datetime64(t) for t in times])
+            times_np = np.array(times, dtype="datetime64[us]")
             times_sec = (times_np - t0) / np.timedelta64(1, 's')
             M0_rad = np.radians(M0_deg)
             n_rad_per_sec = n * (np.pi / (180 * 60))  # Convert to rad/sec
@@ -125,23 +231,20 @@ class SkyfieldOrbitalDataProcessor(OrbitalDataProcessorInterface):
             true_anomaly = (np.degrees(M_to_nu(M, e)) + 360) % 360
 
             # Compile results
-            results = [
-                (
-                    times[i],
-                    round(float(lons[i]), 4),
-                    round(float(lats[i]), 4),
-                    round(float(alts[i]), 4),
-                    round(float(np.linalg.norm(velocities[:, i])), 4),
-                    round(float(azimuth[i]), 4),
-                    round(float(trajectory_arc[i]), 4),
-                    round(float(true_anomaly[i]), 4),
-                    round(float(self.inclination), 4)
-                )
-                for i in range(len(times))
-            ]
-
-            self._log(f"Computed {len(results)} orbital parameter sets", "INFO")
-            return results
+            columns = {
+                "time": times_np,
+                "lon": np.round(lons, 4),
+                "lat": np.round(lats, 4),
+                "alt": np.round(alts, 4),
+                "velocity": np.round(np.linalg.norm(velocities, axis=0), 4),
+                "azimuth": np.round(azimuth, 4),
+                "trajectory_arc": np.round(trajectory_arc, 4),
+                "true_anomaly": np.round(true_anomaly, 4),
+                "inclination": np.full(len(times), round(self.inclination, 4)),
+            }
+
+            self._log("Computed %d orbital parameter sets", "INFO", len(times))
+            return columns
         except Exception as e:
             self._log(f"Failed to compute orbital parameters: {str(e)}", "ERROR")
             raise RuntimeError(f"Failed to compute orbital parameters: {str(e)}")
@@ -160,11 +263,9 @@ class SkyfieldOrbitalDataProcessor(OrbitalDataProcessorInterface):
         :param step_minutes: Step size in minutes.
         :return: List of tuples with orbital parameters.
         """
-        self._log(f"Propagating orbit: start={start}, duration={duration_hours}h, step={step_minutes}m", "INFO")
+        self._log("Propagating orbit: start=%s, duration=%sh, step=%sm", "INFO", start, duration_hours, step_minutes)
 
-        # Generate time steps using pandas
-        end = start + timedelta(hours=duration_hours)
-        times = date_range(start=start, end=end, freq=f"{step_minutes}min").to_pydatetime().tolist()
+        times = self.time_steps(start, duration_hours, step_minutes)
 
-        self._log(f"Generated {len(times)} time steps", "DEBUG")
+        self._log("Generated %d time steps", "DEBUG", len(times))
         return self.compute_orbital_parameters(times)
\ No newline at end of file
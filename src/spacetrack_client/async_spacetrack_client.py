@@ -0,0 +1,203 @@
+"""
+This module contains the AsyncSpacetrackClientWrapper class which retrieves element
+sets with the asynchronous Space-Track client.
+
+All requests share one authenticated session; the number of requests in flight at
+the same time is bounded by a semaphore, and every request takes its slot from the
+RequestScheduler shared with the synchronous client. Identical requests in flight at
+the same time are sent once, and many satellites are retrieved with the batched
+queries of the synchronous client.
+"""
+
+import asyncio
+import inspect
+
+from spacetrack import AsyncSpaceTrackClient
+
+from .rate_limiter import PRIORITY_BATCH, request_key, shared_scheduler
+from .spacetrack_client import (
+    BATCH_LOOKBACK_DAYS,
+    MAX_ID_QUERY_CHARS,
+    _tle_from_record,
+    batch_records_query,
+    chunk_norad_ids,
+    client_options,
+    latest_record_query,
+    latest_records_before,
+    parse_json_response,
+)
+
+# Default number of Space-Track requests in flight at the same time.
+DEFAULT_MAX_CONCURRENCY = 4
+
+
+class AsyncSpacetrackClientWrapper:
+    """
+    Asynchronous counterpart of SpacetrackClientWrapper for TLE and OMM retrieval.
+
+    The coroutines must run on one event loop; the semaphore is created on first use
+    so the wrapper can be built outside of that loop.
+    """
+
+    def __init__(self, username, password, cache=None, max_concurrency=DEFAULT_MAX_CONCURRENCY, scheduler=None,
+                 base_url=None):
+        """
+        Initialize the asynchronous SpaceTrack client with user credentials.
+
+        :param username: SpaceTrack account login (email).
+        :param password: SpaceTrack account password.
+        :param cache: Optional ElementSetCache serving element sets fetched recently.
+        :param max_concurrency: Maximum number of requests in flight.
+        :param scheduler: RequestScheduler enforcing the request caps; defaults to the shared one.
+        :param base_url: Optional API root replacing https://www.space-track.org/, e.g. a local stand-in.
+        """
+        self.client = AsyncSpaceTrackClient(identity=username, password=password, **client_options(base_url))
+        self.cache = cache
+        self.scheduler = scheduler or shared_scheduler()
+        self.max_concurrency = max(1, int(max_concurrency))
+        self._semaphore = None
+        # Tasks of the requests in flight by request_key(), shared by identical requests.
+        self._in_flight = {}
+
+    async def _send(self, method, kwargs):
+        """Send one request once a semaphore slot and a scheduler slot are free."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._semaphore:
+            # The scheduler blocks until a slot is free, so wait for it off the event loop.
+            await asyncio.get_running_loop().run_in_executor(None, self.scheduler.acquire, PRIORITY_BATCH)
+            return await getattr(self.client, method)(**kwargs)
+
+    async def _request(self, method, **kwargs):
+        """
+        Send a Space-Track request, sharing the response of an identical request in flight.
+
+        :param method: Name of the AsyncSpaceTrackClient request class method, e.g. 'gp_history'.
+        :return: Raw response of the request.
+        """
+        key = request_key(method, kwargs)
+        task = self._in_flight.get(key)
+        if task is None:
+            task = self._in_flight[key] = asyncio.ensure_future(self._send(method, kwargs))
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        # A canceled waiter must not cancel the request other waiters share.
+        return await asyncio.shield(task)
+
+    async def _latest_record(self, sat_id, start_datetime):
+        """
+        Return the latest gp_history JSON record before start_datetime, using the cache if possible.
+
+        :return: Record dict, or None if Space-Track has no data in the 30-day window.
+        """
+        loop = asyncio.get_running_loop()
+        if self.cache is not None:
+            # The cache is a sqlite file, so query it off the event loop.
+            record = await loop.run_in_executor(None, self.cache.lookup, sat_id, start_datetime)
+            if record is not None:
+                return record
+
+        data = await self._request('gp_history', **latest_record_query(sat_id, start_datetime))
+        records = parse_json_response(data)
+        if not records:
+            return None
+        if self.cache is not None:
+            await loop.run_in_executor(None, self.cache.store, records[0], start_datetime)
+        return records[0]
+
+    async def get_tle(self, sat_id, start_datetime):
+        """
+        Retrieve TLE data for the specified satellite based on start_datetime.
+
+        :param sat_id: Satellite NORAD ID.
+        :param start_datetime: Start date and time for which TLE data is needed (latest data before this time).
+        :return: Tuple (tle_1, tle_2, orb_incl) containing the TLE lines and orbital inclination.
+        :raises Exception: If TLE data cannot be retrieved.
+        """
+        record = await self._latest_record(sat_id, start_datetime)
+        if not record:
+            raise Exception(f'No TLE data found for satellite {sat_id} before {start_datetime}')
+        return _tle_from_record(record)
+
+    async def get_omm(self, sat_id, start_datetime):
+        """
+        Retrieve OMM data for the specified satellite based on start_datetime.
+
+        :param sat_id: Satellite NORAD ID.
+        :param start_datetime: Start date and time for which OMM data is needed (latest data before this time).
+        :return: OMM data as a parsed JSON object.
+        :raises Exception: If OMM data cannot be retrieved.
+        """
+        record = await self._latest_record(sat_id, start_datetime)
+        if not record:
+            raise Exception(f'No OMM data found for satellite {sat_id} before {start_datetime}')
+        return [record]
+
+    async def get_elements(self, sat_id, start_datetime, data_format):
+        """
+        Retrieve TLE or OMM data for one satellite.
+
+        :raises ValueError: If the data format is unsupported.
+        """
+        if data_format == 'TLE':
+            return await self.get_tle(sat_id, start_datetime)
+        if data_format == 'OMM':
+            return await self.get_omm(sat_id, start_datetime)
+        raise ValueError("Unsupported data format. Use 'TLE' or 'OMM'.")
+
+    def _cached_records(self, sat_ids, start_datetime):
+        """Return the cached records of many satellites by NORAD ID (runs off the event loop)."""
+        found = {}
+        for sat_id in sat_ids:
+            record = self.cache.lookup(sat_id, start_datetime)
+            if record is not None:
+                found[sat_id] = record
+        return found
+
+    async def get_elements_batch(self, sat_ids, start_datetime, data_format, max_chars=MAX_ID_QUERY_CHARS):
+        """
+        Retrieve the latest element sets before start_datetime for many satellites.
+
+        Asynchronous counterpart of SpacetrackClientWrapper.get_elements_batch(): the
+        same batched queries, with the chunks of a lookback window sent concurrently.
+
+        :param sat_ids: Iterable of NORAD IDs.
+        :param start_datetime: Start date and time; the latest data before this time is used.
+        :param data_format: 'TLE' or 'OMM'.
+        :param max_chars: Maximum length of the NORAD ID list per request.
+        :return: Dict NORAD ID -> data shaped like get_tle()/get_omm() results.
+                 IDs without data in the lookback window are missing from the dict.
+        :raises ValueError: If the data format is unsupported.
+        """
+        if data_format not in ('TLE', 'OMM'):
+            raise ValueError("Unsupported data format. Use 'TLE' or 'OMM'.")
+
+        loop = asyncio.get_running_loop()
+        found = {}
+        pending = list(dict.fromkeys(int(i) for i in sat_ids))
+        if self.cache is not None:
+            found = await loop.run_in_executor(None, self._cached_records, pending, start_datetime)
+            pending = [sat_id for sat_id in pending if sat_id not in found]
+
+        for days in BATCH_LOOKBACK_DAYS:
+            if not pending:
+                break
+            responses = await asyncio.gather(*(
+                self._request('gp_history', **batch_records_query(chunk, start_datetime, days))
+                for chunk in chunk_norad_ids(pending, max_chars)
+            ))
+            for data in responses:
+                latest = latest_records_before(parse_json_response(data), start_datetime)
+                if self.cache is not None:
+                    await loop.run_in_executor(None, self.cache.store_many, list(latest.values()), start_datetime)
+                found.update(latest)
+            pending = [sat_id for sat_id in pending if sat_id not in found]
+
+        if data_format == 'TLE':
+            return {sat_id: _tle_from_record(record) for sat_id, record in found.items()}
+        return {sat_id: [record] for sat_id, record in found.items()}
+
+    async def close(self):
+        """Close the shared HTTP session."""
+        result = self.client.close()
+        if inspect.isawaitable(result):
+            await result
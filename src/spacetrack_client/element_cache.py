@@ -0,0 +1,300 @@
+"""
+This module contains the ElementSetCache class, a local SQLite store of element sets
+(gp_history JSON records) retrieved from Space-Track.
+
+Records are keyed by (NORAD_CAT_ID, EPOCH). Next to the records the cache keeps the
+epoch ranges each answer is authoritative for: a query for the latest element set
+before T that returned epoch E proves there was no newer set in (E, T] at fetch time.
+A lookup is served locally when such a range covers the requested time and was
+fetched within the TTL.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "element_sets.sqlite")
+DEFAULT_TTL_HOURS = 6.0
+DEFAULT_MAX_RECORDS_PER_OBJECT = 50
+DEFAULT_MAX_AGE_DAYS = 90
+COMPACTION_INTERVAL_SECONDS = 24 * 3600
+# Older SQLite builds allow at most 999 bound parameters per statement.
+MAX_IDS_PER_STATEMENT = 900
+
+
+def epoch_key(value) -> str:
+    """
+    Normalize an epoch to a sortable ISO string with microseconds.
+
+    :param value: datetime or Space-Track EPOCH string.
+    :return: String like "2025-03-28T09:00:00.000000".
+    """
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    return value.replace(tzinfo=None).isoformat(timespec="microseconds")
+
+
+def id_batches(ids, size: int = MAX_IDS_PER_STATEMENT):
+    """
+    Split a list of NORAD IDs into slices small enough for one IN (...) clause.
+
+    :param ids: List of int NORAD IDs.
+    :param size: Maximum number of IDs per slice.
+    :return: Iterator of lists of IDs.
+    """
+    return (ids[i:i + size] for i in range(0, len(ids), size))
+
+
+class ElementSetCache:
+    """
+    Local store of Space-Track element sets with TTL-based lookups and bounded size.
+    """
+
+    def __init__(self, db_path: str = DEFAULT_CACHE_PATH, ttl_hours: float = DEFAULT_TTL_HOURS,
+                 max_records_per_object: int = DEFAULT_MAX_RECORDS_PER_OBJECT,
+                 max_age_days: float = DEFAULT_MAX_AGE_DAYS, log_callback=None):
+        """
+        Open (and create if needed) the cache database.
+
+        :param db_path: Path of the SQLite file.
+        :param ttl_hours: How long a fetched answer may be served from the cache.
+        :param max_records_per_object: Newest element sets kept per object by compaction.
+        :param max_age_days: Records fetched longer ago than this are removed by compaction.
+        :param log_callback: Optional function to handle logging.
+        """
+        self.db_path = db_path
+        self.ttl_seconds = ttl_hours * 3600
+        self.max_records_per_object = max_records_per_object
+        self.max_age_seconds = max_age_days * 86400
+        self.log_callback = log_callback
+        self._compaction_thread = None
+
+        directory = os.path.dirname(db_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        connection = self._connect()
+        with connection:
+            connection.executescript("""
+                CREATE TABLE IF NOT EXISTS elements (
+                    norad_cat_id INTEGER NOT NULL,
+                    epoch TEXT NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    record TEXT NOT NULL,
+                    PRIMARY KEY (norad_cat_id, epoch)
+                );
+                CREATE TABLE IF NOT EXISTS coverage (
+                    norad_cat_id INTEGER NOT NULL,
+                    covered_from TEXT NOT NULL,
+                    covered_to TEXT NOT NULL,
+                    fetched_at REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_coverage_norad ON coverage (norad_cat_id, covered_to);
+                CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+            """)
+            # A new cache has nothing to compact; the first compaction runs an interval later.
+            connection.execute("INSERT OR IGNORE INTO meta VALUES ('last_compaction', ?)", (str(time.time()),))
+        connection.close()
+
+    def _log(self, message: str, level: str = "INFO", *args):
+        """
+        Log a message using the provided callback if available.
+
+        :param message: Message to log, a %-format string if args are given.
+        :param level: Log level ("INFO", "DEBUG", "WARNING", "ERROR").
+        :param args: Values the sink substitutes into message, only if the level is logged.
+        """
+        if self.log_callback:
+            if args:
+                self.log_callback(message, level, *args)
+            else:
+                self.log_callback(message, level)
+
+    def _connect(self):
+        """Open a connection; one per operation so the cache can be used from any thread."""
+        connection = sqlite3.connect(self.db_path, timeout=30)
+        connection.execute("PRAGMA journal_mode=WAL")
+        return connection
+
+    def lookup(self, sat_id: int, start_datetime: datetime, now: float = None):
+        """
+        Return the cached latest element set before start_datetime if it is still fresh.
+
+        :param sat_id: NORAD ID.
+        :param start_datetime: Upper bound of the epoch.
+        :param now: Current time as a UNIX timestamp (defaults to time.time()).
+        :return: gp_history JSON record, or None on a cache miss.
+        """
+        if self.ttl_seconds <= 0:
+            return None
+        now = time.time() if now is None else now
+        start = epoch_key(start_datetime)
+        connection = self._connect()
+        try:
+            row = connection.execute(
+                """
+                SELECT e.record FROM coverage c
+                JOIN elements e ON e.norad_cat_id = c.norad_cat_id
+                    AND e.epoch >= c.covered_from AND e.epoch <= ?
+                WHERE c.norad_cat_id = ? AND c.covered_from <= ? AND c.covered_to >= ? AND c.fetched_at >= ?
+                ORDER BY e.epoch DESC LIMIT 1
+                """,
+                (start, int(sat_id), start, start, now - self.ttl_seconds),
+            ).fetchone()
+        finally:
+            connection.close()
+        return json.loads(row[0]) if row else None
+
+    def store(self, record, start_datetime: datetime, now: float = None) -> None:
+        """
+        Store the latest element set before start_datetime returned by Space-Track.
+
+        :param record: gp_history JSON record with NORAD_CAT_ID and EPOCH.
+        :param start_datetime: Upper bound of the query the record answers.
+        :param now: Current time as a UNIX timestamp (defaults to time.time()).
+        """
+        self.store_many([record], start_datetime, now)
+
+    def store_many(self, records, start_datetime: datetime, now: float = None) -> None:
+        """
+        Store the latest element sets before start_datetime for several objects.
+
+        :param records: gp_history JSON records, at most one per object.
+        :param start_datetime: Upper bound of the query the records answer.
+        :param now: Current time as a UNIX timestamp (defaults to time.time()).
+        """
+        if not records:
+            return
+        now = time.time() if now is None else now
+        start = epoch_key(start_datetime)
+        rows = [(int(r["NORAD_CAT_ID"]), epoch_key(r["EPOCH"]), now, json.dumps(r)) for r in records]
+        connection = self._connect()
+        with connection:
+            connection.executemany("INSERT OR REPLACE INTO elements VALUES (?, ?, ?, ?)", rows)
+            connection.executemany(
+                "INSERT INTO coverage VALUES (?, ?, ?, ?)",
+                [(sat_id, epoch, start, now) for sat_id, epoch, _, _ in rows],
+            )
+        connection.close()
+        if self._compaction_due(now):
+            self.compact_in_background()
+
+    def newest_epochs(self, sat_ids, before: datetime) -> dict:
+        """
+        Return the newest epoch held locally per object, not after before.
+
+        :param sat_ids: Iterable of NORAD IDs.
+        :param before: Upper bound of the epoch.
+        :return: Dict NORAD ID -> epoch key; objects without records are missing.
+        """
+        ids = [int(i) for i in sat_ids]
+        if not ids:
+            return {}
+        before = epoch_key(before)
+        epochs = {}
+        connection = self._connect()
+        try:
+            for batch in id_batches(ids):
+                epochs.update(connection.execute(
+                    f"""
+                    SELECT norad_cat_id, MAX(epoch) FROM elements
+                    WHERE norad_cat_id IN ({",".join("?" * len(batch))}) AND epoch <= ?
+                    GROUP BY norad_cat_id
+                    """,
+                    (*batch, before),
+                ).fetchall())
+        finally:
+            connection.close()
+        return epochs
+
+    def store_sync(self, records, sat_ids, start_datetime: datetime, now: float = None) -> None:
+        """
+        Merge the records of an incremental sync and mark the synced objects as current.
+
+        The sync fetched every record after the newest local epoch of each object up to
+        start_datetime, so the newest local record is now the latest before start_datetime.
+
+        :param records: gp_history JSON records newer than the local ones.
+        :param sat_ids: NORAD IDs covered by the sync queries.
+        :param start_datetime: Upper bound of the sync queries.
+        :param now: Current time as a UNIX timestamp (defaults to time.time()).
+        """
+        ids = [int(i) for i in sat_ids]
+        now = time.time() if now is None else now
+        start = epoch_key(start_datetime)
+        rows = [(int(r["NORAD_CAT_ID"]), epoch_key(r["EPOCH"]), now, json.dumps(r)) for r in records]
+        connection = self._connect()
+        with connection:
+            connection.executemany("INSERT OR REPLACE INTO elements VALUES (?, ?, ?, ?)", rows)
+            for batch in id_batches(ids):
+                connection.execute(
+                    f"""
+                    INSERT INTO coverage
+                    SELECT norad_cat_id, MAX(epoch), ?, ? FROM elements
+                    WHERE norad_cat_id IN ({",".join("?" * len(batch))}) AND epoch <= ?
+                    GROUP BY norad_cat_id
+                    """,
+                    (start, now, *batch, start),
+                )
+        connection.close()
+
+    def _compaction_due(self, now: float) -> bool:
+        """Return True if the last compaction is older than COMPACTION_INTERVAL_SECONDS."""
+        connection = self._connect()
+        try:
+            row = connection.execute("SELECT value FROM meta WHERE key = 'last_compaction'").fetchone()
+        finally:
+            connection.close()
+        return row is None or now - float(row[0]) >= COMPACTION_INTERVAL_SECONDS
+
+    def compact(self, now: float = None) -> int:
+        """
+        Remove expired coverage, old records and all but the newest records per object.
+
+        :param now: Current time as a UNIX timestamp (defaults to time.time()).
+        :return: Number of element sets removed.
+        """
+        now = time.time() if now is None else now
+        connection = self._connect()
+        with connection:
+            connection.execute("DELETE FROM coverage WHERE fetched_at < ?", (now - self.ttl_seconds,))
+            removed = connection.execute(
+                "DELETE FROM elements WHERE fetched_at < ?", (now - self.max_age_seconds,)
+            ).rowcount
+            removed += connection.execute(
+                """
+                DELETE FROM elements WHERE rowid IN (
+                    SELECT rowid FROM (
+                        SELECT rowid, ROW_NUMBER() OVER (
+                            PARTITION BY norad_cat_id ORDER BY epoch DESC
+                        ) AS rank FROM elements
+                    ) WHERE rank > ?
+                )
+                """,
+                (self.max_records_per_object,),
+            ).rowcount
+            connection.execute("INSERT OR REPLACE INTO meta VALUES ('last_compaction', ?)", (str(now),))
+        connection.close()
+        self._log("Compacted element-set cache: removed %d records", "DEBUG", removed)
+        return removed
+
+    def compact_in_background(self) -> threading.Thread:
+        """
+        Run compact() on a daemon thread unless one is already running.
+
+        :return: The compaction thread.
+        """
+        if self._compaction_thread is not None and self._compaction_thread.is_alive():
+            return self._compaction_thread
+
+        def run():
+            try:
+                self.compact()
+            except sqlite3.Error as e:
+                self._log(f"Element-set cache compaction failed: {str(e)}", "WARNING")
+
+        self._compaction_thread = threading.Thread(target=run, name="element-cache-compaction", daemon=True)
+        self._compaction_thread.start()
+        return self._compaction_thread
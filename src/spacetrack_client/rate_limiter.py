@@ -0,0 +1,202 @@
+"""
+This module contains the RequestScheduler class which keeps Space-Track requests
+within the per-minute and per-hour request caps.
+
+Every request takes one token from each TokenBucket. Waiting requests are released
+in priority order, so interactive searches are not queued behind batch downloads,
+and identical requests in flight at the same time are sent only once.
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import Future
+
+# Space-Track request caps per account.
+REQUESTS_PER_MINUTE = 30
+REQUESTS_PER_HOUR = 300
+
+# Request priorities; lower values are served first.
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BATCH = 1
+
+
+class TokenBucket:
+    """
+    Token bucket refilled continuously with capacity tokens per period.
+    """
+
+    def __init__(self, capacity: int, period_seconds: float, now: float):
+        """
+        :param capacity: Maximum number of tokens, i.e. requests allowed per period.
+        :param period_seconds: Length of the period in seconds.
+        :param now: Current clock value; the bucket starts full.
+        """
+        self.capacity = capacity
+        self.rate = capacity / period_seconds
+        self.tokens = float(capacity)
+        self.updated = now
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens accumulated since the last update."""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def delay(self, now: float) -> float:
+        """
+        Return the seconds until a token is available.
+
+        :param now: Current clock value.
+        :return: 0 if a token can be taken now.
+        """
+        self._refill(now)
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+    def take(self, now: float) -> None:
+        """Take one token; delay(now) must have returned 0."""
+        self._refill(now)
+        self.tokens -= 1
+
+
+class RequestScheduler:
+    """
+    Thread-safe scheduler of Space-Track requests.
+
+    The clock and sleep functions can be replaced, so the scheduler can be tested
+    against a fake clock without waiting.
+    """
+
+    def __init__(self, per_minute: int = REQUESTS_PER_MINUTE, per_hour: int = REQUESTS_PER_HOUR,
+                 clock=time.monotonic, sleep=time.sleep, log_callback=None):
+        """
+        :param per_minute: Requests allowed per minute.
+        :param per_hour: Requests allowed per hour.
+        :param clock: Function returning the current time in seconds.
+        :param sleep: Function sleeping for the given number of seconds.
+        :param log_callback: Optional function to handle logging.
+        """
+        self._clock = clock
+        self._sleep = sleep
+        self.log_callback = log_callback
+        now = clock()
+        self.buckets = [TokenBucket(per_minute, 60, now), TokenBucket(per_hour, 3600, now)]
+        self._condition = threading.Condition()
+        self._queue = []
+        self._sequence = itertools.count()
+        self._in_flight = {}
+
+    def _log(self, message: str, level: str = "INFO", *args):
+        """
+        Log a message using the provided callback if available.
+
+        :param message: Message to log, a %-format string if args are given.
+        :param level: Log level ("INFO", "DEBUG", "WARNING", "ERROR").
+        :param args: Values the sink substitutes into message, only if the level is logged.
+        """
+        if self.log_callback:
+            if args:
+                self.log_callback(message, level, *args)
+            else:
+                self.log_callback(message, level)
+
+    def acquire(self, priority: int = PRIORITY_BATCH) -> None:
+        """
+        Block until a request of the given priority may be sent.
+
+        Requests are released in (priority, arrival) order; the first waiting request
+        sleeps until both buckets have a token.
+
+        :param priority: PRIORITY_INTERACTIVE or PRIORITY_BATCH.
+        """
+        ticket = (priority, next(self._sequence))
+        with self._condition:
+            heapq.heappush(self._queue, ticket)
+            while True:
+                if self._queue[0] != ticket:
+                    self._condition.wait()
+                    continue
+                now = self._clock()
+                delay = max(bucket.delay(now) for bucket in self.buckets)
+                if delay <= 0:
+                    for bucket in self.buckets:
+                        bucket.take(now)
+                    heapq.heappop(self._queue)
+                    self._condition.notify_all()
+                    return
+                self._log("Space-Track rate limit reached, waiting %.1f s", "DEBUG", delay)
+                self._condition.release()
+                try:
+                    self._sleep(delay)
+                finally:
+                    self._condition.acquire()
+
+    def has_capacity(self, reserve: int = 0) -> bool:
+        """
+        Return True if no request is waiting and every bucket holds more than reserve tokens.
+
+        Optional work such as prefetching checks this before queueing requests, so the
+        reserve stays available for requests the user is waiting for.
+
+        :param reserve: Tokens to leave in each bucket.
+        """
+        with self._condition:
+            if self._queue:
+                return False
+            now = self._clock()
+            return all(bucket.delay(now) <= 0 and bucket.tokens >= reserve + 1 for bucket in self.buckets)
+
+    def call(self, key, func, priority: int = PRIORITY_BATCH):
+        """
+        Run func once a request slot is available, sharing the result of identical calls.
+
+        If a call with the same key is already waiting or in flight, its result (or
+        exception) is returned instead of sending another request.
+
+        :param key: Hashable identity of the request.
+        :param func: Function sending the request.
+        :param priority: PRIORITY_INTERACTIVE or PRIORITY_BATCH.
+        :return: Result of func.
+        """
+        with self._condition:
+            future = self._in_flight.get(key)
+            owner = future is None
+            if owner:
+                future = self._in_flight[key] = Future()
+        if not owner:
+            return future.result()
+        try:
+            self.acquire(priority)
+            result = func()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._condition:
+                self._in_flight.pop(key, None)
+
+
+_shared_scheduler = None
+_shared_lock = threading.Lock()
+
+
+def shared_scheduler() -> RequestScheduler:
+    """
+    Return the scheduler shared by all clients of the session.
+
+    The caps apply per account, so the plugin dialog and the search dialog draw
+    from the same buckets.
+    """
+    global _shared_scheduler
+    with _shared_lock:
+        if _shared_scheduler is None:
+            _shared_scheduler = RequestScheduler()
+        return _shared_scheduler
+
+
+def request_key(method: str, kwargs: dict):
+    """Build the coalescing key of a Space-Track request from its method and arguments."""
+    return method, tuple(sorted((name, repr(value)) for name, value in kwargs.items()))
@@ -0,0 +1,172 @@
+"""
+This module contains the SatcatQueryCache class, a local SQLite store of Space-Track
+satcat search results.
+
+Every result page is keyed by the normalized query parameters. A page answers the
+same query with any limit up to the one it was fetched with, or any limit at all when
+it held fewer rows than its limit, i.e. when it is the complete result. Complete name
+searches also answer refined searches whose name contains the cached one.
+"""
+
+import json
+import os
+import sqlite3
+import time
+
+DEFAULT_SATCAT_CACHE_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "satcat.sqlite")
+DEFAULT_SATCAT_TTL_HOURS = 24.0
+
+# Parameters that shape the response but not the set of matching objects.
+_PAGE_PARAMETERS = ("limit", "format")
+# LIKE wildcards; names containing them are not refined locally.
+_LIKE_WILDCARDS = ("%", "_")
+
+
+def query_key(kwargs: dict) -> str:
+    """
+    Normalize satcat query parameters into a cache key.
+
+    Space-Track matches satcat values case-insensitively, so values are compared
+    upper-cased and without surrounding whitespace; limit and format are ignored.
+
+    :param kwargs: Keyword arguments of the satcat request.
+    :return: JSON string of the sorted (name, value) pairs.
+    """
+    return json.dumps(sorted(
+        (name.lower(), str(value).strip().upper())
+        for name, value in kwargs.items() if name not in _PAGE_PARAMETERS
+    ))
+
+
+class SatcatQueryCache:
+    """
+    Local store of satcat result pages with a TTL.
+    """
+
+    def __init__(self, db_path: str = DEFAULT_SATCAT_CACHE_PATH, ttl_hours: float = DEFAULT_SATCAT_TTL_HOURS,
+                 log_callback=None):
+        """
+        Open (and create if needed) the cache database.
+
+        :param db_path: Path of the SQLite file.
+        :param ttl_hours: How long a result page may be served from the cache.
+        :param log_callback: Optional function to handle logging.
+        """
+        self.db_path = db_path
+        self.ttl_seconds = ttl_hours * 3600
+        self.log_callback = log_callback
+
+        directory = os.path.dirname(db_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        connection = self._connect()
+        with connection:
+            connection.executescript("""
+                CREATE TABLE IF NOT EXISTS pages (
+                    query_key TEXT PRIMARY KEY,
+                    row_limit INTEGER NOT NULL,
+                    complete INTEGER NOT NULL,
+                    name_term TEXT,
+                    fetched_at REAL NOT NULL,
+                    results TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_pages_name ON pages (name_term) WHERE name_term IS NOT NULL;
+            """)
+        connection.close()
+
+    def _log(self, message: str, level: str = "INFO", *args):
+        """
+        Log a message using the provided callback if available.
+
+        :param message: Message to log, a %-format string if args are given.
+        :param level: Log level ("INFO", "DEBUG", "WARNING", "ERROR").
+        :param args: Values the sink substitutes into message, only if the level is logged.
+        """
+        if self.log_callback:
+            if args:
+                self.log_callback(message, level, *args)
+            else:
+                self.log_callback(message, level)
+
+    def _connect(self):
+        """Open a connection; one per operation so the cache can be used from any thread."""
+        connection = sqlite3.connect(self.db_path, timeout=30)
+        connection.execute("PRAGMA journal_mode=WAL")
+        return connection
+
+    def lookup(self, kwargs: dict, limit: int, now: float = None):
+        """
+        Return the cached results of a satcat query if a fresh page covers the limit.
+
+        :param kwargs: Keyword arguments of the satcat request.
+        :param limit: Requested number of rows.
+        :param now: Current time as a UNIX timestamp (defaults to time.time()).
+        :return: List of satcat records, or None on a cache miss.
+        """
+        if self.ttl_seconds <= 0:
+            return None
+        now = time.time() if now is None else now
+        connection = self._connect()
+        try:
+            row = connection.execute(
+                "SELECT results FROM pages WHERE query_key = ? AND fetched_at >= ? AND (row_limit >= ? OR complete)",
+                (query_key(kwargs), now - self.ttl_seconds, int(limit)),
+            ).fetchone()
+        finally:
+            connection.close()
+        if row is None:
+            return None
+        self._log("Satcat query answered from the local cache", "DEBUG")
+        return json.loads(row[0])[:int(limit)]
+
+    def refine_name(self, name: str, limit: int, now: float = None):
+        """
+        Answer a name search by filtering a fresh, complete page of a broader name search.
+
+        :param name: Searched name fragment.
+        :param limit: Requested number of rows.
+        :param now: Current time as a UNIX timestamp (defaults to time.time()).
+        :return: List of satcat records ordered like the cached page, or None on a cache miss.
+        """
+        term = name.strip().upper()
+        if self.ttl_seconds <= 0 or not term or any(c in term for c in _LIKE_WILDCARDS):
+            return None
+        now = time.time() if now is None else now
+        connection = self._connect()
+        try:
+            row = connection.execute(
+                """
+                SELECT results FROM pages
+                WHERE name_term IS NOT NULL AND complete AND fetched_at >= ? AND instr(?, name_term) > 0
+                ORDER BY length(name_term) DESC LIMIT 1
+                """,
+                (now - self.ttl_seconds, term),
+            ).fetchone()
+        finally:
+            connection.close()
+        if row is None:
+            return None
+        self._log("Satcat name search '%s' refined from the local cache", "DEBUG", name)
+        matches = [r for r in json.loads(row[0]) if term in str(r.get("SATNAME") or "").upper()]
+        return matches[:int(limit)]
+
+    def store(self, kwargs: dict, limit: int, results: list, name: str = None, now: float = None) -> None:
+        """
+        Store a satcat result page and drop expired pages.
+
+        :param kwargs: Keyword arguments of the satcat request.
+        :param limit: Limit the page was fetched with.
+        :param results: Returned satcat records.
+        :param name: Name fragment if the query is a plain name search, so it can answer refinements.
+        :param now: Current time as a UNIX timestamp (defaults to time.time()).
+        """
+        now = time.time() if now is None else now
+        term = name.strip().upper() if name and not any(c in name for c in _LIKE_WILDCARDS) else None
+        connection = self._connect()
+        with connection:
+            connection.execute("DELETE FROM pages WHERE fetched_at < ?", (now - self.ttl_seconds,))
+            connection.execute(
+                "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?)",
+                (query_key(kwargs), int(limit), int(len(results) < int(limit)), term, now, json.dumps(results)),
+            )
+        connection.close()
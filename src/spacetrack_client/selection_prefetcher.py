@@ -0,0 +1,121 @@
+"""
+This module contains the SelectionPrefetcher class which downloads element sets of
+satellites selected in the search dialog before the track generation starts.
+
+Selected NORAD IDs are collected while the user picks rows and sent in batched
+gp_history queries from a background thread. The results land in the element-set
+cache of the client, so the later run for the same start time is served locally.
+Prefetching only uses spare request capacity of the scheduler.
+"""
+
+import threading
+
+# Seconds to wait for the selection to settle, and between checks for spare capacity.
+PREFETCH_DELAY_SECONDS = 1.0
+# Requests per bucket left for searches and runs the user is waiting for.
+PREFETCH_RESERVE_TOKENS = 10
+
+
+class SelectionPrefetcher:
+    """
+    Background prefetch of the latest element sets before a start time.
+    """
+
+    def __init__(self, client, start_datetime, reserve: int = PREFETCH_RESERVE_TOKENS,
+                 delay_seconds: float = PREFETCH_DELAY_SECONDS, log_callback=None):
+        """
+        :param client: SpacetrackClientWrapper with an element-set cache.
+        :param start_datetime: Start time of the tracks the element sets are needed for.
+        :param reserve: Tokens per bucket that prefetching leaves unused.
+        :param delay_seconds: Settle time before a batch is sent.
+        :param log_callback: Optional function to handle logging.
+        """
+        self.client = client
+        self.start_datetime = start_datetime
+        self.reserve = reserve
+        self.delay_seconds = delay_seconds
+        self.log_callback = log_callback
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = False
+        self._pending = set()
+        self._done = set()
+        self._running = False
+        self._thread = None
+
+    def _log(self, message: str, level: str = "INFO", *args):
+        """
+        Log a message using the provided callback if available.
+
+        :param message: Message to log, a %-format string if args are given.
+        :param level: Log level ("INFO", "DEBUG", "WARNING", "ERROR").
+        :param args: Values the sink substitutes into message, only if the level is logged.
+        """
+        if self.log_callback:
+            if args:
+                self.log_callback(message, level, *args)
+            else:
+                self.log_callback(message, level)
+
+    def update(self, sat_ids) -> None:
+        """
+        Set the selected NORAD IDs; IDs not fetched yet are queued, deselected ones dropped.
+
+        :param sat_ids: Iterable of NORAD IDs.
+        """
+        with self._lock:
+            if self._stopped:
+                return
+            self._pending = {int(sat_id) for sat_id in sat_ids} - self._done
+            if not self._pending:
+                return
+            if not self._running:
+                self._running = True
+                self._thread = threading.Thread(target=self._run, name="selection-prefetch", daemon=True)
+                self._thread.start()
+        self._wake.set()
+
+    def cancel(self) -> None:
+        """Stop prefetching; a batch already sent is still completed."""
+        with self._lock:
+            self._stopped = True
+            self._pending = set()
+        self._wake.set()
+
+    def join(self, timeout: float = None) -> None:
+        """Wait for the background thread to finish."""
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _next_batch(self):
+        """Return the pending IDs once the selection has settled and capacity is spare, or None to stop."""
+        while True:
+            self._wake.clear()
+            # Every update restarts the settle time.
+            if self._wake.wait(self.delay_seconds):
+                continue
+            with self._lock:
+                if self._stopped or not self._pending:
+                    self._running = False
+                    return None
+                if self.client.scheduler.has_capacity(self.reserve):
+                    batch, self._pending = sorted(self._pending), set()
+                    return batch
+
+    def _run(self) -> None:
+        """Send batched queries until nothing is pending."""
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            self._log("Prefetching element sets of %d selected satellites", "DEBUG", len(batch))
+            try:
+                found = self.client.get_elements_batch(batch, self.start_datetime, 'TLE')
+            except Exception as e:
+                self._log(f"Prefetch of selected satellites failed: {str(e)}", "WARNING")
+                with self._lock:
+                    self._running = False
+                return
+            with self._lock:
+                self._done.update(batch)
+            self._log("Prefetched element sets of %d of %d selected satellites", "DEBUG", len(found), len(batch))
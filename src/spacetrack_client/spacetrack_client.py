@@ -9,6 +9,107 @@ from spacetrack import SpaceTrackClient
 import json
 
 from ..spacetrack_dialog.custom_query_dialog import field_types
+from .element_cache import epoch_key
+from .rate_limiter import PRIORITY_BATCH, PRIORITY_INTERACTIVE, request_key, shared_scheduler
+
+# Maximum length of the comma-separated NORAD ID list in one query, well below common URL limits.
+MAX_ID_QUERY_CHARS = 1500
+
+# Lookback windows (days) of batched element queries; IDs missing from the short window are
+# re-queried with the long window, which matches the single-satellite queries.
+BATCH_LOOKBACK_DAYS = (3, 30)
+
+
+def chunk_norad_ids(sat_ids, max_chars=MAX_ID_QUERY_CHARS):
+    """
+    Split NORAD IDs into chunks whose comma-separated list fits into max_chars.
+
+    :param sat_ids: Iterable of NORAD IDs.
+    :param max_chars: Maximum length of the joined ID list.
+    :return: List of lists of int IDs.
+    """
+    chunks, current, length = [], [], 0
+    for sat_id in dict.fromkeys(int(i) for i in sat_ids):
+        id_length = len(str(sat_id)) + (1 if current else 0)
+        if current and length + id_length > max_chars:
+            chunks.append(current)
+            current, length = [], 0
+            id_length -= 1
+        current.append(sat_id)
+        length += id_length
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def client_options(base_url=None):
+    """Return the keyword arguments selecting the API root of a Space-Track client."""
+    return {'base_url': base_url} if base_url else {}
+
+
+def _tle_from_record(record):
+    """Build the (tle_1, tle_2, orb_incl) tuple from a gp_history JSON record."""
+    return record["TLE_LINE1"], record["TLE_LINE2"], record["TLE_LINE2"][8:16]
+
+
+def latest_record_query(sat_id, start_datetime):
+    """
+    Build the gp_history arguments for the latest element set of one object before start_datetime.
+
+    :param sat_id: Satellite NORAD ID.
+    :param start_datetime: Upper bound of the epoch; the lookback window is 30 days.
+    :return: Dict of keyword arguments for gp_history.
+    """
+    start_range = start_datetime - timedelta(days=30)
+    return dict(
+        norad_cat_id=sat_id,
+        epoch=op.inclusive_range(start_range.strftime('%Y-%m-%d'), start_datetime.strftime('%Y-%m-%d %H:%M:%S')),
+        orderby='epoch desc',
+        limit=1,
+        format='json'
+    )
+
+
+def batch_records_query(sat_ids, start_datetime, days):
+    """
+    Build the gp_history arguments for the element sets of many objects in a lookback window.
+
+    :param sat_ids: NORAD IDs of one chunk from chunk_norad_ids().
+    :param start_datetime: Upper bound of the epoch.
+    :param days: Length of the lookback window, one of BATCH_LOOKBACK_DAYS.
+    :return: Dict of keyword arguments for gp_history.
+    """
+    start_range = start_datetime - timedelta(days=days)
+    return dict(
+        norad_cat_id=','.join(map(str, sat_ids)),
+        epoch=op.inclusive_range(start_range.strftime('%Y-%m-%d'), start_datetime.strftime('%Y-%m-%d %H:%M:%S')),
+        orderby='norad_cat_id asc,epoch desc',
+        format='json'
+    )
+
+
+def parse_json_response(data):
+    """Return the records of a JSON response that may arrive as text or already parsed."""
+    return json.loads(data) if isinstance(data, str) else (data or [])
+
+
+def latest_records_before(records, start_datetime):
+    """
+    Pick the record with the latest EPOCH not after start_datetime for every object.
+
+    :param records: gp_history JSON records.
+    :param start_datetime: Upper bound of the epoch.
+    :return: Dict NORAD ID -> record.
+    """
+    latest = {}
+    for record in records:
+        epoch = datetime.fromisoformat(record["EPOCH"])
+        if epoch > start_datetime:
+            continue
+        sat_id = int(record["NORAD_CAT_ID"])
+        if sat_id not in latest or epoch > latest[sat_id][0]:
+            latest[sat_id] = (epoch, record)
+    return {sat_id: record for sat_id, (_, record) in latest.items()}
 
 class SpacetrackClientWrapper:
     """
@@ -17,14 +118,73 @@ class SpacetrackClientWrapper:
     This class encapsulates the logic to retrieve satellite data (TLE or OMM) using the SpaceTrack API.
     """
 
-    def __init__(self, username, password):
+    def __init__(self, username, password, cache=None, scheduler=None, satcat_cache=None, base_url=None):
         """
         Initialize the SpaceTrack client with user credentials.
 
         :param username: SpaceTrack account login (email).
         :param password: SpaceTrack account password.
+        :param cache: Optional ElementSetCache serving element sets fetched recently.
+        :param scheduler: RequestScheduler enforcing the request caps; defaults to the shared one.
+        :param satcat_cache: Optional SatcatQueryCache serving repeated satcat searches.
+        :param base_url: Optional API root replacing https://www.space-track.org/, e.g. a local stand-in.
+        """
+        self.client = SpaceTrackClient(identity=username, password=password, **client_options(base_url))
+        self.cache = cache
+        self.scheduler = scheduler or shared_scheduler()
+        self.satcat_cache = satcat_cache
+
+    def _request(self, method, priority=PRIORITY_BATCH, **kwargs):
+        """
+        Send a Space-Track request through the scheduler.
+
+        :param method: Name of the SpaceTrackClient request class method, e.g. 'gp_history'.
+        :param priority: PRIORITY_INTERACTIVE or PRIORITY_BATCH.
+        :return: Raw response of the request.
         """
-        self.client = SpaceTrackClient(identity=username, password=password)
+        return self.scheduler.call(
+            request_key(method, kwargs), lambda: getattr(self.client, method)(**kwargs), priority
+        )
+
+    def _search_satcat(self, limit, name=None, **kwargs):
+        """
+        Run a satcat query, answering it from the satcat cache when possible.
+
+        :param limit: Maximum number of results.
+        :param name: Name fragment of a plain name search, which may be refined from a broader cached search.
+        :return: List of satcat records.
+        """
+        if self.satcat_cache is not None:
+            results = self.satcat_cache.lookup(kwargs, limit)
+            if results is None and name is not None:
+                results = self.satcat_cache.refine_name(name, limit)
+            if results is not None:
+                return results
+
+        results = parse_json_response(
+            self._request('satcat', priority=PRIORITY_INTERACTIVE, limit=limit, format='json', **kwargs)
+        )
+        if self.satcat_cache is not None:
+            self.satcat_cache.store(kwargs, limit, results, name)
+        return results
+
+    def _latest_record(self, sat_id, start_datetime):
+        """
+        Return the latest gp_history JSON record before start_datetime, using the cache if possible.
+
+        :return: Record dict, or None if Space-Track has no data in the 30-day window.
+        """
+        if self.cache is not None:
+            record = self.cache.lookup(sat_id, start_datetime)
+            if record is not None:
+                return record
+
+        records = parse_json_response(self._request('gp_history', **latest_record_query(sat_id, start_datetime)))
+        if not records:
+            return None
+        if self.cache is not None:
+            self.cache.store(records[0], start_datetime)
+        return records[0]
 
     def get_tle(self, sat_id, start_datetime):
         """
@@ -35,23 +195,10 @@ class SpacetrackClientWrapper:
         :return: Tuple (tle_1, tle_2, orb_incl) containing the TLE lines and orbital inclination.
         :raises Exception: If TLE data cannot be retrieved.
         """
-        start_range = start_datetime - timedelta(days=30)
-        daterange = op.inclusive_range(start_range.strftime('%Y-%m-%d'),
-                                       start_datetime.strftime('%Y-%m-%d %H:%M:%S'))
-
-        data = self.client.gp_history(
-            norad_cat_id=sat_id,
-            epoch=daterange,
-            orderby='epoch desc',
-            limit=1,
-            format='tle'
-        )
-        if not data:
+        record = self._latest_record(sat_id, start_datetime)
+        if not record:
             raise Exception(f'No TLE data found for satellite {sat_id} before {start_datetime}')
-        tle_1 = data[0:69]
-        tle_2 = data[70:139]
-        orb_incl = data[78:86]
-        return tle_1, tle_2, orb_incl
+        return _tle_from_record(record)
 
     def get_omm(self, sat_id, start_datetime):
         """
@@ -62,58 +209,121 @@ class SpacetrackClientWrapper:
         :return: OMM data as a parsed JSON object.
         :raises Exception: If OMM data cannot be retrieved.
         """
-        start_range = start_datetime - timedelta(days=30)
-        daterange = op.inclusive_range(start_range.strftime('%Y-%m-%d'),
-                                       start_datetime.strftime('%Y-%m-%d %H:%M:%S'))
-
-        data = self.client.gp_history(
-            norad_cat_id=sat_id,
-            epoch=daterange,
-            orderby='epoch desc',
-            limit=1,
-            format='json'
-        )
-        if not data:
+        record = self._latest_record(sat_id, start_datetime)
+        if not record:
             raise Exception(f'No OMM data found for satellite {sat_id} before {start_datetime}')
-        return json.loads(data)
+        return [record]
+
+    def get_elements_batch(self, sat_ids, start_datetime, data_format, max_chars=MAX_ID_QUERY_CHARS):
+        """
+        Retrieve the latest element sets before start_datetime for many satellites.
+
+        Many NORAD IDs are sent per gp_history request, in chunks sized by max_chars;
+        the latest epoch per object is selected on the client side.
+
+        :param sat_ids: Iterable of NORAD IDs.
+        :param start_datetime: Start date and time; the latest data before this time is used.
+        :param data_format: 'TLE' or 'OMM'.
+        :param max_chars: Maximum length of the NORAD ID list per request.
+        :return: Dict NORAD ID -> data shaped like get_tle()/get_omm() results.
+                 IDs without data in the lookback window are missing from the dict.
+        :raises ValueError: If the data format is unsupported.
+        """
+        if data_format not in ('TLE', 'OMM'):
+            raise ValueError("Unsupported data format. Use 'TLE' or 'OMM'.")
+
+        found = {}
+        pending = list(dict.fromkeys(int(i) for i in sat_ids))
+        if self.cache is not None:
+            for sat_id in pending:
+                record = self.cache.lookup(sat_id, start_datetime)
+                if record is not None:
+                    found[sat_id] = record
+            pending = [sat_id for sat_id in pending if sat_id not in found]
+
+        for days in BATCH_LOOKBACK_DAYS:
+            if not pending:
+                break
+            for chunk in chunk_norad_ids(pending, max_chars):
+                data = self._request('gp_history', **batch_records_query(chunk, start_datetime, days))
+                latest = latest_records_before(parse_json_response(data), start_datetime)
+                if self.cache is not None:
+                    self.cache.store_many(list(latest.values()), start_datetime)
+                found.update(latest)
+            pending = [sat_id for sat_id in pending if sat_id not in found]
+
+        if data_format == 'TLE':
+            return {sat_id: _tle_from_record(record) for sat_id, record in found.items()}
+        return {sat_id: [record] for sat_id, record in found.items()}
+
+    def sync_elements(self, sat_ids, start_datetime, max_chars=MAX_ID_QUERY_CHARS):
+        """
+        Fetch only the element sets published since the newest epoch held in the cache.
+
+        One epoch window, from the oldest of the newest local epochs up to start_datetime,
+        is queried in NORAD ID batches; records not newer than an object's own newest
+        local epoch are dropped here. Afterwards the cache answers lookups for
+        start_datetime for every synced object; objects without local history are left
+        to the regular queries.
+
+        :param sat_ids: Iterable of NORAD IDs.
+        :param start_datetime: Start date and time; the latest data before this time is needed.
+        :param max_chars: Maximum length of the NORAD ID list per request.
+        :return: Set of synced NORAD IDs.
+        """
+        if self.cache is None:
+            return set()
+        newest = self.cache.newest_epochs(dict.fromkeys(int(i) for i in sat_ids), start_datetime)
+        if not newest:
+            return set()
+
+        since = datetime.fromisoformat(min(newest.values())).strftime('%Y-%m-%d %H:%M:%S')
+        end = start_datetime.strftime('%Y-%m-%d %H:%M:%S')
+        for chunk in chunk_norad_ids(sorted(newest), max_chars):
+            records = parse_json_response(self._request(
+                'gp_history',
+                norad_cat_id=','.join(map(str, chunk)),
+                epoch=op.inclusive_range(since, end),
+                orderby='norad_cat_id asc,epoch desc',
+                format='json'
+            ))
+            newer = [r for r in records
+                     if newest[int(r["NORAD_CAT_ID"])] < epoch_key(r["EPOCH"]) <= epoch_key(start_datetime)]
+            self.cache.store_sync(newer, chunk, start_datetime)
+        return set(newest)
 
     def search_by_name(self, name, limit=100):
         """
         Search satellites by name (partial match).
         """
-        results = self.client.satcat(
+        return self._search_satcat(
+            limit,
+            name=name,
             satname=op.like(f'%{name}%'),
-            orderby='NORAD_CAT_ID asc',
-            limit=limit,
-            format='json'
+            orderby='NORAD_CAT_ID asc'
         )
-        return json.loads(results) if isinstance(results, str) else results
 
     def get_active_satellites(self, limit=100):
         """
         Get all active satellites.
         Поле decay оставляем None, чтобы API выгружал записи, где decay IS NULL.
         """
-        results = self.client.satcat(
+        return self._search_satcat(
+            limit,
             current='Y',
             decay=None,
-            orderby='NORAD_CAT_ID desc',
-            limit=limit,
-            format='json'
+            orderby='NORAD_CAT_ID desc'
         )
-        return json.loads(results) if isinstance(results, str) else results
 
     def search_by_country(self, country_code, limit=100):
         """
         Search satellites launched by a specific country.
         """
-        results = self.client.satcat(
+        return self._search_satcat(
+            limit,
             country=country_code,
-            orderby='NORAD_CAT_ID asc',
-            limit=limit,
-            format='json'
+            orderby='NORAD_CAT_ID asc'
         )
-        return json.loads(results) if isinstance(results, str) else results
 
     def search_by_norad_id(self, norad_input, limit=100):
         """
@@ -146,13 +356,11 @@ class SpacetrackClientWrapper:
             except ValueError as e:
                 raise ValueError(f"Invalid NORAD ID: {norad_input}. Must be a number.") from e
 
-        results = self.client.satcat(
+        return self._search_satcat(
+            limit,
             norad_cat_id=norad_ids,
-            orderby='NORAD_CAT_ID asc',
-            limit=limit,
-            format='json'
+            orderby='NORAD_CAT_ID asc'
         )
-        return json.loads(results) if isinstance(results, str) else results
 
     def search_by_custom_query(self, conditions, limit=100):
         """
@@ -227,12 +435,10 @@ class SpacetrackClientWrapper:
                 query_params[api_field] = ','.join(str(p) for p in predicates)
 
         try:
-            results = self.client.satcat(
+            return self._search_satcat(
+                limit,
                 **query_params,
-                orderby='norad_cat_id asc',
-                limit=limit,
-                format='json'
+                orderby='norad_cat_id asc'
             )
-            return json.loads(results) if isinstance(results, str) else results
         except Exception as e:
             raise Exception(f"Failed to execute satcat query: {str(e)}")
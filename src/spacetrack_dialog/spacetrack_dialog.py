@@ -8,7 +8,12 @@ from datetime import datetime, timezone
 import json
 import os
 import logging
+import sqlite3
+import threading
 
+from ..spacetrack_client.element_cache import DEFAULT_TTL_HOURS, ElementSetCache
+from ..spacetrack_client.satcat_cache import SatcatQueryCache
+from ..spacetrack_client.selection_prefetcher import SelectionPrefetcher
 from ..spacetrack_client.spacetrack_client import SpacetrackClientWrapper
 from .custom_query_dialog import CustomQueryDialog
 
@@ -256,15 +261,21 @@ class SpaceTrackDialog(QtWidgets.QDialog):
 
     def __init__(
         self, parent=None, login: str = None,
-        password: str = None, log_callback=None, translator=None
+        password: str = None, log_callback=None, translator=None,
+        start_datetime: datetime = None, cache_ttl_hours: float = DEFAULT_TTL_HOURS
     ):
         super().__init__(parent)
         self.translator = translator 
         self._init_logger()
-        self.client = SpacetrackClientWrapper(login, password)
+        self.log_callback = log_callback
+        element_cache = self._open_element_cache(cache_ttl_hours) if start_datetime else None
+        self.client = SpacetrackClientWrapper(login, password, cache=element_cache,
+                                              satcat_cache=self._open_satcat_cache())
+        # Element sets of selected satellites are downloaded into the cache for the run at start_datetime.
+        self.prefetcher = SelectionPrefetcher(self.client, start_datetime, log_callback=self._log) \
+            if element_cache is not None else None
         self.selected_ids = []
         self.custom_conds = []
-        self.log_callback = log_callback
 
         self.ui = Ui_SpaceTrackDialog()
         self.ui.setup_ui(self)
@@ -277,6 +288,24 @@ class SpaceTrackDialog(QtWidgets.QDialog):
         """Translate text using Qt's translation system."""
         return QtCore.QCoreApplication.translate("SpaceTrackDialog", text)
 
+    def _open_element_cache(self, ttl_hours: float):
+        """Open the element-set cache shared with the main run, or None if it is disabled or unavailable."""
+        if ttl_hours <= 0:
+            return None
+        try:
+            return ElementSetCache(ttl_hours=ttl_hours, log_callback=self._log)
+        except (OSError, sqlite3.Error) as e:
+            self._log(f"Element-set cache unavailable, selected satellites are not prefetched: {str(e)}", "WARNING")
+            return None
+
+    def _open_satcat_cache(self):
+        """Open the local satcat query cache; searches go to Space-Track if it is unavailable."""
+        try:
+            return SatcatQueryCache(log_callback=self._log)
+        except (OSError, sqlite3.Error) as e:
+            self._log(f"Satcat cache unavailable: {str(e)}", "WARNING")
+            return None
+
     def _init_logger(self):
         """Initialize the logger."""
         self.logger = logging.getLogger("SpaceTracePlugin")
@@ -292,23 +321,28 @@ class SpaceTrackDialog(QtWidgets.QDialog):
         else:
             self.logger.info(message)
 
-    def _log(self, message: str, level: str = "INFO") -> None:
-        """Log message using log_callback and internal logger."""
-        
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        formatted_message = f"[{timestamp}] {message}"
-        
-        if self.log_callback and level.upper() in ["INFO", "WARNING", "DEBUG"]:
-            self.log_callback(formatted_message)
-        
-        if level.upper() == "DEBUG":
-            self.logger.debug(message)
-        elif level.upper() == "WARNING":
-            self.logger.warning(message)
-        elif level.upper() == "ERROR":
-            self.logger.error(message)
+    def _log(self, message: str, level: str = "INFO", *args) -> None:
+        """Log message using log_callback and internal logger.
+
+        The selection prefetcher and the element cache log from their own threads; the
+        callback appends to a widget, so those messages go to the file log only. DEBUG
+        lines are shown only while the plugin logger writes them.
+        """
+        level = level.upper()
+        on_gui_thread = threading.current_thread() is threading.main_thread()
+        shown = level in ["INFO", "WARNING"] or (level == "DEBUG" and self.logger.isEnabledFor(logging.DEBUG))
+        if self.log_callback and on_gui_thread and shown:
+            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            self.log_callback(f"[{timestamp}] {message % args if args else message}")
+
+        if level == "DEBUG":
+            self.logger.debug(message, *args)
+        elif level == "WARNING":
+            self.logger.warning(message, *args)
+        elif level == "ERROR":
+            self.logger.error(message, *args)
         else:
-            self.logger.info(message)
+            self.logger.info(message, *args)
 
     def _connect_signals(self) -> None:
         ui = self.ui
@@ -380,18 +414,18 @@ class SpaceTrackDialog(QtWidgets.QDialog):
         match True:
             case _ if ui.radio_name.isChecked():
                 self._ensure_text(text, "Please enter a satellite name.")
-                self._log(f"Searching by name: {text}, limit: {limit}", "DEBUG")
+                self._log("Searching by name: %s, limit: %s", "DEBUG", text, limit)
                 return self.client.search_by_name(text, limit)
             case _ if ui.radio_active.isChecked():
-                self._log(f"Searching all active satellites, limit: {limit}", "DEBUG")
+                self._log("Searching all active satellites, limit: %s", "DEBUG", limit)
                 return self.client.get_active_satellites(limit)
             case _ if ui.radio_country.isChecked():
                 self._ensure_text(text, "Please enter a country code (e.g., US).")
-                self._log(f"Searching by country: {text}, limit: {limit}", "DEBUG")
+                self._log("Searching by country: %s, limit: %s", "DEBUG", text, limit)
                 return self.client.search_by_country(text, limit)
             case _ if ui.radio_norad.isChecked():
                 self._ensure_text(text, "Please enter a NORAD ID, range, or list.")
-                self._log(f"Searching by NORAD ID: {text}, limit: {limit}", "DEBUG")
+                self._log("Searching by NORAD ID: %s, limit: %s", "DEBUG", text, limit)
                 return self.client.search_by_norad_id(text, limit)
             case _:
                 self._log("No search criteria selected", "WARNING")
@@ -403,7 +437,7 @@ class SpaceTrackDialog(QtWidgets.QDialog):
         dialog.set_saved_conditions(self.custom_conds)
         if dialog.exec_() == QDialog.Accepted:
             self.custom_conds = dialog.get_saved_conditions()
-            self._log(f"Custom query conditions: {self.custom_conds}", "DEBUG")
+            self._log("Custom query conditions: %s", "DEBUG", self.custom_conds)
             self.perform_custom_search(self.custom_conds)
 
     def perform_custom_search(self, conditions: list) -> None:
@@ -425,7 +459,7 @@ class SpaceTrackDialog(QtWidgets.QDialog):
             self.ui.table_result.setItem(0, 0, QtWidgets.QTableWidgetItem("No results"))
             self._log("No results found.")
             return
-        self._log(f"Found {len(results)} items.")
+        self._log("Found %d items.", "INFO", len(results))
         for record in results:
             if isinstance(record, dict):
                 self._add_row(record)
@@ -470,6 +504,8 @@ class SpaceTrackDialog(QtWidgets.QDialog):
             item = self.ui.table_result.item(r, 0)
             if item and item.text().isdigit():
                 self.selected_ids.append(item.text())
+        if self.prefetcher is not None:
+            self.prefetcher.update(self.selected_ids)
 
     def on_accept(self) -> None:
         """Accept dialog only if at least one ID is selected."""
@@ -479,6 +515,12 @@ class SpaceTrackDialog(QtWidgets.QDialog):
         else:
             self._warn(self._translate("Select at least one satellite."))
 
+    def reject(self) -> None:
+        """Stop prefetching the selection when the dialog is cancelled."""
+        if self.prefetcher is not None:
+            self.prefetcher.cancel()
+        super().reject()
+
     def save_selected_data(self) -> None:
         """Save data for selected satellites in chosen format."""
         if not self.selected_ids:
@@ -516,7 +558,7 @@ class SpaceTrackDialog(QtWidgets.QDialog):
             return []
         
         paths = [(nid, os.path.join(dir_path, f"satellite_{nid}.{ext}")) for nid in ids]
-        self._log(f"Selected save paths: {paths}", "DEBUG")
+        self._log("Selected save paths: %s", "DEBUG", paths)
         return paths
 
     def _execute_save(self, fmt: str, paths: list) -> None:
@@ -528,7 +570,7 @@ class SpaceTrackDialog(QtWidgets.QDialog):
         failures = []
 
         for i, (nid, p) in enumerate(paths, 1):
-            self._log(f"Writing {fmt} for ID {nid} to {p}")
+            self._log("Writing %s for ID %s to %s", "INFO", fmt, nid, p)
             try:
                 if fmt == 'OMM':
                     data = self.client.get_omm(nid, start)
@@ -538,7 +580,7 @@ class SpaceTrackDialog(QtWidgets.QDialog):
                     t1, t2, _ = self.client.get_tle(nid, start)
                     with open(p, 'w') as f:
                         f.write(f"{t1}\n{t2}\n")
-                self._log(f"Saved {nid}.")
+                self._log("Saved %s.", "INFO", nid)
             except Exception as e:
                 self._log(f"Error saving {nid}: {e}")
                 failures.append(nid)
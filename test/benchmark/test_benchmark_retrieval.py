@@ -0,0 +1,66 @@
+import importlib.util
+from datetime import datetime
+
+import pytest
+
+from src.data_retriver.async_spacetrack_retriver import AsyncSpaceTrackRetriever
+from src.spacetrack_client.rate_limiter import RequestScheduler
+from src.spacetrack_client.spacetrack_client import SpacetrackClientWrapper
+from test.spacetrack_server import IDENTITY, PASSWORD, SpaceTrackStandIn, synthetic_catalog
+
+pytestmark = pytest.mark.skipif(importlib.util.find_spec("spacetrack.base") is None,
+                                reason="spacetrack is not installed")
+
+NEWEST_EPOCH = datetime(2025, 3, 28, 12)
+START = datetime(2025, 3, 28, 6)
+OBJECT_COUNT = 500
+# Per-satellite requests are throttled by the client to 30 per minute, so keep them few.
+SINGLE_COUNT = 20
+LATENCY_SECONDS = 0.05
+
+
+@pytest.fixture(scope="module")
+def server():
+    catalog = synthetic_catalog(OBJECT_COUNT, records_per_object=20, newest_epoch=NEWEST_EPOCH)
+    with SpaceTrackStandIn(catalog, latency_seconds=LATENCY_SECONDS) as stand_in:
+        yield stand_in
+
+
+def _wrapper(server):
+    return SpacetrackClientWrapper(IDENTITY, PASSWORD, scheduler=RequestScheduler(), base_url=server.base_url)
+
+
+def _sat_ids(count):
+    return list(range(40000, 40000 + count))
+
+
+@pytest.mark.benchmark
+def test_retrieve_per_satellite(benchmark, server):
+    wrapper = _wrapper(server)
+    result = benchmark.pedantic(lambda: [wrapper.get_tle(i, START) for i in _sat_ids(SINGLE_COUNT)],
+                                rounds=1, iterations=1)
+    assert len(result) == SINGLE_COUNT
+
+
+@pytest.mark.benchmark
+def test_retrieve_async(benchmark, server):
+    def run():
+        retriever = AsyncSpaceTrackRetriever(IDENTITY, PASSWORD, max_concurrency=8, base_url=server.base_url)
+        try:
+            retriever.prefetch(_sat_ids(SINGLE_COUNT), START, "TLE")
+            return [retriever._fetch(i, START, "TLE") for i in _sat_ids(SINGLE_COUNT)]
+        finally:
+            retriever.close()
+
+    assert len(benchmark.pedantic(run, rounds=1, iterations=1)) == SINGLE_COUNT
+
+
+@pytest.mark.benchmark
+def test_retrieve_batched(benchmark, server):
+    wrapper = _wrapper(server)
+    before = server.request_counts["gp_history"]
+    result = benchmark.pedantic(lambda: wrapper.get_elements_batch(_sat_ids(OBJECT_COUNT), START, "TLE"),
+                                rounds=1, iterations=1)
+    assert len(result) == OBJECT_COUNT
+    # 500 five-digit IDs fit into two ID lists of at most 1500 characters.
+    assert server.request_counts["gp_history"] - before == 2
@@ -0,0 +1,360 @@
+# coding=utf-8
+"""Local stand-in for the Space-Track API used by retrieval tests and benchmarks.
+
+The server implements login, the modeldef and query endpoints of the gp_history
+and satcat classes over a recorded or synthetic catalog, with optional latency
+and Space-Track's per-minute and per-hour request caps.
+
+    with SpaceTrackStandIn(synthetic_catalog(100)) as server:
+        client = SpacetrackClientWrapper("user", "pass", base_url=server.base_url)
+"""
+
+import json
+import re
+import threading
+import time
+from collections import Counter, deque
+from datetime import datetime, timedelta
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlparse
+
+IDENTITY = "user@example.com"
+PASSWORD = "password"
+SESSION_COOKIE = "chocolatechip"
+RATE_LIMIT_MESSAGE = "You've violated your query rate limit."
+
+# Field types reported by modeldef; everything else is varchar.
+_INT_FIELDS = {"NORAD_CAT_ID", "ELEMENT_SET_NO", "REV_AT_EPOCH", "EPHEMERIS_TYPE", "GP_ID", "LAUNCH_NUM"}
+_DECIMAL_FIELDS = {"MEAN_MOTION", "ECCENTRICITY", "INCLINATION", "RA_OF_ASC_NODE", "ARG_OF_PERICENTER",
+                   "MEAN_ANOMALY", "BSTAR", "MEAN_MOTION_DOT", "MEAN_MOTION_DDOT", "PERIOD", "APOGEE",
+                   "PERIGEE", "SEMIMAJOR_AXIS"}
+_DATETIME_FIELDS = {"EPOCH", "CREATION_DATE"}
+_DATE_FIELDS = {"LAUNCH", "DECAY"}
+
+
+def _tle_checksum(line):
+    """Return line with the modulo-10 checksum appended as column 69."""
+    total = sum(int(c) if c.isdigit() else 1 if c == "-" else 0 for c in line[:68])
+    return f"{line[:68]}{total % 10}"
+
+
+def _tle_lines(sat_id, epoch, inclination, raan, mean_anomaly, mean_motion, element_set_no):
+    """Build a valid TLE line pair for a synthetic object."""
+    day = (epoch - datetime(epoch.year, 1, 1)).total_seconds() / 86400 + 1
+    line1 = _tle_checksum(f"1 {sat_id:05d}U 20001A   {epoch.year % 100:02d}{day:012.8f}  .00001000  00000-0  "
+                          f"10000-3 0 {element_set_no % 10000:4d}0")
+    line2 = _tle_checksum(f"2 {sat_id:05d} {inclination:8.4f} {raan:8.4f} 0001000  90.0000 {mean_anomaly:8.4f} "
+                          f"{mean_motion:11.8f}{1000 + element_set_no % 90000:5d}0")
+    return line1, line2
+
+
+def synthetic_catalog(object_count, records_per_object=10, newest_epoch=None, first_id=40000,
+                      interval_hours=12.0, name_prefix="SYNTH"):
+    """Build a synthetic catalog of LEO objects.
+
+    :param object_count: Number of objects.
+    :param records_per_object: Element sets per object, interval_hours apart.
+    :param newest_epoch: Epoch of the newest element set of every object
+        (defaults to now, rounded down to the hour).
+    :param first_id: NORAD ID of the first object.
+    :param interval_hours: Time between consecutive element sets of an object.
+    :param name_prefix: Object names are "<prefix>-<index>".
+    :returns: Dict with "gp_history" and "satcat" record lists.
+    """
+    newest_epoch = newest_epoch or datetime.utcnow().replace(minute=0, second=0, microsecond=0)
+    gp_history, satcat = [], []
+    for index in range(object_count):
+        sat_id = first_id + index
+        name = f"{name_prefix}-{index + 1}"
+        inclination = 45.0 + (index * 7.3) % 53
+        mean_motion = 14.5 + (index % 17) * 0.08
+        satcat.append({
+            "NORAD_CAT_ID": str(sat_id), "SATNAME": name, "OBJECT_NAME": name,
+            "INTLDES": f"2020-{index % 999 + 1:03d}A", "OBJECT_TYPE": "PAYLOAD", "COUNTRY": ["US", "PRC", "CIS"][index % 3],
+            "LAUNCH": "2020-01-01", "DECAY": None, "CURRENT": "Y", "PERIOD": f"{1440 / mean_motion:.2f}",
+            "INCLINATION": f"{inclination:.2f}", "APOGEE": "560", "PERIGEE": "540", "ECCENTRICITY": "0.0001",
+        })
+        for k in range(records_per_object):
+            epoch = newest_epoch - timedelta(hours=interval_hours * (records_per_object - 1 - k))
+            raan = (index * 11.1 + k * 3.0) % 360
+            mean_anomaly = (k * 37.0) % 360
+            line1, line2 = _tle_lines(sat_id, epoch, inclination, raan, mean_anomaly, mean_motion, k + 1)
+            gp_history.append({
+                "NORAD_CAT_ID": str(sat_id), "OBJECT_NAME": name, "OBJECT_ID": satcat[-1]["INTLDES"],
+                "EPOCH": epoch.strftime("%Y-%m-%dT%H:%M:%S.%f"), "MEAN_MOTION": f"{mean_motion:.8f}",
+                "ECCENTRICITY": "0.00010000", "INCLINATION": f"{inclination:.4f}", "RA_OF_ASC_NODE": f"{raan:.4f}",
+                "ARG_OF_PERICENTER": "90.0000", "MEAN_ANOMALY": f"{mean_anomaly:.4f}", "EPHEMERIS_TYPE": "0",
+                "CLASSIFICATION_TYPE": "U", "ELEMENT_SET_NO": str(k + 1), "REV_AT_EPOCH": str(1000 + k),
+                "BSTAR": "0.00010000", "MEAN_MOTION_DOT": "0.00001000", "MEAN_MOTION_DDOT": "0",
+                "TLE_LINE0": f"0 {name}", "TLE_LINE1": line1, "TLE_LINE2": line2,
+            })
+    return {"gp_history": gp_history, "satcat": satcat}
+
+
+def load_catalog(gp_history_path=None, satcat_path=None):
+    """Load a recorded catalog from JSON arrays saved from Space-Track responses.
+
+    :param gp_history_path: JSON file with gp_history records.
+    :param satcat_path: JSON file with satcat records.
+    :returns: Dict with "gp_history" and "satcat" record lists.
+    """
+    catalog = {"gp_history": [], "satcat": []}
+    for class_, path in (("gp_history", gp_history_path), ("satcat", satcat_path)):
+        if path:
+            with open(path, "r") as f:
+                catalog[class_] = json.load(f)
+    return catalog
+
+
+def _comparable(value):
+    """Return a sort/compare key: numbers as floats, dates and timestamps as datetimes."""
+    if value is None:
+        return (0, "")
+    text = str(value)
+    try:
+        return (1, float(text))
+    except ValueError:
+        pass
+    try:
+        return (2, datetime.fromisoformat(text.rstrip("Z")).isoformat(sep=" ", timespec="microseconds"))
+    except ValueError:
+        return (3, text)
+
+
+def _like(pattern):
+    """Compile a Space-Track LIKE pattern (% and _ wildcards, case-insensitive)."""
+    regex = "".join(".*" if c == "%" else "." if c == "_" else re.escape(c) for c in pattern)
+    return re.compile(f"^{regex}$", re.IGNORECASE | re.DOTALL)
+
+
+def predicate_matcher(value):
+    """Build a function testing one field value against a REST predicate value.
+
+    Supports null-val, <>, <, >, ~~ (like), ^ (starts with), a--b ranges and
+    comma-separated lists.
+    """
+    if value == "null-val":
+        return lambda field: field in (None, "")
+    if value.startswith("<>"):
+        inner = predicate_matcher(value[2:])
+        return lambda field: not inner(field)
+    if value.startswith("<"):
+        bound = _comparable(value[1:])
+        return lambda field: field not in (None, "") and _comparable(field) < bound
+    if value.startswith(">"):
+        bound = _comparable(value[1:])
+        return lambda field: field not in (None, "") and _comparable(field) > bound
+    if value.startswith("~~"):
+        pattern = _like(value[2:])
+        return lambda field: field is not None and bool(pattern.match(str(field)))
+    if value.startswith("^"):
+        prefix = value[1:].upper()
+        return lambda field: field is not None and str(field).upper().startswith(prefix)
+    if "--" in value:
+        low, high = (_comparable(v) for v in value.split("--", 1))
+        return lambda field: field not in (None, "") and low <= _comparable(field) <= high
+    if "," in value:
+        matchers = [predicate_matcher(v) for v in value.split(",")]
+        return lambda field: any(m(field) for m in matchers)
+    expected = _comparable(value)
+    return lambda field: field not in (None, "") and (
+        _comparable(field) == expected or str(field).upper() == value.upper())
+
+
+def run_query(records, predicates):
+    """Apply REST predicates, orderby and limit to a list of records.
+
+    :param records: Records of one request class.
+    :param predicates: Ordered list of (name, value) pairs from the query path.
+    :returns: Tuple (matching records, format).
+    """
+    options = {}
+    filters = []
+    for name, value in predicates:
+        if name in ("orderby", "limit", "format", "distinct", "metadata", "emptyresult", "favorites"):
+            options[name] = value
+        else:
+            filters.append((name.upper(), predicate_matcher(value)))
+    result = [r for r in records if all(match(r.get(field)) for field, match in filters)]
+
+    for term in reversed([t.strip() for t in options.get("orderby", "").split(",") if t.strip()]):
+        field, _, direction = term.partition(" ")
+        result.sort(key=lambda r: _comparable(r.get(field.upper())), reverse=direction.lower() == "desc")
+    if "limit" in options:
+        count, _, offset = options["limit"].partition(",")
+        start = int(offset or 0)
+        result = result[start:start + int(count)]
+    return result, options.get("format", "json")
+
+
+class SpaceTrackStandIn:
+    """Threaded HTTP server answering Space-Track requests from an in-memory catalog."""
+
+    def __init__(self, catalog=None, latency_seconds=0.0, per_minute=None, per_hour=None,
+                 identity=IDENTITY, password=PASSWORD, host="127.0.0.1", port=0):
+        """
+        :param catalog: Dict with "gp_history" and "satcat" record lists.
+        :param latency_seconds: Delay added to every response.
+        :param per_minute: Requests allowed per minute before queries fail, None for no cap.
+        :param per_hour: Requests allowed per hour before queries fail, None for no cap.
+        :param identity: Accepted login.
+        :param password: Accepted password.
+        :param host: Interface to listen on.
+        :param port: Port to listen on; 0 picks a free one.
+        """
+        self.catalog = catalog or {"gp_history": [], "satcat": []}
+        self.latency_seconds = latency_seconds
+        self.limits = [(cap, period) for cap, period in ((per_minute, 60), (per_hour, 3600)) if cap]
+        self.identity = identity
+        self.password = password
+        self.request_counts = Counter()
+        self.query_log = []
+        self.rate_limited = 0
+        self._recent = deque()
+        self._lock = threading.Lock()
+        self._session = "stand-in-session"
+        self._server = ThreadingHTTPServer((host, port), _Handler)
+        self._server.daemon_threads = True
+        self._server.stand_in = self
+        self._thread = None
+
+    @property
+    def base_url(self):
+        """Base URL to pass to the Space-Track client."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self):
+        """Serve requests on a background thread and return the base URL."""
+        self._thread = threading.Thread(target=self._server.serve_forever, name="spacetrack-stand-in", daemon=True)
+        self._thread.start()
+        return self.base_url
+
+    def stop(self):
+        """Shut the server down."""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _within_limits(self):
+        """Record a query and return False if it exceeds a cap."""
+        now = time.monotonic()
+        with self._lock:
+            self._recent.append(now)
+            longest = max((period for _, period in self.limits), default=0)
+            while self._recent and self._recent[0] < now - longest:
+                self._recent.popleft()
+            for cap, period in self.limits:
+                if sum(1 for t in self._recent if t >= now - period) > cap:
+                    self.rate_limited += 1
+                    return False
+        return True
+
+    def _record(self, class_, path):
+        with self._lock:
+            self.request_counts[class_] += 1
+            self.query_log.append(path)
+
+    def modeldef(self, class_):
+        """Return the modeldef fields of a request class, derived from the catalog records."""
+        fields = dict.fromkeys(key for record in self.catalog.get(class_, []) for key in record)
+        fields = fields or {"NORAD_CAT_ID": None}
+
+        def field_type(name):
+            if name in _INT_FIELDS:
+                return "int(10) unsigned"
+            if name in _DECIMAL_FIELDS:
+                return "decimal(20,8)"
+            if name in _DATETIME_FIELDS:
+                return "datetime"
+            if name in _DATE_FIELDS:
+                return "date"
+            return "varchar(255)"
+
+        return {"controller": "basicspacedata", "data": [
+            {"Field": name, "Type": field_type(name), "Null": "YES", "Key": "", "Default": "", "Extra": ""}
+            for name in fields
+        ]}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Request handler; the server instance carries the stand-in as stand_in."""
+
+    def log_message(self, format, *args):
+        pass
+
+    @property
+    def stand_in(self):
+        return self.server.stand_in
+
+    def _send(self, status, body, content_type="application/json", cookie=None):
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        if cookie:
+            self.send_header("Set-Cookie", f"{SESSION_COOKIE}={cookie}; Path=/")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _authenticated(self):
+        cookies = SimpleCookie(self.headers.get("Cookie", ""))
+        return SESSION_COOKIE in cookies and cookies[SESSION_COOKIE].value == self.stand_in._session
+
+    def do_POST(self):
+        if urlparse(self.path).path.rstrip("/") != "/ajaxauth/login":
+            self._send(404, json.dumps({"error": "not found"}))
+            return
+        length = int(self.headers.get("Content-Length", 0))
+        form = parse_qs(self.rfile.read(length).decode("utf-8"))
+        if form.get("identity", [None])[0] == self.stand_in.identity and \
+                form.get("password", [None])[0] == self.stand_in.password:
+            self._send(200, '""', cookie=self.stand_in._session)
+        else:
+            self._send(200, json.dumps({"Login": "Failed"}))
+
+    def do_GET(self):
+        stand_in = self.stand_in
+        path = urlparse(self.path).path
+        if path.rstrip("/") == "/ajaxauth/logout":
+            self._send(200, '"Successfully logged out"')
+            return
+        if not self._authenticated():
+            self._send(401, json.dumps({"error": "You must be logged in to complete this action"}))
+            return
+        if stand_in.latency_seconds:
+            time.sleep(stand_in.latency_seconds)
+
+        parts = [unquote(p) for p in path.strip("/").split("/")]
+        if len(parts) >= 4 and parts[1] == "modeldef" and parts[2] == "class":
+            self._send(200, json.dumps(stand_in.modeldef(parts[3])))
+            return
+        if len(parts) < 4 or parts[1] != "query" or parts[2] != "class" or parts[3] not in stand_in.catalog:
+            self._send(404, json.dumps({"error": f"unknown request {path}"}))
+            return
+
+        class_ = parts[3]
+        stand_in._record(class_, path)
+        if not stand_in._within_limits():
+            self._send(500, RATE_LIMIT_MESSAGE, content_type="text/html")
+            return
+        predicates = list(zip(parts[4::2], parts[5::2]))
+        records, fmt = run_query(stand_in.catalog[class_], predicates)
+        if fmt in ("tle", "3le"):
+            lines = []
+            for r in records:
+                if fmt == "3le":
+                    lines.append(r.get("TLE_LINE0", "0 " + str(r.get("OBJECT_NAME", ""))))
+                lines += [r["TLE_LINE1"], r["TLE_LINE2"]]
+            self._send(200, "\n".join(lines) + ("\n" if lines else ""), content_type="text/plain")
+        else:
+            self._send(200, json.dumps(records))
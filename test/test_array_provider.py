@@ -0,0 +1,82 @@
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+from qgis.core import QgsFeatureRequest, QgsRectangle
+
+from src.Space_trace.orbital import array_provider
+from src.Space_trace.orbital.array_provider import (
+    ArrayFeatureSource,
+    create_array_layer,
+    register_array_provider,
+)
+from src.orbital_data_processor.orbital_data_processor import ORBITAL_COLUMNS
+
+from .utilities import get_qgis_app
+QGIS_APP = get_qgis_app()
+
+
+def sample_columns(count):
+    columns = {"time": np.datetime64("2025-03-28T00:00:00", "us") + np.arange(count) * np.timedelta64(60, "s")}
+    for name in ORBITAL_COLUMNS[1:]:
+        columns[name] = np.arange(count, dtype=float)
+    columns["lat"] = np.arange(count, dtype=float) / 2
+    return columns
+
+
+class ArrayProviderTest(unittest.TestCase):
+    def setUp(self):
+        self.assertTrue(register_array_provider())
+        self.columns = sample_columns(10)
+        self.filled = []
+        fill_feature = ArrayFeatureSource.fill_feature
+
+        def counting_fill(source, f, fid, no_geometry=False):
+            self.filled.append(fid)
+            fill_feature(source, f, fid, no_geometry)
+
+        patcher = patch.object(ArrayFeatureSource, "fill_feature", counting_fill)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.layer = create_array_layer(self.columns, "track")
+
+    def test_count_and_extent_without_materializing(self):
+        self.assertTrue(self.layer.isValid())
+        self.assertEqual(self.layer.featureCount(), 10)
+        self.assertEqual(self.layer.extent(), QgsRectangle(0, 0, 9, 4.5))
+        self.assertEqual(self.filled, [])
+
+    def test_arrays_are_not_copied(self):
+        self.assertIs(self.layer.dataProvider().columns["lon"], self.columns["lon"])
+
+    def test_fid_filter(self):
+        features = list(self.layer.getFeatures(QgsFeatureRequest(3)))
+
+        self.assertEqual([f.id() for f in features], [3])
+        self.assertEqual(features[0]["Longitude"], 3.0)
+        self.assertEqual(features[0].geometry().asPoint().y(), 1.5)
+        self.assertEqual(list(self.layer.getFeatures(QgsFeatureRequest(10))), [])
+        self.assertEqual(self.filled, [3])
+
+    def test_fids_filter(self):
+        features = self.layer.getFeatures(QgsFeatureRequest().setFilterFids([8, 1, 42]))
+
+        self.assertEqual(sorted(f.id() for f in features), [1, 8])
+
+    def test_rect_filter_materializes_only_matches(self):
+        request = QgsFeatureRequest().setFilterRect(QgsRectangle(1.5, 0, 4.5, 10))
+
+        self.assertEqual([f.id() for f in self.layer.getFeatures(request)], [2, 3, 4])
+        self.assertEqual(self.filled, [2, 3, 4])
+
+    def test_dataset_is_released_with_the_layer(self):
+        key = self.layer.dataProvider().dataset_key()
+        self.assertIn(key, array_provider._datasets)
+
+        self.layer.willBeDeleted.emit()
+
+        self.assertNotIn(key, array_provider._datasets)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+import asyncio
+import json
+import threading
+import unittest
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from src.data_retriver import spacetrack_retriver
+from src.data_retriver.async_spacetrack_retriver import AsyncSpaceTrackRetriever
+from src.spacetrack_client.rate_limiter import RequestScheduler
+
+
+def _record(sat_id, epoch="2025-03-28T09:00:00.000000"):
+    return {
+        "NORAD_CAT_ID": str(sat_id),
+        "EPOCH": epoch,
+        "TLE_LINE1": f"1 {sat_id:05d}U line1",
+        "TLE_LINE2": f"2 {sat_id:05d}  51.6386 line2",
+    }
+
+
+class _FakeAsyncClient:
+    """Answers gp_history after a short delay and records the peak number of requests in flight."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.peak = 0
+        self.calls = 0
+        self.closed = False
+
+    async def gp_history(self, norad_cat_id, **kwargs):
+        self.calls += 1
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        ids = [int(i) for i in str(norad_cat_id).split(",")]
+        return json.dumps([_record(i) for i in ids if i != 99999])
+
+    async def close(self):
+        self.closed = True
+
+
+class AsyncSpaceTrackRetrieverTest(unittest.TestCase):
+    def setUp(self):
+        with patch.object(spacetrack_retriver, "SpacetrackClientWrapper", side_effect=AssertionError):
+            self.retriever = AsyncSpaceTrackRetriever("user", "password", max_concurrency=3)
+        self.fake = _FakeAsyncClient()
+        self.retriever.client.client = self.fake
+        self.retriever.client.scheduler = RequestScheduler()
+        self.start = datetime(2025, 3, 28, 12)
+
+    def tearDown(self):
+        self.retriever.close()
+        self.assertTrue(self.fake.closed)
+        self.assertTrue(self.retriever._loop.is_closed())
+
+    def _config(self, sat_id, data_format="TLE"):
+        return SimpleNamespace(data_format=data_format, sat_id=sat_id, start_datetime=self.start,
+                               save_data=False, save_data_path=None)
+
+    def test_prefetch_sends_one_batched_query(self):
+        sat_ids = list(range(25544, 25554))
+        self.assertEqual(self.retriever.prefetch(sat_ids, self.start, "TLE"), 10)
+
+        for sat_id in sat_ids:
+            self.assertEqual(self.retriever.retrieve_data(self._config(sat_id))[2], " 51.6386")
+        self.assertEqual(self.fake.calls, 1)
+        self.assertFalse(self.retriever.incremental_sync)
+
+    def test_prefetch_batches_run_concurrently(self):
+        self.retriever.max_id_chars = 11
+        sat_ids = list(range(25544, 25554))
+        self.retriever.prefetch(sat_ids, self.start, "TLE")
+
+        for sat_id in sat_ids:
+            self.assertEqual(self.retriever.retrieve_data(self._config(sat_id))[0], f"1 {sat_id}U line1")
+        self.assertEqual(self.fake.calls, 5)
+        self.assertLessEqual(self.fake.peak, 3)
+        self.assertGreater(self.fake.peak, 1)
+
+    def test_identical_requests_are_sent_once(self):
+        futures = [self.retriever._submit(25544, self.start, "OMM") for _ in range(3)]
+
+        self.assertEqual([f.result()[0]["NORAD_CAT_ID"] for f in futures], ["25544"] * 3)
+        self.assertEqual(self.fake.calls, 1)
+
+    def test_missing_data_raises(self):
+        self.retriever.prefetch([99999], self.start, "OMM")
+
+        with self.assertRaises(Exception):
+            self.retriever.retrieve_data(self._config(99999, "OMM"))
+        self.assertEqual(self.retriever.retrieve_data(self._config(40000, "OMM"))[0]["NORAD_CAT_ID"], "40000")
+
+    def test_cache_is_queried_off_the_event_loop(self):
+        threads = []
+
+        class Cache:
+            def lookup(self, sat_id, start_datetime):
+                threads.append(threading.current_thread().name)
+                return None
+
+            def store(self, record, start_datetime):
+                threads.append(threading.current_thread().name)
+
+        self.retriever.client.cache = Cache()
+        self.retriever.retrieve_data(self._config(25544))
+
+        self.assertEqual(len(threads), 2)
+        self.assertNotIn("SpaceTraceRetriever", threads)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime
+
+from osgeo import ogr
+
+from src.Space_trace.orbital.consolidated import ConsolidatedTrackWriter
+from src.Space_trace.orbital.handler import OrbitalLogicHandler
+from src.orbital_data_processor.orbital_data_processor import points_to_columns
+
+
+class ConsolidatedTrackWriterTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "tracks.gpkg")
+        self.points = [
+            (datetime(2025, 3, 28, 0, i), 10.0 + i, -20.0, 420.0, 7.66, 90.0, 0.0, 12.5, 51.6)
+            for i in range(3)
+        ]
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_all_satellites_share_tables(self):
+        writer = ConsolidatedTrackWriter(self.path, create_line=True)
+        writer.add_track(25544, self.points, [[(10.0, -20.0), (12.0, -20.0)]])
+        writer.add_track(40000, self.points, [[(10.0, -20.0), (12.0, -20.0)]])
+        points_uri, lines_uri = writer.close()
+
+        self.assertEqual(points_uri, f"{self.path}|layername=points")
+        self.assertEqual(lines_uri, f"{self.path}|layername=lines")
+
+        ds = ogr.Open(self.path)
+        self.assertEqual(ds.GetLayerCount(), 2)
+        points = ds.GetLayerByName("points")
+        self.assertEqual(points.GetFeatureCount(), 6)
+        points.SetAttributeFilter("NORAD_ID = 40000")
+        self.assertEqual(points.GetFeatureCount(), 3)
+        self.assertEqual(ds.GetLayerByName("lines").GetFeatureCount(), 2)
+
+        indexes = ds.ExecuteSQL("SELECT name FROM sqlite_master WHERE type = 'index' AND name LIKE 'idx_%_norad_id'")
+        self.assertEqual(indexes.GetFeatureCount(), 2)
+        ds.ReleaseResultSet(indexes)
+
+    def test_columns_keep_values_and_dates(self):
+        points = self.points + [(datetime(2025, 3, 28, 0, 3, 0, 500000), 13.0, -20.0, 420.0, 7.66, 90.0, 0.0, 12.5,
+                                 51.6)]
+        writer = ConsolidatedTrackWriter(self.path, create_line=True)
+        OrbitalLogicHandler().write_dataset_track(points_to_columns(points), writer, 25544)
+        writer.close()
+
+        ds = ogr.Open(self.path)
+        features = list(ds.GetLayerByName("points"))
+        self.assertEqual([f.GetField("Point_ID") for f in features], [0, 1, 2, 3])
+        self.assertEqual([f.GetField("Longitude") for f in features], [10.0, 11.0, 12.0, 13.0])
+        self.assertEqual(features[1].GetField("Latitude"), -20.0)
+        self.assertEqual(features[1].GetGeometryRef().GetX(), 11.0)
+        self.assertEqual(features[2].GetField("Inclination"), 51.6)
+        date_index = features[0].GetFieldIndex("Date_Time")
+        self.assertEqual(features[1].GetFieldAsDateTime(date_index), [2025, 3, 28, 0, 1, 0.0, 100])
+        self.assertEqual(features[3].GetFieldAsDateTime(date_index), [2025, 3, 28, 0, 3, 0.5, 100])
+        self.assertEqual(ds.GetLayerByName("lines").GetFeatureCount(), 1)
+
+    def test_abort_discards_tracks(self):
+        writer = ConsolidatedTrackWriter(self.path, create_line=False)
+        writer.add_track(25544, self.points)
+        writer.abort()
+
+        ds = ogr.Open(self.path)
+        self.assertEqual(ds.GetLayerByName("points").GetFeatureCount(), 0)
+        self.assertIsNone(ds.GetLayerByName("lines"))
+
+
+if __name__ == "__main__":
+    unittest.main()
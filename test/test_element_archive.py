@@ -0,0 +1,60 @@
+import json
+import os
+import tempfile
+import unittest
+from datetime import datetime
+
+from src.data_retriver.element_archive import ElementArchive
+
+ISS_LINE1 = "1 25544U 98067A   08264.51782528 -.00002182  00000-0 -11606-4 0  2927"
+ISS_LINE2 = "2 25544  51.6416 247.4627 0006703 130.5360 325.0288 15.72125391563537"
+
+
+def _omm(sat_id, epoch):
+    return {"OBJECT_NAME": "OBJECT", "NORAD_CAT_ID": str(sat_id), "EPOCH": epoch, "MEAN_MOTION": "15.5"}
+
+
+class ElementArchiveTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.archive = ElementArchive(os.path.join(self.tmp_dir.name, "archive"))
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_identical_element_sets_are_stored_once(self):
+        first = self.archive.add((ISS_LINE1, ISS_LINE2, 51.6416), "TLE")
+        size = os.path.getsize(self.archive.pack_path)
+        second = self.archive.add((ISS_LINE1 + " ", ISS_LINE2, 51.6416), "TLE")
+
+        self.assertEqual(first, second)
+        self.assertEqual(os.path.getsize(self.archive.pack_path), size)
+        self.assertEqual(self.archive.read(first[0]), f"{ISS_LINE1}\n{ISS_LINE2}\n")
+        self.assertEqual(self.archive.entries(25544), [(25544, "2008-09-20T12:25:40.104192", "TLE", first[0])])
+
+    def test_get_latest_omm_before(self):
+        records = [_omm(40000, "2025-03-27T12:00:00"), _omm(40000, "2025-03-28T12:00:00"),
+                   _omm(40001, "2025-03-28T00:00:00")]
+        self.archive.add(records, "OMM")
+        # Key order does not change the content address.
+        self.archive.add([dict(reversed(list(records[0].items())))], "OMM")
+
+        self.assertEqual(len(self.archive.entries()), 3)
+        self.assertEqual(self.archive.get(40000, "OMM"), [records[1]])
+        self.assertEqual(self.archive.get(40000, "OMM", before=datetime(2025, 3, 28)), [records[0]])
+        with self.assertRaises(ValueError):
+            self.archive.get(40000, "TLE")
+
+    def test_export_writes_legacy_files(self):
+        tle = self.archive.add((ISS_LINE1, ISS_LINE2, 51.6416), "TLE")
+        omm = self.archive.add([_omm(40000, "2025-03-28T12:00:00")], "OMM")
+        base = os.path.join(self.tmp_dir.name, "25544.tle")
+
+        with open(self.archive.export(tle, "TLE", base)) as f:
+            self.assertEqual(f.read(), f"{ISS_LINE1}\n{ISS_LINE2}\n")
+        with open(self.archive.export(omm, "OMM", base)) as f:
+            self.assertEqual(json.load(f), [_omm(40000, "2025-03-28T12:00:00")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from datetime import datetime
+
+from src.spacetrack_client.element_cache import ElementSetCache
+
+
+def _record(sat_id, epoch):
+    return {"NORAD_CAT_ID": str(sat_id), "EPOCH": epoch, "TLE_LINE1": "1", "TLE_LINE2": "2"}
+
+
+class ElementSetCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache = ElementSetCache(os.path.join(self.tmp_dir.name, "cache.sqlite"), ttl_hours=1,
+                                     max_records_per_object=2)
+        self.start = datetime(2025, 3, 28, 12)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_lookup_within_ttl(self):
+        self.cache.store(_record(25544, "2025-03-28T09:00:00.000000"), self.start, now=1000.0)
+
+        self.assertEqual(self.cache.lookup(25544, self.start, now=2000.0)["EPOCH"], "2025-03-28T09:00:00.000000")
+        # Any time between the epoch and the query bound has the same answer.
+        self.assertIsNotNone(self.cache.lookup(25544, datetime(2025, 3, 28, 10), now=2000.0))
+
+    def test_lookup_misses(self):
+        self.cache.store(_record(25544, "2025-03-28T09:00:00.000000"), self.start, now=1000.0)
+
+        self.assertIsNone(self.cache.lookup(25544, self.start, now=1000.0 + 3601))
+        self.assertIsNone(self.cache.lookup(25544, datetime(2025, 3, 28, 13), now=2000.0))
+        self.assertIsNone(self.cache.lookup(25544, datetime(2025, 3, 28, 8), now=2000.0))
+        self.assertIsNone(self.cache.lookup(40000, self.start, now=2000.0))
+
+    def test_compact_keeps_newest_records(self):
+        for hour in (6, 7, 8, 9):
+            self.cache.store(_record(25544, f"2025-03-28T0{hour}:00:00.000000"),
+                             datetime(2025, 3, 28, hour, 30), now=1000.0)
+
+        self.assertEqual(self.cache.compact(now=1500.0), 2)
+        self.assertIsNotNone(self.cache.lookup(25544, datetime(2025, 3, 28, 9, 30), now=1500.0))
+        self.assertIsNone(self.cache.lookup(25544, datetime(2025, 3, 28, 6, 30), now=1500.0))
+
+    @unittest.skipUnless(hasattr(sqlite3.Connection, "setlimit"), "Connection.setlimit needs Python 3.11")
+    def test_sync_of_many_objects(self):
+        # More IDs than older SQLite builds accept as bound parameters in one statement.
+        connect = self.cache._connect
+
+        def limited_connect():
+            connection = connect()
+            connection.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 999)
+            return connection
+
+        self.cache._connect = limited_connect
+        sat_ids = list(range(40000, 42500))
+        records = [_record(sat_id, "2025-03-28T09:00:00.000000") for sat_id in sat_ids]
+        self.cache.store_sync(records, sat_ids, self.start, now=1000.0)
+
+        epochs = self.cache.newest_epochs(sat_ids + [50000], self.start)
+        self.assertEqual(len(epochs), len(sat_ids))
+        self.assertEqual(epochs[42499], "2025-03-28T09:00:00.000000")
+        self.assertIsNotNone(self.cache.lookup(42499, self.start, now=2000.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -44,5 +44,12 @@ class OrbitalLogicHandlerTest(unittest.TestCase):
         self.assertEqual(len(segments), 2)
         self.assertEqual(segments[0], [(-179.0, 0.0), (-180.0, 0.5)])
         self.assertEqual(segments[1], [(180.0, 0.5), (179.0, 1.0)])
+
+    def test_get_line_segments_interpolates_extra_values(self):
+        points = [(-179.0, 0.0, 400.0, 0.0), (179.0, 1.0, 410.0, 60.0)]
+        segments = self.handler.get_line_segments(points)
+
+        self.assertEqual(segments[0], [(-179.0, 0.0, 400.0, 0.0), (-180.0, 0.5, 405.0, 30.0)])
+        self.assertEqual(segments[1], [(180.0, 0.5, 405.0, 30.0), (179.0, 1.0, 410.0, 60.0)])
         
     
\ No newline at end of file
@@ -0,0 +1,210 @@
+import gzip
+import os
+import sqlite3
+import struct
+import tempfile
+import unittest
+from datetime import datetime
+
+from src.Space_trace.orbital.handler import OrbitalLogicHandler
+from src.Space_trace.orbital.mbtiles import TILE_EXTENT, MBTilesTrackWriter, _line_geometry, _zigzag, mercator_unit
+from src.orbital_data_processor.orbital_data_processor import points_to_columns
+
+
+def _fields(data):
+    """Yield (field number, value) of a protobuf message; value is an int or bytes."""
+    pos = 0
+
+    def varint():
+        nonlocal pos
+        result = shift = 0
+        while True:
+            byte = data[pos]
+            pos += 1
+            result |= (byte & 0x7F) << shift
+            shift += 7
+            if byte < 0x80:
+                return result
+
+    while pos < len(data):
+        key = varint()
+        wire = key & 7
+        if wire == 0:
+            yield key >> 3, varint()
+        elif wire == 1:
+            yield key >> 3, struct.unpack("<d", data[pos:pos + 8])[0]
+            pos += 8
+        else:
+            length = varint()
+            yield key >> 3, data[pos:pos + length]
+            pos += length
+
+
+def _varints(data):
+    values, result, shift = [], 0, 0
+    for byte in data:
+        result |= (byte & 0x7F) << shift
+        shift += 7
+        if byte < 0x80:
+            values.append(result)
+            result = shift = 0
+    return values
+
+
+def _unzigzag(value):
+    return (value >> 1) ^ -(value & 1)
+
+
+def _geometry(commands):
+    """Decode MVT commands into runs of absolute tile coordinates."""
+    runs, x, y, i = [], 0, 0, 0
+    while i < len(commands):
+        command, count = commands[i] & 7, commands[i] >> 3
+        i += 1
+        for _ in range(count):
+            x, y = x + _unzigzag(commands[i]), y + _unzigzag(commands[i + 1])
+            i += 2
+            if command == 1:
+                runs.append([(x, y)])
+            else:
+                runs[-1].append((x, y))
+    return runs
+
+
+def decode_tile(data):
+    """Decode a gzipped MVT tile into {layer: [(id, attributes, runs)]}."""
+    layers = {}
+    for _, layer in _fields(gzip.decompress(data)):
+        name, keys, values, features = None, [], [], []
+        for number, value in _fields(layer):
+            if number == 1:
+                name = value.decode("utf-8")
+            elif number == 2:
+                features.append(dict(_fields(value)))
+            elif number == 3:
+                keys.append(value.decode("utf-8"))
+            elif number == 4:
+                ((kind, raw),) = _fields(value)
+                values.append(raw.decode("utf-8") if kind == 1 else _unzigzag(raw) if kind == 6 else raw)
+        layers[name] = [
+            (feature[1], {keys[k]: values[v] for k, v in zip(*[iter(_varints(feature[2]))] * 2)},
+             _geometry(_varints(feature[4])))
+            for feature in features
+        ]
+    return layers
+
+
+class MBTilesTrackWriterTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "tracks.mbtiles")
+        self.columns = points_to_columns([
+            (datetime(2025, 3, 28, 0, i), (350.0 + 4 * i) % 360 - 180, -20.0 + i, 420.0, 7.66, 90.0, 0.0, 12.5, 51.6)
+            for i in range(6)
+        ])
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_line_geometry_commands(self):
+        self.assertEqual(
+            _line_geometry([[(2, 2), (2, 10), (10, 10)]]),
+            [9, 4, 4, 18, 0, 16, 16, 0],
+        )
+        self.assertEqual(_zigzag(-1), 1)
+
+    def test_pyramid_is_written(self):
+        writer = MBTilesTrackWriter(self.path, create_line=True, max_zoom=3)
+        OrbitalLogicHandler().add_columns_to_dataset(self.columns, writer, 25544)
+        points_uri, lines_uri = writer.close()
+
+        self.assertEqual(points_uri, f"type=mbtiles&url={self.path}")
+        self.assertEqual(lines_uri, points_uri)
+        connection = sqlite3.connect(self.path)
+        metadata = dict(connection.execute("SELECT name, value FROM metadata"))
+        self.assertEqual(metadata["format"], "pbf")
+        self.assertEqual(metadata["maxzoom"], "3")
+        zooms = [row[0] for row in connection.execute("SELECT DISTINCT zoom_level FROM tiles ORDER BY zoom_level")]
+        self.assertEqual(zooms, [0, 1, 2, 3])
+        (tile,) = connection.execute("SELECT tile_data FROM tiles WHERE zoom_level = 0").fetchone()
+        data = gzip.decompress(tile)
+        self.assertIn(b"points", data)
+        self.assertIn(b"lines", data)
+        self.assertIn(b"2025-03-28T00:00:00", data)
+        # The track crosses the antimeridian, so at zoom 1 it touches both western and eastern tiles.
+        columns = {row[0] for row in connection.execute("SELECT tile_column FROM tiles WHERE zoom_level = 1")}
+        self.assertEqual(columns, {0, 1})
+        connection.close()
+
+    def _tiles(self, zoom):
+        connection = sqlite3.connect(self.path)
+        rows = connection.execute(
+            "SELECT tile_column, tile_row, tile_data FROM tiles WHERE zoom_level = ?", (zoom,)
+        ).fetchall()
+        connection.close()
+        return {(x, (1 << zoom) - 1 - row): decode_tile(data) for x, row, data in rows}
+
+    def test_tile_features_decode(self):
+        writer = MBTilesTrackWriter(self.path, create_line=False, max_zoom=0)
+        OrbitalLogicHandler().add_columns_to_dataset(self.columns, writer, 25544)
+        writer.close()
+
+        points = self._tiles(0)[(0, 0)]["points"]
+        u, v = mercator_unit(self.columns["lon"], self.columns["lat"])
+        self.assertEqual(len(points), 6)
+        self.assertEqual([attributes["Point_ID"] for _, attributes, _ in points], list(range(6)))
+        self.assertEqual(points[2][1]["NORAD_ID"], 25544)
+        self.assertEqual(points[2][1]["Date_Time"], "2025-03-28T00:02:00")
+        self.assertEqual(points[2][1]["Altitude"], 420.0)
+        self.assertEqual(points[2][2], [[(int(u[2] * TILE_EXTENT), int(v[2] * TILE_EXTENT))]])
+
+    def test_long_edges_are_clipped_to_the_tiles_they_cross(self):
+        writer = MBTilesTrackWriter(self.path, create_line=True, min_zoom=3, max_zoom=3)
+        columns = points_to_columns([
+            (datetime(2025, 3, 28, 0, 0), -80.0, -60.0, 420.0, 7.66, 90.0, 0.0, 12.5, 51.6),
+            (datetime(2025, 3, 28, 0, 1), 80.0, 60.0, 420.0, 7.66, 90.0, 0.0, 12.5, 51.6),
+        ])
+        OrbitalLogicHandler().add_columns_to_dataset(columns, writer, 25544)
+        writer.close()
+
+        line_tiles = {key: layers["lines"] for key, layers in self._tiles(3).items() if layers.get("lines")}
+        # The edge runs from tile (2, 5) to tile (5, 2) and only lands in the tiles along it.
+        self.assertIn((2, 5), line_tiles)
+        self.assertIn((5, 2), line_tiles)
+        self.assertNotIn((2, 2), line_tiles)
+        self.assertNotIn((5, 5), line_tiles)
+        self.assertLess(len(line_tiles), 16)
+        for features in line_tiles.values():
+            for _, _, runs in features:
+                for x, y in (vertex for run in runs for vertex in run):
+                    self.assertTrue(-writer.tile_buffer <= x <= TILE_EXTENT + writer.tile_buffer)
+                    self.assertTrue(-writer.tile_buffer <= y <= TILE_EXTENT + writer.tile_buffer)
+
+    def test_staged_features_give_the_same_tiles(self):
+        writer = MBTilesTrackWriter(self.path, create_line=True, max_zoom=2)
+        handler = OrbitalLogicHandler()
+        handler.add_columns_to_dataset(self.columns, writer, 25544)
+        handler.add_columns_to_dataset(self.columns, writer, 25545)
+        writer.close()
+        expected = {zoom: self._tiles(zoom) for zoom in range(3)}
+
+        writer = MBTilesTrackWriter(self.path, create_line=True, max_zoom=2)
+        writer.flush_features = 1
+        handler.add_columns_to_dataset(self.columns, writer, 25544)
+        self.assertEqual(writer._tiles, {})
+        self.assertTrue(os.path.exists(self.path + ".staging"))
+        handler.add_columns_to_dataset(self.columns, writer, 25545)
+        writer.close()
+
+        self.assertEqual({zoom: self._tiles(zoom) for zoom in range(3)}, expected)
+        self.assertFalse(os.path.exists(self.path + ".staging"))
+
+    def test_abort_writes_nothing(self):
+        writer = MBTilesTrackWriter(self.path, create_line=False)
+        writer.add_track(25544, [(datetime(2025, 3, 28), 10.0, 0.0, 420.0, 7.66, 90.0, 0.0, 12.5, 51.6)])
+        writer.abort()
+        self.assertFalse(os.path.exists(self.path))
+
+
+if __name__ == "__main__":
+    unittest.main()
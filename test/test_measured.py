@@ -0,0 +1,29 @@
+import unittest
+from datetime import datetime
+
+import numpy as np
+
+from src.Space_trace.orbital.measured import interpolate_along_m, m_to_times, times_to_m
+
+
+class MeasuredTrackTest(unittest.TestCase):
+    def test_m_round_trip_keeps_milliseconds(self):
+        times = np.array([datetime(2025, 3, 28, 0, 0, 0, 250000), datetime(2025, 3, 28, 12)],
+                         dtype="datetime64[us]")
+        np.testing.assert_array_equal(m_to_times(times_to_m(times)), times)
+
+    def test_interpolate_along_m(self):
+        start = times_to_m(np.array([datetime(2025, 3, 28)], dtype="datetime64[us]"))[0]
+        vertices = [(10.0, 0.0, 400.0, start), (12.0, 2.0, 420.0, start + 60.0)]
+        times = np.array([datetime(2025, 3, 28, 0, 0, 30), datetime(2025, 3, 28, 0, 5)], dtype="datetime64[us]")
+
+        sampled = interpolate_along_m(vertices, times)
+
+        self.assertEqual(sampled["lon"][0], 11.0)
+        self.assertEqual(sampled["lat"][0], 1.0)
+        self.assertEqual(sampled["alt"][0], 410.0)
+        self.assertTrue(np.isnan(sampled["lon"][1]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+import importlib.util
+import json
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from types import SimpleNamespace
+
+from src.data_retriver.data_retriver import LocalFileRetriever
+from src.data_retriver.omm_catalog import OmmCatalog
+
+ISS_LINE1 = "1 25544U 98067A   08264.51782528 -.00002182  00000-0 -11606-4 0  2927"
+ISS_LINE2 = "2 25544  51.6416 247.4627 0006703 130.5360 325.0288 15.72125391563537"
+ISS_OMM = {
+    "OBJECT_NAME": "ISS (ZARYA)", "OBJECT_ID": "1998-067A", "EPOCH": "2008-09-20T12:25:40.104192",
+    "MEAN_MOTION": "15.72125391", "ECCENTRICITY": "0.0006703", "INCLINATION": "51.6416",
+    "RA_OF_ASC_NODE": "247.4627", "ARG_OF_PERICENTER": "130.5360", "MEAN_ANOMALY": "325.0288",
+    "EPHEMERIS_TYPE": "0", "CLASSIFICATION_TYPE": "U", "NORAD_CAT_ID": "25544", "ELEMENT_SET_NO": "292",
+    "REV_AT_EPOCH": "56353", "BSTAR": "-0.000011606", "MEAN_MOTION_DOT": "-0.00002182", "MEAN_MOTION_DDOT": "0",
+}
+
+
+def _omm(sat_id, epoch, name="OBJECT"):
+    return {"OBJECT_NAME": name, "NORAD_CAT_ID": str(sat_id), "EPOCH": epoch,
+            "MEAN_MOTION": "15.5", "INCLINATION": "51.6"}
+
+
+class OmmCatalogTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.records = [
+            _omm(25544, "2025-03-27T10:00:00.000000", "ISS (ZARYA)"),
+            _omm(33591, "2025-03-27T11:00:00.000000", "NOAA 19 – \"weather\""),
+            _omm(25544, "2025-03-28T09:00:00.000000", "ISS (ZARYA)"),
+        ]
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _path(self, name):
+        return os.path.join(self.tmp_dir.name, name)
+
+    def test_json_array(self):
+        path = self._path("catalog.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.records, f, indent=2, ensure_ascii=False)
+
+        catalog = OmmCatalog(path)
+        self.assertFalse(catalog.is_csv)
+        self.assertEqual(catalog.norad_ids(), [25544, 33591])
+        self.assertEqual(catalog.get_omm(25544)[0]["EPOCH"], "2025-03-28T09:00:00.000000")
+        self.assertEqual(catalog.get_omm(25544, datetime(2025, 3, 28))[0]["EPOCH"], "2025-03-27T10:00:00.000000")
+        self.assertEqual([record for _, record in catalog.iter_records()], self.records)
+        catalog.close()
+
+        reopened = OmmCatalog(path)
+        self.assertEqual(reopened.get_omm(33591)[0]["OBJECT_NAME"], self.records[1]["OBJECT_NAME"])
+        reopened.close()
+
+    def test_small_window_records(self):
+        path = self._path("large.json")
+        records = [dict(_omm(40000 + i, "2025-03-27T10:00:00.000000"), COMMENT="x" * 5000) for i in range(3)]
+        with open(path, "w") as f:
+            json.dump(records, f)
+
+        catalog = OmmCatalog(path, use_sidecar=False)
+        self.assertEqual(catalog.get_omm(40002)[0]["NORAD_CAT_ID"], "40002")
+        catalog.close()
+
+    def test_csv(self):
+        path = self._path("catalog.csv")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("OBJECT_NAME,NORAD_CAT_ID,EPOCH,MEAN_MOTION,INCLINATION\r\n")
+            for record in self.records:
+                name = record["OBJECT_NAME"].replace('"', '""')
+                f.write(f'"{name}",{record["NORAD_CAT_ID"]},{record["EPOCH"]},15.5,51.6\r\n')
+
+        catalog = OmmCatalog(path)
+        self.assertTrue(catalog.is_csv)
+        self.assertEqual(catalog.get_omm(33591)[0]["OBJECT_NAME"], self.records[1]["OBJECT_NAME"])
+        self.assertEqual(len(list(catalog.iter_records())), 3)
+        catalog.close()
+
+    def test_xml(self):
+        path = self._path("catalog.xml")
+        body = "".join(
+            f'<omm id="CCSDS_OMM_VERS" version="2.0"><header><CREATION_DATE/></header><body><segment>'
+            f'<metadata><OBJECT_NAME>{r["OBJECT_NAME"].replace("&", "&amp;")}</OBJECT_NAME></metadata>'
+            f'<data><meanElements><EPOCH>{r["EPOCH"]}</EPOCH></meanElements>'
+            f'<tleParameters><NORAD_CAT_ID>{r["NORAD_CAT_ID"]}</NORAD_CAT_ID></tleParameters></data>'
+            f'</segment></body></omm>'
+            for r in self.records
+        )
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(f'<?xml version="1.0" encoding="UTF-8"?>\n<ndm>{body}</ndm>')
+
+        catalog = OmmCatalog(path)
+        self.assertEqual(catalog.layout, "xml")
+        self.assertEqual(catalog.norad_ids(), [25544, 33591])
+        self.assertEqual(catalog.get_omm(25544)[0]["EPOCH"], "2025-03-28T09:00:00.000000")
+        self.assertEqual(catalog.get_omm(33591)[0]["OBJECT_NAME"], self.records[1]["OBJECT_NAME"])
+        catalog.close()
+
+    def test_local_retriever_picks_the_record_at_the_start_time(self):
+        path = self._path("payload.json")
+        epochs = ["2025-03-27T10:00:00.000000", "2025-03-29T09:00:00.000000", "2025-03-28T09:00:00.000000"]
+        with open(path, "w") as f:
+            json.dump([_omm(25544, epoch, "ISS (ZARYA)") for epoch in epochs], f)
+        retriever = LocalFileRetriever()
+
+        def retrieve(start):
+            config = SimpleNamespace(data_file_path=path, data_format="OMM", save_data=False, save_data_path="",
+                                     catalog=False, sat_id=0, start_datetime=start)
+            return [record["EPOCH"] for record in retriever.retrieve_data(config)]
+
+        self.assertEqual(retrieve(datetime(2025, 3, 28, 12)), ["2025-03-28T09:00:00.000000"])
+        self.assertEqual(retrieve(datetime(2025, 3, 30)), ["2025-03-29T09:00:00.000000"])
+        self.assertEqual(retrieve(datetime(2025, 3, 27, 12)), ["2025-03-27T10:00:00.000000"])
+        self.assertFalse(os.path.exists(path + ".stidx"))
+
+@unittest.skipUnless(all(importlib.util.find_spec(m) for m in ("sgp4", "skyfield", "poliastro")),
+                     "sgp4/skyfield not installed")
+class OmmMeanElementsTest(unittest.TestCase):
+    def test_satrec_matches_tle(self):
+        from sgp4.api import Satrec
+        from src.orbital_data_processor.skyfield import has_mean_elements, omm_satrec
+
+        self.assertTrue(has_mean_elements(ISS_OMM))
+        from_omm = omm_satrec(ISS_OMM)
+        from_tle = Satrec.twoline2rv(ISS_LINE1, ISS_LINE2)
+        for name in ("inclo", "nodeo", "ecco", "argpo", "mo", "no_kozai", "bstar"):
+            self.assertAlmostEqual(getattr(from_omm, name), getattr(from_tle, name), places=6)
+        self.assertAlmostEqual(from_omm.jdsatepoch + from_omm.jdsatepochF,
+                               from_tle.jdsatepoch + from_tle.jdsatepochF, places=6)
+
+
+if __name__ == "__main__":
+    unittest.main()
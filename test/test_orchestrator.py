@@ -1,34 +1,52 @@
+import importlib.util
 import unittest
-from unittest.mock import Mock, patch
-from Space_trace.orbital.facade import OrbitalTrackFacade
-from datetime import date
+from datetime import datetime
+from unittest.mock import patch
 
+from src.config.orbital import OrbitalConfig
+from src.data_retriver.spacetrack_retriver import SpaceTrackRetriever
+from src.Space_trace.orbital.facade import OrbitalTrackFacade
+from .spacetrack_server import IDENTITY, PASSWORD, SpaceTrackStandIn, synthetic_catalog
+
+
+@unittest.skipUnless(importlib.util.find_spec("spacetrack.base"), "spacetrack is not installed")
 class OrbitalOrchestratorTest(unittest.TestCase):
     def setUp(self):
-        self.orchestrator = OrbitalTrackFacade("test@example.com", "password")
-        self.config = Mock(
+        self.catalog = synthetic_catalog(3, records_per_object=4, newest_epoch=datetime(2025, 3, 28, 12),
+                                         first_id=25544)
+        self.server = SpaceTrackStandIn(self.catalog)
+        self.server.start()
+        retriever = SpaceTrackRetriever(IDENTITY, PASSWORD, base_url=self.server.base_url)
+        self.orchestrator = OrbitalTrackFacade(retriever)
+        self.config = OrbitalConfig(
             sat_id=25544,
-            track_day=date(2025, 3, 28),
+            start_datetime=datetime(2025, 3, 28, 6),
             data_format='TLE',
             step_minutes=1,
             output_path='test_output.shp',
             file_format='shp',
             create_line_layer=True,
             save_data=False,
-            data_file_path=None,
-            save_data_path=None
         )
 
-    @patch('src.orbital.spacetrack_client.SpacetrackClientWrapper')
-    @patch('src.orbital.handler.OrbitalLogicHandler')
-    def test_process_persistent_track(self, mock_logic_handler, mock_client):
-        mock_client.return_value.get_tle.return_value = (
-            "TLE1", "TLE2", 51.6448
-        )
-        mock_logic_handler.return_value.create_persistent_orbital_track.return_value = (
-            'test_output.shp', 'test_output_line.shp'
-        )
+    def tearDown(self):
+        self.orchestrator.close()
+        self.server.stop()
+
+    def test_persistent_track(self):
+        handler = self.orchestrator.logic_handler
+        with patch.object(handler, 'propagate_track', return_value=[]) as propagate, \
+                patch.object(handler, 'write_persistent_track',
+                             return_value=('test_output.shp', 'test_output_line.shp')) as write:
+            data = self.orchestrator.retrieve_data(self.config)
+            track = self.orchestrator.propagate_track(self.config, data)
+            result = self.orchestrator.write_track(self.config, data, track)
 
-        result = self.orchestrator.process_persistent_track(self.config)
-        mock_client.return_value.get_tle.assert_called_once_with(25544, date(2025, 3, 28), latest=False)
-        self.assertEqual(result, ('test_output.shp', 'test_output_line.shp'))
\ No newline at end of file
+        # The latest element set before the start time is the one of 2025-03-28 00:00.
+        expected = next(r for r in self.catalog["gp_history"]
+                        if r["NORAD_CAT_ID"] == "25544" and r["EPOCH"].startswith("2025-03-28T00"))
+        data = propagate.call_args.args[0]
+        self.assertEqual((data[0], data[1]), (expected["TLE_LINE1"], expected["TLE_LINE2"]))
+        self.assertIs(write.call_args.args[0], track)
+        self.assertEqual(self.server.request_counts["gp_history"], 1)
+        self.assertEqual(result, ('test_output.shp', 'test_output_line.shp'))
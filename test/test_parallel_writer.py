@@ -0,0 +1,98 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from src.Space_trace.orbital.facade import OrbitalTrackFacade
+from src.Space_trace.orbital.handler import OrbitalLogicHandler
+from src.config.orbital import OrbitalConfig
+from src.orbital_data_processor.orbital_data_processor import points_to_columns
+
+START = datetime(2025, 3, 28)
+
+
+class FakeProcessor:
+    """Processor yielding a straight track whose longitude encodes the satellite."""
+
+    def __init__(self, sat_id):
+        self.sat_id = sat_id
+        self.chunks = 0
+
+    def propagate_chunks(self, start_datetime, duration_hours, step_minutes, chunk_size):
+        count = int(duration_hours * 60 / step_minutes) + 1
+        points = [(start_datetime + timedelta(minutes=i * step_minutes), float(self.sat_id), i / 10,
+                   400.0, 7.6, 0.0, 0.0, 0.0, 51.6) for i in range(count)]
+        for offset in range(0, count, chunk_size):
+            self.chunks += 1
+            yield points_to_columns(points[offset:offset + chunk_size])
+
+
+class ParallelWriterTest(unittest.TestCase):
+    """Runs propagate_track and write_track on a thread pool the way the plugin's output stage does."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.log_threads = set()
+        self.lock = threading.Lock()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _log(self, message, level="INFO", *args):
+        with self.lock:
+            self.log_threads.add(threading.current_thread().name)
+
+    @staticmethod
+    def _build(facade, config, data):
+        return facade.write_track(config, data, facade.propagate_track(config, data))
+
+    def test_workers_write_their_own_files(self):
+        facade = OrbitalTrackFacade(None, log_callback=self._log)
+        configs = [
+            OrbitalConfig(sat_id=sat_id, start_datetime=START, duration_hours=1, step_minutes=1,
+                          output_path=os.path.join(self.tmp.name, f"track_{sat_id}.geojsonl"),
+                          file_format="geojsonl", create_line_layer=False, chunk_size=7)
+            for sat_id in range(1, 9)
+        ]
+
+        with patch.object(OrbitalLogicHandler, "_get_processor",
+                          side_effect=lambda data, data_format: FakeProcessor(data[2])):
+            with ThreadPoolExecutor(max_workers=3, thread_name_prefix="SpaceTraceWriter") as pool:
+                futures = [pool.submit(self._build, facade, config, ("1", "2", config.sat_id))
+                           for config in configs]
+                results = [future.result() for future in futures]
+
+        for config, (point_file, line_file) in zip(configs, results):
+            self.assertEqual(point_file, config.output_path)
+            self.assertIsNone(line_file)
+            with open(point_file, encoding="utf-8") as f:
+                features = [json.loads(line) for line in f]
+            self.assertEqual([feature["properties"]["Point_ID"] for feature in features], list(range(61)))
+            self.assertTrue(all(feature["geometry"]["coordinates"][0] == config.sat_id for feature in features))
+        # Workers log through the callback, which therefore has to be safe off the GUI thread.
+        self.assertTrue(any(name.startswith("SpaceTraceWriter") for name in self.log_threads))
+
+    def test_streamed_track_is_propagated_while_it_is_written(self):
+        facade = OrbitalTrackFacade(None, log_callback=self._log)
+        config = OrbitalConfig(sat_id=1, start_datetime=START, duration_hours=1, step_minutes=1,
+                               output_path=os.path.join(self.tmp.name, "track.geojsonl"),
+                               file_format="geojsonl", create_line_layer=False, chunk_size=7)
+        processor = FakeProcessor(1)
+
+        with patch.object(OrbitalLogicHandler, "_get_processor", return_value=processor):
+            track = facade.propagate_track(config, ("1", "2", 1))
+            # Chunks stay lazy so that only one chunk of a streamed track is held in memory.
+            self.assertEqual(processor.chunks, 0)
+            facade.write_track(config, ("1", "2", 1), track)
+
+        self.assertEqual(processor.chunks, 9)
+        with open(config.output_path, encoding="utf-8") as f:
+            self.assertEqual(len(f.readlines()), 61)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import threading
+import time
+import unittest
+
+from src.Space_trace.orbital.pipeline import Stage, StagedPipeline
+
+
+class StagedPipelineTest(unittest.TestCase):
+    def test_items_pass_all_stages(self):
+        pipeline = StagedPipeline([
+            Stage("retrieve", lambda item: item * 10, workers=2),
+            Stage("propagate", lambda value: value + 1, workers=3),
+            Stage("write", lambda value: -value),
+        ])
+        results = {}
+
+        self.assertTrue(pipeline.run(range(20), on_result=results.__setitem__))
+
+        self.assertEqual(results, {item: -(item * 10 + 1) for item in range(20)})
+        self.assertEqual([m.items for m in pipeline.metrics], [20, 20, 20])
+
+    def test_failed_item_leaves_the_pipeline(self):
+        def propagate(value):
+            if value == 3:
+                raise ValueError("bad elements")
+            return value
+
+        written, errors = [], []
+        pipeline = StagedPipeline([Stage("retrieve", lambda item: item), Stage("propagate", propagate),
+                                   Stage("write", written.append)])
+
+        pipeline.run(range(5), on_error=lambda item, stage, e: errors.append((item, stage, str(e))))
+
+        self.assertEqual(sorted(written), [0, 1, 2, 4])
+        self.assertEqual(errors, [(3, "propagate", "bad elements")])
+        self.assertEqual(pipeline.metrics[1].failures, 1)
+        self.assertEqual(pipeline.metrics[2].items, 4)
+
+    def test_stages_overlap(self):
+        active, peak, lock = set(), [0], threading.Lock()
+
+        def busy(name):
+            def func(value):
+                with lock:
+                    active.add(name)
+                    peak[0] = max(peak[0], len(active))
+                time.sleep(0.02)
+                with lock:
+                    active.discard(name)
+                return value
+            return func
+
+        pipeline = StagedPipeline([Stage(name, busy(name)) for name in ("retrieve", "propagate", "write")])
+        pipeline.run(range(10))
+
+        self.assertEqual(peak[0], 3)
+
+    def test_bounded_queue_blocks_the_producer(self):
+        release = threading.Event()
+        fed = []
+
+        def items():
+            for item in range(10):
+                fed.append(item)
+                yield item
+
+        pipeline = StagedPipeline([Stage("write", lambda value: release.wait())], queue_size=2)
+        thread = threading.Thread(target=pipeline.run, args=(items(),))
+        thread.start()
+        time.sleep(0.1)
+        # One item in the worker, two in the queue and one waiting to be put.
+        self.assertLessEqual(len(fed), 4)
+        release.set()
+        thread.join(2)
+        self.assertEqual(len(fed), 10)
+
+    def test_cancel_drops_remaining_items(self):
+        canceled = threading.Event()
+        written = []
+
+        def write(value):
+            written.append(value)
+            if value == 2:
+                canceled.set()
+
+        pipeline = StagedPipeline([Stage("retrieve", lambda item: item), Stage("write", write)], queue_size=1)
+
+        self.assertFalse(pipeline.run(range(100), is_canceled=canceled.is_set))
+        self.assertLess(len(written), 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
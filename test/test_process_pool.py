@@ -0,0 +1,164 @@
+import importlib.util
+import os
+import sys
+import threading
+import time
+import unittest
+from concurrent.futures import Future
+from datetime import datetime
+from multiprocessing import shared_memory
+from unittest.mock import Mock, patch
+
+import numpy as np
+
+from src.orbital_data_processor.orbital_data_processor import ORBITAL_COLUMNS
+from src.orbital_data_processor.process_pool import (ProcessPoolPropagator, attach_block, python_executable,
+                                                     shared_columns)
+
+ISS_TLE = (
+    "1 25544U 98067A   25087.50000000  .00016717  00000-0  10270-3 0  9005",
+    "2 25544  51.6416 247.4627 0006703 130.5360 325.0288 15.72125391563537",
+    51.6416,
+)
+
+
+def sample_columns(count):
+    columns = {"time": np.datetime64("2025-03-28T00:00:00", "us") + np.arange(count) * np.timedelta64(60, "s")}
+    for index, name in enumerate(ORBITAL_COLUMNS[1:]):
+        columns[name] = np.arange(count, dtype=float) + index
+    return columns
+
+
+class ProcessPoolPropagatorTest(unittest.TestCase):
+    def test_interpreter_of_embedded_python_is_found(self):
+        with patch.object(sys, "executable", os.path.join(sys.exec_prefix, "bin", "qgis")):
+            executable = python_executable()
+        self.assertTrue(os.path.basename(executable).lower().startswith("python"))
+        self.assertTrue(os.path.isfile(executable))
+
+    def test_shared_columns_round_trip(self):
+        expected = sample_columns(10)
+        block = shared_memory.SharedMemory(create=True, size=10 * len(ORBITAL_COLUMNS) * 8)
+        try:
+            for name, column in shared_columns(block.buf, 10).items():
+                column[:] = expected[name]
+            columns = {name: column.copy() for name, column in shared_columns(block.buf, 10).items()}
+        finally:
+            block.close()
+            block.unlink()
+
+        for name in ORBITAL_COLUMNS:
+            np.testing.assert_array_equal(columns[name], expected[name])
+        self.assertEqual(columns["time"].dtype, np.dtype("datetime64[us]"))
+
+    @unittest.skipUnless(importlib.util.find_spec("skyfield"), "skyfield is not installed")
+    def test_worker_result_matches_in_process_propagation(self):
+        from src.orbital_data_processor.skyfield import create_processor
+
+        start = datetime(2025, 3, 28)
+        propagator = ProcessPoolPropagator(workers=1)
+        try:
+            columns = propagator.propagate_columns(ISS_TLE, "TLE", start, 1, 1)
+        finally:
+            propagator.close()
+
+        expected = create_processor(ISS_TLE, "TLE").propagate_columns(start, 1, 1)
+        for name in ORBITAL_COLUMNS:
+            np.testing.assert_array_equal(columns[name], expected[name])
+
+    @unittest.skipUnless(os.name == "posix", "only POSIX shared memory is tracked")
+    def test_attached_block_is_not_tracked(self):
+        block = shared_memory.SharedMemory(create=True, size=8)
+        try:
+            with patch("multiprocessing.resource_tracker.register") as register, \
+                    patch("multiprocessing.resource_tracker.unregister") as unregister:
+                attach_block(block.name).close()
+        finally:
+            block.close()
+            block.unlink()
+
+        # The owner registered the block and unregisters it when it unlinks it.
+        register.assert_not_called()
+        unregister.assert_not_called()
+
+    @unittest.skipUnless(importlib.util.find_spec("skyfield"), "skyfield is not installed")
+    def test_concurrent_propagations_on_one_pool(self):
+        from src.orbital_data_processor.skyfield import create_processor
+
+        starts = [datetime(2025, 3, 28, hour) for hour in range(6)]
+        propagator = ProcessPoolPropagator(workers=2)
+        results = {}
+        barrier = threading.Barrier(len(starts))
+
+        def propagate(start):
+            barrier.wait()
+            results[start] = propagator.propagate_columns(ISS_TLE, "TLE", start, 1, 1)
+
+        try:
+            threads = [threading.Thread(target=propagate, args=(start,)) for start in starts]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            propagator.close()
+
+        self.assertEqual(len(results), len(starts))
+        for start in starts:
+            expected = create_processor(ISS_TLE, "TLE").propagate_columns(start, 1, 1)
+            for name in ORBITAL_COLUMNS:
+                np.testing.assert_array_equal(results[start][name], expected[name])
+
+    def test_concurrent_calls_share_one_pool(self):
+        created = []
+
+        class FakeExecutor:
+            def __init__(self, max_workers, mp_context):
+                # Widen the window in which another thread could start a second pool.
+                time.sleep(0.05)
+                created.append(self)
+
+            def submit(self, fn, *args):
+                future = Future()
+                future.set_result(None)
+                return future
+
+            def shutdown(self, wait=True, cancel_futures=False):
+                pass
+
+        propagator = ProcessPoolPropagator(workers=2)
+        barrier = threading.Barrier(6)
+
+        def propagate():
+            barrier.wait()
+            propagator.propagate_columns(ISS_TLE, "TLE", datetime(2025, 3, 28), 1, 1)
+
+        with patch("src.orbital_data_processor.process_pool.ProcessPoolExecutor", FakeExecutor):
+            threads = [threading.Thread(target=propagate) for _ in range(6)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            propagator.close()
+
+        self.assertEqual(len(created), 1)
+
+    def test_handler_shapes_pool_results(self):
+        from src.Space_trace.orbital.handler import OrbitalLogicHandler
+
+        propagator = Mock()
+        propagator.propagate_columns.return_value = sample_columns(10)
+        handler = OrbitalLogicHandler(propagator=propagator)
+        args = (ISS_TLE, "TLE", datetime(2025, 3, 28), 9 / 60, 1)
+
+        chunks = list(handler.propagate_track(*args, shape="chunks", chunk_size=4))
+        points = handler.propagate_track(*args, shape="points")
+
+        self.assertEqual([len(chunk["time"]) for chunk in chunks], [4, 4, 2])
+        self.assertEqual(len(points), 10)
+        self.assertEqual(points[1][0], datetime(2025, 3, 28, 0, 1))
+        self.assertEqual(points[1][2], 2.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
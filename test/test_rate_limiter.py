@@ -0,0 +1,122 @@
+import threading
+import time
+import unittest
+
+from src.spacetrack_client.rate_limiter import (
+    PRIORITY_BATCH,
+    PRIORITY_INTERACTIVE,
+    RequestScheduler,
+    TokenBucket,
+)
+
+
+class _FakeClock:
+    """Clock that only advances when sleep() is called."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TokenBucketTest(unittest.TestCase):
+    def test_refill(self):
+        bucket = TokenBucket(2, 60, now=0.0)
+        bucket.take(0.0)
+        bucket.take(0.0)
+
+        self.assertAlmostEqual(bucket.delay(0.0), 30.0)
+        self.assertAlmostEqual(bucket.delay(15.0), 15.0)
+        self.assertEqual(bucket.delay(30.0), 0.0)
+
+
+class RequestSchedulerTest(unittest.TestCase):
+    def test_minute_and_hour_caps(self):
+        clock = _FakeClock()
+        scheduler = RequestScheduler(per_minute=3, per_hour=4, clock=clock, sleep=clock.sleep)
+
+        for _ in range(3):
+            scheduler.acquire()
+        self.assertEqual(clock.now, 0.0)
+
+        scheduler.acquire()
+        self.assertAlmostEqual(clock.now, 20.0)
+
+        # The hour bucket is empty now; the next token arrives after 3600 / 4 seconds.
+        scheduler.acquire()
+        self.assertAlmostEqual(clock.now, 900.0)
+
+    def test_interactive_requests_go_first(self):
+        clock = _FakeClock()
+        scheduler = RequestScheduler(per_minute=1, per_hour=100, clock=clock, sleep=clock.sleep)
+        scheduler.acquire()
+        order = []
+        search_done = threading.Event()
+
+        def search():
+            scheduler.acquire(PRIORITY_INTERACTIVE)
+            order.append("search")
+            search_done.set()
+
+        def batch_sleep(seconds):
+            # While the batch request waits for a token, an interactive search arrives.
+            if not search_done.is_set():
+                threading.Thread(target=search).start()
+                search_done.wait(2)
+            clock.sleep(seconds)
+
+        scheduler._sleep = lambda seconds: (
+            batch_sleep(seconds) if threading.current_thread().name == "batch" else clock.sleep(seconds)
+        )
+        batch = threading.Thread(target=lambda: (scheduler.acquire(PRIORITY_BATCH), order.append("batch")),
+                                 name="batch")
+        batch.start()
+        batch.join(2)
+
+        self.assertEqual(order, ["search", "batch"])
+
+    def test_duplicate_requests_are_coalesced(self):
+        scheduler = RequestScheduler()
+        started = threading.Event()
+        finish = threading.Event()
+        calls = []
+
+        def slow_request():
+            calls.append(1)
+            started.set()
+            finish.wait(2)
+            return "result"
+
+        results = []
+        first = threading.Thread(target=lambda: results.append(scheduler.call("key", slow_request)))
+        first.start()
+        started.wait(2)
+        second = threading.Thread(target=lambda: results.append(scheduler.call("key", slow_request)))
+        second.start()
+        time.sleep(0.05)
+        finish.set()
+        first.join(2)
+        second.join(2)
+
+        self.assertEqual(results, ["result", "result"])
+        self.assertEqual(len(calls), 1)
+
+    def test_coalesced_failure_propagates(self):
+        scheduler = RequestScheduler()
+
+        def failing():
+            raise RuntimeError("rate limited")
+
+        with self.assertRaises(RuntimeError):
+            scheduler.call("key", failing, PRIORITY_INTERACTIVE)
+        self.assertEqual(scheduler.call("key", lambda: 42), 42)
+
+
+if __name__ == "__main__":
+    unittest.main()
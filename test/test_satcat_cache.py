@@ -0,0 +1,66 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock
+
+from src.spacetrack_client.rate_limiter import RequestScheduler
+from src.spacetrack_client.satcat_cache import SatcatQueryCache, query_key
+from src.spacetrack_client.spacetrack_client import SpacetrackClientWrapper
+
+
+def _satcat(sat_id, name):
+    return {"NORAD_CAT_ID": str(sat_id), "SATNAME": name}
+
+
+class SatcatQueryCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache = SatcatQueryCache(os.path.join(self.tmp_dir.name, "satcat.sqlite"), ttl_hours=1)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_query_key_normalizes_values(self):
+        self.assertEqual(query_key({"country": " us ", "limit": 10, "format": "json"}),
+                         query_key({"COUNTRY": "US", "limit": 100}))
+
+    def test_lookup_serves_smaller_limits(self):
+        page = [_satcat(i, f"SAT {i}") for i in range(10)]
+        self.cache.store({"country": "US"}, 10, page, now=1000.0)
+
+        self.assertEqual(self.cache.lookup({"country": "us"}, 5, now=2000.0), page[:5])
+        # A full page may be truncated, so a larger limit is a miss.
+        self.assertIsNone(self.cache.lookup({"country": "US"}, 25, now=2000.0))
+        self.assertIsNone(self.cache.lookup({"country": "US"}, 5, now=1000.0 + 3601))
+
+    def test_complete_page_serves_any_limit(self):
+        page = [_satcat(25544, "ISS (ZARYA)")]
+        self.cache.store({"norad_cat_id": 25544}, 10, page, now=1000.0)
+
+        self.assertEqual(self.cache.lookup({"norad_cat_id": 25544}, 100, now=2000.0), page)
+
+    def test_refine_name_filters_complete_page(self):
+        page = [_satcat(1, "STARLINK-11"), _satcat(2, "STARLINK-12"), _satcat(3, "STARLINK-1234")]
+        self.cache.store({"satname": "%STARLINK-1%"}, 10, page, name="STARLINK-1", now=1000.0)
+
+        self.assertEqual(self.cache.refine_name("starlink-12", 10, now=2000.0), page[1:])
+        self.assertIsNone(self.cache.refine_name("ONEWEB", 10, now=2000.0))
+
+        self.cache.store({"satname": "%ONEWEB%"}, 2, page[:2], name="ONEWEB", now=1000.0)
+        self.assertIsNone(self.cache.refine_name("ONEWEB-1", 10, now=2000.0))
+
+    def test_wrapper_answers_repeated_searches_locally(self):
+        wrapper = SpacetrackClientWrapper.__new__(SpacetrackClientWrapper)
+        wrapper.client = Mock()
+        wrapper.scheduler = RequestScheduler()
+        wrapper.satcat_cache = self.cache
+        wrapper.client.satcat.return_value = [_satcat(44713, "STARLINK-1007"), _satcat(44714, "STARLINK-1008")]
+
+        first = wrapper.search_by_name("STARLINK-100", 10)
+        self.assertEqual(wrapper.search_by_name("starlink-100", 5), first)
+        self.assertEqual(wrapper.search_by_name("STARLINK-1008", 10), first[1:])
+        self.assertEqual(wrapper.client.satcat.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
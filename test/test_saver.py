@@ -0,0 +1,160 @@
+import json
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import Mock, patch
+
+from src.Space_trace.orbital import saver as saver_module
+from src.Space_trace.orbital.handler import OrbitalLogicHandler
+from src.Space_trace.orbital.saver import FactoryProvider, GeoJsonSeqSaver
+from src.orbital_data_processor.orbital_data_processor import (
+    OrbitalDataProcessorInterface,
+    iso_date_unit,
+    points_to_columns,
+)
+
+
+class TimeOnlyProcessor(OrbitalDataProcessorInterface):
+    """Processor returning only the time column, recording the size of every call."""
+
+    def __init__(self):
+        self.calls = []
+
+    def get_coord(self, time_utc):
+        return 0.0, 0.0, 0.0
+
+    def compute_orbital_columns(self, times):
+        self.calls.append(len(times))
+        return points_to_columns([(t, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0) for t in times])
+
+
+class GeoJsonSeqSaverTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.saver = FactoryProvider.get_factory("geojsons").get_saver()
+        self.points = [
+            (datetime(2025, 3, 28, 0, i), 10.0 + i, -20.5, 420.1234, 7.66, 90.0, 0.01, 12.5, 51.6386)
+            for i in range(5)
+        ]
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _read(self, path):
+        with open(path, encoding="utf-8") as f:
+            # str.splitlines() would also split on the RS record separator
+            return f.read().split("\n")[:-1]
+
+    def test_factory_returns_streaming_saver(self):
+        self.assertIsInstance(self.saver, GeoJsonSeqSaver)
+        self.assertTrue(self.saver.supports_streaming)
+
+    def test_captured_project_settings_are_used(self):
+        project_crs, context = Mock(), Mock()
+        with patch.object(saver_module, "QgsProject") as project:
+            handler = OrbitalLogicHandler(project_crs=project_crs, transform_context=context)
+            saver = handler._get_saver("geojsonl")
+
+        project.instance.assert_not_called()
+        self.assertIs(saver.project_crs, project_crs)
+        self.assertIs(saver.transform_context, context)
+
+    def test_chunks_are_appended_with_record_separator(self):
+        path = os.path.join(self.tmp_dir.name, "track.geojsons")
+        columns = points_to_columns(self.points)
+        self.saver.begin(path)
+        self.saver.append_point_columns({k: v[:2] for k, v in columns.items()}, path, start_id=0)
+        self.saver.append_point_columns({k: v[2:] for k, v in columns.items()}, path, start_id=2)
+
+        lines = self._read(path)
+        self.assertEqual(len(lines), 5)
+        for i, line in enumerate(lines):
+            self.assertTrue(line.startswith("\x1e"))
+            feature = json.loads(line[1:])
+            self.assertEqual(feature["properties"]["Point_ID"], i)
+            self.assertEqual(feature["geometry"]["coordinates"], [10.0 + i, -20.5])
+        self.assertEqual(json.loads(lines[0][1:])["properties"]["Date_Time"], "2025-03-28T00:00:00")
+
+    def test_sub_second_dates_keep_milliseconds(self):
+        path = os.path.join(self.tmp_dir.name, "track.geojsonl")
+        points = [(datetime(2025, 3, 28) + timedelta(milliseconds=500 * i),) + pt[1:]
+                  for i, pt in enumerate(self.points[:3])]
+        self.saver.save_points(points, path)
+
+        dates = [json.loads(line)["properties"]["Date_Time"] for line in self._read(path)]
+        self.assertEqual(dates, ["2025-03-28T00:00:00.000", "2025-03-28T00:00:00.500", "2025-03-28T00:00:01.000"])
+
+    def test_chunks_share_the_date_precision_of_the_run(self):
+        path = os.path.join(self.tmp_dir.name, "track.geojsonl")
+        points = [(datetime(2025, 3, 28) + timedelta(milliseconds=500 * i),) + self.points[0][1:] for i in range(4)]
+        columns = points_to_columns(points)
+        unit = iso_date_unit(points[0][0], 0.5 / 60)
+        self.saver.begin(path)
+        # The first chunk only holds a whole-second sample.
+        self.saver.append_point_columns({k: v[:1] for k, v in columns.items()}, path, date_unit=unit)
+        self.saver.append_point_columns({k: v[1:] for k, v in columns.items()}, path, start_id=1, date_unit=unit)
+
+        dates = [json.loads(line)["properties"]["Date_Time"] for line in self._read(path)]
+        self.assertEqual(unit, "ms")
+        self.assertEqual(dates[:2], ["2025-03-28T00:00:00.000", "2025-03-28T00:00:00.500"])
+
+    def test_date_unit_follows_start_and_step(self):
+        self.assertEqual(iso_date_unit(datetime(2025, 3, 28), 0.5), "s")
+        self.assertEqual(iso_date_unit(datetime(2025, 3, 28), 1.5 / 60), "ms")
+        self.assertEqual(iso_date_unit(datetime(2025, 3, 28, 0, 0, 0, 250000), 1), "ms")
+
+    def test_non_finite_values_are_written_as_null(self):
+        path = os.path.join(self.tmp_dir.name, "track.geojsonl")
+        points = list(self.points)
+        points[1] = points[1][:3] + (float("nan"),) + points[1][4:]
+        points[2] = (points[2][0], float("inf")) + points[2][2:]
+        self.saver.save_points(points, path)
+
+        features = [json.loads(line) for line in self._read(path)]
+        self.assertEqual(len(features), 5)
+        self.assertIsNone(features[1]["properties"]["Altitude"])
+        self.assertEqual(features[1]["properties"]["Velocity"], 7.66)
+        self.assertEqual(features[1]["geometry"]["coordinates"], [11.0, -20.5])
+        self.assertIsNone(features[2]["geometry"])
+        self.assertIsNone(features[2]["properties"]["Longitude"])
+        self.assertEqual(features[2]["properties"]["Point_ID"], 2)
+
+    def test_non_finite_vertices_are_dropped(self):
+        path = os.path.join(self.tmp_dir.name, "track_line.geojsonl")
+        self.saver.begin(path)
+        count = self.saver.append_line_segments(
+            [[(1.0, 0.0), (float("nan"), 0.5), (2.0, 1.0)], [(3.0, 0.0), (float("inf"), 1.0)]], path
+        )
+
+        self.assertEqual(count, 1)
+        self.assertEqual(json.loads(self._read(path)[0])["geometry"]["coordinates"], [[1.0, 0.0], [2.0, 1.0]])
+
+    def test_newline_delimited_lines(self):
+        path = os.path.join(self.tmp_dir.name, "track_line.geojsonl")
+        self.saver.begin(path)
+        self.saver.append_line_segments([[(179.0, 0.0), (180.0, 0.5)], [(-180.0, 0.5), (-179.0, 1.0)]], path)
+
+        lines = self._read(path)
+        self.assertEqual([json.loads(line)["properties"]["ID"] for line in lines], [1, 2])
+        self.assertEqual(json.loads(lines[1])["geometry"]["coordinates"], [[-180.0, 0.5], [-179.0, 1.0]])
+
+
+class PropagateChunksTest(unittest.TestCase):
+    def test_chunk_times_are_computed_per_chunk(self):
+        processor = TimeOnlyProcessor()
+        start = datetime(2025, 3, 28)
+
+        with patch.object(OrbitalDataProcessorInterface, "time_steps", side_effect=AssertionError):
+            chunks = processor.propagate_chunks(start, 1, 1.5, chunk_size=16)
+            first = next(chunks)
+            self.assertEqual(processor.calls, [16])
+            rest = list(chunks)
+
+        self.assertEqual(processor.calls, [16, 16, 9])
+        times = [t for chunk in [first] + rest for t in chunk["time"].tolist()]
+        self.assertEqual(times, OrbitalDataProcessorInterface.time_steps(start, 1, 1.5))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import time
+import unittest
+from datetime import datetime
+from unittest.mock import Mock
+
+from src.spacetrack_client.rate_limiter import RequestScheduler
+from src.spacetrack_client.selection_prefetcher import SelectionPrefetcher
+from src.spacetrack_dialog.spacetrack_dialog import SpaceTrackDialog
+
+
+class SelectionPrefetcherTest(unittest.TestCase):
+    def setUp(self):
+        self.client = Mock()
+        self.client.scheduler = RequestScheduler()
+        self.client.get_elements_batch.side_effect = lambda ids, start, fmt: {i: None for i in ids}
+        self.start = datetime(2025, 3, 28, 12)
+
+    def test_settled_selection_is_fetched_in_one_batch(self):
+        prefetcher = SelectionPrefetcher(self.client, self.start, delay_seconds=0.05)
+        prefetcher.update(["25544"])
+        prefetcher.update(["25544", "20580"])
+        prefetcher.update(["20580", "43013"])
+        time.sleep(0.2)
+        prefetcher.update(["20580", "43013"])
+        prefetcher.join(1)
+
+        self.client.get_elements_batch.assert_called_once_with([20580, 43013], self.start, 'TLE')
+
+    def test_waits_for_spare_capacity(self):
+        clock = [0.0]
+        self.client.scheduler = RequestScheduler(per_minute=12, clock=lambda: clock[0])
+        for _ in range(3):
+            self.client.scheduler.acquire()
+        prefetcher = SelectionPrefetcher(self.client, self.start, delay_seconds=0.05)
+        prefetcher.update([25544])
+        time.sleep(0.2)
+        self.client.get_elements_batch.assert_not_called()
+
+        clock[0] += 60
+        prefetcher.join(1)
+        self.client.get_elements_batch.assert_called_once()
+
+    def test_cancel_drops_pending_ids(self):
+        prefetcher = SelectionPrefetcher(self.client, self.start, delay_seconds=0.05)
+        prefetcher.update([25544])
+        prefetcher.cancel()
+        prefetcher.join(1)
+
+        self.client.get_elements_batch.assert_not_called()
+
+    def test_background_prefetch_does_not_touch_the_dialog_log(self):
+        # Only the logging attributes are needed, so skip the widget setup.
+        dialog = SpaceTrackDialog.__new__(SpaceTrackDialog)
+        dialog.log_callback = Mock()
+        dialog.logger = Mock()
+        prefetcher = SelectionPrefetcher(self.client, self.start, delay_seconds=0.05, log_callback=dialog._log)
+        prefetcher.update([25544])
+        prefetcher.join(1)
+
+        self.client.get_elements_batch.assert_called_once()
+        dialog.log_callback.assert_not_called()
+        self.assertEqual(dialog.logger.debug.call_count, 2)
+
+        dialog._log("Search finished")
+        dialog.log_callback.assert_called_once()
+
+    def test_debug_lines_are_shown_only_with_debug_logging(self):
+        dialog = SpaceTrackDialog.__new__(SpaceTrackDialog)
+        dialog.log_callback = Mock()
+        dialog.logger = Mock()
+        dialog.logger.isEnabledFor.return_value = False
+
+        dialog._log("Searching by name: %s, limit: %s", "DEBUG", "ISS", 10)
+        dialog.log_callback.assert_not_called()
+        # The arguments are passed on; the logger formats them only if it writes the record.
+        dialog.logger.debug.assert_called_once_with("Searching by name: %s, limit: %s", "ISS", 10)
+
+        dialog.logger.isEnabledFor.return_value = True
+        dialog._log("Searching by name: %s, limit: %s", "DEBUG", "ISS", 10)
+        self.assertTrue(dialog.log_callback.call_args.args[0].endswith("Searching by name: ISS, limit: 10"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+import json
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from unittest.mock import Mock
+
+from src.spacetrack_client.spacetrack_client import (
+    SpacetrackClientWrapper,
+    chunk_norad_ids,
+    latest_records_before,
+)
+from src.spacetrack_client.element_cache import ElementSetCache
+from src.spacetrack_client.rate_limiter import RequestScheduler
+
+
+def _record(sat_id, epoch):
+    return {
+        "NORAD_CAT_ID": str(sat_id),
+        "EPOCH": epoch,
+        "TLE_LINE1": f"1 {sat_id:05d}U line1 {epoch}",
+        "TLE_LINE2": f"2 {sat_id:05d}  51.6386 line2",
+    }
+
+
+class SpacetrackBatchTest(unittest.TestCase):
+    def test_chunk_norad_ids_respects_length(self):
+        chunks = chunk_norad_ids([25544, 25545, 25546, 25544], max_chars=11)
+        self.assertEqual(chunks, [[25544, 25545], [25546]])
+        for chunk in chunks:
+            self.assertLessEqual(len(",".join(map(str, chunk))), 11)
+
+    def test_latest_records_before(self):
+        records = [
+            _record(25544, "2025-03-27T10:00:00.000000"),
+            _record(25544, "2025-03-28T09:00:00.000000"),
+            _record(25544, "2025-03-28T13:00:00.000000"),
+            _record(40000, "2025-03-26T00:00:00.000000"),
+        ]
+        latest = latest_records_before(records, datetime(2025, 3, 28, 12))
+        self.assertEqual(latest[25544]["EPOCH"], "2025-03-28T09:00:00.000000")
+        self.assertEqual(latest[40000]["EPOCH"], "2025-03-26T00:00:00.000000")
+
+    def test_get_elements_batch_requeries_missing_ids(self):
+        wrapper = SpacetrackClientWrapper.__new__(SpacetrackClientWrapper)
+        wrapper.client = Mock()
+        wrapper.scheduler = RequestScheduler()
+        wrapper.cache = None
+        wrapper.client.gp_history.side_effect = [
+            json.dumps([_record(25544, "2025-03-28T09:00:00.000000")]),
+            json.dumps([_record(40000, "2025-03-10T00:00:00.000000")]),
+        ]
+
+        result = wrapper.get_elements_batch([25544, 40000, 99999], datetime(2025, 3, 28, 12), "TLE")
+
+        self.assertEqual(sorted(result), [25544, 40000])
+        self.assertEqual(result[25544][2], " 51.6386")
+        self.assertEqual(wrapper.client.gp_history.call_count, 2)
+        self.assertEqual(wrapper.client.gp_history.call_args_list[1].kwargs["norad_cat_id"], "40000,99999")
+
+    def test_get_elements_batch_uses_cache(self):
+        wrapper = SpacetrackClientWrapper.__new__(SpacetrackClientWrapper)
+        wrapper.client = Mock()
+        wrapper.scheduler = RequestScheduler()
+        wrapper.cache = Mock()
+        wrapper.cache.lookup.side_effect = lambda sat_id, start: (
+            _record(25544, "2025-03-28T09:00:00.000000") if sat_id == 25544 else None
+        )
+        wrapper.client.gp_history.return_value = json.dumps([_record(40000, "2025-03-27T00:00:00.000000")])
+
+        result = wrapper.get_elements_batch([25544, 40000], datetime(2025, 3, 28, 12), "OMM")
+
+        self.assertEqual(sorted(result), [25544, 40000])
+        self.assertEqual(wrapper.client.gp_history.call_count, 1)
+        self.assertEqual(wrapper.client.gp_history.call_args.kwargs["norad_cat_id"], "40000")
+        stored = wrapper.cache.store_many.call_args.args[0]
+        self.assertEqual([r["NORAD_CAT_ID"] for r in stored], ["40000"])
+
+    def test_sync_elements_requests_only_newer_records(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            wrapper = SpacetrackClientWrapper.__new__(SpacetrackClientWrapper)
+            wrapper.client = Mock()
+            wrapper.scheduler = RequestScheduler()
+            wrapper.cache = ElementSetCache(os.path.join(tmp_dir, "cache.sqlite"))
+            wrapper.cache.store_many([_record(25544, "2025-03-27T09:00:00.000000"),
+                                      _record(25545, "2025-03-27T18:00:00.000000")], datetime(2025, 3, 27, 20))
+            wrapper.client.gp_history.return_value = json.dumps([
+                _record(25544, "2025-03-28T08:00:00.000000"),
+                _record(25544, "2025-03-27T09:00:00.000000"),
+                _record(25545, "2025-03-27T18:00:00.000000"),
+            ])
+            start = datetime(2025, 3, 28, 12)
+
+            self.assertEqual(wrapper.sync_elements([25544, 25545, 40000], start), {25544, 25545})
+            self.assertEqual(wrapper.client.gp_history.call_count, 1)
+            query = wrapper.client.gp_history.call_args.kwargs
+            self.assertEqual(query["norad_cat_id"], "25544,25545")
+            self.assertTrue(query["epoch"].startswith("2025-03-27"))
+            self.assertEqual(wrapper.cache.lookup(25544, start)["EPOCH"], "2025-03-28T08:00:00.000000")
+            self.assertEqual(wrapper.cache.lookup(25545, start)["EPOCH"], "2025-03-27T18:00:00.000000")
+            self.assertIsNone(wrapper.cache.lookup(40000, start))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+import importlib.util
+import json
+import os
+import tempfile
+import unittest
+import urllib.error
+import urllib.request
+from datetime import datetime
+from http.cookiejar import CookieJar
+from urllib.parse import quote, urlencode
+
+from src.spacetrack_client.element_cache import ElementSetCache
+from src.spacetrack_client.rate_limiter import RequestScheduler
+from .spacetrack_server import IDENTITY, PASSWORD, SpaceTrackStandIn, synthetic_catalog
+
+NEWEST_EPOCH = datetime(2025, 3, 28, 12)
+HAS_SPACETRACK = importlib.util.find_spec("spacetrack.base") is not None
+
+
+class SpaceTrackStandInTest(unittest.TestCase):
+    def setUp(self):
+        self.server = SpaceTrackStandIn(synthetic_catalog(5, records_per_object=4, newest_epoch=NEWEST_EPOCH),
+                                        per_minute=3)
+        self.server.start()
+        self.opener = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(CookieJar()))
+
+    def tearDown(self):
+        self.server.stop()
+
+    def _login(self, password=PASSWORD):
+        data = urlencode({"identity": IDENTITY, "password": password}).encode()
+        with self.opener.open(self.server.base_url + "ajaxauth/login", data) as response:
+            return json.loads(response.read())
+
+    def _query(self, class_, **predicates):
+        path = "".join(f"/{key}/{quote(str(value), safe='')}" for key, value in predicates.items())
+        with self.opener.open(f"{self.server.base_url}basicspacedata/query/class/{class_}{path}") as response:
+            return json.loads(response.read())
+
+    def test_queries_require_login(self):
+        self.assertEqual(self._login("wrong"), {"Login": "Failed"})
+        with self.assertRaises(urllib.error.HTTPError) as error:
+            self._query("satcat", norad_cat_id=40000)
+        self.assertEqual(error.exception.code, 401)
+
+    def test_gp_history_predicates(self):
+        self._login()
+        records = self._query("gp_history", norad_cat_id="40000,40002",
+                              epoch="2025-03-27 06:00:00--2025-03-28 12:00:00",
+                              orderby="norad_cat_id asc,epoch desc", format="json")
+
+        self.assertEqual([(r["NORAD_CAT_ID"], r["EPOCH"][:13]) for r in records], [
+            ("40000", "2025-03-28T12"), ("40000", "2025-03-28T00"), ("40000", "2025-03-27T12"),
+            ("40002", "2025-03-28T12"), ("40002", "2025-03-28T00"), ("40002", "2025-03-27T12"),
+        ])
+        self.assertTrue(all(len(r["TLE_LINE1"]) == 69 for r in records))
+
+        names = self._query("satcat", satname="~~%synth-%", decay="null-val", orderby="NORAD_CAT_ID desc", limit=2)
+        self.assertEqual([r["SATNAME"] for r in names], ["SYNTH-5", "SYNTH-4"])
+
+    def test_rate_limit(self):
+        self._login()
+        for _ in range(3):
+            self._query("satcat", norad_cat_id=40000)
+        with self.assertRaises(urllib.error.HTTPError) as error:
+            self._query("satcat", norad_cat_id=40000)
+        self.assertEqual(error.exception.code, 500)
+        self.assertEqual(self.server.rate_limited, 1)
+
+
+@unittest.skipUnless(HAS_SPACETRACK, "spacetrack is not installed")
+class SpacetrackClientStandInTest(unittest.TestCase):
+    def setUp(self):
+        self.server = SpaceTrackStandIn(synthetic_catalog(20, records_per_object=6, newest_epoch=NEWEST_EPOCH))
+        self.server.start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def _wrapper(self, cache=None):
+        from src.spacetrack_client.spacetrack_client import SpacetrackClientWrapper
+
+        return SpacetrackClientWrapper(IDENTITY, PASSWORD, cache=cache, scheduler=RequestScheduler(),
+                                       base_url=self.server.base_url)
+
+    def test_get_tle_and_batch(self):
+        wrapper = self._wrapper()
+        start = datetime(2025, 3, 28, 6)
+
+        line1, _, _ = wrapper.get_tle(40003, start)
+        batch = wrapper.get_elements_batch(range(40000, 40020), start, "TLE")
+
+        self.assertEqual(batch[40003][0], line1)
+        self.assertEqual(len(batch), 20)
+        self.assertEqual(self.server.request_counts["gp_history"], 2)
+
+    def test_sync_elements_sends_one_query_per_batch(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache = ElementSetCache(os.path.join(tmp_dir, "cache.sqlite"))
+            # The newest local epochs of the objects fall on three different days.
+            by_object = {}
+            for record in self.server.catalog["gp_history"]:
+                by_object.setdefault(int(record["NORAD_CAT_ID"]), []).append(record)
+            for sat_id, records in by_object.items():
+                cache.store_many(records[:sat_id % 4 + 1], datetime(2025, 3, 27, 12))
+
+            synced = self._wrapper(cache).sync_elements(sorted(by_object), NEWEST_EPOCH)
+
+            self.assertEqual(synced, set(by_object))
+            self.assertEqual(self.server.request_counts["gp_history"], 1)
+            for sat_id, records in by_object.items():
+                self.assertEqual(cache.lookup(sat_id, NEWEST_EPOCH)["EPOCH"], records[-1]["EPOCH"])
+
+    def test_search_by_name(self):
+        results = self._wrapper().search_by_name("SYNTH-1", limit=5)
+
+        self.assertEqual([r["SATNAME"] for r in results], ["SYNTH-1", "SYNTH-10", "SYNTH-11", "SYNTH-12", "SYNTH-13"])
+
+
+if __name__ == "__main__":
+    unittest.main()
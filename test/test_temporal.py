@@ -0,0 +1,74 @@
+import unittest
+from datetime import datetime
+
+import numpy as np
+
+from src.Space_trace.orbital import temporal
+from src.Space_trace.orbital.temporal import SortedTimeIndex, feature_ids_between, register_time_index
+
+
+class _Signal:
+    def __init__(self):
+        self.slots = []
+
+    def connect(self, slot):
+        self.slots.append(slot)
+
+    def emit(self):
+        for slot in self.slots:
+            slot()
+
+
+class _Layer:
+    def __init__(self, layer_id):
+        self._id = layer_id
+        self.willBeDeleted = _Signal()
+
+    def id(self):
+        return self._id
+
+
+class SortedTimeIndexTest(unittest.TestCase):
+    def setUp(self):
+        times = np.array([datetime(2025, 3, 28, 0, m) for m in (0, 1, 2, 3, 4)], dtype="datetime64[us]")
+        self.index = SortedTimeIndex(times)
+
+    def test_ids_between_inclusive(self):
+        ids = self.index.ids_between(datetime(2025, 3, 28, 0, 1), datetime(2025, 3, 28, 0, 3))
+        self.assertEqual(ids.tolist(), [1, 2, 3])
+
+    def test_ids_between_half_open(self):
+        ids = self.index.ids_between(datetime(2025, 3, 28, 0, 1), datetime(2025, 3, 28, 0, 3), include_end=False)
+        self.assertEqual(ids.tolist(), [1, 2])
+
+    def test_open_bounds(self):
+        self.assertEqual(self.index.ids_between(None, datetime(2025, 3, 28, 0, 1)).tolist(), [0, 1])
+        self.assertEqual(self.index.ids_between(datetime(2025, 3, 28, 0, 4), None).tolist(), [4])
+
+    def test_unsorted_input(self):
+        times = np.array([datetime(2025, 1, 1, 2), datetime(2025, 1, 1, 0), datetime(2025, 1, 1, 1)],
+                         dtype="datetime64[us]")
+        index = SortedTimeIndex(times)
+        self.assertEqual(index.ids_between(datetime(2025, 1, 1, 0), datetime(2025, 1, 1, 1)).tolist(), [1, 2])
+
+
+class LayerTimeIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.layer = _Layer("points_1")
+        times = [datetime(2025, 3, 28, 0, m) for m in range(5)]
+        register_time_index(self.layer, times, [10, 11, 12, 13, 14])
+
+    def tearDown(self):
+        self.layer.willBeDeleted.emit()
+
+    def test_feature_ids_between(self):
+        ids = feature_ids_between(self.layer, datetime(2025, 3, 28, 0, 1), datetime(2025, 3, 28, 0, 2))
+        self.assertEqual(ids, [11, 12])
+
+    def test_index_released_with_layer(self):
+        self.layer.willBeDeleted.emit()
+        self.assertNotIn("points_1", temporal._layer_time_indexes)
+
+
+if __name__ == "__main__":
+    unittest.main()
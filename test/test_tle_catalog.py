@@ -0,0 +1,107 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+from datetime import datetime
+from types import SimpleNamespace
+
+from src.data_retriver.data_retriver import LocalFileRetriever
+from src.data_retriver.catalog_index import sidecar_path
+from src.data_retriver.tle_catalog import TleCatalog, parse_norad_field, tle_epoch
+
+ISS_LINE1 = "1 25544U 98067A   08264.51782528 -.00002182  00000-0 -11606-4 0  2927"
+ISS_LINE2 = "2 25544  51.6416 247.4627 0006703 130.5360 325.0288 15.72125391563537"
+
+
+def _checksum(line):
+    """Append the modulo-10 checksum to the first 68 characters of a TLE line."""
+    total = sum(int(c) if c.isdigit() else (1 if c == "-" else 0) for c in line[:68])
+    return line[:68] + str(total % 10)
+
+
+def _tle(sat_id, day="08264.51782528", inclination=" 51.6416"):
+    line1 = _checksum(f"1 {sat_id:05d}U 98067A   {day} -.00002182  00000-0 -11606-4 0  292 ")
+    line2 = _checksum(f"2 {sat_id:05d} {inclination} 247.4627 0006703 130.5360 325.0288 15.7212539156353 ")
+    return line1, line2
+
+
+class TleCatalogTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _write(self, text, name="catalog.txt"):
+        path = os.path.join(self.tmp_dir.name, name)
+        with open(path, "w", newline="") as f:
+            f.write(text)
+        return path
+
+    def test_checksum_helper_matches_reference(self):
+        self.assertEqual(_checksum(ISS_LINE1), ISS_LINE1)
+        self.assertEqual(_checksum(ISS_LINE2), ISS_LINE2)
+
+    def test_3le_index(self):
+        lines = ["ISS (ZARYA)", *_tle(25544), "0 NOAA 19", *_tle(33591, inclination=" 99.1917")]
+        catalog = TleCatalog(self._write("\r\n".join(lines) + "\r\n"))
+
+        self.assertEqual(catalog.norad_ids(), [25544, 33591])
+        self.assertEqual(catalog.name(25544), "ISS (ZARYA)")
+        self.assertEqual(catalog.name(33591), "NOAA 19")
+        line1, line2, inclination = catalog.get_tle(33591)
+        self.assertTrue(line1.startswith("1 33591U"))
+        self.assertEqual(inclination, 99.1917)
+
+    def test_checksum_errors_are_skipped(self):
+        bad1, bad2 = _tle(40000)
+        bad2 = bad2[:-1] + str((int(bad2[-1]) + 1) % 10)
+        catalog = TleCatalog(self._write("\n".join([*_tle(25544), bad1, bad2])))
+
+        self.assertEqual(catalog.norad_ids(), [25544])
+        with self.assertRaises(ValueError):
+            catalog.get_tle(40000)
+        with self.assertRaises(ValueError):
+            catalog.get_tle(99999)
+
+    def test_latest_epoch_before_start(self):
+        text = "\n".join([*_tle(25544, day="08264.00000000"), *_tle(25544, day="08266.00000000")])
+        catalog = TleCatalog(self._write(text))
+
+        self.assertEqual(tle_epoch(catalog.get_tle(25544, datetime(2008, 9, 21, 12))[0]), datetime(2008, 9, 20))
+        self.assertEqual(tle_epoch(catalog.get_tle(25544)[0]), datetime(2008, 9, 22))
+
+    def test_alpha5_norad_field(self):
+        self.assertEqual(parse_norad_field("A0001"), 100001)
+        self.assertEqual(parse_norad_field("25544"), 25544)
+
+    def test_local_retriever_reads_catalog_subset(self):
+        path = self._write("\n".join([*_tle(25544), *_tle(33591), *_tle(40000)]) + "\n")
+        retriever = LocalFileRetriever()
+        for sat_id in (40000, 25544):
+            config = SimpleNamespace(data_file_path=path, data_format="TLE", save_data=False, save_data_path="",
+                                     catalog=True, sat_id=sat_id, start_datetime=datetime(2025, 1, 1))
+            self.assertTrue(retriever.retrieve_data(config)[0].startswith(f"1 {sat_id}U"))
+        self.assertEqual(len(retriever._catalogs), 1)
+        retriever.close()
+
+    def test_sidecar_index_is_reused(self):
+        path = self._write("\n".join([*_tle(25544), *_tle(33591)]))
+        TleCatalog(path).close()
+        self.assertTrue(os.path.exists(sidecar_path(path)))
+
+        with mock.patch.object(TleCatalog, "_scan", side_effect=AssertionError("rescanned")):
+            catalog = TleCatalog(path)
+        self.assertEqual(catalog.get_tle(33591)[0][2:7], "33591")
+        catalog.close()
+
+        # A changed catalog invalidates the sidecar.
+        with open(path, "a") as f:
+            f.write("\n" + "\n".join(_tle(40000)))
+        catalog = TleCatalog(path)
+        self.assertEqual(catalog.norad_ids(), [25544, 33591, 40000])
+        catalog.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+import time
+import unittest
+
+from qgis.core import QgsApplication
+
+from src.Space_trace.track_task import ITEMS_PER_SUBTASK, TrackGenerationTask
+
+from .utilities import get_qgis_app
+QGIS_APP = get_qgis_app()
+
+
+class FakePlugin:
+    """Records the hook calls a TrackGenerationTask makes on the plugin."""
+
+    def __init__(self, fail_item=None):
+        self.fail_item = fail_item
+        self.calls = []
+        self.progress = []
+        self.finished = []
+
+    def _prepare_run(self, run):
+        self.calls.append("prepare")
+
+    def _process_chunk(self, run, items, task):
+        for done, item in enumerate(items, 1):
+            if task.isCanceled():
+                return False
+            if item == self.fail_item:
+                raise ValueError(f"item {item} failed")
+            run.record(item, (None, f"points_{item}", None))
+            task.setProgress(100.0 * done / len(items))
+            self.progress.append(task.progress())
+        self.calls.append(("chunk", list(items)))
+        return True
+
+    def _complete_run(self, run):
+        self.calls.append("complete")
+
+    def _finish_run(self, run, result):
+        self.finished.append((run, result))
+
+
+class TrackTaskTest(unittest.TestCase):
+    def _wait_finished(self, plugin, timeout=10):
+        deadline = time.monotonic() + timeout
+        while not plugin.finished and time.monotonic() < deadline:
+            QgsApplication.processEvents()
+            time.sleep(0.01)
+        # Give a second finished() call the chance to arrive.
+        for _ in range(20):
+            QgsApplication.processEvents()
+            time.sleep(0.01)
+
+    def test_items_are_split_into_subtasks(self):
+        items = list(range(1, 2 * ITEMS_PER_SUBTASK + 21))
+        task = TrackGenerationTask(FakePlugin(), items, {}, "shp")
+
+        self.assertEqual([sub.items for sub in task.subtasks],
+                         [items[:ITEMS_PER_SUBTASK], items[ITEMS_PER_SUBTASK:2 * ITEMS_PER_SUBTASK],
+                          items[2 * ITEMS_PER_SUBTASK:]])
+        self.assertEqual([sub.prepare for sub in task.subtasks], [True, False, False])
+
+    def test_subtasks_report_progress(self):
+        plugin = FakePlugin()
+        task = TrackGenerationTask(plugin, [1, 2, 3, 4, 5], {}, "shp", items_per_subtask=4)
+
+        self.assertTrue(all(sub.run() for sub in task.subtasks))
+
+        self.assertEqual(plugin.calls, ["prepare", ("chunk", [1, 2, 3, 4]), ("chunk", [5])])
+        self.assertEqual(plugin.progress, [25.0, 50.0, 75.0, 100.0, 100.0])
+        self.assertEqual(task.processed_count(), 5)
+
+    def test_canceled_subtask_stops(self):
+        plugin = FakePlugin()
+        task = TrackGenerationTask(plugin, [1, 2, 3], {}, "shp")
+        task.subtasks[0].cancel()
+
+        self.assertFalse(task.subtasks[0].run())
+        self.assertEqual(task.processed_count(), 0)
+
+    def test_failed_subtask_keeps_the_exception(self):
+        task = TrackGenerationTask(FakePlugin(fail_item=2), [1, 2, 3], {}, "shp")
+
+        self.assertFalse(task.subtasks[0].run())
+        self.assertIsInstance(task.exception, ValueError)
+
+    def test_finish_run_is_called_once_after_all_subtasks(self):
+        plugin = FakePlugin()
+        task = TrackGenerationTask(plugin, list(range(1, 8)), {}, "shp", items_per_subtask=3)
+
+        QgsApplication.taskManager().addTask(task)
+        self._wait_finished(plugin)
+
+        self.assertEqual(plugin.finished, [(task, True)])
+        self.assertEqual(plugin.calls, ["prepare", ("chunk", [1, 2, 3]), ("chunk", [4, 5, 6]), ("chunk", [7]),
+                                        "complete"])
+        self.assertEqual([r[0] for r in task.results], list(range(1, 8)))
+
+    def test_failed_run_finishes_once_with_false(self):
+        plugin = FakePlugin(fail_item=5)
+        task = TrackGenerationTask(plugin, list(range(1, 8)), {}, "shp", items_per_subtask=3)
+
+        QgsApplication.taskManager().addTask(task)
+        self._wait_finished(plugin)
+
+        self.assertEqual(plugin.finished, [(task, False)])
+        self.assertNotIn("complete", plugin.calls)
+        self.assertIsInstance(task.exception, ValueError)
+
+
+if __name__ == "__main__":
+    unittest.main()